@@ -0,0 +1,70 @@
+"""Command line interface for the benchmarks. Run from the repository root:
+
+python -m benchmarks run --scale 1000 --scale 100000
+python -m benchmarks run --case operator --case load_archive
+python -m benchmarks compare old.json new.json
+python -m benchmarks list-cases
+
+The nodc_* stubs and a generated NODC_CONFIG are used unless --installed-nodc is
+given (see benchmarks.environment). benchmarks.cases and benchmarks.runner import
+sharkadm and are therefore imported after the environment is activated.
+"""
+
+import rich
+import typer
+
+from benchmarks import environment
+
+app = typer.Typer()
+
+
+@app.command()
+def run(
+    case: list[str] | None = None,
+    scale: list[int] | None = None,
+    seed: int = 0,
+    repeat: int = 1,
+    output: str | None = None,
+    installed_nodc: bool = False,
+):
+    """Runs the benchmark cases (names or groups) at the given scales (rows). Give
+    --installed-nodc to use the installed nodc_* packages and NODC_CONFIG"""
+    environment.activate(installed_nodc=installed_nodc)
+    from benchmarks import runner
+
+    results = runner.run_benchmarks(
+        case_names=case,
+        scales=scale or runner.DEFAULT_SCALES,
+        seed=seed,
+        repeat=repeat,
+    )
+    path = runner.save_results(results, output)
+    rich.print(f"Results saved to: {path}")
+
+
+@app.command()
+def compare(old: str, new: str, threshold: float = 0.2):
+    """Compares two result files. Exits with code 1 if there are regressions"""
+    environment.activate()
+    from benchmarks import runner
+
+    lines, regressions = runner.compare_results(
+        runner.load_results(old), runner.load_results(new), threshold=threshold
+    )
+    rich.print("\n".join(lines))
+    if regressions:
+        rich.print(f"{len(regressions)} regressions above {threshold:.0%}")
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def list_cases():
+    environment.activate()
+    from benchmarks import cases
+
+    for case in cases.get_cases():
+        rich.print(f"{case.name.ljust(40)}{case.group}")
+
+
+if __name__ == "__main__":
+    app()
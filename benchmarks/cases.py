@@ -0,0 +1,171 @@
+"""Benchmark cases.
+
+A case prepares its input (not measured) and then runs the measured part. Input
+files are generated with benchmarks.synthetic in a temporary directory.
+
+The cases need a NODC_CONFIG matching the synthetic data and the nodc_* packages
+(or their stubs). Call benchmarks.environment.activate before this module is
+imported. Which packages were stubbed is stored with the results (see runner).
+"""
+
+import pathlib
+from abc import ABC, abstractmethod
+from typing import Any
+
+from benchmarks import synthetic
+from sharkadm import transformers, validators, workflow
+from sharkadm.controller import SHARKadmPolarsController, get_polars_controller_with_data
+from sharkadm.data.df.df_data_holder import PolarsDataFrameDataHolder
+
+ROWS_PER_CNV_PROFILE = 1000
+
+# Data type of the synthetic data for operators not valid for phytoplankton
+OPERATOR_DATA_TYPES = {"PolarsAddVisitKey": "PhysicalChemical"}
+
+
+class BenchmarkCase(ABC):
+    group: str = ""
+
+    def __init__(self, name: str, **kwargs):
+        self.name = name
+        self.kwargs = kwargs
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}: {self.name}"
+
+    @abstractmethod
+    def prepare(self, nr_rows: int, directory: pathlib.Path, seed: int) -> Any:
+        """Creates the input and returns what is given to run"""
+        ...
+
+    @abstractmethod
+    def run(self, prepared: Any) -> None: ...
+
+
+def write_input(
+    input_format: str, nr_rows: int, directory: pathlib.Path, seed: int
+) -> pathlib.Path:
+    """Writes synthetic input of the given format and returns the path to load"""
+    if input_format == "cnv":
+        return synthetic.write_cnv(
+            directory,
+            nr_profiles=max(1, nr_rows // ROWS_PER_CNV_PROFILE),
+            nr_scans=min(nr_rows, ROWS_PER_CNV_PROFILE),
+            seed=seed,
+        )
+    df = synthetic.get_rows(nr_rows, seed=seed)
+    writers = dict(
+        archive=synthetic.write_archive,
+        zip_archive=synthetic.write_zip_archive,
+        lims=synthetic.write_lims,
+        dv_template=synthetic.write_dv_template,
+    )
+    return writers[input_format](directory, df)
+
+
+class LoadCase(BenchmarkCase):
+    """Loads an input into a controller"""
+
+    group = "load"
+
+    def prepare(self, nr_rows: int, directory: pathlib.Path, seed: int) -> Any:
+        return write_input(self.kwargs["input_format"], nr_rows, directory, seed)
+
+    def run(self, prepared: pathlib.Path) -> None:
+        get_polars_controller_with_data(prepared)
+
+
+class DvWorkflowCase(BenchmarkCase):
+    """Runs the DV workflow for the data type of the input"""
+
+    group = "workflow"
+
+    def prepare(self, nr_rows: int, directory: pathlib.Path, seed: int) -> Any:
+        path = write_input(self.kwargs["input_format"], nr_rows, directory, seed)
+        export_directory = directory / "export"
+        export_directory.mkdir(exist_ok=True)
+        return path, export_directory
+
+    def run(self, prepared: tuple[pathlib.Path, pathlib.Path]) -> None:
+        path, export_directory = prepared
+        wflow = workflow.get_dv_workflow_for_data_type(
+            self.kwargs.get("data_type", "Phytoplankton")
+        )
+        wflow.set_data_sources(path)
+        wflow.set_export_directory_for_exporters(export_directory)
+        info = wflow.start_workflow()
+        if info is not None:
+            raise RuntimeError(f"Workflow terminated: {info.operator} {info.msg}")
+
+
+class OperatorCase(BenchmarkCase):
+    """Runs one operator on synthetic data in a data frame data holder"""
+
+    group = "operator"
+
+    def prepare(self, nr_rows: int, directory: pathlib.Path, seed: int) -> Any:
+        controller = SHARKadmPolarsController()
+        df = synthetic.get_rows(nr_rows, seed=seed, data_type=self.kwargs["data_type"])
+        controller.set_data_holder(
+            PolarsDataFrameDataHolder(df, data_type=df["delivery_datatype"][0])
+        )
+        return controller, self._get_operator()
+
+    def _get_operator(self):
+        name = self.kwargs["operator"]
+        for module in (transformers, validators):
+            if hasattr(module, name):
+                return getattr(module, name)(**self.kwargs.get("operator_kwargs", {}))
+        raise AttributeError(f"No operator named {name}")
+
+    def run(self, prepared) -> None:
+        controller, operator = prepared
+        info = controller.run_operators(operator)
+        if info.terminated:
+            raise RuntimeError(f"Operator {operator.name} terminated: {info[-1].msg}")
+        if not info[-1].valid:
+            raise RuntimeError(f"Operator {operator.name} is not valid for the data")
+
+
+def _get_default_cases() -> list[BenchmarkCase]:
+    cases = []
+    for input_format in ("archive", "zip_archive", "lims", "cnv", "dv_template"):
+        cases.append(LoadCase(f"load_{input_format}", input_format=input_format))
+    for input_format in ("archive", "dv_template"):
+        cases.append(
+            DvWorkflowCase(f"dv_workflow_{input_format}", input_format=input_format)
+        )
+    for operator in (
+        "PolarsStripAllValues",
+        "PolarsAddDatetime",
+        "PolarsAddVisitKey",
+        "PolarsAddSharkSampleMd5",
+        "PolarsAddSamplePositionSweref99tm",
+        "PolarsAddDyntaxaId",
+        "ValidateDuplicatedRows",
+        "ValidateDateAndTime",
+        "ValidateCommonValuesByVisit",
+    ):
+        cases.append(
+            OperatorCase(
+                operator,
+                operator=operator,
+                data_type=OPERATOR_DATA_TYPES.get(operator, "Phytoplankton"),
+            )
+        )
+    return cases
+
+
+CASES: dict[str, BenchmarkCase] = {case.name: case for case in _get_default_cases()}
+
+
+def get_cases(names: list[str] | None = None) -> list[BenchmarkCase]:
+    """Returns the cases with the given names (or groups). Returns all cases if no
+    names are given"""
+    if not names:
+        return list(CASES.values())
+    cases = [case for case in CASES.values() if case.name in names or case.group in names]
+    missing = set(names) - {case.name for case in cases} - {case.group for case in cases}
+    if missing:
+        raise KeyError(f"Unknown benchmark cases: {', '.join(sorted(missing))}")
+    return cases
@@ -0,0 +1,44 @@
+"""Environment of a benchmark run.
+
+sharkadm reads NODC_CONFIG and imports the nodc_* packages when it is imported,
+so activate must be called before sharkadm (or benchmarks.cases and
+benchmarks.runner) is imported. By default the nodc_* stubs are registered for
+the packages that are not installed and NODC_CONFIG is set to a generated config
+directory matching the synthetic data (see benchmarks.nodc_config). The directory
+is removed when the process exits.
+
+With installed_nodc=True the installed packages and the config directory found
+by sharkadm are used as is.
+"""
+
+import atexit
+import os
+import pathlib
+import shutil
+import tempfile
+
+from benchmarks import nodc_config, nodc_stubs
+
+CONFIG_ENV = "NODC_CONFIG"
+
+STUBBED_PACKAGES: list[str] = []
+GENERATED_CONFIG_DIRECTORY: pathlib.Path | None = None
+
+
+def activate(installed_nodc: bool = False) -> None:
+    global GENERATED_CONFIG_DIRECTORY
+    if installed_nodc or GENERATED_CONFIG_DIRECTORY:
+        return
+    STUBBED_PACKAGES.extend(nodc_stubs.install())
+    # The sharkadm test config directory is created next to the config directory
+    root = pathlib.Path(tempfile.mkdtemp(prefix="sharkadm_benchmark_"))
+    atexit.register(shutil.rmtree, root, ignore_errors=True)
+    GENERATED_CONFIG_DIRECTORY = nodc_config.write_nodc_config(root / "NODC_CONFIG")
+    os.environ[CONFIG_ENV] = str(GENERATED_CONFIG_DIRECTORY)
+
+
+def get_meta() -> dict:
+    return dict(
+        nodc_stubs=list(STUBBED_PACKAGES),
+        generated_nodc_config=GENERATED_CONFIG_DIRECTORY is not None,
+    )
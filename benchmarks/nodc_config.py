@@ -0,0 +1,230 @@
+"""Minimal NODC_CONFIG directory for the benchmarks.
+
+write_nodc_config writes the config files sharkadm reads when loading and
+processing the inputs written by benchmarks.synthetic: import matrices with the
+column SYNTHETIC (synthetic.IMPORT_MATRIX_KEY), delivery note and data type
+mappings, the profile mapping for the cnv files, custom id and status config,
+the SMHI trophic types and a DV workflow with operators that run on the synthetic
+data (with the nodc_* stubs if the packages are not installed).
+"""
+
+import json
+import pathlib
+
+import yaml
+
+from benchmarks import nodc_stubs, synthetic
+
+_VISIT_PREFIXES = ("visit_", "reported_visit", "platform", "station", "reported_station")
+_SAMPLE_PREFIXES = ("sample_", "reported_sample", "reported_lat", "reported_lon")
+
+# LIMS and cnv columns (see synthetic.write_lims and synthetic.write_cnv) mapped
+# to internal names in the import matrix for physical and chemical data
+LIMS_COLUMNS = dict(
+    SHIPC="platform_code",
+    MYEAR="visit_year",
+    STATN="reported_station_name",
+    SDATE="visit_date",
+    STIME="sample_time",
+    LATIT="reported_latitude",
+    LONGI="reported_longitude",
+    DEPH="sample_depth_m",
+    SMPNO="sample_id",
+)
+
+PROFILE_PARAMETERS = dict(
+    zip(
+        ("PRES_CTD", "TEMP_CTD", "SALT_CTD", "DOXY_CTD", "CHLFLUO_CTD"),
+        synthetic.CNV_COLUMNS,
+    )
+)
+
+DELIVERY_NOTE_KEYS = dict(
+    MYEAR="provtagningsår",
+    DTYPE="datatyp",
+    FORMAT="format",
+    RLABO="rapporterande institut",
+    ORDERER="beställare",
+    PROJ="projekt",
+    STATUS="status",
+    COMNT="kommentarer",
+)
+
+DATA_TYPES = {
+    "Phytoplankton": "phytoplankton",
+    "Physical and Chemical": "physicalchemical",
+    "PhysicalChemical": "physicalchemical",
+}
+
+WORKFLOW_OPERATORS = (
+    "PolarsStripAllValues",
+    "PolarsAddDatetime",
+    "PolarsAddVisitKey",
+    "PolarsAddSharkSampleMd5",
+    "PolarsAddSamplePositionSweref99tm",
+    "PolarsAddDyntaxaScientificName",
+    "PolarsAddDyntaxaId",
+    "PolarsAddWormsScientificName",
+    "PolarsAddWormsAphiaId",
+    "PolarsAddBvolScientificNameOriginal",
+    "PolarsAddBvolScientificNameAndSizeClass",
+    "PolarsAddBvolRefList",
+    "PolarsSetTrophicTypeSMHI",
+    "AddRedList",
+    "ValidateDuplicatedRows",
+    "ValidateDateAndTime",
+    "ValidateCommonValuesByVisit",
+)
+
+WORKFLOW_EXPORTERS = (dict(name="PolarsSHARKdataTxt", encoding="utf8"),)
+
+
+def _get_level(column: str) -> str:
+    if column.startswith(_VISIT_PREFIXES):
+        return "visit"
+    if column.startswith(_SAMPLE_PREFIXES):
+        return "sample"
+    return "variable"
+
+
+def _write_table(path: pathlib.Path, rows: list[list[str]], encoding: str) -> None:
+    with open(path, "w", encoding=encoding) as fid:
+        fid.write("\n".join("\t".join(row) for row in rows))
+
+
+def _write_yaml(path: pathlib.Path, data: dict) -> None:
+    with open(path, "w", encoding="utf8") as fid:
+        yaml.safe_dump(data, fid, allow_unicode=True, sort_keys=False)
+
+
+def _write_import_matrices(directory: pathlib.Path) -> None:
+    columns = synthetic.get_rows(1).columns
+    _write_table(
+        directory / "import_matrix_phytoplankton.txt",
+        [
+            ["internal_key", synthetic.IMPORT_MATRIX_KEY],
+            *[[f"{_get_level(col)}.{col}", col] for col in columns],
+        ],
+        encoding="iso_8859_1",
+    )
+    _write_table(
+        directory / "import_matrix_physicalchemical.txt",
+        [
+            ["internal_key", "LIMS", synthetic.IMPORT_MATRIX_KEY],
+            *[
+                [f"{_get_level(col)}.{col}", external, col]
+                for external, col in LIMS_COLUMNS.items()
+            ],
+            *[
+                [f"variable.{par}", par, par]
+                for par in (*synthetic.LIMS_PARAMETERS, *PROFILE_PARAMETERS)
+            ],
+        ],
+        encoding="iso_8859_1",
+    )
+
+
+def _write_mappings(directory: pathlib.Path) -> None:
+    _write_table(
+        directory / "delivery_note_mapping.txt",
+        [
+            ["short_key", "synonyms"],
+            *[[key, synonym] for key, synonym in DELIVERY_NOTE_KEYS.items()],
+        ],
+        encoding="cp1252",
+    )
+    _write_yaml(directory / "data_type_mapping.yaml", DATA_TYPES)
+    _write_yaml(directory / "mapper_data_type_to_internal.yaml", DATA_TYPES)
+    with open(directory / "profile_mapping.json", "w", encoding="utf8") as fid:
+        json.dump(
+            dict(
+                mapping_parameter={
+                    short: [name] for short, name in PROFILE_PARAMETERS.items()
+                }
+            ),
+            fid,
+            indent=2,
+        )
+    columns = synthetic.get_rows(1).columns
+    _write_table(
+        directory / "column_views.txt",
+        [["sharkweb_all", "sharkdata_phytoplankton"], *[[col, col] for col in columns]],
+        encoding="cp1252",
+    )
+
+
+def _write_reference_lists(directory: pathlib.Path) -> None:
+    _write_table(
+        directory / "trophictype_smhi.txt",
+        [
+            ["scientific_name", "size_class", "trophic_type"],
+            *[
+                [name, str(size_class), ("AU", "HT", "MX")[nr % 3]]
+                for nr, name in enumerate(nodc_stubs.get_taxa())
+                for size_class in range(1, synthetic.NR_SIZE_CLASSES + 1)
+            ],
+        ],
+        encoding="cp1252",
+    )
+    _write_table(
+        directory / "translate_codes_NEW.txt",
+        [
+            ["field", "code", "swedish_name", "english_name"],
+            ["size_class_ref_list_code", "BVOL_NOMP_2024", "BVOL_NOMP_2024", ""],
+            ["species_flag_code", "SP", "Species", "Species"],
+        ],
+        encoding="cp1252",
+    )
+    _write_yaml(
+        directory / "mandatory_columns.yaml",
+        dict(
+            general=["visit_date", "station_name", "sample_depth_m"],
+            phytoplankton=["scientific_name", "parameter", "value", "unit"],
+        ),
+    )
+    _write_yaml(
+        directory / "delivery_note_status.yaml",
+        dict(
+            deliverer=dict(check_status_sv="Ej kontrollerad", data_checked_by_sv="-"),
+            deliverer_and_datahost=dict(
+                check_status_sv="Klar", data_checked_by_sv="Leverantör och Datavärd"
+            ),
+        ),
+    )
+    ids = directory / "ids"
+    ids.mkdir(exist_ok=True)
+    _write_yaml(
+        ids / "id_phytoplankton.yaml",
+        dict(
+            data_type="phytoplankton",
+            levels=dict(
+                visit=dict(columns=["visit_date", "station_name"]),
+                sample=dict(columns=["visit_date", "station_name", "sample_depth_m"]),
+            ),
+        ),
+    )
+
+
+def _write_workflow(directory: pathlib.Path) -> None:
+    workflow = directory / "workflow"
+    workflow.mkdir(exist_ok=True)
+    _write_yaml(
+        workflow / "workflow_dv.yaml",
+        dict(
+            workflow_config=dict(save_config=False),
+            adm_logger_config=dict(reset_before_workflow=True),
+            operators=[dict(name=name) for name in WORKFLOW_OPERATORS],
+            exporters=list(WORKFLOW_EXPORTERS),
+        ),
+    )
+
+
+def write_nodc_config(directory: str | pathlib.Path) -> pathlib.Path:
+    """Writes the config files to directory (created if missing) and returns it"""
+    directory = pathlib.Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    _write_import_matrices(directory)
+    _write_mappings(directory)
+    _write_reference_lists(directory)
+    _write_workflow(directory)
+    return directory
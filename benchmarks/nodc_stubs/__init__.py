@@ -0,0 +1,49 @@
+"""Stand-ins for the nodc_* packages used when they are not installed.
+
+The stubs answer from the names, codes and stations generated by
+benchmarks.synthetic so that operators depending on the packages do their work
+(lookups, joins and column updates) instead of logging that the package is
+missing. Lookups are dictionary based and cheap, so timings of the operators
+using them measure sharkadm and not the reference lists.
+
+Use install to register stubs for the packages that are not installed.
+"""
+
+import importlib
+import importlib.util
+import re
+import sys
+
+from benchmarks import synthetic
+
+STUB_PACKAGES = ("nodc_bvol", "nodc_codes", "nodc_dyntaxa", "nodc_worms")
+
+# Number of taxa known to the stubs. synthetic.get_rows uses fewer by default
+NR_TAXA = 1000
+
+_TAXON_PATTERN = re.compile(r"^Genus\d{3} species(\d{4})$")
+
+
+def get_taxon_nr(name: str) -> int | None:
+    """Returns the number of a synthetic taxon. Returns None if name is not a
+    synthetic taxon"""
+    match = _TAXON_PATTERN.match(str(name).strip())
+    if not match or int(match.group(1)) >= NR_TAXA:
+        return None
+    return int(match.group(1))
+
+
+def get_taxa() -> list[str]:
+    return synthetic.get_taxa(NR_TAXA)
+
+
+def install(names: tuple[str, ...] | list[str] = STUB_PACKAGES) -> list[str]:
+    """Registers stubs for the packages in names that are not installed. Must be
+    called before sharkadm is imported. Returns the names of the stubbed packages"""
+    stubbed = []
+    for name in names:
+        if name in sys.modules or importlib.util.find_spec(name) is not None:
+            continue
+        sys.modules[name] = importlib.import_module(f"{__name__}.{name}")
+        stubbed.append(name)
+    return stubbed
@@ -0,0 +1,68 @@
+"""Stub of nodc_bvol. Every synthetic taxon has all synthetic size classes in the
+BVOL_NOMP list"""
+
+from benchmarks.nodc_stubs import get_taxa
+from benchmarks.nodc_stubs.nodc_worms import APHIA_ID_OFFSET
+from benchmarks.synthetic import NR_SIZE_CLASSES
+
+REF_LIST = "BVOL_NOMP_2024"
+
+
+def _get_name_and_size(name: str, size_class: int) -> str:
+    return f"{name}:{size_class}"
+
+
+class TranslateBvolName:
+    def get_scientific_name_from_to_mapper(self) -> dict[str, str]:
+        return {}
+
+
+class BvolNomp:
+    def get_species_to_aphia_id_mapper(self) -> dict[str, str]:
+        return {name: str(APHIA_ID_OFFSET + nr) for nr, name in enumerate(get_taxa())}
+
+    def get_species_and_size_class_to_ref_list_mapper(self) -> dict[str, str]:
+        return {
+            _get_name_and_size(name, size_class): REF_LIST
+            for name in get_taxa()
+            for size_class in range(1, NR_SIZE_CLASSES + 1)
+        }
+
+    def get_species_and_size_class_to_aphia_id_mapper(self) -> dict[str, str]:
+        return {
+            _get_name_and_size(name, size_class): str(APHIA_ID_OFFSET + nr)
+            for nr, name in enumerate(get_taxa())
+            for size_class in range(1, NR_SIZE_CLASSES + 1)
+        }
+
+    def get_calculated_volume_mapper(self) -> dict[str, str]:
+        """Cell volume (um3) by aphia id and size class"""
+        return {
+            _get_name_and_size(str(APHIA_ID_OFFSET + nr), size_class): str(
+                100 * size_class
+            )
+            for nr in range(len(get_taxa()))
+            for size_class in range(1, NR_SIZE_CLASSES + 1)
+        }
+
+    def get_carbon_per_volume_mapper(self) -> dict[str, str]:
+        """Carbon per counted unit by aphia id and size class"""
+        return {
+            _get_name_and_size(str(APHIA_ID_OFFSET + nr), size_class): str(
+                15 * size_class
+            )
+            for nr in range(len(get_taxa()))
+            for size_class in range(1, NR_SIZE_CLASSES + 1)
+        }
+
+
+def get_translate_bvol_name_object() -> TranslateBvolName:
+    return TranslateBvolName()
+
+
+def get_translate_bvol_name_size_object() -> TranslateBvolName:
+    return TranslateBvolName()
+
+
+def get_bvol_nomp_object() -> BvolNomp:
+    return BvolNomp()
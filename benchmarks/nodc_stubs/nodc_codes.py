@@ -0,0 +1,31 @@
+"""Stub of nodc_codes with the codes used in the synthetic delivery notes"""
+
+_CODES = {
+    "LABO": {
+        "SMHI": dict(
+            swedish_name="Sveriges meteorologiska och hydrologiska institut",
+            english_name="Swedish Meteorological and Hydrological Institute",
+        ),
+    },
+    "project": {
+        "NATIONAL": dict(
+            swedish_name="Nationell miljöövervakning",
+            english_name="National environmental monitoring",
+        ),
+    },
+    "SHIPC": {
+        "77SE": dict(swedish_name="Svea", english_name="Svea"),
+    },
+}
+
+
+class TranslateCodes:
+    def get_info(self, field: str, code: str) -> dict | None:
+        info = _CODES.get(field, {}).get(str(code).strip().upper())
+        if not info:
+            return None
+        return dict(field=field, code=code, **info)
+
+
+def get_translate_codes_object() -> TranslateCodes:
+    return TranslateCodes()
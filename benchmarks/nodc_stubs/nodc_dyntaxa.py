@@ -0,0 +1,72 @@
+"""Stub of nodc_dyntaxa. All synthetic taxa are accepted names in dyntaxa and
+every tenth taxon is red listed"""
+
+from benchmarks.nodc_stubs import get_taxa, get_taxon_nr
+
+DYNTAXA_ID_OFFSET = 200000
+
+
+def _get_dyntaxa_id(name: str) -> str | None:
+    nr = get_taxon_nr(name)
+    if nr is None:
+        return None
+    return str(DYNTAXA_ID_OFFSET + nr)
+
+
+class TranslateDyntaxa:
+    source = "nodc_dyntaxa stub"
+
+    def get(self, name: str) -> str | None:
+        if get_taxon_nr(name) is None:
+            return None
+        return str(name).strip()
+
+    def get_dyntaxa_id(self, name: str) -> str | None:
+        return _get_dyntaxa_id(name)
+
+
+class DyntaxaTaxon:
+    def get(self, name: str) -> str | None:
+        return _get_dyntaxa_id(name)
+
+    def get_name_list(self) -> list[str]:
+        return get_taxa()
+
+    def get_info(self, scientificName: str = "", **kwargs) -> list[dict]:
+        if get_taxon_nr(scientificName) is None:
+            return []
+        genus = scientificName.split()[0]
+        return [
+            dict(
+                scientificName=scientificName,
+                taxonomicStatus="accepted",
+                kingdom="Chromista",
+                phylum="Myzozoa",
+                class_="Dinophyceae",
+                order="Peridiniales",
+                family="Peridiniaceae",
+                genus=genus,
+                species=scientificName,
+                taxon_hierarchy=f"Chromista - Myzozoa - {genus} - {scientificName}",
+            )
+        ]
+
+
+class RedList:
+    def get_info(self, name: str) -> dict | None:
+        nr = get_taxon_nr(name)
+        if nr is None or nr % 10:
+            return None
+        return dict(scientific_name=name, category="NT")
+
+
+def get_translate_dyntaxa_object() -> TranslateDyntaxa:
+    return TranslateDyntaxa()
+
+
+def get_dyntaxa_taxon_object() -> DyntaxaTaxon:
+    return DyntaxaTaxon()
+
+
+def get_red_list_object() -> RedList:
+    return RedList()
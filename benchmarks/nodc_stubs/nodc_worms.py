@@ -0,0 +1,30 @@
+"""Stub of nodc_worms. All synthetic taxa are accepted names in WoRMS"""
+
+from benchmarks.nodc_stubs import get_taxon_nr
+
+APHIA_ID_OFFSET = 100000
+
+
+class TranslateWorms:
+    source = "nodc_worms stub"
+
+    def get(self, name: str) -> str | None:
+        if get_taxon_nr(name) is None:
+            return None
+        return str(name).strip()
+
+
+class TaxaWorms:
+    def get_aphia_id(self, name: str) -> str | None:
+        nr = get_taxon_nr(name)
+        if nr is None:
+            return None
+        return str(APHIA_ID_OFFSET + nr)
+
+
+def get_translate_worms_object() -> TranslateWorms:
+    return TranslateWorms()
+
+
+def get_taxa_worms_object() -> TaxaWorms:
+    return TaxaWorms()
@@ -0,0 +1,94 @@
+"""Time and memory measurement of a single benchmark case.
+
+Peak memory is measured in two ways. tracemalloc gives the peak of memory
+allocated by Python. Memory allocated by polars (Rust) is not seen by
+tracemalloc, so the resident set size (RSS) of the process is also sampled in a
+background thread. RSS is read from psutil if installed, else from /proc.
+"""
+
+import os
+import pathlib
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+_MB = 1024 * 1024
+_PROC_STATM = pathlib.Path("/proc/self/statm")
+
+
+def get_rss_bytes() -> int | None:
+    """Returns the current resident set size of the process. Returns None if it
+    can not be read on this platform"""
+    if psutil:
+        return psutil.Process(os.getpid()).memory_info().rss
+    if _PROC_STATM.exists():
+        pages = int(_PROC_STATM.read_text().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE")
+    return None
+
+
+class _RssSampler(threading.Thread):
+    def __init__(self, interval: float):
+        super().__init__(daemon=True)
+        self._interval = interval
+        self._stop_event = threading.Event()
+        self.start_rss = get_rss_bytes()
+        self.peak_rss = self.start_rss
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self._interval):
+            self._sample()
+
+    def _sample(self) -> None:
+        rss = get_rss_bytes()
+        if rss is not None:
+            self.peak_rss = max(self.peak_rss, rss)
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+        self._sample()
+
+
+def measure(
+    func: Callable[[], Any], trace_python_memory: bool = True, interval: float = 0.01
+) -> dict[str, float | str | None]:
+    """Runs func and returns elapsed seconds and peak memory. Exceptions in func
+    are caught and returned as status error"""
+    sampler = _RssSampler(interval)
+    if trace_python_memory:
+        tracemalloc.start()
+    sampler.start()
+    status = "ok"
+    error = ""
+    t0 = time.perf_counter()
+    try:
+        func()
+    except Exception as e:
+        status = "error"
+        error = f"{e.__class__.__name__}: {e}"
+    seconds = time.perf_counter() - t0
+    sampler.stop()
+    peak_python = None
+    if trace_python_memory:
+        peak_python = tracemalloc.get_traced_memory()[1] / _MB
+        tracemalloc.stop()
+    peak_rss_increase = None
+    if sampler.start_rss is not None:
+        peak_rss_increase = (sampler.peak_rss - sampler.start_rss) / _MB
+    return dict(
+        status=status,
+        error=error,
+        seconds=round(seconds, 4),
+        peak_python_memory_mb=None if peak_python is None else round(peak_python, 2),
+        peak_rss_increase_mb=(
+            None if peak_rss_increase is None else round(peak_rss_increase, 2)
+        ),
+    )
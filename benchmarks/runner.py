@@ -0,0 +1,216 @@
+"""Runs benchmark cases at several scales and stores the results as json.
+
+Result file layout:
+
+    {
+        "meta": {"sharkadm_version": ..., "polars_version": ..., ...},
+        "results": [
+            {"case": ..., "group": ..., "nr_rows": ..., "status": "ok",
+             "seconds": ..., "peak_python_memory_mb": ...,
+             "peak_rss_increase_mb": ..., "error": ""},
+            ...
+        ]
+    }
+
+Results from two files (for example two SHARKadm versions) are compared with
+compare_results.
+
+benchmarks.environment.activate must be called before this module is imported.
+Taxonomy tables compiled from the nodc_* stubs are kept in a temporary directory
+and not in the taxonomy cache of the user.
+"""
+
+import contextlib
+import datetime
+import gc
+import importlib.metadata
+import importlib.util
+import json
+import pathlib
+import platform
+import subprocess
+import tempfile
+
+import polars as pl
+
+from benchmarks import environment
+from benchmarks.cases import BenchmarkCase, get_cases
+from benchmarks.profiling import measure
+from sharkadm import taxonomy_store
+
+DEFAULT_SCALES = (1_000, 10_000, 100_000)
+
+DEFAULT_RESULTS_DIRECTORY = pathlib.Path(__file__).parent / "results"
+
+NODC_PACKAGES = (
+    "nodc_bvol",
+    "nodc_codes",
+    "nodc_dyntaxa",
+    "nodc_geography",
+    "nodc_occurrence_id",
+    "nodc_station",
+    "nodc_worms",
+)
+
+
+def get_sharkadm_version() -> str:
+    try:
+        return importlib.metadata.version("sharkadm")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def get_git_commit() -> str:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=pathlib.Path(__file__).parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+    return result.stdout.strip()
+
+
+def get_meta(seed: int) -> dict:
+    return dict(
+        sharkadm_version=get_sharkadm_version(),
+        git_commit=get_git_commit(),
+        polars_version=pl.__version__,
+        python_version=platform.python_version(),
+        platform=platform.platform(),
+        created=datetime.datetime.now().isoformat(timespec="seconds"),
+        seed=seed,
+        nodc_packages={
+            name: name not in environment.STUBBED_PACKAGES
+            and importlib.util.find_spec(name) is not None
+            for name in NODC_PACKAGES
+        },
+        **environment.get_meta(),
+    )
+
+
+@contextlib.contextmanager
+def _stub_taxonomy_store():
+    if not environment.STUBBED_PACKAGES:
+        yield
+        return
+    old_store = taxonomy_store.get_store()
+    with tempfile.TemporaryDirectory() as directory:
+        taxonomy_store.set_store(taxonomy_store.TaxonomyStore(directory))
+        try:
+            yield
+        finally:
+            taxonomy_store.set_store(old_store)
+
+
+def run_case(case: BenchmarkCase, nr_rows: int, seed: int = 0, repeat: int = 1) -> dict:
+    """Runs case repeat times on fresh input and returns the fastest run"""
+    runs = []
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as directory:
+            try:
+                prepared = case.prepare(nr_rows, pathlib.Path(directory), seed)
+            except Exception as e:
+                return dict(
+                    case=case.name,
+                    group=case.group,
+                    nr_rows=nr_rows,
+                    status="error",
+                    error=f"Prepare failed: {e.__class__.__name__}: {e}",
+                    seconds=None,
+                    peak_python_memory_mb=None,
+                    peak_rss_increase_mb=None,
+                )
+            gc.collect()
+            runs.append(measure(lambda: case.run(prepared)))
+        if runs[-1]["status"] != "ok":
+            break
+    result = min(runs, key=lambda run: run["seconds"])
+    return dict(case=case.name, group=case.group, nr_rows=nr_rows, **result)
+
+
+def run_benchmarks(
+    case_names: list[str] | None = None,
+    scales: tuple[int, ...] | list[int] = DEFAULT_SCALES,
+    seed: int = 0,
+    repeat: int = 1,
+    verbose: bool = True,
+) -> dict:
+    results = []
+    with _stub_taxonomy_store():
+        for case in get_cases(case_names):
+            for nr_rows in scales:
+                result = run_case(case, nr_rows, seed=seed, repeat=repeat)
+                results.append(result)
+                if verbose:
+                    print(_get_result_line(result))
+    return dict(meta=get_meta(seed), results=results)
+
+
+def _get_result_line(result: dict) -> str:
+    line = (
+        f"{result['case']:<40}{result['nr_rows']:>10} rows  "
+        f"{result['seconds'] or 0:>9.3f} s  "
+        f"{result['peak_python_memory_mb'] or 0:>9.1f} MB (python)  "
+        f"{result['peak_rss_increase_mb'] or 0:>9.1f} MB (rss)"
+    )
+    if result["status"] != "ok":
+        line = f"{line}  {result['status'].upper()}: {result['error']}"
+    return line
+
+
+def get_default_results_path(meta: dict) -> pathlib.Path:
+    version = meta["sharkadm_version"]
+    if meta["git_commit"]:
+        version = f"{version}_{meta['git_commit']}"
+    time_str = meta["created"].replace(":", "").replace("-", "")
+    return DEFAULT_RESULTS_DIRECTORY / f"benchmark_{version}_{time_str}.json"
+
+
+def save_results(results: dict, path: str | pathlib.Path | None = None) -> pathlib.Path:
+    path = pathlib.Path(path or get_default_results_path(results["meta"]))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as fid:
+        json.dump(results, fid, indent=2)
+    return path
+
+
+def load_results(path: str | pathlib.Path) -> dict:
+    with open(path, encoding="utf-8") as fid:
+        return json.load(fid)
+
+
+def compare_results(
+    old: dict, new: dict, threshold: float = 0.2
+) -> tuple[list[str], list[dict]]:
+    """Compares seconds and peak memory for cases found in both results. Returns
+    report lines and the comparisons where new is more than threshold (fraction)
+    slower or uses more memory"""
+    old_results = {(res["case"], res["nr_rows"]): res for res in old["results"]}
+    lines = [
+        f"Old: {old['meta']['sharkadm_version']} {old['meta']['git_commit']} "
+        f"({old['meta']['created']})",
+        f"New: {new['meta']['sharkadm_version']} {new['meta']['git_commit']} "
+        f"({new['meta']['created']})",
+        "",
+    ]
+    regressions = []
+    for res in new["results"]:
+        old_res = old_results.get((res["case"], res["nr_rows"]))
+        if not old_res or old_res["status"] != "ok" or res["status"] != "ok":
+            continue
+        ratios = {
+            key: res[key] / old_res[key]
+            for key in ("seconds", "peak_python_memory_mb", "peak_rss_increase_mb")
+            if old_res[key] and res[key] is not None
+        }
+        lines.append(
+            f"{res['case']:<40}{res['nr_rows']:>10} rows  "
+            + "  ".join(f"{key}: {ratio:.2f}x" for key, ratio in ratios.items())
+        )
+        if any(ratio > 1 + threshold for ratio in ratios.values()):
+            regressions.append(dict(case=res["case"], nr_rows=res["nr_rows"], **ratios))
+    return lines, regressions
@@ -0,0 +1,345 @@
+"""Deterministic generator of synthetic SHARK data.
+
+All data is generated from a seed so that the same arguments always give the same
+rows. Rows are built from a number of stations, taxa and parameters. Each visit is
+a station on a date. Each visit has a number of depths and each depth has one row
+per taxon and parameter combination drawn for the visit.
+
+The writers put the data in the file structures recognised by
+sharkadm.data.get_polars_data_holder: archive directory, zip archive, LIMS
+directory, CNV profile directory and DV template (xlsx).
+"""
+
+import datetime
+import pathlib
+import zipfile
+
+import numpy as np
+import polars as pl
+import xlsxwriter
+
+PARAMETERS = (
+    ("Abundance", "ind/l"),
+    ("Biovolume concentration", "mm3/l"),
+    ("Carbon concentration", "ugC/l"),
+    ("Temperature", "C"),
+    ("Salinity", "psu"),
+    ("Oxygen", "ml/l"),
+    ("Phosphate", "umol/l"),
+    ("Nitrate", "umol/l"),
+)
+
+LIMS_PARAMETERS = ("TEMP_BTL", "SALT_BTL", "DOXY_BTL", "PHOS", "NTRA", "SIOH", "CPHL")
+
+QUALITY_FLAGS = ("", "", "", "", "B", "S", "<")
+
+CNV_COLUMNS = (
+    "prDM: Pressure, Digiquartz [db]",
+    "t090C: Temperature [ITS-90, deg C]",
+    "sal00: Salinity, Practical [PSU]",
+    "sbeox0ML/L: Oxygen, SBE 43 [ml/l]",
+    "flECO-AFL: Fluorescence, WET Labs ECO-AFL/FL [mg/m^3]",
+)
+
+NR_SIZE_CLASSES = 3
+
+# Column in the import matrix used for the synthetic deliveries
+IMPORT_MATRIX_KEY = "SYNTHETIC"
+
+_START_DATE = datetime.date(2020, 1, 1)
+
+
+def get_station_names(nr_stations: int) -> list[str]:
+    return [f"STATION {nr:04d}" for nr in range(1, nr_stations + 1)]
+
+
+def get_taxa(nr_taxa: int) -> list[str]:
+    return [f"Genus{nr // 10:03d} species{nr:04d}" for nr in range(nr_taxa)]
+
+
+def get_parameters(nr_parameters: int) -> list[tuple[str, str]]:
+    """Returns (parameter, unit). Parameter names are numbered if nr_parameters
+    exceeds the number of predefined parameters"""
+    parameters = list(PARAMETERS[:nr_parameters])
+    for nr in range(len(PARAMETERS), nr_parameters):
+        parameters.append((f"Parameter {nr}", "unit"))
+    return parameters
+
+
+def get_rows(
+    nr_rows: int,
+    nr_stations: int = 20,
+    nr_taxa: int = 50,
+    nr_parameters: int = 3,
+    seed: int = 0,
+    data_type: str = "Phytoplankton",
+) -> pl.DataFrame:
+    """Returns nr_rows of synthetic data in row format with internal column names.
+    All values are strings"""
+    rng = np.random.default_rng(seed)
+    stations = get_station_names(nr_stations)
+    taxa = get_taxa(nr_taxa)
+    parameters = get_parameters(nr_parameters)
+
+    station_lat = rng.uniform(55.0, 65.5, nr_stations).round(5)
+    station_lon = rng.uniform(11.0, 23.5, nr_stations).round(5)
+
+    # About 50 rows per visit gives realistic group sizes
+    nr_visits = max(1, nr_rows // 50)
+    visit_station = rng.integers(0, nr_stations, nr_visits)
+    visit_day = rng.integers(0, 3 * 365, nr_visits)
+    visit_minute = rng.integers(6 * 60, 18 * 60, nr_visits)
+
+    row_visit = np.sort(rng.integers(0, nr_visits, nr_rows))
+    row_depth = rng.choice(np.array([0, 2, 5, 10, 20]), nr_rows)
+    row_taxon = rng.integers(0, nr_taxa, nr_rows)
+    row_parameter = rng.integers(0, len(parameters), nr_rows)
+    row_value = rng.lognormal(1.0, 1.5, nr_rows).round(3)
+    row_flag = rng.integers(0, len(QUALITY_FLAGS), nr_rows)
+    row_size_class = rng.integers(1, NR_SIZE_CLASSES + 1, nr_rows)
+
+    station_idx = visit_station[row_visit]
+    dates = [
+        (_START_DATE + datetime.timedelta(days=int(day))).strftime("%Y-%m-%d")
+        for day in range(3 * 365)
+    ]
+    df = pl.DataFrame(
+        {
+            "visit_id": row_visit,
+            "station_idx": station_idx,
+            "day": visit_day[row_visit],
+            "minute": visit_minute[row_visit],
+            "sample_depth_m": row_depth,
+            "taxon_idx": row_taxon,
+            "parameter_idx": row_parameter,
+            "value": row_value,
+            "flag_idx": row_flag,
+            "size_class": row_size_class,
+        }
+    )
+    df = df.with_columns(
+        pl.col("day").replace_strict(range(len(dates)), dates).alias("visit_date"),
+        pl.format(
+            "{}:{}",
+            (pl.col("minute") // 60).cast(pl.String).str.zfill(2),
+            (pl.col("minute") % 60).cast(pl.String).str.zfill(2),
+        ).alias("sample_time"),
+        pl.col("station_idx")
+        .replace_strict(range(nr_stations), stations)
+        .alias("station_name"),
+        pl.col("station_idx")
+        .replace_strict(range(nr_stations), station_lat)
+        .cast(pl.String)
+        .alias("sample_latitude_dd"),
+        pl.col("station_idx")
+        .replace_strict(range(nr_stations), station_lon)
+        .cast(pl.String)
+        .alias("sample_longitude_dd"),
+        pl.col("taxon_idx").replace_strict(range(nr_taxa), taxa).alias("scientific_name"),
+        pl.col("parameter_idx")
+        .replace_strict(range(len(parameters)), [par for par, _ in parameters])
+        .alias("parameter"),
+        pl.col("parameter_idx")
+        .replace_strict(range(len(parameters)), [unit for _, unit in parameters])
+        .alias("unit"),
+        pl.col("flag_idx")
+        .replace_strict(range(len(QUALITY_FLAGS)), QUALITY_FLAGS)
+        .alias("quality_flag"),
+    )
+    return df.select(
+        pl.col("visit_date").str.slice(0, 4).alias("visit_year"),
+        "visit_date",
+        pl.col("visit_date").alias("sample_date"),
+        "sample_time",
+        pl.col("visit_date").alias("reported_visit_date"),
+        pl.col("sample_time").alias("reported_sample_time"),
+        pl.lit("77SE").alias("platform_code"),
+        pl.col("station_name").alias("reported_station_name"),
+        "station_name",
+        pl.col("sample_latitude_dd").alias("reported_latitude"),
+        pl.col("sample_longitude_dd").alias("reported_longitude"),
+        "sample_latitude_dd",
+        "sample_longitude_dd",
+        pl.col("sample_depth_m").cast(pl.String),
+        pl.format("{}-{}", "visit_id", "sample_depth_m").alias("sample_id"),
+        pl.col("scientific_name").alias("reported_scientific_name"),
+        "scientific_name",
+        pl.col("scientific_name").alias("dyntaxa_scientific_name"),
+        pl.col("size_class").cast(pl.String),
+        "parameter",
+        pl.col("value").cast(pl.String),
+        "unit",
+        "quality_flag",
+        pl.lit(data_type).alias("delivery_datatype"),
+    )
+
+
+def get_delivery_note_lines(data_type: str, data_format: str, year: str) -> list[str]:
+    return [
+        f"MYEAR: {year}",
+        f"DTYPE: {data_type}",
+        f"FORMAT: {data_format}",
+        "RLABO: SMHI",
+        "ORDERER: SMHI",
+        "PROJ: NATIONAL",
+        "STATUS: Synthetic",
+        "COMNT: Synthetic data for benchmarks",
+    ]
+
+
+def _get_data_format(data_type: str) -> str:
+    return f"{data_type}:{IMPORT_MATRIX_KEY}"
+
+
+def _write_txt(df: pl.DataFrame, path: pathlib.Path) -> None:
+    df.write_csv(path, separator="\t")
+
+
+def _write_lines(lines: list[str], path: pathlib.Path) -> None:
+    with open(path, "w", encoding="cp1252") as fid:
+        fid.write("\n".join(lines))
+
+
+def write_archive(
+    directory: str | pathlib.Path, df: pl.DataFrame, name: str = "SHARK_Synthetic"
+) -> pathlib.Path:
+    """Writes df as an archive directory and returns the archive root"""
+    root = pathlib.Path(directory) / name
+    processed = root / "processed_data"
+    processed.mkdir(parents=True, exist_ok=True)
+    (root / "received_data").mkdir(exist_ok=True)
+    data_type = df["delivery_datatype"][0]
+    _write_txt(df, processed / "data.txt")
+    _write_lines(
+        get_delivery_note_lines(
+            data_type, _get_data_format(data_type), df["visit_year"].min()
+        ),
+        processed / "delivery_note.txt",
+    )
+    return root
+
+
+def write_zip_archive(
+    directory: str | pathlib.Path, df: pl.DataFrame, name: str | None = None
+) -> pathlib.Path:
+    """Writes df as a SHARK zip package and returns the path to the zip file. The
+    data type is read from the default name (SHARK_<data type>_Synthetic)"""
+    data_type = df["delivery_datatype"][0]
+    name = name or f"SHARK_{data_type}_Synthetic"
+    path = pathlib.Path(directory) / f"{name}.zip"
+    delivery_note = get_delivery_note_lines(
+        data_type, _get_data_format(data_type), df["visit_year"].min()
+    )
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("shark_data.txt", df.write_csv(separator="\t"))
+        zf.writestr("processed_data/data.txt", df.write_csv(separator="\t"))
+        zf.writestr(
+            "processed_data/delivery_note.txt",
+            "\n".join(delivery_note).encode("cp1252"),
+        )
+    return path
+
+
+def write_lims(
+    directory: str | pathlib.Path, df: pl.DataFrame, name: str = "LIMS_Synthetic"
+) -> pathlib.Path:
+    """Writes the samples in df as a LIMS export (one column and one quality flag
+    column per parameter). Returns the LIMS root directory"""
+    root = pathlib.Path(directory) / name
+    raw_data = root / "Raw_data"
+    raw_data.mkdir(parents=True, exist_ok=True)
+    samples = df.unique("sample_id", maintain_order=True)
+    value = pl.col("value").cast(pl.Float64)
+    lims = samples.select(
+        pl.col("platform_code").alias("SHIPC"),
+        pl.col("visit_year").alias("MYEAR"),
+        pl.col("station_name").alias("STATN"),
+        pl.col("sample_date").alias("SDATE"),
+        pl.col("sample_time").alias("STIME"),
+        pl.col("sample_latitude_dd").alias("LATIT"),
+        pl.col("sample_longitude_dd").alias("LONGI"),
+        pl.col("sample_depth_m").alias("DEPH"),
+        pl.col("sample_id").alias("SMPNO"),
+        *[
+            col
+            for nr, par in enumerate(LIMS_PARAMETERS)
+            for col in [
+                (value * (nr + 1)).round(3).cast(pl.String).alias(par),
+                pl.col("quality_flag").alias(f"Q_{par}"),
+            ]
+        ],
+    )
+    _write_txt(lims, raw_data / "data.txt")
+    return root
+
+
+def write_cnv(
+    directory: str | pathlib.Path,
+    nr_profiles: int,
+    nr_scans: int,
+    seed: int = 0,
+    name: str = "CNV_Synthetic",
+) -> pathlib.Path:
+    """Writes nr_profiles Seabird cnv files with nr_scans rows each. Returns the
+    directory holding the files"""
+    root = pathlib.Path(directory) / name
+    root.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    stations = get_station_names(max(nr_profiles, 1))
+    for nr in range(nr_profiles):
+        time = datetime.datetime(2020, 1, 1, 8) + datetime.timedelta(days=nr)
+        lat = rng.uniform(55.0, 65.5)
+        lon = rng.uniform(11.0, 23.5)
+        lines = [
+            "* Sea-Bird SBE 9 Data File:",
+            f"* NMEA Latitude = {int(lat):02d} {lat % 1 * 60:05.2f} N",
+            f"* NMEA Longitude = {int(lon):03d} {lon % 1 * 60:05.2f} E",
+            f"* System UpLoad Time = {time.strftime('%b %d %Y %H:%M:%S')}",
+            f"** Station: {stations[nr]}",
+        ]
+        lines.extend(f"# name {i} = {col}" for i, col in enumerate(CNV_COLUMNS))
+        lines.append("*END*")
+        pressure = np.linspace(1.0, nr_scans / 10, nr_scans)
+        values = np.column_stack(
+            [
+                pressure,
+                rng.normal(8, 2, nr_scans),
+                rng.normal(7, 1, nr_scans),
+                rng.normal(6, 1, nr_scans),
+                rng.lognormal(0, 0.5, nr_scans),
+            ]
+        ).round(4)
+        lines.extend(" ".join(f"{value:11.4f}" for value in row) for row in values)
+        path = root / f"SBE09_1387_{time.strftime('%Y%m%d_%H%M')}_77_10_{nr:04d}.cnv"
+        _write_lines(lines, path)
+    return root
+
+
+def write_dv_template(
+    directory: str | pathlib.Path, df: pl.DataFrame, name: str = "Synthetic_DV"
+) -> pathlib.Path:
+    """Writes df as a DV template workbook (delivery note sheet and data sheet).
+    Written in constant memory mode so large scales can be generated"""
+    path = pathlib.Path(directory) / f"{name}.xlsx"
+    data_type = df["delivery_datatype"][0]
+    workbook = xlsxwriter.Workbook(str(path), {"constant_memory": True})
+    try:
+        sheet = workbook.add_worksheet("Förklaring")
+        sheet.write_row(0, 0, ["Leveransinformation"])
+        # The format in a DV template is the import matrix key
+        delivery_note = get_delivery_note_lines(
+            data_type, IMPORT_MATRIX_KEY, df["visit_year"].min()
+        )
+        for r, line in enumerate(delivery_note, start=1):
+            key, value = [item.strip() for item in line.split(":", 1)]
+            sheet.write_row(r, 0, [key, "", value])
+
+        sheet = workbook.add_worksheet("Kolumner")
+        sheet.write_row(0, 0, [f"Dataleverans {data_type}"])
+        sheet.write_row(1, 0, [""])
+        sheet.write_row(2, 0, ["Tabellhuvud:", *df.columns])
+        for r, row in enumerate(df.iter_rows(), start=3):
+            sheet.write_row(r, 0, ["", *row])
+    finally:
+        workbook.close()
+    return path
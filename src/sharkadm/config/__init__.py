@@ -9,6 +9,7 @@ from sharkadm.config.custom_id import CustomIdsHandler
 from sharkadm.config.data_type_mapper import DataTypeMapper
 from sharkadm.config.delivery_note_mapper import DeliveryNoteMapper
 from sharkadm.config.import_matrix import ImportMatrixConfig, ImportMatrixMapper
+from sharkadm.config.registry import ConfigRegistry, config_registry
 from sharkadm.config.translate_headers import TranslateHeaders
 from sharkadm.config.trophic_type_smhi import TrophicTypeSMHI
 
@@ -64,7 +65,9 @@ class DataHolderProtocol(Protocol):
 
 def get_column_views_config(path: str | pathlib.Path | None = None) -> ColumnViews:
     path = path or sharkadm_config.get_path("column_views")
-    return ColumnViews(path)
+    return config_registry.get(
+        ("column_views", str(path)), lambda: ColumnViews(path), path
+    )
 
 
 def get_translate_headers_config(
@@ -85,7 +88,10 @@ def get_import_matrix_config(data_type: str, **kwargs) -> ImportMatrixConfig | N
     path = get_import_matrix_config_paths().get(data_type)
     if not path:
         return
-    return ImportMatrixConfig(path, data_type=data_type, **kwargs)
+    key = ("import_matrix", data_type, str(path), repr(sorted(kwargs.items())))
+    return config_registry.get(
+        key, lambda: ImportMatrixConfig(path, data_type=data_type, **kwargs), path
+    )
     # for name, path in get_import_matrix_config_paths().items():
     #     if data_type == name:
     #         return ImportMatrixConfig(
@@ -116,7 +122,14 @@ def get_header_mapper_from_data_holder(
 
 def get_custom_id_handler(config_directory: str | pathlib.Path | None = None):
     config_directory = config_directory or sharkadm_config("ids")
-    return CustomIdsHandler(config_directory) if config_directory else None
+    if not config_directory:
+        return None
+    config_directory = pathlib.Path(config_directory)
+    return config_registry.get(
+        ("custom_ids", str(config_directory)),
+        lambda: CustomIdsHandler(config_directory),
+        *sorted(config_directory.iterdir()),
+    )
 
 
 def get_delivery_note_mapper(
@@ -198,6 +211,32 @@ def get_import_matrix_config_paths(
     return paths
 
 
+def preload_config() -> None:
+    """Parses all config files handled by config_registry"""
+    from sharkadm.config import translate_codes_new
+
+    for data_type in get_import_matrix_config_paths():
+        get_import_matrix_config(data_type)
+    if not sharkadm_config:
+        return
+    if sharkadm_config.get_path("column_views"):
+        get_column_views_config()
+    get_custom_id_handler()
+    translate_codes_new.get_translate_codes_new_data()
+
+
+def warm_start(snapshot_path: str | pathlib.Path | None = None) -> ConfigRegistry:
+    """Loads parsed config from a snapshot. If the snapshot is missing or any of
+    its source files have changed, config is parsed and a new snapshot is saved.
+    Config files edited after this are not read again until
+    config_registry.invalidate() is called."""
+    if config_registry.load_snapshot(snapshot_path) and len(config_registry):
+        return config_registry
+    preload_config()
+    config_registry.save_snapshot(snapshot_path)
+    return config_registry
+
+
 def get_sharkadm_config(path: pathlib.Path | str | None = None) -> Config:
     if not path:
         path = CONFIG_DIRECTORY
@@ -161,10 +161,11 @@ class ImportMatrixConfig:
                     f"Invalid import matrix key '{import_column}'. "
                     f"Did y'{suggestions[0]}'?"
                 )
-        return self._mappers.setdefault(
-            import_column,
-            ImportMatrixMapper(self.data_type, import_column, self._data[import_column]),
-        )
+        if import_column not in self._mappers:
+            self._mappers[import_column] = ImportMatrixMapper(
+                self.data_type, import_column, self._data[import_column]
+            )
+        return self._mappers[import_column]
 
     def get(self, import_column: str, external_par: str) -> str:
         """Returns the internal parameter name for the given institute and external
@@ -0,0 +1,154 @@
+import hashlib
+import pathlib
+import pickle
+import threading
+from typing import Any, Callable
+
+from sharkadm.sharkadm_logger import adm_logger
+
+SNAPSHOT_VERSION = 1
+
+RegistryKey = tuple[str, ...]
+
+
+def get_file_hash(path: str | pathlib.Path) -> str:
+    with open(path, "rb") as fid:
+        return hashlib.file_digest(fid, hashlib.sha256).hexdigest()
+
+
+def get_default_snapshot_path() -> pathlib.Path:
+    from sharkadm import utils
+
+    return utils.get_root_directory("cache") / "config_snapshot.pickle"
+
+
+class ConfigRegistry:
+    """Holds parsed config objects so that every config file is parsed once per
+    process. Each object is stored together with the sha256 hashes of the files it
+    was parsed from. The registry can be saved as a snapshot (pickle) and loaded in
+    one step by other processes. Entries in the snapshot whose source files have
+    changed are ignored and parsed again on first use. Objects already in the
+    registry are not checked against their source files, see invalidate."""
+
+    def __init__(self):
+        self._objects: dict[RegistryKey, Any] = {}
+        self._hashes: dict[RegistryKey, dict[str, str]] = {}
+        self._lock = threading.RLock()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__} with {len(self._objects)} objects"
+
+    def __contains__(self, key: RegistryKey) -> bool:
+        return key in self._objects
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    @property
+    def keys(self) -> list[RegistryKey]:
+        return list(self._objects)
+
+    def get(
+        self,
+        key: RegistryKey,
+        loader: Callable[[], Any],
+        *source_paths: str | pathlib.Path,
+    ) -> Any:
+        """Returns the object registered under key. If not present, the object is
+        created by calling loader and registered with the hashes of source_paths."""
+        with self._lock:
+            if key in self._objects:
+                return self._objects[key]
+            obj = loader()
+            self._objects[key] = obj
+            self._hashes[key] = {
+                str(path): get_file_hash(path)
+                for path in source_paths
+                if pathlib.Path(path).is_file()
+            }
+            return obj
+
+    def invalidate(self, key: RegistryKey | None = None) -> None:
+        """Clears the object registered under key. If key is None, the objects
+        whose source files have changed since they were parsed are cleared. Cleared
+        objects are parsed again on next use. Long running processes (e.g. the GUI)
+        call this to pick up edited config files."""
+        with self._lock:
+            if key is None:
+                keys = [
+                    registered_key
+                    for registered_key, hashes in self._hashes.items()
+                    if not self._hashes_are_valid(hashes)
+                ]
+            else:
+                keys = [key]
+            for registered_key in keys:
+                self._objects.pop(registered_key, None)
+                self._hashes.pop(registered_key, None)
+        if keys:
+            adm_logger.log_workflow(
+                f"Invalidated {len(keys)} config objects", level=adm_logger.DEBUG
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._objects = {}
+            self._hashes = {}
+
+    def save_snapshot(self, path: str | pathlib.Path | None = None) -> pathlib.Path:
+        path = pathlib.Path(path or get_default_snapshot_path())
+        with self._lock:
+            entries = {
+                key: (self._hashes[key], obj) for key, obj in self._objects.items()
+            }
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as fid:
+            pickle.dump(
+                dict(version=SNAPSHOT_VERSION, entries=entries),
+                fid,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        tmp_path.replace(path)
+        adm_logger.log_workflow(
+            f"Saved config snapshot with {len(entries)} objects to {path}",
+            level=adm_logger.DEBUG,
+        )
+        return path
+
+    def load_snapshot(self, path: str | pathlib.Path | None = None) -> bool:
+        """Loads valid entries from snapshot. Returns True if all entries in the
+        snapshot were valid."""
+        path = pathlib.Path(path or get_default_snapshot_path())
+        if not path.exists():
+            return False
+        try:
+            with open(path, "rb") as fid:
+                snapshot = pickle.load(fid)
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+            adm_logger.log_workflow(
+                f"Could not load config snapshot {path}: {e}", level=adm_logger.WARNING
+            )
+            return False
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            return False
+        all_valid = True
+        with self._lock:
+            for key, (hashes, obj) in snapshot["entries"].items():
+                if not self._hashes_are_valid(hashes):
+                    all_valid = False
+                    continue
+                self._objects.setdefault(key, obj)
+                self._hashes.setdefault(key, hashes)
+        return all_valid
+
+    @staticmethod
+    def _hashes_are_valid(hashes: dict[str, str]) -> bool:
+        for path, file_hash in hashes.items():
+            if not pathlib.Path(path).is_file():
+                return False
+            if get_file_hash(path) != file_hash:
+                return False
+        return True
+
+
+config_registry = ConfigRegistry()
@@ -2,10 +2,9 @@
 # that is not implemented in sharkadm yet. But we need this fil to find the list
 # of valid size_class_ref_list_code
 
-import functools
-
 import polars as pl
 
+from sharkadm.config.registry import config_registry
 from sharkadm.sharkadm_logger import adm_logger
 from sharkadm.utils import get_nodc_config_directory
 
@@ -23,11 +22,14 @@ def _file_exists() -> bool:
     return True
 
 
-@functools.cache
 def get_translate_codes_new_data() -> pl.DataFrame | None:
     if not _file_exists():
         return
-    return pl.read_csv(FILE_PATH, separator="\t", encoding="cp1252")
+    return config_registry.get(
+        ("translate_codes_new", str(FILE_PATH)),
+        lambda: pl.read_csv(FILE_PATH, separator="\t", encoding="cp1252"),
+        FILE_PATH,
+    )
 
 
 def get_valid_size_class_ref_list_codes() -> list[str]:
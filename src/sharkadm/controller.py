@@ -1,5 +1,6 @@
 import pathlib
 import re
+import tempfile
 from typing import Any, Self
 
 import polars as pl
@@ -7,13 +8,14 @@ import polars as pl
 from sharkadm import (
     event,
     exporters,
+    resource_governor,
     sharkadm_exceptions,
     transformers,
     utils,
     validators,
 )
 from sharkadm.config.data_type import DataType
-from sharkadm.data import get_polars_data_holder
+from sharkadm.data import concat_data_holders, get_polars_data_holder
 from sharkadm.data.data_holder import PolarsDataHolder
 from sharkadm.exporters import PolarsExporter
 from sharkadm.multi_transformers import PolarsMultiTransformer
@@ -75,6 +77,8 @@ class SHARKadmPolarsController:
         self._validators_before: list[Validator] = []
         self._validators_after: list[Validator] = []
         self._exporters: list[PolarsExporter] = []
+        self._chunk_rows: int | None = None
+        self._spill_to_disk: bool = False
 
         utils.clear_temp_directory(7)
         utils.clear_export_directory(7)
@@ -88,6 +92,12 @@ class SHARKadmPolarsController:
         new_controller.set_data_holder(cdh)
         return new_controller
 
+    def __radd__(self, other):
+        # Makes sum(controllers) possible
+        if other == 0:
+            return self
+        return NotImplemented
+
     @classmethod
     def get_validators(cls) -> dict[str, dict]:
         return validators.get_validators_info()
@@ -174,6 +184,16 @@ class SHARKadmPolarsController:
         self.transform(transformers.PolarsAddRowNumber())
         return self
 
+    def set_chunked_processing(
+        self, chunk_rows: int | None, spill_to_disk: bool = False
+    ) -> Self:
+        """Consecutive row local transformers are run on chunk_rows rows at a time.
+        With spill_to_disk the data is kept in temporary parquet files while the
+        chunks are processed. Set chunk_rows to None to process all rows at once."""
+        self._chunk_rows = chunk_rows
+        self._spill_to_disk = spill_to_disk
+        return self
+
     def transform(
         self,
         *transformers: PolarsTransformer | PolarsMultiTransformer,
@@ -200,48 +220,183 @@ class SHARKadmPolarsController:
         self,
         *operators: Operator,
         return_if_cause_for_termination: bool = True,
+    ) -> OperatorsInfo | Any:
+        info = self._run_operators(
+            *operators, return_if_cause_for_termination=return_if_cause_for_termination
+        )
+        # Categorical columns are kept as categorical between runs
+        self._data_holder.encode_categorical()
+        return info
+
+    def _prepare_data_holder_for_operator(self, operator: Operator) -> None:
+        # Categorical columns are decoded once, for the first operator that does not
+        # support them, and encoded again after the run (see run_operators)
+        if not operator.supports_categorical:
+            self._data_holder.decode_categorical()
+
+    def _run_operators(
+        self,
+        *operators: Operator,
+        return_if_cause_for_termination: bool = True,
     ) -> OperatorsInfo | Any:
         tot_nr_operators = len(operators)
+        governor = resource_governor.get_governor()
 
         operator_infos = OperatorsInfo()
-        for i, oper in enumerate(operators):
-            title = f"Running transformer...{oper.name}"
-            if isinstance(oper, Validator):
-                title = f"Running validator...{oper.name}"
-            if isinstance(oper, PolarsExporter):
-                title = f"Running exporter...{oper.name}"
-            event.post_event(
-                "progress",
-                dict(
-                    total=tot_nr_operators,
-                    current=i + 1,
-                    title=title,
-                ),
-            )
-            if isinstance(oper, PolarsTransformer):
-                info = oper.transform(
-                    self._data_holder,
-                    return_if_cause_for_termination=return_if_cause_for_termination,
-                )
-            elif isinstance(oper, Validator):
-                info = oper.validate(
-                    self._data_holder,
-                )
-            elif isinstance(oper, PolarsExporter):
-                info = oper.export(
-                    self._data_holder,
-                )
-                if isinstance(info, pl.DataFrame):
-                    return info
-            else:
-                raise ValueError("Invalid operator")
-            operator_infos.add(info)
-            if not operator_infos.all_succeeded and return_if_cause_for_termination:
-                operator_infos.terminated = True
-                return operator_infos
+        nr_done = 0
+        for segment in get_row_local_segments(operators):
+            chunk_rows, spill_to_disk = self._get_chunk_settings(segment)
+            if chunk_rows:
+                for oper in segment:
+                    nr_done += 1
+                    self._post_progress(oper, nr_done, tot_nr_operators)
+                with governor.track(
+                    ", ".join(oper.name for oper in segment), len(self._data_holder.data)
+                ) as usage:
+                    usage["chunk_rows"] = chunk_rows
+                    info = self._transform_in_chunks(
+                        segment,
+                        chunk_rows,
+                        spill_to_disk=spill_to_disk,
+                        return_if_cause_for_termination=return_if_cause_for_termination,
+                    )
+                operator_infos.add(info)
+                if not operator_infos.all_succeeded and return_if_cause_for_termination:
+                    operator_infos.terminated = True
+                    return operator_infos
+                continue
+            for oper in segment:
+                nr_done += 1
+                self._post_progress(oper, nr_done, tot_nr_operators)
+                self._prepare_data_holder_for_operator(oper)
+                with governor.track(oper.name, len(self._data_holder.data)):
+                    if isinstance(oper, PolarsTransformer):
+                        info = oper.transform(
+                            self._data_holder,
+                            return_if_cause_for_termination=return_if_cause_for_termination,
+                        )
+                    elif isinstance(oper, Validator):
+                        info = oper.validate(
+                            self._data_holder,
+                        )
+                    elif isinstance(oper, PolarsExporter):
+                        info = oper.export(
+                            self._data_holder,
+                        )
+                        if isinstance(info, pl.DataFrame):
+                            return info
+                    else:
+                        raise ValueError("Invalid operator")
+                operator_infos.add(info)
+                if not operator_infos.all_succeeded and return_if_cause_for_termination:
+                    operator_infos.terminated = True
+                    return operator_infos
 
         return operator_infos
 
+    @staticmethod
+    def _post_progress(operator: Operator, current: int, total: int) -> None:
+        title = f"Running transformer...{operator.name}"
+        if isinstance(operator, Validator):
+            title = f"Running validator...{operator.name}"
+        if isinstance(operator, PolarsExporter):
+            title = f"Running exporter...{operator.name}"
+        event.post_event(
+            "progress",
+            dict(
+                total=total,
+                current=current,
+                title=title,
+            ),
+        )
+
+    def _get_chunk_settings(self, segment: list[Operator]) -> tuple[int | None, bool]:
+        """Returns number of rows per chunk (None if segment is run on all data at
+        once) and if chunks are spilled to disk. Chunks are used if set with
+        set_chunked_processing or if the resource governor finds the data close to
+        the memory budget. The governor always spills to disk"""
+        if not is_chunkable(segment[0]) or self._data_holder.is_filtered:
+            return None, False
+        nr_rows = len(self._data_holder.data)
+        if self._chunk_rows:
+            if self._chunk_rows >= nr_rows:
+                return None, False
+            return self._chunk_rows, self._spill_to_disk
+        chunk_rows = resource_governor.get_governor().get_chunk_rows(
+            self._data_holder.data
+        )
+        return chunk_rows, bool(chunk_rows)
+
+    def _transform_in_chunks(
+        self,
+        segment: list[PolarsTransformer],
+        chunk_rows: int,
+        spill_to_disk: bool = False,
+        **kwargs,
+    ) -> OperatorsInfo:
+        """Runs row local transformers on chunk_rows rows at a time. All
+        transformers in segment are run on a chunk before the next chunk is
+        processed, so intermediate results are bounded by the chunk size. With
+        spill_to_disk the input and the processed chunks are kept in temporary
+        parquet files and only one chunk is held in memory until the chunks are
+        combined. If a transformer fails, the data is restored to the input of the
+        segment. The log entries of each transformer are merged over the chunks
+        (see SHARKadmLogger.log_chunk_entries) and the returned info covers all
+        chunks."""
+        adm_logger.log_workflow(
+            f"Running {', '.join(oper.name for oper in segment)} in chunks of "
+            f"{chunk_rows} rows",
+            level=adm_logger.INFO,
+        )
+        with tempfile.TemporaryDirectory(
+            dir=utils.get_temp_directory("chunks"), ignore_cleanup_errors=True
+        ) as directory:
+            directory = pathlib.Path(directory)
+            data: pl.DataFrame | pl.LazyFrame = self._data_holder.data
+            nr_rows = len(data)
+            if spill_to_disk:
+                source_path = directory / "source.parquet"
+                data.write_parquet(source_path)
+                self._data_holder.data = data.clear()
+                self._data_holder.clear_float_col_cache()
+                data = pl.scan_parquet(source_path)
+            chunks = []
+            infos: list[OperatorsInfo] = []
+            # Log entries per operator and chunk. Logged when all chunks are
+            # processed so that the log is the same as without chunks
+            chunk_entries: list[list] = [[] for _ in segment]
+            try:
+                for nr, offset in enumerate(range(0, nr_rows, chunk_rows)):
+                    chunk = data.slice(offset, chunk_rows)
+                    self._data_holder.data = (
+                        chunk.collect() if isinstance(chunk, pl.LazyFrame) else chunk
+                    )
+                    for oper, entries in zip(segment, chunk_entries):
+                        self._prepare_data_holder_for_operator(oper)
+                        with adm_logger.held_entries() as held:
+                            info = oper.transform(self._data_holder, **kwargs)
+                        entries.append(held)
+                        infos.append(info)
+                        if not info.all_succeeded:
+                            self._data_holder.data = (
+                                data.collect() if isinstance(data, pl.LazyFrame) else data
+                            )
+                            return sum(infos, OperatorsInfo())
+                    if spill_to_disk:
+                        chunk_path = directory / f"chunk_{nr:06d}.parquet"
+                        self._data_holder.data.write_parquet(chunk_path)
+                        chunks.append(pl.scan_parquet(chunk_path))
+                    else:
+                        chunks.append(self._data_holder.data)
+            finally:
+                for entries in chunk_entries:
+                    adm_logger.log_chunk_entries(entries)
+            combined = pl.concat(chunks, how="diagonal_relaxed")
+            if isinstance(combined, pl.LazyFrame):
+                combined = combined.collect()
+            self._data_holder.data = combined
+        return sum(infos, OperatorsInfo())
+
     def run_operator(
         self,
         operator: Operator,
@@ -259,6 +414,23 @@ class SHARKadmPolarsController:
         return cols
 
 
+def is_chunkable(operator: Operator) -> bool:
+    """Row local transformers can be run on chunks of rows"""
+    return isinstance(operator, PolarsTransformer) and operator.row_local
+
+
+def get_row_local_segments(operators: tuple[Operator, ...]) -> list[list[Operator]]:
+    """Groups consecutive chunkable operators in segments. Every other operator is
+    a segment of its own and marks a boundary where all data is needed."""
+    segments = []
+    for oper in operators:
+        if segments and is_chunkable(oper) and is_chunkable(segments[-1][-1]):
+            segments[-1].append(oper)
+        else:
+            segments.append([oper])
+    return segments
+
+
 def _get_name_mapper(list_to_map: list[dict]) -> dict[str, dict]:
     return_dict = dict()
     for item in list_to_map:
@@ -287,7 +459,25 @@ def _get_fixed_list(
 def get_polars_controller_with_data(
     path: pathlib.Path | str | pl.DataFrame, **kwargs
 ) -> SHARKadmPolarsController:
+    categorical_storage = kwargs.pop("categorical_storage", False)
+    categorical_columns = kwargs.pop("categorical_columns", None)
+    chunk_rows = kwargs.pop("chunk_rows", None)
+    spill_to_disk = kwargs.pop("spill_to_disk", False)
     c = SHARKadmPolarsController()
+    c.set_chunked_processing(chunk_rows, spill_to_disk=spill_to_disk)
     holder = get_polars_data_holder(path, **kwargs)
+    if categorical_storage:
+        holder.use_categorical_storage(columns=categorical_columns)
     c.set_data_holder(holder)
     return c
+
+
+def concat_controllers(
+    controllers: list[SHARKadmPolarsController], how: str = "diagonal_relaxed"
+) -> SHARKadmPolarsController:
+    """Returns a new controller with the data from all controllers concatenated in
+    one step. Prefer this over sum(controllers) when combining many datasets"""
+    cdh = concat_data_holders([c.data_holder for c in controllers], how=how)
+    new_controller = SHARKadmPolarsController()
+    new_controller.set_data_holder(cdh)
+    return new_controller
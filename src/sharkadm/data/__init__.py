@@ -10,7 +10,11 @@ from sharkadm.data.archive import (
     directory_is_archive,
     get_polars_archive_data_holder,
 )
-from sharkadm.data.data_holder import PolarsDataHolder
+from sharkadm.data.data_holder import (
+    PolarsConcatDataHolder,
+    PolarsDataHolder,
+    concat_data_holders,
+)
 from sharkadm.data.df import (
     PolarsDataFrameDataHolder,
     get_data_frame_data_holder,
@@ -36,17 +40,19 @@ from sharkadm.data.zip_archive import (
     get_polars_zip_archive_data_holder,
     path_is_zip_archive,
 )
+from sharkadm.operator_catalogue import operator_catalogue
+
+operator_catalogue.register_group("data_holders", PolarsDataHolder)
 
 
-@functools.cache
 def get_data_holder_list() -> list[str]:
     """Returns a sorted list of name of all available data_holders"""
-    return sorted(utils.get_all_class_children_names(PolarsDataHolder))
+    return sorted(get_polars_data_holders())
 
 
 def get_polars_data_holders() -> dict[str, Type[PolarsDataHolder]]:
     """Returns a dictionary with data_holders"""
-    return utils.get_all_class_children(PolarsDataHolder)
+    return operator_catalogue.get_classes("data_holders")
 
 
 def get_data_holder_object(trans_name: str, **kwargs) -> PolarsDataHolder:
@@ -65,17 +71,7 @@ def get_data_holders_description() -> dict[str, str]:
 
 
 def get_data_holders_info() -> dict:
-    result = dict()
-    for name, tran in get_polars_data_holders().items():
-        result[name] = dict()
-        result[name]["name"] = name
-        result[name]["description"] = tran.get_data_holder_description()
-        result[name]["kwargs"] = dict()
-        for key, value in inspect.signature(tran.__init__).parameters.items():
-            if key in ["self", "kwargs"]:
-                continue
-            result[name]["kwargs"][key] = value.default
-    return result
+    return operator_catalogue.get_info("data_holders")
 
 
 def get_data_holders_description_text() -> str:
@@ -131,7 +127,7 @@ def get_polars_data_holder(
                 return get_polars_profile_cnv_data_holder(path, **kwargs)
             archive_directory = directory_is_archive(path)
             if archive_directory:
-                return get_polars_archive_data_holder(archive_directory)
+                return get_polars_archive_data_holder(archive_directory, **kwargs)
         if path_has_or_is_standard_format_profile_data(path):
             return get_polars_profile_standard_format_data_holder(path, **kwargs)
         if path_has_or_is_cnv_profile_data(path):
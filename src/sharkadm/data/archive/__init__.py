@@ -34,13 +34,15 @@ polars_object_mapping = dict(
 )
 
 
-def get_polars_archive_data_holder(path: str | pathlib.Path) -> PolarsArchiveDataHolder:
+def get_polars_archive_data_holder(
+    path: str | pathlib.Path, **kwargs
+) -> PolarsArchiveDataHolder:
     path = pathlib.Path(path)
     d_note = DeliveryNote.from_txt_file(path / "processed_data/delivery_note.txt")
     d_holder = polars_object_mapping.get(d_note.data_format)
     if not d_holder:
         raise sharkadm_exceptions.ArchiveDataHolderError(d_note.data_format)
-    return d_holder(path)
+    return d_holder(path, **kwargs)
 
 
 def directory_is_archive(directory: str | pathlib.Path) -> Union[pathlib.Path, False]:
@@ -3,12 +3,12 @@
 import datetime
 import pathlib
 import re
-import string
 from typing import Protocol
 
-import openpyxl
-import pandas as pd
-
+from sharkadm.data.data_source.dv_template_workbook import (
+    DvTemplateWorkbook,
+    get_dv_template_workbook,
+)
 from sharkadm.sharkadm_logger import adm_logger
 
 DATE_FORMATS = ["%Y-%m-%d", "%Y-%m"]
@@ -235,51 +235,41 @@ class AnalyseInfo:
 
     @classmethod
     def from_dv_template(
-        cls, path: str | pathlib.Path, mapper: Mapper = None
+        cls,
+        path: str | pathlib.Path | DvTemplateWorkbook,
+        mapper: Mapper = None,
     ) -> "AnalyseInfo":
-        wb = openpyxl.load_workbook(path)
-        sheet_name = None
-        for name in ["Analysinfo"]:
-            if name in wb.sheetnames:
-                sheet_name = name
-                break
+        workbook = get_dv_template_workbook(path)
+        sheet_name = workbook.get_sheet_name(["Analysinfo"])
         if not sheet_name:
             adm_logger.log_workflow(
-                f"Could not find analyse_info sheet in file: {path}",
+                f"Could not find analyse_info sheet in file: {workbook.path}",
                 level=adm_logger.WARNING,
             )
             return
             # raise Exception(f'Could not find analyse_info sheet in file: {path}')
 
-        # ws = wb.get_sheet_by_name(sheet_name)
-        ws = wb[sheet_name]
-        skip_nr_rows = 0
-        for r in range(1, 5):
-            if ws.cell(r, 1).value in ["Tabellhuvud:"]:
-                skip_nr_rows = r - 1
-                break
-        df = pd.read_excel(path, skiprows=skip_nr_rows, sheet_name=sheet_name, dtype=str)
-        df.fillna("", inplace=True)
+        df = workbook.get_table(sheet_name).fill_null("")
 
         uncert_col_name = "UNCERT"
-        uncert_col_char = None
-        for col, char in zip(df.columns, string.ascii_uppercase):
-            if col == uncert_col_name:
-                uncert_col_char = char
-                break
+        number_formats = None
 
         data = dict()
-        data["path"] = path
-        for r, row in enumerate(df.iterrows()):
-            line_dict = row[1].to_dict()
+        data["path"] = workbook.path
+        for r, line_dict in enumerate(df.iter_rows(named=True)):
             if not line_dict["PARAM"]:
                 continue
 
-            cell_name = f"{uncert_col_char}{r + skip_nr_rows + 2}"
-            num_format = ws[cell_name].number_format
             uncert = line_dict[uncert_col_name]
-            if uncert and "%" in num_format:
-                uncert = convert_uncert_value_to_percent(uncert, num_format)
+            if uncert and "%" not in uncert:
+                # Percentage is only given by the cell format
+                if number_formats is None:
+                    number_formats = workbook.get_number_formats(
+                        sheet_name, uncert_col_name
+                    )
+                num_format = number_formats[r] if r < len(number_formats) else ""
+                if "%" in num_format:
+                    uncert = convert_uncert_value_to_percent(uncert, num_format)
             line_dict["original_uncert"] = line_dict[uncert_col_name]
             line_dict[uncert_col_name] = uncert
 
@@ -8,6 +8,7 @@ from sharkadm.data import change_log
 from sharkadm.data.archive import analyse_info, delivery_note, metadata, sampling_info
 from sharkadm.data.data_holder import PolarsDataHolder
 from sharkadm.data.data_source.base import PolarsDataFile
+from sharkadm.data.data_source.streaming import get_streaming_kwargs
 from sharkadm.data.data_source.txt_file import (
     CsvRowFormatPolarsDataFile,
 )
@@ -24,6 +25,9 @@ class PolarsArchiveDataHolder(PolarsDataHolder, ABC):
     ):
         super().__init__()
         self._archive_root_directory = pathlib.Path(archive_root_directory)
+        self._data_filter = kwargs.get("data_filter")
+        self._columns = kwargs.get("columns")
+        self._streaming_kwargs = get_streaming_kwargs(kwargs)
 
         self._data: pl.DataFrame = pl.DataFrame()
         self._dataset_name: str | None = None
@@ -68,7 +72,12 @@ class PolarsArchiveDataHolder(PolarsDataHolder, ABC):
             return
 
         d_source = CsvRowFormatPolarsDataFile(
-            path=data_file_path, data_type=self.delivery_note.data_type
+            path=data_file_path,
+            data_type=self.delivery_note.data_type,
+            data_filter=self._data_filter,
+            columns=self._columns,
+            header_mapper=self.import_matrix_mapper,
+            **self._streaming_kwargs,
         )
         d_source.map_header(self.import_matrix_mapper)
 
@@ -1,13 +1,15 @@
 # -*- coding: utf-8 -*-
 
-import datetime
 import pathlib
+import re
 from typing import Protocol
 
-import pandas as pd
-
 from sharkadm import config, sharkadm_exceptions
 from sharkadm.config.data_type import data_type_handler
+from sharkadm.data.data_source.dv_template_workbook import (
+    DvTemplateWorkbook,
+    get_dv_template_workbook,
+)
 from sharkadm.sharkadm_logger import adm_logger
 
 try:
@@ -16,6 +18,10 @@ except ImportError:
     pass
 
 
+# Dates are read as datetime strings from the template
+DATETIME_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}")
+
+
 class Mapper(Protocol):
     def get_internal_name(self, external_par: str) -> str: ...
 
@@ -98,32 +104,30 @@ class DeliveryNote:
         return DeliveryNote(data, mapper=mapper)
 
     @classmethod
-    def from_dv_template(cls, path: str | pathlib.Path, mapper: Mapper = None):
-        path = pathlib.Path(path)
-        if path.suffix != ".xlsx":
-            msg = f"File is not a valid xlsx dv template: {path}"
-            adm_logger.log_workflow(msg, level=adm_logger.ERROR)
-            raise FileNotFoundError(msg)
+    def from_dv_template(
+        cls, path: str | pathlib.Path | DvTemplateWorkbook, mapper: Mapper = None
+    ):
+        try:
+            workbook = get_dv_template_workbook(path)
+        except FileNotFoundError as e:
+            adm_logger.log_workflow(str(e), level=adm_logger.ERROR)
+            raise
 
         dn_mapper = config.get_delivery_note_mapper()
 
-        dn = pd.read_excel(path, sheet_name="Förklaring")
-        dn["key_row"] = dn[dn.columns[0]].apply(
-            lambda x: True if isinstance(x, str) and x.isupper() else False
-        )
-
-        fdn = dn[dn["key_row"]]
-
-        col_mapping = dict((c, col) for c, col in enumerate(dn.columns))
+        # First row is header
+        dn = workbook.get_sheet("Förklaring")[1:]
 
         data = dict()
-        data["path"] = path
-        for key, value in zip(fdn[col_mapping[0]], fdn[col_mapping[2]]):
-            if str(value) == "nan":
+        data["path"] = workbook.path
+        for key, value in zip(dn.to_series(0), dn.to_series(2)):
+            if not (isinstance(key, str) and key.isupper()):
+                continue
+            if value is None:
                 value = ""
-            elif isinstance(value, datetime.datetime):
-                value = value.date()
-            data[dn_mapper.get(key)] = str(value)
+            elif DATETIME_PATTERN.match(value):
+                value = value.split()[0]
+            data[dn_mapper.get(key)] = value
         data["data_format"] = data["FORMAT"]
         data["import_matrix_key"] = data["FORMAT"]
         if data["FORMAT"] == "PP":
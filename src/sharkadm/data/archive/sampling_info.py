@@ -4,9 +4,10 @@ import datetime
 import pathlib
 from typing import Protocol
 
-import openpyxl
-import pandas as pd
-
+from sharkadm.data.data_source.dv_template_workbook import (
+    DvTemplateWorkbook,
+    get_dv_template_workbook,
+)
 from sharkadm.sharkadm_logger import adm_logger
 
 DATE_FORMATS = ["%Y-%m-%d", "%Y-%m"]
@@ -105,34 +106,24 @@ class SamplingInfo:
 
     @classmethod
     def from_dv_template(
-        cls, path: str | pathlib.Path, mapper: Mapper = None
+        cls,
+        path: str | pathlib.Path | DvTemplateWorkbook,
+        mapper: Mapper = None,
     ) -> "SamplingInfo":
-        wb = openpyxl.load_workbook(path)
-        sheet_name = None
-        for name in ["Provtagningsinfo"]:
-            if name in wb.sheetnames:
-                sheet_name = name
-                break
+        workbook = get_dv_template_workbook(path)
+        sheet_name = workbook.get_sheet_name(["Provtagningsinfo"])
         if not sheet_name:
             adm_logger.log_workflow(
-                f"Could not find sampling_info sheet in file: {path}",
+                f"Could not find sampling_info sheet in file: {workbook.path}",
                 level=adm_logger.WARNING,
             )
             return
             # raise Exception(f'Could not find analyse_info sheet in file: {path}')
 
-        ws = wb.get_sheet_by_name(sheet_name)
-        skip_nr_rows = 0
-        for r in range(1, 5):
-            if ws.cell(r, 1).value in ["Tabellhuvud:"]:
-                skip_nr_rows = r - 1
-                break
-        df = pd.read_excel(path, skiprows=skip_nr_rows, sheet_name=sheet_name, dtype=str)
-        df.fillna("", inplace=True)
+        df = workbook.get_table(sheet_name).fill_null("")
         data = dict()
-        data["path"] = path
-        for row in df.iterrows():
-            line_dict = row[1].to_dict()
+        data["path"] = workbook.path
+        for line_dict in df.iter_rows(named=True):
             if not line_dict["PARAM"]:
                 continue
             line_dict["VALIDFR"] = _get_date(line_dict["VALIDFR"])
@@ -1,5 +1,6 @@
 import datetime
 from abc import ABC, abstractmethod
+from typing import Iterable
 
 import polars as pl
 
@@ -18,17 +19,34 @@ class PolarsDataHolder(ABC):
     _data_type_synonym = "unknown"
     _data_structure = "row"
 
+    # Columns never stored as categorical
+    _non_categorical_columns = ("row_number",)
+
     def __init__(self, *args, **kwargs):
         self._data_sources: dict[str, PolarsDataSource] = dict()
+        # Directories with files backing the data (see data_source.streaming)
+        self._spill_directories: list = []
         self._number_metadata_rows = 0
         self._header_mapper = None
         self._qf_column_prefix = None
         self._data_structure = kwargs.get("data_structure", self._data_structure)
         self._data = pl.DataFrame()
+        # Filtered data is a view: the selected row indexes in _data. The filtered
+        # frame is gathered on demand and cached in _filtered_data
+        self._filter_rows: pl.Series | None = None
         self._filtered_data = None
         self._data_type_obj: DataType = data_type_handler.get_data_type_obj(
             kwargs.get("data_type", self._data_type_synonym)
         )
+        self._categorical_storage = False
+        self._categorical_auto = True
+        self._categorical_max_unique_ratio = 0.1
+        self._categorical_columns: set[str] = set()
+        self._categorical_checked_columns: set[str] = set()
+        self._categorical_storage_info: dict[str, int] = dict(
+            string_size=0, categorical_size=0
+        )
+        self._float_col_cache: dict[str, tuple[pl.Series, pl.Series]] = dict()
 
     def __repr__(self) -> str:
         return (
@@ -37,23 +55,7 @@ class PolarsDataHolder(ABC):
         )
 
     def __add__(self, other) -> "PolarsConcatDataHolder":
-        if self.data_type != other.data_type:
-            adm_logger.log_workflow(
-                f"Not allowed to merge data_sources of different data_types: "
-                f"{self.data_type} and {other.data_type}"
-            )
-            raise TypeError
-        if self.dataset_name == other.dataset_name:
-            adm_logger.log_workflow(
-                f"Not allowed to merge to instances of the same dataset: "
-                f"{self.dataset_name}"
-            )
-            raise TypeError
-        concat_data = pl.concat([self.data, other.data])
-        cdh = PolarsConcatDataHolder()
-        cdh.data = concat_data
-        cdh.set_data_type_obj(self.data_type_obj)
-        return cdh
+        return PolarsConcatDataHolder.concat_data_holders([self, other])
 
     def __radd__(self, other) -> "PolarsDataHolder":
         return self
@@ -81,9 +83,17 @@ class PolarsDataHolder(ABC):
     def data_sources(self) -> dict:
         return self._data_sources
 
+    @property
+    def spill_directories(self) -> list:
+        return list(self._spill_directories)
+
     @property
     def data(self) -> pl.DataFrame:
         if self.is_filtered:
+            if self._filtered_data is None:
+                self._filtered_data = self._data.select(
+                    pl.all().gather(self._filter_rows)
+                )
             return self._filtered_data
         return self._data
 
@@ -93,6 +103,8 @@ class PolarsDataHolder(ABC):
             raise "Data must be of type pl.DataFrame"
         self._data = df
         self.reset_filter()
+        for col in set(self._float_col_cache) - set(df.columns):
+            self._float_col_cache.pop(col)
 
     @property
     def data_structure(self) -> str:
@@ -123,7 +135,7 @@ class PolarsDataHolder(ABC):
 
     @property
     def columns(self) -> list[str]:
-        return sorted(self.data.columns)
+        return sorted(self._data.columns)
 
     @property
     @abstractmethod
@@ -215,6 +227,7 @@ class PolarsDataHolder(ABC):
         This method is not adding to data itself."""
         self._check_data_source(data_source)
         self._data_sources[str(data_source)] = data_source
+        self._spill_directories.extend(data_source.spill_directories)
 
     def _check_data_source(self, data_source: PolarsDataSource) -> None:
         # Can be overwritten in child classes
@@ -254,21 +267,192 @@ class PolarsDataHolder(ABC):
 
     @property
     def is_filtered(self) -> bool:
-        if self._filtered_data is None:
+        if self._filter_rows is None:
             return False
         return True
 
+    @property
+    def filter_rows(self) -> pl.Series | None:
+        """Row indexes (in the unfiltered data) selected by the current filter"""
+        return self._filter_rows
+
+    def get_data(self, columns: list[str] | None = None) -> pl.DataFrame:
+        """Returns data (filtered if a filter is set) for the given columns. For
+        filtered data only the given columns are gathered."""
+        if columns is None:
+            return self.data
+        if not self.is_filtered:
+            return self._data.select(columns)
+        if self._filtered_data is not None:
+            return self._filtered_data.select(columns)
+        return self._data.select(pl.col(columns).gather(self._filter_rows))
+
     def filter(self, data_filter):
-        mask = data_filter.get_filter_mask(self)
+        """Filters data. Filters are combined with any previous filter. No data is
+        copied, only the selected row indexes are stored. If the filter can be
+        expressed as a single predicate it is evaluated directly on the unfiltered
+        data."""
+        expr = data_filter.get_filter_expression()
+        if expr is None or not set(expr.meta.root_names()).issubset(self._data.columns):
+            # Missing columns are handled (and logged) by the filter
+            mask = data_filter.get_filter_mask(self)
+        else:
+            mask = self._data.select(expr).to_series()
+            if self.is_filtered:
+                mask = mask.gather(self._filter_rows)
         if mask.is_empty():
             adm_logger.log_workflow(
                 "Could / Will not filter due to empty mask.",
                 level=adm_logger.WARNING,
             )
             return
-        self._filtered_data = self.data.remove(~mask)
+        # Rows with null in mask are kept (as with DataFrame.remove)
+        mask = mask.fill_null(True)
+        if self.is_filtered:
+            self._filter_rows = self._filter_rows.filter(mask)
+        else:
+            self._filter_rows = mask.arg_true()
+        self._filtered_data = None
 
     def reset_filter(self):
+        self._filter_rows = None
+        self._filtered_data = None
+
+    def clear_float_col_cache(self) -> None:
+        """Releases the cached float columns (and the source columns they refer to)"""
+        self._float_col_cache = dict()
+
+    def float_col(self, col: str, strict: bool = False) -> pl.Series:
+        """Returns column col as pl.Float64. Comma is accepted as decimal separator.
+        Empty strings and values that can not be parsed are null. If strict, an
+        InvalidOperationError is raised for non-empty values that can not be parsed.
+        The parsed column is cached and is only parsed again if the column has
+        changed."""
+        source = self.get_data([col])[col]
+        if source.dtype not in (pl.String, pl.Categorical):
+            return source.cast(pl.Float64, strict=strict)
+        cached = self._float_col_cache.get(col)
+        if cached and cached[0].equals(source):
+            float_col = cached[1]
+        else:
+            float_col = (
+                source.cast(pl.String)
+                .str.replace(",", ".", literal=True)
+                .cast(pl.Float64, strict=False)
+            )
+            self._float_col_cache[col] = (source, float_col)
+        if strict:
+            self._check_float_col(source, float_col)
+        return float_col
+
+    @staticmethod
+    def _check_float_col(source: pl.Series, float_col: pl.Series) -> None:
+        invalid = float_col.is_null() & source.is_not_null()
+        invalid = invalid & (source.cast(pl.String).str.len_chars() > 0)
+        if invalid.any():
+            raise pl.exceptions.InvalidOperationError(
+                f"Could not convert values in column {source.name} to float: "
+                f"{source.filter(invalid).unique().head(5).to_list()}"
+            )
+
+    @property
+    def categorical_storage(self) -> bool:
+        return self._categorical_storage
+
+    @property
+    def categorical_storage_info(self) -> dict[str, int]:
+        """Estimated size in bytes of the categorical columns stored as strings and
+        as categoricals"""
+        return dict(self._categorical_storage_info)
+
+    def use_categorical_storage(
+        self,
+        columns: list[str] | None = None,
+        auto: bool = True,
+        max_unique_ratio: float = 0.1,
+    ) -> None:
+        """Stores low cardinality string columns as pl.Categorical. The given columns
+        are always stored as categorical. If auto is True, other string columns with
+        fewer unique values than max_unique_ratio * number of rows are also stored as
+        categorical. Operators that do not set supports_categorical get the columns
+        as strings (see SHARKadmPolarsController.run_operators)."""
+        pl.enable_string_cache()
+        self._categorical_storage = True
+        self._categorical_auto = auto
+        self._categorical_max_unique_ratio = max_unique_ratio
+        self._categorical_columns.update(columns or [])
+        self._categorical_checked_columns.update(columns or [])
+
+    def use_string_storage(self) -> None:
+        """Stores all categorical columns as strings again"""
+        self.decode_categorical()
+        self._categorical_storage = False
+
+    def get_low_cardinality_columns(
+        self, columns: list[str] | None = None, max_unique_ratio: float = 0.1
+    ) -> list[str]:
+        """Returns the string columns (among columns if given) with fewer unique
+        values than max_unique_ratio * number of rows"""
+        schema = self._data.schema
+        if columns is None:
+            columns = list(schema)
+        columns = [
+            col
+            for col in columns
+            if schema.get(col) == pl.String and col not in self._non_categorical_columns
+        ]
+        if not columns or self._data.is_empty():
+            return []
+        max_unique = max(1, int(self._data.height * max_unique_ratio))
+        n_unique = self._data.select(pl.col(columns).n_unique()).row(0, named=True)
+        return [col for col in columns if n_unique[col] <= max_unique]
+
+    def encode_categorical(self) -> None:
+        """Casts the categorical columns from pl.String to pl.Categorical. New string
+        columns are checked for low cardinality if auto is used."""
+        if not self._categorical_storage:
+            return
+        schema = self._data.schema
+        if self._categorical_auto:
+            new_columns = [
+                col
+                for col, dtype in schema.items()
+                if dtype == pl.String and col not in self._categorical_checked_columns
+            ]
+            self._categorical_columns.update(
+                self.get_low_cardinality_columns(
+                    new_columns, max_unique_ratio=self._categorical_max_unique_ratio
+                )
+            )
+            self._categorical_checked_columns.update(new_columns)
+        columns = [
+            col for col in self._categorical_columns if schema.get(col) == pl.String
+        ]
+        if not columns:
+            return
+        string_size = self._data.select(columns).estimated_size()
+        self._data = self._data.with_columns(pl.col(columns).cast(pl.Categorical))
+        self._filtered_data = None
+        categorical_size = self._data.select(columns).estimated_size()
+        self._categorical_storage_info = dict(
+            string_size=string_size, categorical_size=categorical_size
+        )
+        adm_logger.log_workflow(
+            f"Stored {len(columns)} columns as categorical: "
+            f"{string_size / 1e6:.1f} MB -> {categorical_size / 1e6:.1f} MB",
+            level=adm_logger.DEBUG,
+        )
+
+    def decode_categorical(self) -> None:
+        """Casts all pl.Categorical columns to pl.String"""
+        if not self._categorical_storage:
+            return
+        columns = [
+            col for col, dtype in self._data.schema.items() if dtype == pl.Categorical
+        ]
+        if not columns:
+            return
+        self._data = self._data.with_columns(pl.col(columns).cast(pl.String))
         self._filtered_data = None
 
     @property
@@ -297,6 +481,53 @@ class PolarsConcatDataHolder(PolarsDataHolder):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
+    @classmethod
+    def concat_data_holders(
+        cls, holders: Iterable[PolarsDataHolder], how: str = "diagonal_relaxed"
+    ) -> "PolarsConcatDataHolder":
+        """Concatenates the data in all holders in one step. With the default how
+        the columns are aligned (missing columns are null) and dtypes are relaxed
+        to a common supertype. The data is not rechunked. Rows are tagged with the
+        dataset_name of the holder they come from (if not already tagged)."""
+        holders = list(holders)
+        if not holders:
+            raise ValueError("No data holders to concatenate")
+        data_type = holders[0].data_type
+        dataset_names = set()
+        frames = []
+        for holder in holders:
+            if holder.data_type != data_type:
+                adm_logger.log_workflow(
+                    f"Not allowed to merge data_sources of different data_types: "
+                    f"{data_type} and {holder.data_type}"
+                )
+                raise TypeError
+            names = cls._get_dataset_names(holder)
+            if dataset_names & names:
+                adm_logger.log_workflow(
+                    f"Not allowed to merge to instances of the same dataset: "
+                    f"{', '.join(sorted(dataset_names & names))}"
+                )
+                raise TypeError
+            dataset_names.update(names)
+            data = holder.data
+            if "dataset_name" not in data.columns:
+                data = data.with_columns(dataset_name=pl.lit(holder.dataset_name))
+            frames.append(data)
+        cdh = cls()
+        cdh.data = pl.concat(frames, how=how, rechunk=False)
+        # The data is not rechunked and may still be backed by spilled files
+        for holder in holders:
+            cdh._spill_directories.extend(holder.spill_directories)
+        cdh.set_data_type_obj(holders[0].data_type_obj)
+        return cdh
+
+    @staticmethod
+    def _get_dataset_names(holder: PolarsDataHolder) -> set[str]:
+        if isinstance(holder, PolarsConcatDataHolder):
+            return set(holder.data["dataset_name"].unique())
+        return {holder.dataset_name}
+
     @staticmethod
     def get_data_holder_description() -> str:
         return "This is a concatenated data holder"
@@ -308,8 +539,16 @@ class PolarsConcatDataHolder(PolarsDataHolder):
 
     @property
     def dataset_name(self) -> str:
-        return " # ".join(self.data["dataset_name"].unique())
+        return " # ".join(self.data["dataset_name"].unique(maintain_order=True))
 
     @property
     def number_metadata_rows(self) -> None:
         return
+
+
+def concat_data_holders(
+    holders: Iterable[PolarsDataHolder], how: str = "diagonal_relaxed"
+) -> PolarsConcatDataHolder:
+    """Concatenates all data holders in one step.
+    See PolarsConcatDataHolder.concat_data_holders"""
+    return PolarsConcatDataHolder.concat_data_holders(holders, how=how)
@@ -6,6 +6,13 @@ import pandas as pd
 import polars as pl
 
 from sharkadm.config.data_type import DataType, data_type_handler
+from sharkadm.data.data_source.streaming import (
+    get_transcode_chunk_size,
+    transcode_to_utf8,
+)
+from sharkadm.sharkadm_logger import adm_logger
+
+UTF8_ENCODINGS = ("utf8", "utf-8", "utf_8")
 
 
 class ImportMapper(Protocol):
@@ -14,6 +21,12 @@ class ImportMapper(Protocol):
     def get_external_name(self, external_par: str) -> str: ...
 
 
+class DataFilter(Protocol):
+    def get_filter_expression(self) -> pl.Expr | None: ...
+
+    def get_filter_mask(self, data_holder) -> pl.Series: ...
+
+
 class PolarsDataSource:
     def __init__(
         self,
@@ -29,6 +42,8 @@ class PolarsDataSource:
         self._mapped_columns: dict = dict()
         self._not_mapped_columns: list = []
         self._unit_mapper: dict[str, str] = dict()
+        # Directories with files backing the data. Kept as long as the data is used
+        self._spill_directories: list = []
 
     def __repr__(self) -> str:
         return (
@@ -100,6 +115,10 @@ class PolarsDataSource:
     def get_data(self) -> pl.DataFrame:
         return self._data
 
+    @property
+    def spill_directories(self) -> list:
+        return list(self._spill_directories)
+
     @property
     def data(self) -> pl.DataFrame:
         return self._data
@@ -120,28 +139,144 @@ class PolarsDataSource:
 
 
 class PolarsDataFile(PolarsDataSource, ABC):
+    """Base class for data files. If data_filter and/or columns are given they
+    are, if possible, pushed down to the csv scan so that only matching rows and
+    the needed columns are read into memory. Column names in data_filter and columns
+    are internal names if header_mapper is given, otherwise names in the file.
+    If the filter can not be applied when the file is scanned it is applied after
+    the header is mapped."""
+
+    # Columns (names in file) always read. Used when columns is given
+    _required_columns: tuple[str, ...] = ()
+
     def __init__(
         self,
         path: str | pathlib.Path | None = None,
         data_type: str | None = None,
         encoding: str = "cp1252",
+        data_filter: DataFilter | None = None,
+        columns: list[str] | None = None,
+        header_mapper: ImportMapper | None = None,
         **kwargs,
     ) -> None:
         super().__init__(data_type=data_type)
         self._path: pathlib.Path = pathlib.Path(path)
         self._source: str = str(self._path)
         self._encoding: str = encoding
+        self._data_filter = data_filter
+        self._columns = columns
+        self._pushdown_mapper = header_mapper
+        self._data_filter_applied = data_filter is None
 
         self._load_file()
         self._do_post_init_stuf()
+        if not self._pushdown_mapper:
+            self._apply_data_filter()
 
     @property
     def path(self) -> pathlib.Path:
         return self._path
 
+    @property
+    def data_filter_applied(self) -> bool:
+        return self._data_filter_applied
+
+    @property
+    def has_pushdown(self) -> bool:
+        """True if data_filter or columns are given"""
+        return self._data_filter is not None or bool(self._columns)
+
     @abstractmethod
     def _load_file(self) -> None: ...
 
+    def _get_scan_source(
+        self, directory: pathlib.Path, chunk_size: int | None = None
+    ) -> pathlib.Path:
+        """Returns source for pl.scan_csv. Files that are not utf8 encoded are
+        transcoded, chunk_size characters at a time, to a utf8 file in directory"""
+        if self._encoding.lower() in UTF8_ENCODINGS:
+            return self._path
+        return transcode_to_utf8(
+            self._path,
+            directory / f"{self._path.stem}_utf8{self._path.suffix}",
+            encoding=self._encoding,
+            chunk_size=chunk_size or get_transcode_chunk_size(),
+        )
+
+    def _collect(self, lf: pl.LazyFrame) -> pl.DataFrame:
+        """Applies data_filter and columns to the lazy frame and collects it"""
+        return self._get_lazy_frame(lf).collect()
+
+    def _get_lazy_frame(self, lf: pl.LazyFrame) -> pl.LazyFrame:
+        """Applies data_filter (predicate) and columns (projection) to the lazy
+        frame"""
+        if not self.has_pushdown:
+            return lf
+        header = lf.collect_schema().names()
+        to_internal = self._get_internal_names(header)
+        if to_internal is None:
+            return lf
+        lf = lf.rename(to_internal)
+        expr = None
+        if self._data_filter is not None:
+            expr = self._data_filter.get_filter_expression()
+        if expr is not None and set(expr.meta.root_names()).issubset(
+            to_internal.values()
+        ):
+            # Rows with null in the filter are kept (as in PolarsDataHolder.filter)
+            lf = lf.filter(expr.fill_null(True))
+            self._data_filter_applied = True
+        if self._columns:
+            required = [
+                to_internal[col] for col in self._required_columns if col in header
+            ]
+            wanted = set(self._columns) | set(required)
+            lf = lf.select([col for col in to_internal.values() if col in wanted])
+        to_file_names = {value: key for key, value in to_internal.items()}
+        return lf.rename(to_file_names, strict=False)
+
+    def _get_internal_names(self, header: list[str]) -> dict[str, str] | None:
+        """Returns a mapping from column names in the file to internal names.
+        Returns None if the mapping is not unique"""
+        if not self._pushdown_mapper:
+            return {col: col.strip() for col in header}
+        to_internal = {}
+        for col in header:
+            internal_name = self._pushdown_mapper.get_internal_name(col.strip())
+            if internal_name in to_internal.values() or (
+                internal_name != col and internal_name in header
+            ):
+                internal_name = col
+            to_internal[col] = internal_name
+        if len(set(to_internal.values())) != len(to_internal):
+            adm_logger.log_workflow(
+                f"Could not push down filter and columns when reading {self._path}. "
+                f"Header can not be uniquely mapped",
+                level=adm_logger.DEBUG,
+            )
+            return None
+        return to_internal
+
+    def map_header(self, mapper: ImportMapper) -> None:
+        super().map_header(mapper)
+        self._apply_data_filter()
+
+    def _apply_data_filter(self) -> None:
+        """Applies the data filter if it was not applied when the file was scanned.
+        Filters with an expression are only applied if all columns needed by the
+        filter are present"""
+        if self._data_filter_applied:
+            return
+        expr = self._data_filter.get_filter_expression()
+        if expr is None:
+            mask = self._data_filter.get_filter_mask(self)
+        elif set(expr.meta.root_names()).issubset(self._data.columns):
+            mask = self._data.select(expr).to_series()
+        else:
+            return
+        self._data = self._data.filter(mask.fill_null(True))
+        self._data_filter_applied = True
+
 
 class PolarsDataDataFrame(PolarsDataSource, ABC):
     def __init__(
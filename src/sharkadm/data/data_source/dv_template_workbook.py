@@ -0,0 +1,121 @@
+import pathlib
+
+import fastexcel
+import polars as pl
+
+HEADER_ROW_TAG = "Tabellhuvud:"
+
+# The header row is searched for in this many rows at the top of a table sheet
+_MAX_HEADER_ROW = 4
+
+
+class DvTemplateWorkbook:
+    """Data host delivery template (xlsx) opened once with calamine. Sheets are
+    loaded with all cells as strings the first time they are requested."""
+
+    def __init__(self, path: str | pathlib.Path):
+        self._path = pathlib.Path(path)
+        if self._path.suffix != ".xlsx":
+            raise FileNotFoundError(f"File is not a valid xlsx dv template: {path}")
+        self._reader = fastexcel.read_excel(self._path)
+        self._sheets: dict[str, pl.DataFrame] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}: {self._path}"
+
+    @property
+    def path(self) -> pathlib.Path:
+        return self._path
+
+    @property
+    def sheet_names(self) -> list[str]:
+        return self._reader.sheet_names
+
+    def get_sheet_name(self, candidates: list[str]) -> str | None:
+        """Returns the first of the candidates found in the workbook"""
+        for name in candidates:
+            if name in self.sheet_names:
+                return name
+        return None
+
+    def load_sheets(self, sheet_names: list[str]) -> None:
+        """Loads all the given sheets that are present in the workbook"""
+        for name in sheet_names:
+            if name in self.sheet_names:
+                self.get_sheet(name)
+
+    def get_sheet(self, sheet_name: str) -> pl.DataFrame:
+        """Returns all cells in the sheet as strings. Columns are not named"""
+        if sheet_name not in self._sheets:
+            self._sheets[sheet_name] = self._reader.load_sheet_by_name(
+                sheet_name, header_row=None, dtypes="string"
+            ).to_polars()
+        return self._sheets[sheet_name]
+
+    def get_header_row(self, sheet_name: str) -> int:
+        """Returns the index of the row tagged as header row. Defaults to 0"""
+        first_column = self.get_sheet(sheet_name)[:_MAX_HEADER_ROW].to_series()
+        for index, value in enumerate(first_column):
+            if value == HEADER_ROW_TAG:
+                return index
+        return 0
+
+    def get_table(self, sheet_name: str, header_row: int | None = None) -> pl.DataFrame:
+        """Returns the sheet as a table with the columns named by the header row.
+        Empty rows and empty columns without header are removed"""
+        sheet = self.get_sheet(sheet_name)
+        if header_row is None:
+            header_row = self.get_header_row(sheet_name)
+        if not sheet.height:
+            return sheet
+        header = []
+        for index, name in enumerate(sheet.row(header_row)):
+            name = name or f"__UNNAMED__{index}"
+            unique_name = name
+            nr = 0
+            while unique_name in header:
+                nr += 1
+                unique_name = f"{name}_{nr}"
+            header.append(unique_name)
+        table = sheet[header_row + 1 :]
+        table.columns = header
+        table = table.filter(~pl.all_horizontal(pl.col(header).is_null()))
+        return table.select(
+            col
+            for col in table.columns
+            if not col.startswith("__UNNAMED__") or table[col].null_count() < len(table)
+        )
+
+    def get_number_formats(self, sheet_name: str, column: str) -> list[str]:
+        """Returns the number format of the cells in column for each row in
+        get_table(sheet_name). Calamine does not read cell formats so the sheet is
+        opened with openpyxl. Use only when the format is needed."""
+        import openpyxl
+
+        wb = openpyxl.load_workbook(self._path, read_only=True)
+        try:
+            column_index = None
+            number_formats = []
+            for row in wb[sheet_name].iter_rows():
+                values = [cell.value for cell in row]
+                if column_index is None:
+                    if column in values:
+                        column_index = values.index(column)
+                    continue
+                if all(value is None for value in values):
+                    continue
+                if column_index < len(row):
+                    number_formats.append(row[column_index].number_format)
+                else:
+                    number_formats.append("General")
+            return number_formats
+        finally:
+            wb.close()
+
+
+def get_dv_template_workbook(
+    path_or_workbook: str | pathlib.Path | DvTemplateWorkbook,
+) -> DvTemplateWorkbook:
+    if isinstance(path_or_workbook, DvTemplateWorkbook):
+        return path_or_workbook
+    return DvTemplateWorkbook(path_or_workbook)
@@ -1,9 +1,41 @@
+import pathlib
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Type
+
 import polars as pl
 
 from sharkadm.data.data_source.base import PolarsDataFile
 
+SENSOR_COLUMN_PATTERN = re.compile(r"^(?!QV:|Q0?_).+\[.*\]$")
+
+
+def get_sensor_columns(header: list[str]) -> list[str]:
+    """Returns the columns in header that holds sensor values,
+    i.e. columns with a unit in brackets that are not quality flag columns"""
+    return [col for col in header if SENSOR_COLUMN_PATTERN.match(col.strip())]
+
+
+def load_profile_files(
+    paths: list[pathlib.Path],
+    file_class: Type["_ProfilePolarsDataFile"],
+    max_workers: int | None = None,
+    **kwargs,
+) -> list["_ProfilePolarsDataFile"]:
+    """Loads the given profile files concurrently. The returned list has the
+    same order as paths. Parsing is done in polars which releases the GIL."""
+    if len(paths) < 2 or max_workers == 1:
+        return [file_class(path=path, **kwargs) for path in paths]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda path: file_class(path=path, **kwargs), paths))
+
+
+class _ProfilePolarsDataFile(PolarsDataFile):
+    """Base class for profile files where the data table is preceded by
+    lines starting with "//". The file is read and decoded once. Header lines are
+    handed to _parse_comment_line and the data table is parsed from the same
+    buffer."""
 
-class StandardFormatPolarsDataFile(PolarsDataFile):
     def __init__(self, *args, **kwargs):
         self._separator = kwargs.get(
             "separator", kwargs.get("delimiter", kwargs.get("sep", "\t"))
@@ -12,21 +44,66 @@ class StandardFormatPolarsDataFile(PolarsDataFile):
             "nr_rows",
             kwargs.get("n_rows", kwargs.get("read_nr_rows", kwargs.get("read_n_rows"))),
         )
-        self._metadata = {}
+        self._typed_sensor_columns = kwargs.get("typed_sensor_columns", False)
         super().__init__(*args, **kwargs)
 
     def _load_file(self) -> None:
-        self._data = pl.read_csv(
-            self._path,
+        with open(self._path, encoding=self._encoding) as fid:
+            text = fid.read()
+        start = 0
+        while text.startswith("//", start):
+            end = text.find("\n", start)
+            if end == -1:
+                end = len(text)
+            self._parse_comment_line(text[start:end].rstrip("\r"))
+            start = end + 1
+        body = text[start:]
+        header_end = body.find("\n")
+        header = body[: header_end if header_end != -1 else None].rstrip("\r")
+        schema_overrides = None
+        if self._typed_sensor_columns:
+            schema_overrides = {
+                col: pl.Float64
+                for col in get_sensor_columns(header.split(self._separator))
+            }
+        read_kwargs = dict(
             comment_prefix="//",
-            encoding=self._encoding,
             separator=self._separator,
             n_rows=self._n_rows,
             infer_schema=False,
+            schema_overrides=schema_overrides,
             missing_utf8_is_empty_string=True,
         )
+        if self.has_pushdown:
+            self._data = self._collect(pl.scan_csv(body.encode("utf-8"), **read_kwargs))
+            return
+        self._data = pl.read_csv(body.encode("utf-8"), **read_kwargs)
+
+    def _parse_comment_line(self, line: str) -> None:
+        # Can be overwritten in child classes
+        return
+
+
+class StandardFormatPolarsDataFile(_ProfilePolarsDataFile):
+    _required_columns = ("YEAR", "MONTH", "DAY", "HOUR", "MINUTE")
+
+    def __init__(self, *args, **kwargs):
+        self._metadata = {}
+        self._sensorinfo_reached = False
+        super().__init__(*args, **kwargs)
+
+    def _load_file(self) -> None:
+        super()._load_file()
         self._add_date_and_time()
 
+    def _parse_comment_line(self, line: str) -> None:
+        if line.startswith("//SENSORINFO"):
+            self._sensorinfo_reached = True
+        if self._sensorinfo_reached or not line.startswith("//METADATA;"):
+            return
+        line = line.removeprefix("//METADATA;").strip().split(";", maxsplit=1)
+        self._metadata[line[0]] = line[1] if len(line) > 1 else ""
+
     def _add_date_and_time(self):
         self._data = self._data.with_columns(
             pl.concat_str(
@@ -48,34 +125,9 @@ class StandardFormatPolarsDataFile(PolarsDataFile):
         )
 
     def _load_metadata(self) -> None:
-        with open(self._path, encoding=self._encoding) as f:
-            for line in f:
-                if line.startswith("//SENSORINFO"):
-                    break
-                if line.startswith("//METADATA;"):
-                    line = line.removeprefix("//METADATA;").strip().split(";", maxsplit=1)
-                    self._metadata[line[0]] = line[1] if len(line) > 1 else ""
+        # Metadata is collected when the file is loaded
+        return
 
 
-class OdvProfilePolarsDataFile(PolarsDataFile):
-    def __init__(self, *args, **kwargs):
-        self._separator = kwargs.get(
-            "separator", kwargs.get("delimiter", kwargs.get("sep", "\t"))
-        )
-        self._n_rows = kwargs.get(
-            "nr_rows",
-            kwargs.get("n_rows", kwargs.get("read_nr_rows", kwargs.get("read_n_rows"))),
-        )
-
-        super().__init__(*args, **kwargs)
-
-    def _load_file(self) -> None:
-        self._data = pl.read_csv(
-            self._path,
-            comment_prefix="//",
-            encoding=self._encoding,
-            separator=self._separator,
-            n_rows=self._n_rows,
-            infer_schema=False,
-            missing_utf8_is_empty_string=True,
-        )
+class OdvProfilePolarsDataFile(_ProfilePolarsDataFile):
+    pass
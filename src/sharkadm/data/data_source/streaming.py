@@ -0,0 +1,136 @@
+"""Memory bounded reading of large csv files.
+
+The file is transcoded to utf8 in chunks (if needed) and parsed with pl.scan_csv
+in batches by the polars streaming engine. The result is spilled to a temporary
+uncompressed Arrow IPC file that is then memory mapped. The whole file is never
+decoded in memory, peak memory during parsing is bounded by memory_budget_mb and
+the columns of the resulting frame are backed by the file (pages are read on use
+and can be evicted by the operating system).
+
+The spilled file is kept in a SpillDirectory that lives as long as the data file
+and the data holders holding its data. A mapped file can not be removed on
+Windows while a frame using it is alive. Directories that can not be removed are
+removed later (when a new spill directory is created or when the process exits).
+"""
+
+import atexit
+import pathlib
+import shutil
+import tempfile
+import threading
+import weakref
+
+import polars as pl
+
+DEFAULT_MEMORY_BUDGET_MB = 256
+
+# Keyword arguments that data holders pass on to CsvRowFormatPolarsDataFile
+STREAMING_KWARGS = ("streaming", "memory_budget_mb", "temp_directory")
+
+SPILL_DIRECTORY_PREFIX = "sharkadm_spill_"
+
+# Spill directories that could not be removed
+_pending_spill_directories: set[pathlib.Path] = set()
+_pending_lock = threading.Lock()
+
+# Part of the memory budget used for one batch. The rest is left for
+# transcoding buffers and polars overhead
+_BATCH_PART_OF_BUDGET = 0.1
+_MIN_BATCH_ROWS = 1000
+_SAMPLE_SIZE = 2**20
+
+
+def get_streaming_kwargs(kwargs: dict) -> dict:
+    """Returns the streaming keyword arguments found in kwargs"""
+    return {key: kwargs[key] for key in STREAMING_KWARGS if key in kwargs}
+
+
+def transcode_to_utf8(
+    path: str | pathlib.Path,
+    target_path: str | pathlib.Path,
+    encoding: str = "cp1252",
+    chunk_size: int = 2**24,
+) -> pathlib.Path:
+    """Writes path as utf8 to target_path. The file is read chunk_size characters at
+    a time"""
+    target_path = pathlib.Path(target_path)
+    with (
+        open(path, encoding=encoding, newline="") as source,
+        open(target_path, "w", encoding="utf-8", newline="") as target,
+    ):
+        while chunk := source.read(chunk_size):
+            target.write(chunk)
+    return target_path
+
+
+def get_batch_size(
+    path: str | pathlib.Path, memory_budget_mb: float = DEFAULT_MEMORY_BUDGET_MB
+) -> int:
+    """Returns number of rows to parse per batch. The row size is estimated from
+    the beginning of the file"""
+    with open(path, "rb") as fid:
+        sample = fid.read(_SAMPLE_SIZE)
+    row_size = max(len(sample) // max(sample.count(b"\n"), 1), 1)
+    batch_bytes = memory_budget_mb * 1e6 * _BATCH_PART_OF_BUDGET
+    return max(int(batch_bytes // row_size), _MIN_BATCH_ROWS)
+
+
+def get_transcode_chunk_size(memory_budget_mb: float = DEFAULT_MEMORY_BUDGET_MB) -> int:
+    """Returns number of characters to transcode at a time. A character can be
+    up to four bytes in utf8"""
+    return max(int(memory_budget_mb * 1e6 * _BATCH_PART_OF_BUDGET / 4), 2**16)
+
+
+def sink_to_ipc(
+    lf: pl.LazyFrame, target_path: str | pathlib.Path, batch_size: int
+) -> pathlib.Path:
+    """Runs lf with the streaming engine and writes the result to target_path as an
+    uncompressed Arrow IPC file (can be memory mapped without copying)"""
+    target_path = pathlib.Path(target_path)
+    with pl.Config(streaming_chunk_size=batch_size):
+        lf.sink_ipc(target_path, compression="uncompressed")
+    return target_path
+
+
+def remove_spill_directory(directory: pathlib.Path) -> bool:
+    """Removes directory. Returns False if it could not be removed. It is then
+    removed by a later call to remove_pending_spill_directories"""
+    try:
+        shutil.rmtree(directory)
+    except FileNotFoundError:
+        pass
+    except OSError:
+        with _pending_lock:
+            _pending_spill_directories.add(directory)
+        return False
+    with _pending_lock:
+        _pending_spill_directories.discard(directory)
+    return True
+
+
+def remove_pending_spill_directories() -> None:
+    with _pending_lock:
+        directories = list(_pending_spill_directories)
+    for directory in directories:
+        remove_spill_directory(directory)
+
+
+atexit.register(remove_pending_spill_directories)
+
+
+class SpillDirectory:
+    """Temporary directory for data spilled to disk. The directory is removed when
+    the object is garbage collected or when cleanup is called."""
+
+    def __init__(self, temp_directory: str | pathlib.Path | None = None):
+        remove_pending_spill_directories()
+        self.path = pathlib.Path(
+            tempfile.mkdtemp(prefix=SPILL_DIRECTORY_PREFIX, dir=temp_directory)
+        )
+        self._finalizer = weakref.finalize(self, remove_spill_directory, self.path)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}: {self.path}"
+
+    def cleanup(self) -> None:
+        self._finalizer()
@@ -1,14 +1,51 @@
+import pathlib
+import tempfile
+
 import polars as pl
 
 from .base import PolarsDataFile
+from .streaming import (
+    DEFAULT_MEMORY_BUDGET_MB,
+    SpillDirectory,
+    get_batch_size,
+    get_transcode_chunk_size,
+    sink_to_ipc,
+)
 
 
 class CsvRowFormatPolarsDataFile(PolarsDataFile):
-    def __init__(self, *args, delimiter: str = "\t", **kwargs):
+    """Row format csv file. With streaming=True the file is read in batches with
+    peak memory bounded by memory_budget_mb (see data_source.streaming). The data is
+    then memory mapped from a temporary file in a SpillDirectory (see
+    spill_directories) that is removed when no longer referenced.
+    Temporary files are written to temp_directory (system default if not given)."""
+
+    def __init__(
+        self,
+        *args,
+        delimiter: str = "\t",
+        streaming: bool = False,
+        memory_budget_mb: float | None = None,
+        temp_directory: str | pathlib.Path | None = None,
+        **kwargs,
+    ):
         self._delimiter = delimiter
+        self._streaming = streaming
+        self._memory_budget_mb = memory_budget_mb or DEFAULT_MEMORY_BUDGET_MB
+        self._temp_directory = temp_directory
         super().__init__(*args, **kwargs)
 
     def _load_file(self) -> None:
+        if self._streaming:
+            self._data = self._stream_file()
+            return
+        if self.has_pushdown:
+            with tempfile.TemporaryDirectory(
+                dir=self._temp_directory, ignore_cleanup_errors=True
+            ) as directory:
+                source = self._get_scan_source(pathlib.Path(directory))
+                self._data = self._collect(self._scan_csv(source))
+            return
         self._data = pl.read_csv(
             self._path,
             encoding=self._encoding,
@@ -16,3 +53,31 @@ class CsvRowFormatPolarsDataFile(PolarsDataFile):
             infer_schema=False,
             missing_utf8_is_empty_string=True,
         )
+
+    def _scan_csv(self, source: pathlib.Path, **kwargs) -> pl.LazyFrame:
+        return pl.scan_csv(
+            source,
+            separator=self._delimiter,
+            infer_schema=False,
+            missing_utf8_is_empty_string=True,
+            **kwargs,
+        )
+
+    def _stream_file(self) -> pl.DataFrame:
+        # The spilled file backs the returned frame. Data holders keep the spill
+        # directory as long as they hold the data
+        spill_directory = SpillDirectory(self._temp_directory)
+        self._spill_directories.append(spill_directory)
+        ipc_path = spill_directory.path / "data.arrow"
+        with tempfile.TemporaryDirectory(
+            dir=self._temp_directory, ignore_cleanup_errors=True
+        ) as directory:
+            source = self._get_scan_source(
+                pathlib.Path(directory),
+                chunk_size=get_transcode_chunk_size(self._memory_budget_mb),
+            )
+            lf = self._get_lazy_frame(self._scan_csv(source, low_memory=True))
+            sink_to_ipc(
+                lf, ipc_path, batch_size=get_batch_size(source, self._memory_budget_mb)
+            )
+        return pl.read_ipc(ipc_path, memory_map=True, rechunk=False)
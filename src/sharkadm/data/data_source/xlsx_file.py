@@ -1,15 +1,30 @@
 import polars as pl
 
 from .base import PolarsDataFile
+from .dv_template_workbook import DvTemplateWorkbook
 
 
 class XlsxFormatPolarsDataFile(PolarsDataFile):
-    def __init__(self, *args, sheet_name: str, skip_rows: int = 0, **kwargs):
+    def __init__(
+        self,
+        *args,
+        sheet_name: str,
+        skip_rows: int = 0,
+        workbook: DvTemplateWorkbook | None = None,
+        **kwargs,
+    ):
         self._sheet_name = sheet_name
         self._skip_rows = skip_rows
+        self._workbook = workbook
         super().__init__(*args, **kwargs)
 
     def _load_file(self) -> None:
+        if self._workbook:
+            # Sheet already read by the workbook
+            self._data = self._workbook.get_table(
+                self._sheet_name, header_row=self._skip_rows
+            )
+            return
         self._data = pl.read_excel(
             self._path,
             engine="calamine",
@@ -33,7 +33,8 @@ class PolarsDataFrameDataHolder(PolarsDataHolder):
 
         self._set_data_source(d_source)
 
-    def get_data_holder_description(self) -> str:
+    @staticmethod
+    def get_data_holder_description() -> str:
         return "Data holder holding given polars dataframe"
 
     @property
@@ -1,17 +1,26 @@
 import pathlib
-import re
 
-import openpyxl
 import pandas as pd
+import polars as pl
 
 from sharkadm.config.data_type import DataType, data_type_handler
 from sharkadm.config.import_matrix import ImportMatrixConfig, ImportMatrixMapper
 from sharkadm.data.archive import analyse_info, delivery_note, sampling_info
 from sharkadm.data.data_holder import PolarsDataHolder
 from sharkadm.data.data_source.base import PolarsDataFile
+from sharkadm.data.data_source.dv_template_workbook import DvTemplateWorkbook
 from sharkadm.data.data_source.xlsx_file import XlsxFormatPolarsDataFile
 from sharkadm.sharkadm_logger import adm_logger
 
+DATA_SHEET_NAMES = ["data", "Klistra in i denna", "Klistra in  i denna", "Kolumner"]
+MANDATORY_COLUMNS_SHEET_NAME = "Kolumnförklaring"
+
+# Mapped mandatory columns by template version
+# (data type, import matrix key, content of the mandatory columns sheet). The least
+# recently used version is dropped when the cache is full
+MANDATORY_COLUMNS_CACHE_SIZE = 32
+_mandatory_columns_cache: dict[tuple, tuple[list[str], list[str]]] = {}
+
 
 class PolarsDvTemplateDataHolder(PolarsDataHolder):
     _data_type: DataType | None = None
@@ -41,14 +50,16 @@ class PolarsDvTemplateDataHolder(PolarsDataHolder):
 
         self._data_sources = {}
 
+        # All sheets are read from the same workbook opened once with calamine
+        self._workbook = DvTemplateWorkbook(self._template_path)
+
         self._initiate()
         self._load_delivery_note()
-        # self._load_mandatory_columns()
         self._load_import_matrix()
         self._load_data()
-        self._load_delivery_note()  # Reload to map
         self._load_analyse_info()
         self._load_sampling_info()
+        # self._load_mandatory_columns()
         self._map_mandatory_lists()
 
     @staticmethod
@@ -131,41 +142,64 @@ class PolarsDvTemplateDataHolder(PolarsDataHolder):
         return str(max(self.data["sample_latitude_dd"].cast(float)))
 
     def _load_delivery_note(self) -> None:
+        # The delivery note is mapped with the mapper given by its own data type
+        # and import matrix key. This is the same mapper as in _load_import_matrix
         self._delivery_note = delivery_note.DeliveryNote.from_dv_template(
-            self._template_path, mapper=self._import_matrix_mapper
+            self._workbook, mapper=self._import_matrix_mapper
         )
 
     def _load_analyse_info(self) -> None:
         self._analyse_info = analyse_info.AnalyseInfo.from_dv_template(
-            self._template_path, mapper=self._import_matrix_mapper
+            self._workbook, mapper=self._import_matrix_mapper
         )
 
     def _load_sampling_info(self) -> None:
         self._sampling_info = sampling_info.SamplingInfo.from_dv_template(
-            self._template_path, mapper=self._import_matrix_mapper
+            self._workbook, mapper=self._import_matrix_mapper
         )
 
-    def _load_mandatory_columns(self):
-        # TODO: Convert to polars
-        dn = pd.read_excel(self._template_path, sheet_name="Kolumnförklaring")
-        key_col_name = dn.columns[3]
-        dn["key_row"] = dn[key_col_name].apply(
-            lambda x: True if isinstance(x, str) and x.isupper() else False
-        )
-
-        fdn = dn[dn["key_row"]]
-        fdn = fdn.reset_index(drop=True)
-        fdn["man_str"] = fdn[dn.columns[0]].apply(str)
-
-        self._mandatory_reg_columns = list(fdn[fdn[dn.columns[0]] == "*"][key_col_name])
-        try:
-            self._mandatory_nat_columns = list(
-                fdn[fdn["man_str"].str.contains("*")][key_col_name]
+    def _load_mandatory_columns(self) -> None:
+        if MANDATORY_COLUMNS_SHEET_NAME not in self._workbook.sheet_names:
+            adm_logger.log_workflow(
+                "Could not find mandatory columns in template", level=adm_logger.DEBUG
             )
-        except re.error:
+            return
+        # First row is header. Fourth column holds the keys and first column
+        # tells if the column is mandatory
+        sheet = self._workbook.get_sheet(MANDATORY_COLUMNS_SHEET_NAME)[1:]
+        if sheet.width < 4:
             adm_logger.log_workflow(
-                "Could not find mandatory_nat_columns", level=adm_logger.WARNING
+                "Could not find mandatory columns in template", level=adm_logger.WARNING
             )
+            return
+        sheet = sheet.select(
+            pl.nth(0).fill_null("").alias("mandatory"), pl.nth(3).alias("key")
+        ).filter(
+            # Keys are upper case
+            pl.col("key").str.contains(r"\p{Lu}") & ~pl.col("key").str.contains(r"\p{Ll}")
+        )
+        cache_key = (
+            self.delivery_note.data_type,
+            self.delivery_note.import_matrix_key,
+            tuple(sheet.iter_rows()),
+        )
+        if cache_key in _mandatory_columns_cache:
+            cached = _mandatory_columns_cache.pop(cache_key)
+        else:
+            reg_columns = sheet.filter(pl.col("mandatory") == "*")["key"].to_list()
+            nat_columns = sheet.filter(
+                pl.col("mandatory").str.contains("*", literal=True)
+            )["key"].to_list()
+            cached = (
+                self._map_mandatory_list(reg_columns),
+                self._map_mandatory_list(nat_columns),
+            )
+            if len(_mandatory_columns_cache) >= MANDATORY_COLUMNS_CACHE_SIZE:
+                _mandatory_columns_cache.pop(next(iter(_mandatory_columns_cache)))
+        _mandatory_columns_cache[cache_key] = cached
+        reg_columns, nat_columns = cached
+        self._mandatory_reg_columns = list(reg_columns)
+        self._mandatory_nat_columns = list(nat_columns)
 
     def _map_mandatory_lists(self):
         if not self.import_matrix_mapper:
@@ -182,6 +216,14 @@ class PolarsDvTemplateDataHolder(PolarsDataHolder):
             for col in self._mandatory_nat_columns
         ]
 
+    def _map_mandatory_list(self, columns: list[str]) -> list[str]:
+        if not self.import_matrix_mapper:
+            adm_logger.log_workflow(
+                f"Could not map mandatory lists in {self.__class__.__name__}"
+            )
+            return columns
+        return [self._import_matrix_mapper.get_internal_name(col) for col in columns]
+
     def _load_import_matrix(self) -> None:
         """Loads the import matrix for the given data type"""
         # return
@@ -254,25 +296,17 @@ class PolarsDvTemplateDataHolder(PolarsDataHolder):
         self._data_sources[str(data_source)] = data_source
 
     def _load_data(self):
-        wb = openpyxl.load_workbook(self._template_path)
-        sheet_name = None
-        for name in ["data", "Klistra in i denna", "Klistra in  i denna", "Kolumner"]:
-            if name in wb.sheetnames:
-                sheet_name = name
-                break
+        sheet_name = self._workbook.get_sheet_name(DATA_SHEET_NAMES)
         if not sheet_name:
             raise Exception(f"Could not find data sheet in file: {self._template_path}")
 
-        ws = wb.get_sheet_by_name(sheet_name)
-        for r in range(1, 5):
-            if ws.cell(r, 1).value in ["Tabellhuvud:"]:
-                self._number_metadata_rows = r - 1
-                break
+        self._number_metadata_rows = self._workbook.get_header_row(sheet_name)
         d_source = XlsxFormatPolarsDataFile(
             path=self._template_path,
             data_type=self.delivery_note.data_type,
             sheet_name=sheet_name,
             skip_rows=self.number_metadata_rows,
+            workbook=self._workbook,
         )
         if self.import_matrix_mapper:
             d_source.map_header(self.import_matrix_mapper)
@@ -2,6 +2,7 @@ import pathlib
 from typing import Union
 
 from sharkadm import config
+from sharkadm.data.data_source.streaming import get_streaming_kwargs
 
 from .lims_data_holder import PolarsLimsDataHolder
 
@@ -19,7 +20,11 @@ def get_polars_lims_data_holder(
         mapper = config.get_import_matrix_mapper(
             data_type="physicalchemical", import_column="LIMS"
         )
-    return PolarsLimsDataHolder(lims_root_directory=path, header_mapper=mapper)
+    return PolarsLimsDataHolder(
+        lims_root_directory=path,
+        header_mapper=mapper,
+        **get_streaming_kwargs(kwargs),
+    )
 
 
 def is_lims_directory(directory: str | pathlib.Path) -> Union[pathlib.Path, False]:
@@ -6,6 +6,7 @@ import polars as pl
 from sharkadm.data.archive import analyse_info, sampling_info
 from sharkadm.data.data_holder import PolarsDataHolder
 from sharkadm.data.data_source.base import PolarsDataFile
+from sharkadm.data.data_source.streaming import get_streaming_kwargs
 from sharkadm.data.data_source.txt_file import CsvRowFormatPolarsDataFile
 from sharkadm.sharkadm_logger import adm_logger
 
@@ -25,8 +26,12 @@ class PolarsLimsDataHolder(PolarsDataHolder):
         self,
         lims_root_directory: str | pathlib.Path | None = None,
         header_mapper: HeaderMapper = None,
+        **kwargs,
     ):
         super().__init__()
+        self._data_filter = kwargs.get("data_filter")
+        self._columns = kwargs.get("columns")
+        self._streaming_kwargs = get_streaming_kwargs(kwargs)
         self._lims_root_directory = pathlib.Path(lims_root_directory)
         if not self._lims_root_directory.is_dir():
             raise NotADirectoryError(self._lims_root_directory)
@@ -78,7 +83,12 @@ class PolarsLimsDataHolder(PolarsDataHolder):
 
     def _load_data(self) -> None:
         data_source = CsvRowFormatPolarsDataFile(
-            path=self.data_file_path, data_type=self.data_type
+            path=self.data_file_path,
+            data_type=self.data_type,
+            data_filter=self._data_filter,
+            columns=self._columns,
+            header_mapper=self._header_mapper,
+            **self._streaming_kwargs,
         )
         if self._header_mapper:
             data_source.map_header(self._header_mapper)
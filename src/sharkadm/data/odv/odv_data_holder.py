@@ -8,6 +8,7 @@ from sharkadm.data.data_holder import PolarsDataHolder
 from sharkadm.data.data_source.base import ImportMapper
 from sharkadm.data.data_source.profile.standard_format_file import (
     OdvProfilePolarsDataFile,
+    load_profile_files,
 )
 
 
@@ -50,15 +51,23 @@ class PolarsOdvDataHolder(PolarsDataHolder):
         return """Holds data from one or more odv profiles"""
 
     def _load_data(self) -> None:
+        kwargs = dict(self._kwargs)
+        max_workers = kwargs.pop("max_workers", None)
+        if kwargs.get("columns"):
+            # Needed in _add_date_and_time
+            kwargs["columns"] = [*kwargs["columns"], "sample_iso_datetime"]
+        data_sources = load_profile_files(
+            self._paths,
+            OdvProfilePolarsDataFile,
+            max_workers=max_workers,
+            data_type=self.data_type,
+            header_mapper=self._header_mapper,
+            # encoding=self._kwargs.pop('encoding', 'utf-8'),
+            **kwargs,
+        )
         dfs = []
         columns = None
-        for path in self._paths:
-            data_source = OdvProfilePolarsDataFile(
-                path=path,
-                data_type=self.data_type,
-                # encoding=self._kwargs.pop('encoding', 'utf-8'),
-                **self._kwargs,
-            )
+        for data_source in data_sources:
             if self._header_mapper:
                 data_source.map_header(self._header_mapper)
             if not columns:
@@ -67,7 +76,7 @@ class PolarsOdvDataHolder(PolarsDataHolder):
             dfs.append(data_source.data)
             self._data_sources[str(data_source)] = data_source
         dfs = [df.select(sorted(columns)) for df in dfs]
-        self._data = pl.concat(dfs, how="vertical_relaxed")
+        self._data = pl.concat(dfs, how="vertical_relaxed", rechunk=False)
         self._data.fill_nan("")
         self._add_date_and_time()
 
@@ -7,6 +7,7 @@ from sharkadm.data.archive import analyse_info, sampling_info
 from sharkadm.data.data_holder import PolarsDataHolder
 from sharkadm.data.data_source.profile.standard_format_file import (
     StandardFormatPolarsDataFile,
+    load_profile_files,
 )
 
 
@@ -81,24 +82,26 @@ class PolarsProfileStandardFormatDataHolder(PolarsDataHolder):
     #     return self._analyse_info
 
     def _load_data(self) -> None:
+        kwargs = dict(self._kwargs)
+        max_workers = kwargs.pop("max_workers", None)
+        data_sources = load_profile_files(
+            self._paths,
+            StandardFormatPolarsDataFile,
+            max_workers=max_workers,
+            data_type=self.data_type,
+            header_mapper=self._header_mapper,
+            **kwargs,
+        )
         dfs = []
-        for path in self._paths:
-            print(f"{path=}")
-            data_source = StandardFormatPolarsDataFile(
-                path=path, data_type=self.data_type, **self._kwargs
-            )
+        for data_source in data_sources:
             if self._header_mapper:
                 data_source.map_header(self._header_mapper)
             dfs.append(data_source.data)
             self._data_sources[str(data_source)] = data_source
-        columns = sorted(set().union(*(df.columns for df in dfs)))
-        dfs = [
-            df.select(
-                [pl.col(c) if c in df.columns else pl.lit(None).alias(c) for c in columns]
-            ).fill_null("")
-            for df in dfs
-        ]
-        self._data = pl.concat(dfs, how="vertical_relaxed")
+        self._data = pl.concat(dfs, how="diagonal_relaxed", rechunk=False)
+        self._data = self._data.select(sorted(self._data.columns)).with_columns(
+            pl.col(pl.String).fill_null("")
+        )
 
     # def _load_sampling_info(self) -> None:
     #     #TODO: To be added
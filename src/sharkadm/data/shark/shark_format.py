@@ -6,6 +6,7 @@ from ...config import ImportMatrixConfig, ImportMatrixMapper
 from ...config.data_type import data_type_handler
 from .. import PolarsDataHolder
 from ..data_source.base import PolarsDataFile
+from ..data_source.streaming import get_streaming_kwargs
 from ..data_source.txt_file import CsvRowFormatPolarsDataFile
 
 
@@ -18,6 +19,9 @@ class PolarsSharkDataHolder(PolarsDataHolder):
         self._path = pathlib.Path(path)
         self._encoding = kwargs.get("encoding", "cp1252")
         self._separator = kwargs.get("separator", kwargs.get("delimiter", "\t"))
+        self._data_filter = kwargs.get("data_filter")
+        self._columns = kwargs.get("columns")
+        self._streaming_kwargs = get_streaming_kwargs(kwargs)
 
         self._data: pl.DataFrame = pl.DataFrame()
         self._dataset_name: str | None = None
@@ -38,32 +42,40 @@ class PolarsSharkDataHolder(PolarsDataHolder):
         self._import_matrix_mapper = self.data_type_obj.get_mapper(self.data_format)
 
     def _load_data(self) -> None:
-        d_source = CsvRowFormatPolarsDataFile(path=self._path, encoding=self._encoding)
-        for col in ["Datatyp", "Data type", "DTYPE", "delivery_datatype", "data_type"]:
-            if col in d_source.data:
-                all_data_types = set(d_source.data[col])
-                # Not sure if we want to raise exception if multiple datatypes are found
-                # if len(all_data_types) > 1:
-                #     raise sharkadm_exceptions.ToManyDatatypesError(str(all_data_types))
-                data_type = all_data_types.pop()
-                self._data_type_obj = data_type_handler.get_data_type_obj(
-                    data_type.lower().replace(" ", "")
-                )
-                d_source.data_type_obj = self._data_type_obj
-                break
-
-        # if d_source._data_type:
-        #     self._data_type_obj = data_type_handler.get_data_type_obj(
-        #         d_source._data_type.lower().replace(" ", "")
-        #     )
-        # print(f"{self._data_type_obj=}")
-
+        data_type_found = self._set_data_type_from_file()
         self._load_import_matrix()
+        d_source = CsvRowFormatPolarsDataFile(
+            path=self._path,
+            encoding=self._encoding,
+            data_filter=self._data_filter,
+            columns=self._columns,
+            header_mapper=self.import_matrix_mapper,
+            **self._streaming_kwargs,
+        )
+        if data_type_found:
+            d_source.data_type_obj = self._data_type_obj
         if self.import_matrix_mapper:
             d_source.map_header(self.import_matrix_mapper)
 
         self._set_data_source(d_source)
 
+    def _set_data_type_from_file(self) -> bool:
+        """Sets data type from the data type column in the first data row. The
+        import matrix (and mapper) for the data type is needed before the file is
+        read to push down data filter and columns."""
+        with open(self._path, encoding=self._encoding) as fid:
+            header = [item.strip() for item in fid.readline().split(self._separator)]
+            first_row = [item.strip() for item in fid.readline().split(self._separator)]
+        for col in ["Datatyp", "Data type", "DTYPE", "delivery_datatype", "data_type"]:
+            if col in header and header.index(col) < len(first_row):
+                data_type = first_row[header.index(col)]
+                # Not sure if we want to raise exception if multiple datatypes are found
+                self._data_type_obj = data_type_handler.get_data_type_obj(
+                    data_type.lower().replace(" ", "")
+                )
+                return True
+        return False
+
     @staticmethod
     def get_data_holder_description() -> str:
         return """Holds data from shark export"""
@@ -28,6 +28,17 @@ class PolarsDataFilter(ABC):
         self, data_holder: PolarsDataHolder
     ) -> pl.expr.expr.Expr | None: ...
 
+    def _get_filter_expression(self) -> pl.Expr | None:
+        """Override to express the filter as a single polars expression. Filters
+        with an expression are combined into one predicate and evaluated directly
+        on the unfiltered data."""
+        return None
+
+    def _get_expression_mask(self, data_holder: PolarsDataHolder) -> pl.Series:
+        """Returns the mask given by _get_filter_expression. Use in _get_filter_mask
+        of filters with an expression"""
+        return data_holder.data.select(self._get_filter_expression()).to_series()
+
     def __repr__(self):
         return f"{self.__class__.__name__}"
 
@@ -42,6 +53,14 @@ class PolarsDataFilter(ABC):
         obj._invert = True
         return obj
 
+    def get_filter_expression(self) -> pl.Expr | None:
+        expr = self._get_filter_expression()
+        if expr is None:
+            return None
+        if self._invert:
+            return ~expr
+        return expr
+
     def get_filter_mask(self, data_holder: PolarsDataHolder) -> pl.expr.expr.Expr | None:
         mask = self._get_filter_mask(data_holder)
         if self._invert:
@@ -84,7 +103,31 @@ class PolarsCombinedDataFilter:
     def name(self) -> str:
         return str(self)
 
+    def get_filter_expression(self) -> pl.Expr | None:
+        """Returns the combined filter as a single expression. Returns None if any
+        of the filters can not be expressed as an expression."""
+        expr = self._mask.get_filter_expression()
+        other = self._and or self._or
+        if expr is None:
+            return None
+        if other:
+            other_expr = other.get_filter_expression()
+            if other_expr is None:
+                return None
+            if self._and:
+                expr = expr & other_expr
+            else:
+                expr = expr | other_expr
+        if self._invert:
+            return ~expr
+        return expr
+
     def get_filter_mask(self, data_holder: PolarsDataHolder) -> pl.expr.expr.Expr | None:
+        expr = self.get_filter_expression()
+        if expr is not None and set(expr.meta.root_names()).issubset(
+            data_holder.data.columns
+        ):
+            return data_holder.data.select(expr).to_series()
         if self._and:
             mask = self._mask.get_filter_mask(data_holder) & self._and.get_filter_mask(
                 data_holder
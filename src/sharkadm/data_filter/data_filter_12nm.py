@@ -19,10 +19,10 @@ class PolarsDataFilterInside12nm(PolarsDataFilter):
                 f"Could not filter data. Missing column {col}", level=adm_logger.ERROR
             )
             raise
+        return self._get_expression_mask(data_holder)
 
-        # boolean_wb = data_holder.data['location_wb'] != 'N'
-        boolean_wb = (data_holder.data["location_wb"] == "Y") | (
-            data_holder.data["location_wb"] == "P"
-        )
-        boolean_county = data_holder.data["location_county"] != ""
+    def _get_filter_expression(self) -> pl.Expr:
+        # boolean_wb = pl.col("location_wb") != "N"
+        boolean_wb = (pl.col("location_wb") == "Y") | (pl.col("location_wb") == "P")
+        boolean_county = pl.col("location_county") != ""
         return boolean_wb | boolean_county
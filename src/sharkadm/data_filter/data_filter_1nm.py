@@ -23,8 +23,10 @@ class PolarsDataFilterInside1nm(PolarsDataFilter):
                 f"Could not filter data. Missing column {col}", level=adm_logger.ERROR
             )
             raise
+        return self._get_expression_mask(data_holder)
 
-        # boolean_wb = data_holder.data['location_wb'] != 'N'
-        boolean_code = data_holder.data["location_sea_area_code"] != ""
-        boolean_name = data_holder.data["location_sea_area_name"] != ""
+    def _get_filter_expression(self) -> pl.Expr:
+        # boolean_wb = pl.col("location_wb") != "N"
+        boolean_code = pl.col("location_sea_area_code") != ""
+        boolean_name = pl.col("location_sea_area_name") != ""
         return boolean_code & boolean_name
@@ -6,9 +6,15 @@ from sharkadm.data_filter.base import PolarsDataFilter
 
 class PolarsDataFilterTrue(PolarsDataFilter):
     def _get_filter_mask(self, data_holder: PolarsDataHolder) -> pl.Series:
-        return pl.Series([True] * len(data_holder.data))
+        return self._get_expression_mask(data_holder)
+
+    def _get_filter_expression(self) -> pl.Expr:
+        return pl.repeat(True, pl.len())
 
 
 class PolarsDataFilterFalse(PolarsDataFilter):
     def _get_filter_mask(self, data_holder: PolarsDataHolder) -> pl.Series:
-        return pl.Series([False] * len(data_holder.data))
+        return self._get_expression_mask(data_holder)
+
+    def _get_filter_expression(self) -> pl.Expr:
+        return pl.repeat(False, pl.len())
@@ -26,19 +26,17 @@ class PolarsDataFilterBoundingBox(PolarsDataFilter):
         self._lon_min = lon_min
         self._lon_max = lon_max
 
-    def _get_filter_mask(
-        self,
-        data_holder: PolarsDataHolder,
-    ) -> pl.Series:
-        boolean = pl.Series(
-            [True for _ in range(len(data_holder.data))], dtype=pl.Boolean
-        )
+    def _get_filter_mask(self, data_holder: PolarsDataHolder) -> pl.Series:
+        return self._get_expression_mask(data_holder)
+
+    def _get_filter_expression(self) -> pl.Expr:
+        boolean = pl.repeat(True, pl.len())
         if self._lat_min is not None:
-            boolean = boolean & (data_holder.data[self.lat_col] >= self._lat_min)
+            boolean = boolean & (pl.col(self.lat_col) >= self._lat_min)
         if self._lat_max is not None:
-            boolean = boolean & (data_holder.data[self.lat_col] <= self._lat_max)
+            boolean = boolean & (pl.col(self.lat_col) <= self._lat_max)
         if self._lon_min is not None:
-            boolean = boolean & (data_holder.data[self.lon_col] >= self._lon_min)
+            boolean = boolean & (pl.col(self.lon_col) >= self._lon_min)
         if self._lon_max is not None:
-            boolean = boolean & (data_holder.data[self.lon_col] <= self._lon_max)
+            boolean = boolean & (pl.col(self.lon_col) <= self._lon_max)
         return boolean
@@ -10,7 +10,10 @@ class PolarsDataFilterLocation(PolarsDataFilter):
         self._locations = locations
 
     def _get_filter_mask(self, data_holder: PolarsDataHolder) -> pl.Series:
-        mask = data_holder.data[self._locations[0]]
+        return self._get_expression_mask(data_holder)
+
+    def _get_filter_expression(self) -> pl.Expr:
+        expr = pl.col(self._locations[0])
         for col in self._locations[1:]:
-            mask = mask | data_holder.data[col]
-        return mask
+            expr = expr | pl.col(col)
+        return expr
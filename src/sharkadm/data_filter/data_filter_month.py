@@ -10,10 +10,7 @@ class PolarsDataFilterMonths(PolarsDataFilter):
         self._str_months = [f"{m:02}" for m in months]
 
     def _get_filter_mask(self, data_holder: PolarsDataHolder) -> pl.Series:
-        return (
-            data_holder.data.with_columns(
-                ok_month=pl.col("visit_month").is_in(self._str_months)
-            )
-            .select("ok_month")
-            .to_series()
-        )
+        return self._get_expression_mask(data_holder)
+
+    def _get_filter_expression(self) -> pl.Expr:
+        return pl.col("visit_month").is_in(self._str_months)
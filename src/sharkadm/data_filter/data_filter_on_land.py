@@ -13,4 +13,7 @@ class PolarsDataFilterOnLand(PolarsDataFilter):
                 f"Could not filter data. Missing column {col}", level=adm_logger.ERROR
             )
             raise
-        return data_holder.data["location_wb"] == ""
+        return self._get_expression_mask(data_holder)
+
+    def _get_filter_expression(self) -> pl.Expr:
+        return pl.col("location_wb") == ""
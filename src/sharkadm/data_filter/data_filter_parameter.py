@@ -10,4 +10,7 @@ class PolarsDataFilterParameter(PolarsDataFilter):
         self._parameter = parameter
 
     def _get_filter_mask(self, data_holder: PolarsDataHolder) -> pl.Series:
-        return data_holder.data.select(pl.col("parameter") == self._parameter).to_series()
+        return self._get_expression_mask(data_holder)
+
+    def _get_filter_expression(self) -> pl.Expr:
+        return pl.col("parameter") == self._parameter
@@ -12,6 +12,7 @@ class PolarsDataFilterQflag(PolarsDataFilter):
         self._qflags = qflags
 
     def _get_filter_mask(self, data_holder: PolarsDataHolder) -> pl.Series:
-        return data_holder.data.select(
-            pl.col("quality_flag").is_in(self._qflags)
-        ).to_series()
+        return self._get_expression_mask(data_holder)
+
+    def _get_filter_expression(self) -> pl.Expr:
+        return pl.col("quality_flag").is_in(self._qflags)
@@ -5,6 +5,15 @@ from sharkadm.data_filter.base import PolarsDataFilter
 from sharkadm.sharkadm_logger import adm_logger
 
 
+def _get_float_expression(column: str) -> pl.Expr:
+    return (
+        pl.when(pl.col(column).str.len_chars() == 0)
+        .then(None)
+        .otherwise(pl.col(column))
+        .cast(float)
+    )
+
+
 class PolarsDataFilterValueLessThan(PolarsDataFilter):
     def __init__(self, column: str, value: float):
         super().__init__(column=column, value=value)
@@ -18,15 +27,10 @@ class PolarsDataFilterValueLessThan(PolarsDataFilter):
                 level=adm_logger.ERROR,
             )
             raise
-        # return data_holder.data[self._column].cast(float) < self._value
-        col_data = data_holder.data.select(
-            pl.when(pl.col(self._column).str.len_chars() == 0)
-            .then(None)
-            .otherwise(pl.col(self._column))
-            .cast(float)
-            .alias("_temp")
-        )["_temp"]
-        return col_data < self._value
+        return self._get_expression_mask(data_holder)
+
+    def _get_filter_expression(self) -> pl.Expr:
+        return _get_float_expression(self._column) < self._value
 
 
 class PolarsDataFilterValueMoreThan(PolarsDataFilter):
@@ -42,16 +46,10 @@ class PolarsDataFilterValueMoreThan(PolarsDataFilter):
                 level=adm_logger.ERROR,
             )
             raise
-        # return data_holder.data[self._column].cast(float) < self._value
+        return self._get_expression_mask(data_holder)
 
-        col_data = data_holder.data.select(
-            pl.when(pl.col(self._column).str.len_chars() == 0)
-            .then(None)
-            .otherwise(pl.col(self._column))
-            .cast(float)
-            .alias("_temp")
-        )["_temp"]
-        return col_data > self._value
+    def _get_filter_expression(self) -> pl.Expr:
+        return _get_float_expression(self._column) > self._value
 
 
 class PolarsDataFilterValueEquals(PolarsDataFilter):
@@ -67,13 +65,7 @@ class PolarsDataFilterValueEquals(PolarsDataFilter):
                 level=adm_logger.ERROR,
             )
             raise
-        # return data_holder.data[self._column].cast(float) < self._value
+        return self._get_expression_mask(data_holder)
 
-        col_data = data_holder.data.select(
-            pl.when(pl.col(self._column).str.len_chars() == 0)
-            .then(None)
-            .otherwise(pl.col(self._column))
-            .cast(float)
-            .alias("_temp")
-        )["_temp"]
-        return col_data == self._value
+    def _get_filter_expression(self) -> pl.Expr:
+        return _get_float_expression(self._column) == self._value
@@ -10,10 +10,7 @@ class PolarsDataFilterYears(PolarsDataFilter):
         self._str_years = [str(y) for y in years]
 
     def _get_filter_mask(self, data_holder: PolarsDataHolder) -> pl.Series:
-        return (
-            data_holder.data.with_columns(
-                ok_years=pl.col("visit_year").is_in(self._str_years)
-            )
-            .select("ok_years")
-            .to_series()
-        )
+        return self._get_expression_mask(data_holder)
+
+    def _get_filter_expression(self) -> pl.Expr:
+        return pl.col("visit_year").is_in(self._str_years)
@@ -0,0 +1,291 @@
+"""Row based comparison of two versions of a dataset.
+
+Each row gets a 64-bit hash (polars hash_rows) of its key columns and of its value
+columns. Rows are matched on the key hash. Matched rows with different value
+hashes are changed. Only the changed rows are compared column by column to count
+changes per column. If no key columns are given the whole row is the key. Rows are
+then either added or removed, never changed.
+"""
+
+import io
+import pathlib
+import zipfile
+
+import polars as pl
+
+from sharkadm.data.change_log import ChangeLog
+from sharkadm.data.data_holder import PolarsDataHolder
+from sharkadm.sharkadm_logger import adm_logger
+
+KEY_HASH_COLUMN = "_diff_key_hash"
+KEY_OCCURRENCE_COLUMN = "_diff_key_occurrence"
+VALUE_HASH_COLUMN = "_diff_value_hash"
+ROW_KEY_COLUMNS = (KEY_HASH_COLUMN, KEY_OCCURRENCE_COLUMN)
+
+# Columns that differ between runs without the data having changed
+NOT_COMPARED_COLUMNS = ("row_number", "source")
+
+ZIP_PACKAGE_DATA_FILE = "shark_data.txt"
+
+
+def get_row_hashes(df: pl.DataFrame, columns: list[str]) -> pl.Series:
+    """Returns a 64-bit hash per row of the given columns"""
+    # Categorical codes are not stable between data holders. Hash the strings
+    return (
+        df.select(columns)
+        .with_columns(pl.col(pl.Categorical).cast(pl.String))
+        .hash_rows()
+    )
+
+
+def _add_hashes(
+    df: pl.DataFrame, key_columns: list[str], value_columns: list[str]
+) -> pl.DataFrame:
+    return (
+        df.with_columns(
+            get_row_hashes(df, key_columns).alias(KEY_HASH_COLUMN),
+            get_row_hashes(df, value_columns).alias(VALUE_HASH_COLUMN),
+        )
+        .with_columns(
+            # Rows with the same key are matched in order of appearance
+            pl.col(KEY_HASH_COLUMN)
+            .cum_count()
+            .over(KEY_HASH_COLUMN)
+            .alias(KEY_OCCURRENCE_COLUMN)
+        )
+        .with_row_index("_diff_row_index")
+    )
+
+
+class DatasetDiff:
+    """Result of a comparison between an old and a new version of a dataset"""
+
+    def __init__(
+        self,
+        added: pl.DataFrame,
+        removed: pl.DataFrame,
+        changed: pl.DataFrame,
+        column_change_counts: dict[str, int],
+        key_columns: list[str],
+        value_columns: list[str],
+        nr_old_rows: int,
+        nr_new_rows: int,
+    ) -> None:
+        self._added = added
+        self._removed = removed
+        self._changed = changed
+        self._column_change_counts = column_change_counts
+        self._key_columns = key_columns
+        self._value_columns = value_columns
+        self._nr_old_rows = nr_old_rows
+        self._nr_new_rows = nr_new_rows
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}: {len(self.added)} added, "
+            f"{len(self.removed)} removed, {len(self.changed)} changed"
+        )
+
+    @property
+    def added(self) -> pl.DataFrame:
+        """Rows in the new data that are not in the old data"""
+        return self._added
+
+    @property
+    def removed(self) -> pl.DataFrame:
+        """Rows in the old data that are not in the new data"""
+        return self._removed
+
+    @property
+    def changed(self) -> pl.DataFrame:
+        """Key columns of the changed rows together with the old and new value of
+        each changed column (named <column>_old and <column>_new)"""
+        return self._changed
+
+    @property
+    def column_change_counts(self) -> dict[str, int]:
+        """Number of changed rows per value column. Only columns with changes are
+        included"""
+        return self._column_change_counts
+
+    @property
+    def key_columns(self) -> list[str]:
+        return self._key_columns
+
+    @property
+    def value_columns(self) -> list[str]:
+        return self._value_columns
+
+    @property
+    def is_identical(self) -> bool:
+        return not (len(self.added) or len(self.removed) or len(self.changed))
+
+    def get_summary_lines(self) -> list[str]:
+        lines = [
+            f"Rows compared: {self._nr_old_rows} old, {self._nr_new_rows} new",
+            f"Rows added: {len(self.added)}",
+            f"Rows removed: {len(self.removed)}",
+            f"Rows changed: {len(self.changed)}",
+        ]
+        for col, count in self.column_change_counts.items():
+            lines.append(f"Column {col} changed in {count} rows")
+        return lines
+
+    def get_report_lines(self, max_rows: int = 100) -> list[str]:
+        """Returns summary lines followed by the keys of at most max_rows added,
+        removed and changed rows"""
+        lines = self.get_summary_lines()
+        key_columns = self.key_columns or self.value_columns
+        for title, df in [("Added", self.added), ("Removed", self.removed)]:
+            if not len(df):
+                continue
+            lines.extend(["", f"{title} rows (keys):", "\t".join(key_columns)])
+            for row in df.select(key_columns).head(max_rows).iter_rows():
+                lines.append("\t".join(str(value) for value in row))
+        if len(self.changed):
+            lines.extend(["", "Changed rows:"])
+            changed_columns = list(self.column_change_counts)
+            for row in self.changed.head(max_rows).iter_rows(named=True):
+                key = ", ".join(str(row[col]) for col in self.key_columns)
+                changes = [
+                    f"{col}: {row[f'{col}_old']} -> {row[f'{col}_new']}"
+                    for col in changed_columns
+                    if row[f"{col}_old"] != row[f"{col}_new"]
+                ]
+                lines.append(f"{key}\t{'; '.join(changes)}")
+        return lines
+
+    def write_report(self, path: str | pathlib.Path, max_rows: int = 100) -> None:
+        path = pathlib.Path(path)
+        with open(path, "w", encoding="utf8") as fid:
+            fid.write("\n".join(self.get_report_lines(max_rows=max_rows)))
+        adm_logger.log_workflow(f"Dataset diff report saved to: {path}")
+
+    def add_to_change_log(self, change_log: ChangeLog) -> None:
+        """Adds the summary of the diff to the change log"""
+        if self.is_identical:
+            change_log.add_to_log("No changes in data compared to previous version")
+            return
+        change_log.add_to_log(
+            f"Changes in data compared to previous version: "
+            f"{'; '.join(self.get_summary_lines()[1:])}"
+        )
+
+
+def diff_data(
+    old: pl.DataFrame,
+    new: pl.DataFrame,
+    key_columns: list[str] | None = None,
+    value_columns: list[str] | None = None,
+) -> DatasetDiff:
+    """Compares old and new data. value_columns defaults to all columns found in
+    both old and new data that are not key columns. If key_columns is not given
+    rows are identified by all value columns."""
+    key_columns = list(key_columns or [])
+    if value_columns is None:
+        value_columns = [
+            col
+            for col in new.columns
+            if col in old.columns
+            and col not in key_columns
+            and col not in NOT_COMPARED_COLUMNS
+        ]
+    value_columns = list(value_columns)
+    for df in [old, new]:
+        missing = [col for col in [*key_columns, *value_columns] if col not in df]
+        if missing:
+            raise KeyError(f"Missing columns for diff: {', '.join(missing)}")
+
+    old_hashed = _add_hashes(old, key_columns or value_columns, value_columns)
+    new_hashed = _add_hashes(new, key_columns or value_columns, value_columns)
+    old_keys = old_hashed.select(*ROW_KEY_COLUMNS, VALUE_HASH_COLUMN, "_diff_row_index")
+    new_keys = new_hashed.select(*ROW_KEY_COLUMNS, VALUE_HASH_COLUMN, "_diff_row_index")
+
+    helper_columns = [*ROW_KEY_COLUMNS, VALUE_HASH_COLUMN, "_diff_row_index"]
+    added = new_hashed.join(old_keys, on=ROW_KEY_COLUMNS, how="anti").drop(helper_columns)
+    removed = old_hashed.join(new_keys, on=ROW_KEY_COLUMNS, how="anti").drop(
+        helper_columns
+    )
+
+    changed = pl.DataFrame()
+    column_change_counts = {}
+    if key_columns:
+        matched = old_keys.join(
+            new_keys, on=ROW_KEY_COLUMNS, suffix="_new", maintain_order="left"
+        ).filter(pl.col(VALUE_HASH_COLUMN) != pl.col(f"{VALUE_HASH_COLUMN}_new"))
+        old_changed = old.select(pl.col(value_columns).gather(matched["_diff_row_index"]))
+        new_changed = new.select(
+            pl.col(*key_columns, *value_columns).gather(matched["_diff_row_index_new"])
+        )
+        for col in value_columns:
+            nr_changes = (
+                old_changed[col]
+                .cast(pl.String)
+                .ne_missing(new_changed[col].cast(pl.String))
+            ).sum()
+            if nr_changes:
+                column_change_counts[col] = nr_changes
+        changed = new_changed.select(key_columns).with_columns(
+            *[
+                series
+                for col in column_change_counts
+                for series in [
+                    old_changed[col].alias(f"{col}_old"),
+                    new_changed[col].alias(f"{col}_new"),
+                ]
+            ]
+        )
+
+    return DatasetDiff(
+        added=added,
+        removed=removed,
+        changed=changed,
+        column_change_counts=column_change_counts,
+        key_columns=key_columns,
+        value_columns=value_columns,
+        nr_old_rows=len(old),
+        nr_new_rows=len(new),
+    )
+
+
+def diff_data_holders(
+    old: PolarsDataHolder,
+    new: PolarsDataHolder,
+    key_columns: list[str] | None = None,
+    value_columns: list[str] | None = None,
+) -> DatasetDiff:
+    """Compares the data in two data holders"""
+    return diff_data(
+        old.data, new.data, key_columns=key_columns, value_columns=value_columns
+    )
+
+
+def get_zip_package_data(path: str | pathlib.Path) -> pl.DataFrame:
+    """Returns the data file in a SHARK zip package with all columns as strings"""
+    with zipfile.ZipFile(path) as zf:
+        content = zf.read(ZIP_PACKAGE_DATA_FILE)
+    try:
+        content.decode("utf8")
+    except UnicodeDecodeError:
+        content = content.decode("cp1252").encode("utf8")
+    return pl.read_csv(
+        io.BytesIO(content),
+        separator="\t",
+        infer_schema=False,
+        missing_utf8_is_empty_string=True,
+    )
+
+
+def diff_zip_packages(
+    old_path: str | pathlib.Path,
+    new_path: str | pathlib.Path,
+    key_columns: list[str] | None = None,
+    value_columns: list[str] | None = None,
+) -> DatasetDiff:
+    """Compares the data files in two SHARK zip packages without unpacking them"""
+    return diff_data(
+        get_zip_package_data(old_path),
+        get_zip_package_data(new_path),
+        key_columns=key_columns,
+        value_columns=value_columns,
+    )
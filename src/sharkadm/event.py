@@ -1,4 +1,10 @@
 import enum
+import logging
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
 
 
 class Events(enum.StrEnum):
@@ -21,6 +27,11 @@ class Events(enum.StrEnum):
 
 _subscribers = dict((str(ev), dict()) for ev in Events)
 
+# Subscribers by event in order of priority. Each item is (func, batched)
+_ordered_subscribers: dict[str, list[tuple]] = dict()
+
+_dispatcher: "_QueuedDispatcher | None" = None
+
 
 class EventNotFound(Exception):
     pass
@@ -30,30 +41,190 @@ def get_events() -> list[str]:
     return sorted(_subscribers)
 
 
-def subscribe(event: str | Events, func, prio: int = 50) -> None:
+def subscribe(event: str | Events, func, prio: int = 50, batched: bool = False) -> None:
+    """Subscribe func to event. A batched subscriber is called with a list of data
+    instead of once for every event"""
     event = str(event)
     if event not in _subscribers:
         raise EventNotFound(event)
     _subscribers[event].setdefault(prio, [])
-    if func in _subscribers[event][prio]:
+    if any(f == func for f, _ in _subscribers[event][prio]):
         return
-    _subscribers[event][prio].append(func)
+    _subscribers[event][prio].append((func, batched))
+    _ordered_subscribers.pop(event, None)
 
 
-def post_event(event: str | Events, data: dict | str) -> None:
-    # print()
-    # print(f"{event=}")
-    # print(f"{data=}")
-    # print(f"{_subscribers=}")
+def unsubscribe(event: str | Events, func) -> None:
     event = str(event)
-    if type(data) is str:
-        data = dict(msg=data)
     if event not in _subscribers:
         raise EventNotFound(event)
-    for prio in sorted(_subscribers[event]):
-        for func in _subscribers[event][prio]:
+    for prio, items in _subscribers[event].items():
+        _subscribers[event][prio] = [item for item in items if item[0] != func]
+    _ordered_subscribers.pop(event, None)
+
+
+def _get_subscribers(event: str) -> list[tuple]:
+    if event not in _ordered_subscribers:
+        _ordered_subscribers[event] = [
+            item
+            for prio in sorted(_subscribers[event])
+            for item in _subscribers[event][prio]
+        ]
+    return _ordered_subscribers[event]
+
+
+def _dispatch(event: str, data_list: list[dict]) -> None:
+    for func, batched in _get_subscribers(event):
+        if batched:
+            func(data_list)
+            continue
+        for data in data_list:
             func(data)
+
+
+def _dispatch_with_log(event: str, data_list: list[dict]) -> None:
+    _dispatch(event, data_list)
     if event == Events.LOG_PROGRESS:
         return
     if event != Events.LOG:
-        post_event(Events.LOG, data)
+        _dispatch(Events.LOG, data_list)
+
+
+def post_event(event: str | Events, data: dict | str) -> None:
+    event = str(event)
+    if type(data) is str:
+        data = dict(msg=data)
+    if event not in _subscribers:
+        raise EventNotFound(event)
+    if _dispatcher:
+        _dispatcher.put(event, data)
+        return
+    _dispatch_with_log(event, [data])
+
+
+class _QueuedDispatcher:
+    """Delivers events to subscribers from a background thread. Posting never
+    blocks. If the queue is full the event is dropped. Progress events are not
+    queued: only the latest progress per title is kept and delivered at most once
+    per progress_interval seconds"""
+
+    def __init__(
+        self, max_queue_size: int, batch_size: int, progress_interval: float
+    ) -> None:
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._batch_size = batch_size
+        self._progress_interval = progress_interval
+        self._progress_lock = threading.Lock()
+        self._pending_progress: dict[str, dict] = dict()
+        self._last_progress_time: dict[str, float] = dict()
+        self._stop = threading.Event()
+        self.nr_dropped = 0
+        self._thread = threading.Thread(
+            target=self._run, name="sharkadm-event-dispatcher", daemon=True
+        )
+        self._thread.start()
+
+    def put(self, event: str, data: dict) -> None:
+        if event == Events.LOG_PROGRESS:
+            with self._progress_lock:
+                self._pending_progress[str(data.get("title", ""))] = data
+            return
+        try:
+            self._queue.put_nowait((event, data))
+        except queue.Full:
+            self.nr_dropped += 1
+
+    def _get_batch(self) -> list[tuple[str, dict]]:
+        try:
+            batch = [self._queue.get(timeout=self._progress_interval)]
+        except queue.Empty:
+            return []
+        while len(batch) < self._batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _deliver_batch(self, batch: list[tuple[str, dict]]) -> None:
+        # Consecutive events of the same type are delivered together
+        start = 0
+        for i in range(1, len(batch) + 1):
+            if i == len(batch) or batch[i][0] != batch[start][0]:
+                self._deliver(batch[start][0], [data for _, data in batch[start:i]])
+                start = i
+
+    def _deliver_progress(self, force: bool = False) -> None:
+        now = time.monotonic()
+        with self._progress_lock:
+            to_deliver = []
+            for title, data in list(self._pending_progress.items()):
+                last = self._last_progress_time.get(title, 0)
+                if force or now - last >= self._progress_interval:
+                    to_deliver.append(data)
+                    self._last_progress_time[title] = now
+                    self._pending_progress.pop(title)
+        if to_deliver:
+            self._deliver(Events.LOG_PROGRESS, to_deliver)
+
+    @staticmethod
+    def _deliver(event: str, data_list: list[dict]) -> None:
+        try:
+            _dispatch_with_log(event, data_list)
+        except Exception:
+            # A failing subscriber must not stop the dispatcher
+            logger.exception(f"Subscriber failed for event {event}")
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._deliver_batch(self._get_batch())
+            self._deliver_progress()
+
+    def flush(self) -> None:
+        """Delivers all queued events and pending progress in the calling thread"""
+        batch = []
+        while True:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        self._deliver_batch(batch)
+        self._deliver_progress(force=True)
+
+    def stop(self, flush: bool = True) -> None:
+        self._stop.set()
+        self._thread.join()
+        if flush:
+            self.flush()
+
+
+def start_queued_dispatch(
+    max_queue_size: int = 10_000, batch_size: int = 500, progress_interval: float = 0.2
+) -> None:
+    """Events are queued and delivered to subscribers by a background thread
+    until stop_queued_dispatch is called"""
+    global _dispatcher
+    if _dispatcher:
+        return
+    _dispatcher = _QueuedDispatcher(
+        max_queue_size=max_queue_size,
+        batch_size=batch_size,
+        progress_interval=progress_interval,
+    )
+
+
+def stop_queued_dispatch(flush: bool = True) -> None:
+    """Stops the background thread. Events still in the queue are delivered in the
+    calling thread if flush is True"""
+    global _dispatcher
+    if not _dispatcher:
+        return
+    dispatcher = _dispatcher
+    _dispatcher = None
+    dispatcher.stop(flush=flush)
+    if dispatcher.nr_dropped:
+        logger.warning(f"{dispatcher.nr_dropped} events dropped since queue was full")
+
+
+def is_queued_dispatch() -> bool:
+    return _dispatcher is not None
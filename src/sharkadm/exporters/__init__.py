@@ -1,96 +1,94 @@
-# ruff: noqa: I001
-import functools
 import pathlib
 from typing import Type
 
-from sharkadm import utils
 from sharkadm.exporters.base import PolarsExporter
-from sharkadm.exporters.columns import ExportColumnViewsColumnsNotInData
-from sharkadm.exporters.comment import ExportComment
-from sharkadm.exporters.dataframe import PolarsDataFrame
-from sharkadm.exporters.html_station_map import (
-    PolarsHtmlMap,
-    PolarsHtmlScatterMap,
-)
-
-# from sharkadm.exporters.ifcb_visualization import IfcbVisualizationFiles
-from sharkadm.exporters.jellyfish import ExportJellyfishRowsFromLimsExport
-from sharkadm.exporters.plot import SimplePlot
-from sharkadm.exporters.print_on_screen import PrintDataFrame
-from sharkadm.exporters.profile import ExportStandardFormat
-from sharkadm.exporters.shark_data_txt_file import (
-    PolarsSHARKdataTxtAsGiven,
-    PolarsSHARKdataTxt,
-)
-from sharkadm.exporters.shark_metadata_auto import PolarsSHARKMetadataAuto
-from sharkadm.exporters.species_translation import SpeciesTranslationTxt
-
-# from sharkadm.exporters.standard_format import PolarsStandardFormat
-from sharkadm.exporters.statistics import PolarsPrintStatistics, PolarsStatisticsToTxt
-from sharkadm.exporters.system import (
-    ExportersSummaryFile,
-    TransformersSummaryFile,
-    ValidatorsSummaryFile,
-)
-from sharkadm.exporters.txt_file import (
-    PolarsTxtAsIs,
-    PolarsTxtWithImportedColumns,
-)
-from sharkadm.exporters.zip_archive import PolarsZipArchive
-from sharkadm.exporters.dv_template_qc_result import (
-    ExportDvTemplateWithQcResult,
-    LimsExportDvTemplateWithQcResult,
-)
-from sharkadm.utils.inspect_kwargs import get_kwargs_for_class
-
-
-@functools.cache
+from sharkadm.operator_catalogue import operator_catalogue
+from sharkadm.utils.lazy_import import get_lazy_attribute, import_modules
+
+# Exporter classes are imported from their modules on first access
+_LAZY_NAMES = {
+    "ExportColumnViewsColumnsNotInData": "columns",
+    "ExportComment": "comment",
+    "ExportDvTemplateWithQcResult": "dv_template_qc_result",
+    "ExportJellyfishRowsFromLimsExport": "jellyfish",
+    "ExportStandardFormat": "profile",
+    "ExportersSummaryFile": "system",
+    # "IfcbVisualizationFiles": "ifcb_visualization",
+    "LimsExportDvTemplateWithQcResult": "dv_template_qc_result",
+    "PolarsDataFrame": "dataframe",
+    "PolarsHtmlMap": "html_station_map",
+    "PolarsHtmlScatterMap": "html_station_map",
+    "PolarsPrintStatistics": "statistics",
+    "PolarsSHARKMetadataAuto": "shark_metadata_auto",
+    "PolarsSHARKdataTxt": "shark_data_txt_file",
+    "PolarsSHARKdataTxtAsGiven": "shark_data_txt_file",
+    # "PolarsStandardFormat": "standard_format",
+    "PolarsStatisticsToTxt": "statistics",
+    "PolarsTxtAsIs": "txt_file",
+    "PolarsTxtWithImportedColumns": "txt_file",
+    "PolarsZipArchive": "zip_archive",
+    "PrintDataFrame": "print_on_screen",
+    "SimplePlot": "plot",
+    "SpeciesTranslationTxt": "species_translation",
+    "TransformersSummaryFile": "system",
+    "ValidatorsSummaryFile": "system",
+}
+
+
+def __getattr__(name: str):
+    return get_lazy_attribute(__name__, _LAZY_NAMES, name)
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + list(_LAZY_NAMES))
+
+
+def import_all_exporters() -> None:
+    """Imports all exporter modules"""
+    import_modules(__name__, _LAZY_NAMES.values())
+
+
+operator_catalogue.register_group("exporters", PolarsExporter, import_all_exporters)
+
+
 def get_exporter_list() -> list[str]:
     """Returns a sorted list of name of all available exporters"""
-    return sorted(utils.get_all_class_children_names(PolarsExporter))
+    return sorted(get_exporters_info())
 
 
-@functools.cache
 def get_exporters() -> dict[str, Type[PolarsExporter]]:
-    """Returns a dictionary with exporters"""
-    return utils.get_all_class_children(PolarsExporter)
+    """Returns a dictionary with exporters. Imports all exporter modules"""
+    return operator_catalogue.get_classes("exporters")
     # exporters = {}
     # for cls in PolarsExporter.__subclasses__():
     #     exporters[cls.__name__] = cls
     # return exporters
 
 
+def get_exporter_class(name: str) -> Type[PolarsExporter] | None:
+    """Returns the exporter class with the given name. Only the module of the
+    exporter is imported"""
+    return operator_catalogue.get_class("exporters", name)
+
+
 def get_exporter_object(name: str, **kwargs) -> PolarsExporter:
     """Returns PolarsExporter object that matches the given exporter name"""
-    all_exporters = get_exporters()
-    exporter = all_exporters[name]
+    exporter = get_exporter_class(name)
+    if not exporter:
+        raise KeyError(name)
     return exporter(**kwargs)
 
 
 def get_exporters_description() -> dict[str, str]:
     """Returns a dictionary with exporter name as key and the description as value"""
     result = dict()
-    for name, tran in get_exporters().items():
-        result[name] = tran.get_exporter_description()
+    for name, info in get_exporters_info().items():
+        result[name] = info["description"]
     return result
 
 
 def get_exporters_info() -> dict:
-    result = dict()
-    for name, exp in get_exporters().items():
-        result[name] = dict()
-        result[name]["name"] = name
-        result[name]["description"] = exp.get_exporter_description()
-        result[name]["kwargs"] = get_kwargs_for_class(exp)
-        # result[name]['kwargs'] = dict()
-        # for key, value in inspect.signature(exp.__init__).parameters.items():
-        #     if key in ['self', 'kwargs']:
-        #         continue
-        #     val = value.default
-        #     if type(val) == type:
-        #         val = None
-        #     result[name]['kwargs'][key] = val
-    return result
+    return operator_catalogue.get_info("exporters")
 
 
 def get_exporters_description_text() -> str:
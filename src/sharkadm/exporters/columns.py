@@ -5,6 +5,8 @@ from .base import PolarsFileExporter
 
 
 class ExportColumnViewsColumnsNotInData(PolarsFileExporter):
+    supports_categorical = True
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._column_views = get_column_views_config()
@@ -138,18 +138,9 @@ class PolarsHtmlScatterMap(PolarsFileExporter):
             zoom_start=6,
             tiles="Cartodb Positron",
         )
-        self.m.fit_bounds(
-            (
-                (
-                    data_holder.data["sample_latitude_dd"].cast(float).min(),
-                    data_holder.data["sample_longitude_dd"].cast(float).min(),
-                ),
-                (
-                    data_holder.data["sample_latitude_dd"].cast(float).max(),
-                    data_holder.data["sample_longitude_dd"].cast(float).max(),
-                ),
-            )
-        )
+        lat = data_holder.float_col("sample_latitude_dd", strict=True)
+        lon = data_holder.float_col("sample_longitude_dd", strict=True)
+        self.m.fit_bounds(((lat.min(), lon.min()), (lat.max(), lon.max())))
 
         if self._by_percentage:
             self._plot_by_percentage(data_holder)
@@ -6,6 +6,8 @@ from .base import PolarsExporter
 class PrintDataFrame(PolarsExporter):
     """Prints the dataframe on screen"""
 
+    supports_categorical = True
+
     @staticmethod
     def get_exporter_description() -> str:
         return "Prints data on screen"
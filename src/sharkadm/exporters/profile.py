@@ -1,4 +1,5 @@
 import pathlib
+from concurrent.futures import ThreadPoolExecutor
 
 import polars as pl
 
@@ -9,6 +10,43 @@ from ..data.profile.base import PolarsProfileDataHolder
 from .base import PolarsFileExporter
 
 
+def write_profile_file(
+    path: pathlib.Path,
+    header_lines: list[str],
+    data: pl.DataFrame,
+    encoding: str = "cp1252",
+    quote_style: str = "necessary",
+) -> None:
+    """Writes header lines followed by data as tab separated csv to path"""
+    # Empty strings are written as empty fields and not quoted as ""
+    data = data.with_columns(pl.col(pl.String).replace("", None))
+    with open(path, "w", encoding=encoding) as fid:
+        if header_lines:
+            fid.write("\n".join(header_lines))
+            fid.write("\n")
+        fid.write(data.write_csv(separator="\t", quote_style=quote_style))
+
+
+def write_profile_files(
+    jobs: list[tuple[pathlib.Path, list[str], pl.DataFrame]],
+    max_workers: int | None = None,
+    **kwargs,
+) -> None:
+    """Writes profile files on a thread pool. Each job is a tuple with
+    (path, header_lines, data). See write_profile_file for kwargs."""
+    if len(jobs) < 2 or max_workers == 1:
+        for path, header_lines, data in jobs:
+            write_profile_file(path, header_lines, data, **kwargs)
+        return
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(write_profile_file, path, header_lines, data, **kwargs)
+            for path, header_lines, data in jobs
+        ]
+        for future in futures:
+            future.result()
+
+
 class ExportStandardFormat(PolarsFileExporter):
     valid_data_structures = ("profile",)
 
@@ -183,50 +221,47 @@ class ExportStandardFormat(PolarsFileExporter):
             adm_logger.log_export(
                 "So sensor_info loaded. Will create without this information"
             )
+        metadata_by_key = data_holder.metadata_by_key
+        unit_mapper = dict(data_holder.get_unit_mapper())
+        unit_mapper["PRES_CTD"] = "[dbar]"
+        jobs = []
         for (source,), df in data_holder.data.group_by("source"):
+            key = pathlib.Path(str(source)).stem
+            meta = metadata_by_key[key]
             all_lines = []
-            meta_lines = self._get_metadata_lines(
-                data_holder=data_holder, source=str(source)
+            all_lines.extend(self.initial_lines)
+            all_lines.extend(self._get_metadata_lines(meta))
+            all_lines.extend(
+                self._get_sensor_info_lines(data_holder=data_holder, source=source)
             )
-            sensor_info_lines = self._get_sensor_info_lines(
-                data_holder=data_holder, source=source
+            all_lines.append("//INFORMATION;")
+            all_lines.extend(
+                self._get_instrument_info_lines(data_holder=data_holder, source=source)
             )
-            instrument_info_lines = self._get_instrument_info_lines(
-                data_holder=data_holder, source=source
+            data = self._get_data(
+                data_holder=data_holder, df=df, meta=meta, unit_mapper=unit_mapper
             )
-            data_lines = self._get_data_lines(data_holder=data_holder, df=df)
-
-            all_lines.extend(self.initial_lines)
-            all_lines.extend(meta_lines)
-            all_lines.extend(sensor_info_lines)
-            all_lines.append("//INFORMATION;")
-            all_lines.extend(instrument_info_lines)
-            all_lines.extend(data_lines)
-
             export_path = (
                 self.export_directory / pathlib.Path(source).with_suffix(".txt").name
             )
-            print(f"{export_path=}")
-            with open(export_path, "w", encoding="cp1252") as fid:
-                fid.write("\n".join(all_lines))
+            jobs.append((export_path, all_lines, data))
+        write_profile_files(
+            jobs,
+            max_workers=self._kwargs.get("max_workers"),
+            encoding="cp1252",
+            quote_style="never",
+        )
 
-    def _get_metadata_columns_in_order(
-        self, data_holder: PolarsProfileDataHolder, key: str
-    ) -> list[str]:
-        meta_columns = [
-            col for col in self.metadata_order if col in data_holder.metadata_by_key[key]
-        ]
+    def _get_metadata_columns_in_order(self, meta: dict[str, str]) -> list[str]:
+        meta_columns = [col for col in self.metadata_order if col in meta]
         return meta_columns
 
-    def _get_metadata_lines(
-        self, data_holder: PolarsProfileDataHolder, source: str
-    ) -> list[str]:
+    def _get_metadata_lines(self, meta: dict[str, str]) -> list[str]:
         lines = []
-        key = pathlib.Path(source).stem
-        columns_in_order = self._get_metadata_columns_in_order(data_holder, key)
+        columns_in_order = self._get_metadata_columns_in_order(meta)
         for meta_par in columns_in_order:
             trans_meta_par = self._mapper.get_external_name(meta_par)
-            value = data_holder.metadata_by_key[key][meta_par]
+            value = meta[meta_par]
             lines.append(f"//METADATA;{trans_meta_par};{value}")
             if (
                 trans_meta_par == "FILE_NAME"
@@ -262,26 +297,22 @@ class ExportStandardFormat(PolarsFileExporter):
             lines.append(f"//INSTRUMENT_METADATA;{item.strip()}")
         return lines
 
-    def _get_data_lines(
-        self, data_holder: PolarsProfileDataHolder, df: pl.DataFrame
-    ) -> list[str]:
-        key = pathlib.Path(df["source"][0]).stem
+    def _get_data(
+        self,
+        data_holder: PolarsProfileDataHolder,
+        df: pl.DataFrame,
+        meta: dict[str, str],
+        unit_mapper: dict[str, str],
+    ) -> pl.DataFrame:
         updated_df = self._add_initial_data_columns(df)
-        data_cols = [
-            col
-            for col in data_holder.data.columns
-            if col not in data_holder.metadata_by_key[key]
-        ]
+        data_cols = [col for col in data_holder.data.columns if col not in meta]
         data_cols = [
             data_holder.header_mapper.get_external_name(col) for col in data_cols
         ]
-        data_cols = self.initial_data_columns + data_cols
+        data_cols = self.initial_data_columns + tuple(data_cols)
         remove_cols = ["row_number"]
         data_cols = [col for col in data_cols if col not in remove_cols]
 
-        unit_mapper = data_holder.get_unit_mapper()
-        unit_mapper["PRES_CTD"] = "[dbar]"
-
         cols_to_add = []
         new_cols = []
         for col in data_cols:
@@ -298,21 +329,11 @@ class ExportStandardFormat(PolarsFileExporter):
             cols_to_add.append(pl.lit("").alias(q_col))
             new_cols.append(q0_col)
             new_cols.append(q_col)
-        print(f"1:         {new_cols=}")
         final_df = updated_df.with_columns(cols_to_add)[new_cols]
-        print(f"1: {final_df.columns=}")
 
         final_df = final_df.with_columns(pl.col("MONTH").str.zfill(2).alias("MONTH"))
         col_order = self._get_final_column_order(final_df)
-        print(f"2:        {col_order=}")
-        final_df = final_df[col_order]
-        print(f"2: {final_df.columns=}")
-
-        lines = list()
-        lines.append("\t".join(final_df.columns))
-        for line in final_df.iter_rows():
-            lines.append("\t".join(line))
-        return lines
+        return final_df[col_order]
 
     def _get_final_column_order(self, df: pl.DataFrame) -> list:
         columns = [col for col in self.FINAL_COLUMN_ORDER if col in df.columns]
@@ -9,6 +9,7 @@ from ..data import PolarsDataHolder
 from ..data.profile.base import PolarsProfileDataHolder
 from ..utils.paths import get_next_incremented_file_path
 from .base import PolarsFileExporter
+from .profile import write_profile_files
 
 
 class PolarsStandardFormat(PolarsFileExporter):
@@ -40,9 +41,11 @@ class PolarsStandardFormat(PolarsFileExporter):
 
     def _export(self, data_holder: PolarsProfileDataHolder) -> None:
         metadata = data_holder.metadata_original_columns
+        reserved_paths = set()
+        jobs = []
         for (date, time), data in data_holder.data.group_by("visit_date", "sample_time"):
             stem = pathlib.Path(data[0, "source"]).stem
-            meta = metadata[(date, time)]
+            meta = metadata[stem]
             data_cols = [col for col in data_holder.data.columns if not meta.get(col)]
             meta_rows = self._get_metadata_rows(meta)
 
@@ -52,15 +55,12 @@ class PolarsStandardFormat(PolarsFileExporter):
             data = self._reorder_data(data, data_cols)
 
             path = self._export_directory / f"{stem}.txt"
-            if path.exists():
-                path = get_next_incremented_file_path(path)
-            header_lines = self._initial_rows + meta_rows
-            with open(path, "w", encoding="cp1252") as fid:
-                fid.write("\n".join(header_lines))
-                fid.write("\n")
-            data.to_pandas().to_csv(
-                path, mode="a", sep="\t", index=False, encoding="cp1252"
-            )
+            path = get_next_incremented_file_path(path, reserved=reserved_paths)
+            reserved_paths.add(path)
+            jobs.append((path, self._initial_rows + meta_rows, data))
+        write_profile_files(
+            jobs, max_workers=self._kwargs.get("max_workers"), encoding=self._encoding
+        )
 
     def _add_columns(self, data: pl.DataFrame) -> pl.DataFrame:
         data = data.with_columns(
@@ -8,6 +8,8 @@ from .base import PolarsExporter, PolarsFileExporter
 
 
 class PolarsPrintStatistics(PolarsExporter):
+    supports_categorical = True
+
     @staticmethod
     def get_exporter_description() -> str:
         return "Print statistics on screen"
@@ -25,6 +27,8 @@ class PolarsPrintStatistics(PolarsExporter):
 
 
 class PolarsStatisticsToTxt(PolarsFileExporter):
+    supports_categorical = True
+
     def __init__(
         self,
         export_directory: str | pathlib.Path | None = None,
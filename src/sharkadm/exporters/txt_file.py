@@ -7,6 +7,8 @@ from sharkadm.utils.paths import get_next_incremented_file_path
 
 
 class PolarsTxtAsIs(PolarsFileExporter):
+    supports_categorical = True
+
     def __init__(
         self,
         export_directory: str | pathlib.Path | None = None,
@@ -55,6 +57,8 @@ class PolarsTxtAsIs(PolarsFileExporter):
 
 
 class PolarsTxtWithImportedColumns(PolarsFileExporter):
+    supports_categorical = True
+
     def __init__(
         self,
         export_directory: str | pathlib.Path | None = None,
@@ -3,7 +3,9 @@ import os
 import pathlib
 import shutil
 
-from sharkadm import exporters, sharkadm_logger, utils
+import polars as pl
+
+from sharkadm import dataset_diff, exporters, sharkadm_logger, utils
 from sharkadm.data import PolarsDataHolder
 from sharkadm.sharkadm_logger import adm_logger
 from sharkadm.utils import archive
@@ -18,9 +20,13 @@ class PolarsZipArchive(PolarsFileExporter):
         self,
         export_directory: str | pathlib.Path | None = None,
         export_file_name: str | pathlib.Path | None = None,
+        previous_zip_archive: str | pathlib.Path | None = None,
+        diff_key_columns: list[str] | None = None,
         **kwargs,
     ):
         super().__init__(export_directory, export_file_name, **kwargs)
+        self._previous_zip_archive = previous_zip_archive
+        self._diff_key_columns = diff_key_columns
 
         self._data_holder: PolarsDataHolder | None = None
         self._metadata_auto: exporters.PolarsSHARKMetadataAuto | None = None
@@ -138,9 +144,35 @@ class PolarsZipArchive(PolarsFileExporter):
         )
         exporter.export(self._data_holder)
 
+    def _get_diff_to_previous_zip_archive(self) -> dataset_diff.DatasetDiff | None:
+        if not self._previous_zip_archive:
+            return None
+        if not pathlib.Path(self._previous_zip_archive).exists():
+            self._log(
+                f"Previous zip archive not found: {self._previous_zip_archive}",
+                level=adm_logger.WARNING,
+            )
+            return None
+        diff = dataset_diff.diff_data(
+            dataset_diff.get_zip_package_data(self._previous_zip_archive),
+            pl.read_csv(
+                self._temp_target_directory / dataset_diff.ZIP_PACKAGE_DATA_FILE,
+                separator="\t",
+                encoding=self._encoding,
+                infer_schema=False,
+                missing_utf8_is_empty_string=True,
+            ),
+            key_columns=self._diff_key_columns,
+        )
+        diff.write_report(self._save_zip_path.with_suffix(".change_report.txt"))
+        return diff
+
     def _create_changelog_file(self) -> None:
+        diff = self._get_diff_to_previous_zip_archive()
         if hasattr(self._data_holder, "change_log"):
             path = self._temp_target_directory / "change_log.txt"
+            if diff:
+                diff.add_to_change_log(self._data_holder.change_log)
             self._data_holder.change_log.add_sharkadm_logger_info()
             self._data_holder.change_log.save_file(path)
         else:
@@ -0,0 +1,370 @@
+"""Incremental reprocessing of resubmitted datasets.
+
+The result of the row local operators (see Operator.row_local) at the start of the
+workflow is stored as a snapshot together with a hash of each input row. When the
+dataset is processed again only inserted or changed rows are run through these
+operators. The result is merged with the unchanged rows of the snapshot. Removed
+rows are dropped. The rest of the workflow, from the first operator that is not
+row local, needs all rows and is always run on the merged data.
+
+Validation log entries from the row local operators are stored per row in the
+snapshot. Entries for unchanged rows are logged again, with the current row
+numbers, merged with the entries from the changed rows. Entries without row
+numbers can not be traced to rows and are kept from both runs, but a success
+entry without row numbers is dropped if the validator reports a failure in the
+same column.
+
+A full rerun is made if there is no snapshot or if the row local operators, the
+input columns or the polars version have changed.
+"""
+
+import json
+import pathlib
+import re
+from typing import Any
+
+import polars as pl
+
+from sharkadm.controller import SHARKadmPolarsController
+from sharkadm.dataset_diff import get_row_hashes
+from sharkadm.sharkadm_logger import RowNumbers, adm_logger
+from sharkadm.sharkadm_operator import Operator, OperatorsInfo
+
+ROW_HASH_COLUMN = "_incremental_row_hash"
+ROW_OCCURRENCE_COLUMN = "_incremental_row_occurrence"
+KEY_COLUMNS = (ROW_HASH_COLUMN, ROW_OCCURRENCE_COLUMN)
+ENTRY_COLUMN = "_incremental_entry"
+
+# Columns that are not part of the input row when hashing
+_NOT_HASHED_COLUMNS = ("row_number", "source")
+
+
+# Keys in log entries that are not stored in the snapshot
+_NOT_STORED_ENTRY_KEYS = ("row_numbers", "log_nr", "dataset_name", "count")
+
+_SIMPLE_TYPES = (str, int, float, bool, type(None))
+
+
+def _is_simple(value: Any) -> bool:
+    if isinstance(value, (list, tuple)):
+        return all(isinstance(item, _SIMPLE_TYPES) for item in value)
+    return isinstance(value, _SIMPLE_TYPES)
+
+
+def get_operators_signature(operators: list[Operator]) -> list[str]:
+    """Returns a list that identifies the operators and their settings (attributes
+    with simple values)"""
+    signature = []
+    for oper in operators:
+        settings = {key: value for key, value in vars(oper).items() if _is_simple(value)}
+        signature.append(f"{oper.name}: {json.dumps(settings, sort_keys=True)}")
+    return signature
+
+
+def get_hash_columns(df: pl.DataFrame) -> list[str]:
+    return sorted(col for col in df.columns if col not in _NOT_HASHED_COLUMNS)
+
+
+def add_row_keys(df: pl.DataFrame) -> pl.DataFrame:
+    """Adds the row hash of the input columns and the occurrence of the hash
+    (identical rows get different occurrence numbers)"""
+    row_hash = get_row_hashes(df, get_hash_columns(df))
+    return df.with_columns(row_hash.alias(ROW_HASH_COLUMN)).with_columns(
+        pl.col(ROW_HASH_COLUMN)
+        .cum_count()
+        .over(ROW_HASH_COLUMN)
+        .alias(ROW_OCCURRENCE_COLUMN)
+    )
+
+
+def split_operators(operators: list[Operator]) -> tuple[list[Operator], list[Operator]]:
+    """Splits operators in the row local operators at the start, that can be run
+    on changed rows only, and the rest that are run on all rows"""
+    for nr, oper in enumerate(operators):
+        if not oper.row_local:
+            return list(operators[:nr]), list(operators[nr:])
+    return list(operators), []
+
+
+def get_entry_rows(entries: list[dict], keys: pl.DataFrame) -> pl.DataFrame:
+    """Returns the row keys of the row numbers in each log entry. ENTRY_COLUMN is
+    the index of the entry. keys has the row numbers (as integers) and the row
+    keys of the data"""
+    ranges = [
+        (nr, start, end)
+        for nr, data in enumerate(entries)
+        if isinstance(data.get("row_numbers"), RowNumbers)
+        for start, end in data["row_numbers"].ranges
+    ]
+    entry_rows = pl.DataFrame(
+        ranges,
+        schema={ENTRY_COLUMN: pl.Int64, "start": pl.Int64, "end": pl.Int64},
+        orient="row",
+    )
+    entry_rows = entry_rows.select(
+        ENTRY_COLUMN, pl.int_ranges("start", pl.col("end") + 1).alias("row_number")
+    ).explode("row_number")
+    return entry_rows.join(keys, on="row_number", how="inner").select(
+        ENTRY_COLUMN, *KEY_COLUMNS
+    )
+
+
+def _get_int_row_numbers(keys: pl.DataFrame) -> pl.DataFrame:
+    return keys.with_columns(pl.col("row_number").cast(pl.Int64, strict=False))
+
+
+def _drop_contradicted_successes(entries: list[dict]) -> list[dict]:
+    """Drops success entries without row numbers if the same validator reports a
+    failure in the same column"""
+    failed = {
+        (data["cls"], str(data.get("column")))
+        for data in entries
+        if data.get("validation_success") is False
+    }
+    return [
+        data
+        for data in entries
+        if not (
+            data.get("validation_success") is True
+            and not data.get("row_numbers")
+            and (data["cls"], str(data.get("column"))) in failed
+        )
+    ]
+
+
+class IncrementalSnapshot:
+    """Snapshot of a processed dataset stored in directory"""
+
+    def __init__(self, directory: str | pathlib.Path, dataset_name: str):
+        self._directory = pathlib.Path(directory) / re.sub(r"[^\w\-.]", "_", dataset_name)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}: {self._directory}"
+
+    @property
+    def result_path(self) -> pathlib.Path:
+        return self._directory / "result.parquet"
+
+    @property
+    def meta_path(self) -> pathlib.Path:
+        return self._directory / "meta.json"
+
+    @property
+    def entries_path(self) -> pathlib.Path:
+        return self._directory / "validation_entries.json"
+
+    @property
+    def entry_rows_path(self) -> pathlib.Path:
+        return self._directory / "validation_entry_rows.parquet"
+
+    @property
+    def exists(self) -> bool:
+        return all(
+            path.exists()
+            for path in (
+                self.result_path,
+                self.meta_path,
+                self.entries_path,
+                self.entry_rows_path,
+            )
+        )
+
+    def get_meta(self) -> dict:
+        if not self.meta_path.exists():
+            return dict()
+        with open(self.meta_path, encoding="utf-8") as fid:
+            return json.load(fid)
+
+    def get_result(self) -> pl.DataFrame:
+        return pl.read_parquet(self.result_path)
+
+    def get_entries(self, keys: pl.DataFrame) -> list[dict]:
+        """Returns the stored validation log entries for the rows in keys with the
+        row numbers in keys. Entries with row numbers that are not in keys are
+        left out"""
+        with open(self.entries_path, encoding="utf-8") as fid:
+            stored = json.load(fid)
+        rows = (
+            pl.read_parquet(self.entry_rows_path)
+            .join(_get_int_row_numbers(keys), on=KEY_COLUMNS, how="inner")
+            .group_by(ENTRY_COLUMN)
+            .agg("row_number")
+        )
+        rows_by_entry = dict(zip(rows[ENTRY_COLUMN], rows["row_number"]))
+        entries = []
+        for nr, item in enumerate(stored):
+            data = item["entry"]
+            if item["traced"]:
+                if nr not in rows_by_entry:
+                    continue
+                data["row_numbers"] = RowNumbers(rows_by_entry[nr])
+            entries.append(data)
+        return entries
+
+    def save(
+        self,
+        result: pl.DataFrame,
+        operators: list[Operator],
+        input_columns: list[str],
+        entries: list[dict] | None = None,
+    ) -> None:
+        """Saves the result of the row local operators and the validation log
+        entries they made"""
+        entries = entries or []
+        self._directory.mkdir(parents=True, exist_ok=True)
+        result.write_parquet(self.result_path)
+        keys = _get_int_row_numbers(result.select("row_number", *KEY_COLUMNS))
+        get_entry_rows(entries, keys).write_parquet(self.entry_rows_path)
+        stored = [
+            dict(
+                entry={
+                    key: value
+                    for key, value in data.items()
+                    if key not in _NOT_STORED_ENTRY_KEYS
+                },
+                traced=bool(
+                    isinstance(data.get("row_numbers"), RowNumbers)
+                    and data["row_numbers"]
+                ),
+            )
+            for data in entries
+        ]
+        with open(self.entries_path, "w", encoding="utf-8") as fid:
+            json.dump(stored, fid, default=str)
+        meta = dict(
+            operators=get_operators_signature(operators),
+            input_columns=input_columns,
+            polars_version=pl.__version__,
+        )
+        with open(self.meta_path, "w", encoding="utf-8") as fid:
+            json.dump(meta, fid, indent=2)
+
+    def get_reason_for_full_rerun(
+        self, operators: list[Operator], input_columns: list[str]
+    ) -> str:
+        """Returns the reason a full rerun is needed. Returns an empty string if
+        incremental processing is possible"""
+        if not self.exists:
+            return "No previous snapshot"
+        row_local_operators, _ = split_operators(operators)
+        meta = self.get_meta()
+        if meta.get("operators") != get_operators_signature(row_local_operators):
+            return "Operators have changed"
+        if meta.get("input_columns") != input_columns:
+            return "Input columns have changed"
+        if meta.get("polars_version") != pl.__version__:
+            # Row hashes are not guaranteed to be stable between polars versions
+            return "Polars version has changed"
+        return ""
+
+    def run_operators(
+        self, controller: SHARKadmPolarsController, *operators: Operator
+    ) -> OperatorsInfo:
+        """Runs operators on the data in controller. Only inserted or changed rows
+        are run through the row local operators at the start if possible. The rest
+        of the operators are run on all rows. The data holder in controller holds
+        the full (merged) result afterwards and the snapshot is updated."""
+        data_holder = controller.data_holder
+        input_columns = get_hash_columns(data_holder.data)
+        data_holder.data = add_row_keys(data_holder.data)
+        new_keys = data_holder.data.select("row_number", *KEY_COLUMNS)
+        row_local_operators, dataset_operators = split_operators(list(operators))
+
+        reason = self.get_reason_for_full_rerun(list(operators), input_columns)
+        if reason:
+            adm_logger.log_workflow(
+                f"Incremental processing not possible, running all rows: {reason}",
+                level=adm_logger.INFO,
+            )
+            previous_entries = []
+            info, held = self._run_row_local(controller, row_local_operators)
+        else:
+            previous_entries = self.get_entries(new_keys)
+            info, held = self._run_incremental(controller, new_keys, *row_local_operators)
+        entries = self._log_entries(held, previous_entries)
+
+        if not info.terminated:
+            self.save(data_holder.data, row_local_operators, input_columns, entries)
+        data_holder.data = data_holder.data.drop(KEY_COLUMNS, strict=False)
+        if info.terminated or not dataset_operators:
+            return info
+
+        adm_logger.log_workflow(
+            f"Running all rows: {', '.join(oper.name for oper in dataset_operators)}",
+            level=adm_logger.INFO,
+        )
+        dataset_info = controller.run_operators(*dataset_operators)
+        info.add(dataset_info)
+        info.terminated = dataset_info.terminated
+        return info
+
+    @staticmethod
+    def _run_row_local(
+        controller: SHARKadmPolarsController, operators: list[Operator]
+    ) -> tuple[OperatorsInfo, list[dict]]:
+        """Runs operators and returns the info and the log entries made (not yet
+        logged)"""
+        with adm_logger.held_entries() as held:
+            info = controller.run_operators(*operators)
+        return info, held
+
+    @staticmethod
+    def _log_entries(held: list[dict], previous_entries: list[dict]) -> list[dict]:
+        """Logs entries held when running the row local operators. The validation
+        entries are merged with the entries for unchanged rows in the snapshot and
+        logged where the validator first logged. Returns the merged validation
+        entries"""
+        new_entries = [data for data in held if data["log_type"] == adm_logger.VALIDATION]
+        entries = _drop_contradicted_successes(
+            adm_logger.merge_chunk_entries([previous_entries, new_entries])
+        )
+        entries_by_cls: dict[str, list[dict]] = dict()
+        for data in entries:
+            entries_by_cls.setdefault(data["cls"], []).append(data)
+        to_log = []
+        for data in held:
+            if data["log_type"] == adm_logger.VALIDATION:
+                to_log.extend(entries_by_cls.pop(data["cls"], []))
+            else:
+                to_log.append(data)
+        for remaining in entries_by_cls.values():
+            to_log.extend(remaining)
+        adm_logger.log_entries(to_log)
+        return entries
+
+    def _run_incremental(
+        self,
+        controller: SHARKadmPolarsController,
+        new_keys: pl.DataFrame,
+        *operators: Operator,
+    ) -> tuple[OperatorsInfo, list[dict]]:
+        data_holder = controller.data_holder
+        previous = self.get_result()
+        previous_keys = previous.select(KEY_COLUMNS)
+        changed = data_holder.data.join(previous_keys, on=KEY_COLUMNS, how="anti")
+        unchanged = previous.drop("row_number").join(
+            new_keys, on=KEY_COLUMNS, how="inner"
+        )
+        nr_removed = len(previous) - len(unchanged)
+        adm_logger.log_workflow(
+            f"Incremental processing: {len(changed)} inserted or changed rows, "
+            f"{nr_removed} removed or changed rows, {len(unchanged)} unchanged rows",
+            level=adm_logger.INFO,
+        )
+        info = OperatorsInfo()
+        held = []
+        if len(changed):
+            data_holder.data = changed
+            info, held = self._run_row_local(controller, list(operators))
+            if info.terminated:
+                return info, held
+            changed = data_holder.data
+        merged = pl.concat([unchanged, changed], how="diagonal_relaxed")
+        # Columns in the same order as in a full run
+        columns = changed.columns if len(changed) else previous.columns
+        merged = merged.select(
+            *columns, *(col for col in merged.columns if col not in columns)
+        )
+        data_holder.data = merged.sort(pl.col("row_number").cast(pl.Int64))
+        data_holder.encode_categorical()
+        return info, held
@@ -1,43 +1,67 @@
-import functools
 import pathlib
 from typing import Type
 
-from sharkadm import utils
 from sharkadm.multi_transformers.base import PolarsMultiTransformer
-from sharkadm.multi_transformers.bvol import BvolPolars
-from sharkadm.multi_transformers.calculate import CalculatePolars
-from sharkadm.multi_transformers.date_time import DateTimePolars
-from sharkadm.multi_transformers.dyntaxa import DyntaxaPolars
-from sharkadm.multi_transformers.general_dv import GeneralDVPolars
-from sharkadm.multi_transformers.general_final import GeneralFinal
-from sharkadm.multi_transformers.general_initial import GeneralInitial
-from sharkadm.multi_transformers.lims import Lims
-from sharkadm.multi_transformers.location import (
-    LocationIntWaterPolars,
-    LocationPolars,
+from sharkadm.operator_catalogue import operator_catalogue
+from sharkadm.utils.lazy_import import get_lazy_attribute, import_modules
+
+# Multi transformer classes are imported from their modules on first access
+_LAZY_NAMES = {
+    "BvolPolars": "bvol",
+    "CalculatePolars": "calculate",
+    "DateTimePolars": "date_time",
+    "DyntaxaPolars": "dyntaxa",
+    "GeneralDVPolars": "general_dv",
+    "GeneralFinal": "general_final",
+    "GeneralInitial": "general_initial",
+    "Lims": "lims",
+    "LocationIntWaterPolars": "location",
+    "LocationPolars": "location",
+    "PositionPolars": "position",
+    "StaticDVPolars": "static_dv",
+    "TranslatePolars": "translate",
+    "WormsPolars": "worms",
+}
+
+
+def __getattr__(name: str):
+    return get_lazy_attribute(__name__, _LAZY_NAMES, name)
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + list(_LAZY_NAMES))
+
+
+def import_all_multi_transformers() -> None:
+    """Imports all multi transformer modules"""
+    import_modules(__name__, _LAZY_NAMES.values())
+
+
+operator_catalogue.register_group(
+    "multi_transformers", PolarsMultiTransformer, import_all_multi_transformers
 )
-from sharkadm.multi_transformers.position import PositionPolars
-from sharkadm.multi_transformers.static_dv import StaticDVPolars
-from sharkadm.multi_transformers.translate import TranslatePolars
-from sharkadm.multi_transformers.worms import WormsPolars
-from sharkadm.utils.inspect_kwargs import get_kwargs_for_class
 
 
-@functools.cache
 def get_multi_transformer_list() -> list[str]:
     """Returns a sorted list of name of all available multi_transformers"""
-    return sorted(utils.get_all_class_children_names(PolarsMultiTransformer))
+    return sorted(get_multi_transformers_info())
 
 
 def get_multi_transformers() -> dict[str, Type[PolarsMultiTransformer]]:
-    """Returns a dictionary with multi_transformers"""
-    return utils.get_all_class_children(PolarsMultiTransformer)
+    """Returns a dictionary with multi_transformers. Imports all multi transformer
+    modules"""
+    return operator_catalogue.get_classes("multi_transformers")
+
+
+def get_multi_transformer_class(name: str) -> Type[PolarsMultiTransformer] | None:
+    """Returns the multi transformer class with the given name. Only the module of
+    the multi transformer is imported"""
+    return operator_catalogue.get_class("multi_transformers", name)
 
 
 def get_multi_transformer_object(name: str, **kwargs) -> PolarsMultiTransformer | None:
     """Returns MultiTransformer object that matches the given multi transformer names"""
-    all_trans = get_multi_transformers()
-    tran = all_trans.get(name)
+    tran = get_multi_transformer_class(name)
     if not tran:
         return
     return tran(**kwargs)
@@ -47,21 +71,15 @@ def get_multi_transformers_description() -> dict[str, str]:
     """Returns a dictionary with multi transformer name as key and the description as
     value"""
     result = dict()
-    for name, tran in get_multi_transformers().items():
+    for name, info in get_multi_transformers_info().items():
         if name.startswith("_"):
             continue
-        result[name] = tran.get_transformer_description()
+        result[name] = info["description"]
     return result
 
 
 def get_multi_transformers_info() -> dict:
-    result = dict()
-    for name, tran in get_multi_transformers().items():
-        result[name] = dict()
-        result[name]["name"] = name
-        result[name]["description"] = tran.get_transformer_description()
-        result[name]["kwargs"] = get_kwargs_for_class(tran)
-    return result
+    return operator_catalogue.get_info("multi_transformers")
 
 
 def get_multi_transformers_description_text() -> str:
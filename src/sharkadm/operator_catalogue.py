@@ -0,0 +1,96 @@
+import copy
+import threading
+from typing import Any, Callable, Type
+
+from sharkadm import operator_manifest, utils
+
+
+class _Group:
+    def __init__(self, base: Type, import_all: Callable[[], None] | None = None):
+        self.base = base
+        self.import_all = import_all or (lambda: None)
+
+
+class OperatorCatalogue:
+    """Memoized catalogue of operator classes (transformers, validators, exporters
+    etc.) and data holders. Classes and info are looked up once per group and name
+    and then served from dicts. Plugins discovered via the sharkadm.plugin_operators
+    entry points are included. Call invalidate() after loading new modules or
+    plugins."""
+
+    def __init__(self):
+        self._groups: dict[str, _Group] = {}
+        self._classes: dict[str, dict[str, Type]] = {}
+        self._lookup: dict[str, dict[str, Type | None]] = {}
+        self._info: dict[str, dict[str, dict[str, Any]]] = {}
+        self._lock = threading.RLock()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__} with groups: {', '.join(self._groups)}"
+
+    @property
+    def groups(self) -> list[str]:
+        return list(self._groups)
+
+    def register_group(
+        self, group: str, base: Type, import_all: Callable[[], None] | None = None
+    ) -> None:
+        """Registers a group of classes. All subclasses of base belongs to the group.
+        import_all should import all modules in the group"""
+        with self._lock:
+            self._groups[group] = _Group(base, import_all)
+            self._clear_group(group)
+
+    def get_classes(self, group: str) -> dict[str, Type]:
+        """Returns (a copy of) all classes in group. All modules in the group are
+        imported"""
+        with self._lock:
+            if group not in self._classes:
+                grp = self._groups[group]
+                grp.import_all()
+                self._classes[group] = utils.get_all_class_children(grp.base)
+            return dict(self._classes[group])
+
+    def get_class(self, group: str, name: str) -> Type | None:
+        """Returns the class with the given name in group. Only the module of the
+        class is imported if the class is listed in the operator manifest."""
+        with self._lock:
+            if group in self._classes:
+                return self._classes[group].get(name)
+            lookup = self._lookup.setdefault(group, {})
+            if name not in lookup:
+                grp = self._groups[group]
+                lookup[name] = operator_manifest.get_operator_class(
+                    group, name, grp.base, grp.import_all
+                )
+            return lookup[name]
+
+    def get_info(self, group: str) -> dict[str, dict[str, Any]]:
+        """Returns (a deep copy of) name, description and kwargs for all classes
+        in group"""
+        with self._lock:
+            if group not in self._info:
+                grp = self._groups[group]
+                self._info[group] = operator_manifest.get_operators_info(
+                    group, grp.base, grp.import_all
+                )
+            return copy.deepcopy(self._info[group])
+
+    def invalidate(self, group: str | None = None) -> None:
+        """Clears cached classes and info for group (all groups if None). New
+        plugins are loaded and the operator manifest is read again."""
+        from sharkadm import plugin_operators
+
+        plugin_operators.load_plugins()
+        operator_manifest.get_operator_manifest.cache_clear()
+        with self._lock:
+            for grp in [group] if group else self.groups:
+                self._clear_group(grp)
+
+    def _clear_group(self, group: str) -> None:
+        self._classes.pop(group, None)
+        self._lookup.pop(group, None)
+        self._info.pop(group, None)
+
+
+operator_catalogue = OperatorCatalogue()
@@ -0,0 +1,158 @@
+"""Manifest with name, module, description and kwargs for all built-in operators.
+
+The manifest makes it possible to list operators and to look up a single operator
+without importing every operator module (and their heavy dependencies).
+Regenerate the manifest after adding or changing an operator:
+
+    python -m sharkadm.operator_manifest
+"""
+
+import functools
+import importlib
+import json
+import pathlib
+from typing import Any, Callable, Iterable, Type
+
+from sharkadm import utils
+from sharkadm.utils.inspect_kwargs import get_kwargs_for_class
+
+MANIFEST_PATH = pathlib.Path(__file__).parent / "operator_manifest.json"
+
+DESCRIPTION_METHODS = dict(
+    transformers="get_transformer_description",
+    validators="get_validator_description",
+    exporters="get_exporter_description",
+    multi_transformers="get_transformer_description",
+    data_holders="get_data_holder_description",
+)
+
+
+def _get_operator_info(group: str, cls: Type) -> dict[str, Any]:
+    kwargs = get_kwargs_for_class(cls)
+    return dict(
+        name=cls.__name__,
+        module=cls.__module__,
+        description=getattr(cls, DESCRIPTION_METHODS[group])(),
+        kwargs=json.loads(json.dumps(kwargs, default=str)),
+    )
+
+
+def _get_base_classes() -> dict[str, Type]:
+    from sharkadm.exporters.base import PolarsExporter
+    from sharkadm.multi_transformers.base import PolarsMultiTransformer
+    from sharkadm.transformers.base import PolarsTransformer
+    from sharkadm.validators.base import Validator
+
+    return dict(
+        transformers=PolarsTransformer,
+        validators=Validator,
+        exporters=PolarsExporter,
+        multi_transformers=PolarsMultiTransformer,
+    )
+
+
+def _import_all_operator_modules() -> None:
+    from sharkadm import exporters, multi_transformers, transformers, validators
+
+    transformers.import_all_transformers()
+    validators.import_all_validators()
+    exporters.import_all_exporters()
+    multi_transformers.import_all_multi_transformers()
+
+
+def create_operator_manifest() -> dict[str, dict[str, dict[str, Any]]]:
+    """Imports all operator modules and returns the manifest for built-in
+    operators"""
+    _import_all_operator_modules()
+
+    manifest = dict()
+    for group, base in _get_base_classes().items():
+        manifest[group] = dict()
+        for name, cls in sorted(utils.get_all_class_children(base).items()):
+            if not cls.__module__.startswith("sharkadm."):
+                continue
+            manifest[group][name] = _get_operator_info(group, cls)
+    return manifest
+
+
+def write_operator_manifest(path: str | pathlib.Path = MANIFEST_PATH) -> pathlib.Path:
+    path = pathlib.Path(path)
+    with open(path, "w", encoding="utf-8") as fid:
+        json.dump(create_operator_manifest(), fid, indent=2, ensure_ascii=False)
+        fid.write("\n")
+    get_operator_manifest.cache_clear()
+    return path
+
+
+@functools.cache
+def get_operator_manifest() -> dict[str, dict[str, dict[str, Any]]]:
+    """Returns the manifest. Returns an empty dict if no manifest is found"""
+    if not MANIFEST_PATH.exists():
+        return dict()
+    with open(MANIFEST_PATH, encoding="utf-8") as fid:
+        return json.load(fid)
+
+
+def import_operator_modules(groups: Iterable[str] | None = None) -> list[str]:
+    """Imports the modules of all operators in the manifest (only in groups if
+    given). Used to load all operators up front in long running processes. All
+    operator modules are imported if there is no manifest. Returns the names of the
+    imported modules"""
+    manifest = get_operator_manifest()
+    if not manifest:
+        _import_all_operator_modules()
+        return []
+    groups = set(groups or manifest)
+    modules = sorted(
+        {
+            info["module"]
+            for group, operators in manifest.items()
+            if group in groups
+            for info in operators.values()
+        }
+    )
+    for module in modules:
+        importlib.import_module(module)
+    return modules
+
+
+def get_operator_class(
+    group: str, name: str, base: Type, import_all: Callable[[], None]
+) -> Type | None:
+    """Returns the operator class with the given name. If the operator is in the
+    manifest only the module of the operator is imported."""
+    manifest = get_operator_manifest()
+    info = manifest.get(group, {}).get(name)
+    if info:
+        return getattr(importlib.import_module(info["module"]), name)
+    if not manifest:
+        import_all()
+    # Plugins and other operators not in the manifest
+    return utils.get_all_class_children(base).get(name)
+
+
+def get_operators_info(
+    group: str, base: Type, import_all: Callable[[], None]
+) -> dict[str, dict[str, Any]]:
+    """Returns name, description and kwargs for all operators in group. Built-in
+    operators are read from the manifest. Imported operators that are not in the
+    manifest (plugins) are added."""
+    manifest = get_operator_manifest()
+    if not manifest:
+        import_all()
+    result = dict()
+    for name, info in manifest.get(group, {}).items():
+        result[name] = dict(
+            name=name, description=info["description"], kwargs=dict(info["kwargs"])
+        )
+    for name, cls in utils.get_all_class_children(base).items():
+        if name in result:
+            continue
+        info = _get_operator_info(group, cls)
+        info.pop("module")
+        result[name] = info
+    return result
+
+
+if __name__ == "__main__":
+    print(f"Operator manifest written to: {write_operator_manifest()}")
@@ -1,7 +1,18 @@
 from importlib.metadata import entry_points
 
 PLUGINS = dict()
-for discovered_plugin in entry_points(group="sharkadm.plugin_operators"):
-    name = discovered_plugin.value
-    module = discovered_plugin.load()
-    PLUGINS[name] = module
+
+
+def load_plugins() -> dict:
+    """Loads plugin modules registered under the entry point group
+    sharkadm.plugin_operators. Plugins already loaded are not loaded again."""
+    for discovered_plugin in entry_points(group="sharkadm.plugin_operators"):
+        name = discovered_plugin.value
+        if name in PLUGINS:
+            continue
+        module = discovered_plugin.load()
+        PLUGINS[name] = module
+    return PLUGINS
+
+
+load_plugins()
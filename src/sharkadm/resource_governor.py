@@ -0,0 +1,273 @@
+"""Thread and memory governor for processes that run workflows.
+
+Thread pools: polars and the numerical libraries (through numpy) size their
+thread pools from environment variables. When several workers run in parallel
+each worker should get its share of the cores. The variables must be set before
+polars is used and before numpy is imported. A spawned worker imports the main
+module of the parent and the pool initializer before the initializer runs, so the
+variables are set in the parent (worker_thread_environment) while the workers are
+started (start_workers) and restored afterwards. Spawned workers inherit the
+environment of the parent.
+
+Memory budget: the governor of the process (get_governor) is used by
+SHARKadmPolarsController. If a memory budget is set
+- large files are loaded with the streaming (memory bounded) reader and
+- row local transformers are run in chunks of rows when the memory in use plus
+  an estimate of what the operator needs is close to the budget.
+The budget is soft. The process is not stopped if it is exceeded.
+
+Usage: time, rows and resident memory (RSS) are recorded per operator and
+returned by ResourceGovernor.get_report.
+"""
+
+import contextlib
+import os
+import pathlib
+import sys
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+
+import polars as pl
+
+from sharkadm.sharkadm_logger import adm_logger
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows
+    resource = None
+
+THREAD_ENVIRONMENT_VARIABLES = (
+    "POLARS_MAX_THREADS",
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+)
+
+# An operator is assumed to need this many times the size of the data
+OPERATOR_MEMORY_FACTOR = 2.0
+# Loading a file is assumed to need this many times the size of the file
+LOAD_MEMORY_FACTOR = 3.0
+# Part of the budget where the governor starts to save memory
+BUDGET_THRESHOLD = 0.8
+# Part of the budget used by one chunk of rows
+CHUNK_PART_OF_BUDGET = 0.1
+MIN_CHUNK_ROWS = 10_000
+
+_MB = 1024 * 1024
+_PROC_STATM = pathlib.Path("/proc/self/statm")
+
+
+def get_rss_bytes() -> int | None:
+    """Returns the current resident set size of the process. Returns None if it
+    can not be read on this platform"""
+    if psutil:
+        return psutil.Process(os.getpid()).memory_info().rss
+    if _PROC_STATM.exists():
+        pages = int(_PROC_STATM.read_text().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE")
+    return None
+
+
+def get_rss_mb() -> float | None:
+    rss = get_rss_bytes()
+    if rss is None:
+        return None
+    return rss / _MB
+
+
+def get_peak_rss_mb() -> float | None:
+    """Returns the peak resident set size of the process so far"""
+    if not resource:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, kilobytes on linux
+    if sys.platform == "darwin":
+        return peak / _MB
+    return peak / 1024
+
+
+def get_threads_per_worker(nr_workers: int, nr_cpus: int | None = None) -> int:
+    nr_cpus = nr_cpus or os.cpu_count() or 1
+    return max(1, nr_cpus // max(nr_workers, 1))
+
+
+def get_thread_environment(nr_threads: int) -> dict[str, str]:
+    return {name: str(nr_threads) for name in THREAD_ENVIRONMENT_VARIABLES}
+
+
+@contextlib.contextmanager
+def worker_thread_environment(nr_threads: int) -> Iterator[None]:
+    """Sets the thread pool sizes of worker processes started from this process
+    within the block. The previous environment is restored afterwards. The polars
+    thread pool of this process is started first so that it keeps its size"""
+    pl.thread_pool_size()
+    environment = get_thread_environment(nr_threads)
+    previous = {name: os.environ.get(name) for name in environment}
+    os.environ.update(environment)
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def _do_nothing() -> None:
+    return None
+
+
+def start_workers(executor: ProcessPoolExecutor, nr_workers: int) -> None:
+    """Starts the worker processes of executor. Workers are otherwise started when
+    tasks are submitted (outside worker_thread_environment)"""
+    for _ in range(nr_workers):
+        executor.submit(_do_nothing)
+
+
+def get_path_size_mb(path: str | pathlib.Path) -> float:
+    path = pathlib.Path(path)
+    if path.is_file():
+        return path.stat().st_size / _MB
+    if path.is_dir():
+        return sum(p.stat().st_size for p in path.rglob("*") if p.is_file()) / _MB
+    return 0.0
+
+
+class ResourceGovernor:
+    def __init__(
+        self,
+        memory_budget_mb: float | None = None,
+        nr_threads: int | None = None,
+    ):
+        self._memory_budget_mb = memory_budget_mb
+        self._nr_threads = nr_threads
+        self._operator_usage: list[dict] = []
+        self._start_time = time.perf_counter()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(memory_budget_mb={self._memory_budget_mb}, "
+            f"nr_threads={self._nr_threads})"
+        )
+
+    @property
+    def memory_budget_mb(self) -> float | None:
+        return self._memory_budget_mb
+
+    @memory_budget_mb.setter
+    def memory_budget_mb(self, budget: float | None) -> None:
+        self._memory_budget_mb = budget
+
+    @property
+    def nr_threads(self) -> int | None:
+        return self._nr_threads
+
+    def reset(self) -> None:
+        """Clears the recorded usage. Call at the start of each job"""
+        self._operator_usage = []
+        self._start_time = time.perf_counter()
+
+    def _get_available_mb(self) -> float | None:
+        rss = get_rss_mb()
+        if self._memory_budget_mb is None or rss is None:
+            return None
+        return self._memory_budget_mb * BUDGET_THRESHOLD - rss
+
+    def get_load_kwargs(self, path: str | pathlib.Path) -> dict:
+        """Returns streaming kwargs for the loader if loading path in memory would
+        get close to the budget"""
+        available = self._get_available_mb()
+        if available is None or isinstance(path, pl.DataFrame):
+            return {}
+        if get_path_size_mb(path) * LOAD_MEMORY_FACTOR < available:
+            return {}
+        memory_budget_mb = max(available, self._memory_budget_mb * CHUNK_PART_OF_BUDGET)
+        adm_logger.log_workflow(
+            f"Loading {path} with streaming reader to stay within memory budget",
+            level=adm_logger.INFO,
+        )
+        return dict(streaming=True, memory_budget_mb=memory_budget_mb)
+
+    def get_chunk_rows(self, df: pl.DataFrame) -> int | None:
+        """Returns the number of rows per chunk if an operator on df should be run
+        in chunks. Returns None if df can be processed at once"""
+        available = self._get_available_mb()
+        if available is None or not len(df):
+            return None
+        size_mb = df.estimated_size("mb")
+        if size_mb * OPERATOR_MEMORY_FACTOR < available:
+            return None
+        chunk_mb = self._memory_budget_mb * CHUNK_PART_OF_BUDGET
+        chunk_rows = int(len(df) * chunk_mb / max(size_mb, 1e-9))
+        chunk_rows = max(chunk_rows, MIN_CHUNK_ROWS)
+        if chunk_rows >= len(df):
+            return None
+        return chunk_rows
+
+    @contextlib.contextmanager
+    def track(self, name: str, nr_rows: int) -> Iterator[dict]:
+        """Records time and memory of the block. Items added to the yielded dict
+        are part of the record"""
+        usage = dict(operator=name, nr_rows=nr_rows, rss_before_mb=get_rss_mb())
+        t0 = time.perf_counter()
+        try:
+            yield usage
+        finally:
+            usage["seconds"] = time.perf_counter() - t0
+            usage["rss_after_mb"] = get_rss_mb()
+            self._operator_usage.append(usage)
+
+    def get_report(self) -> dict:
+        """Returns resource usage since the last reset"""
+        rss_values = [
+            usage[key]
+            for usage in self._operator_usage
+            for key in ("rss_before_mb", "rss_after_mb")
+            if usage.get(key) is not None
+        ]
+        return dict(
+            nr_threads=self._nr_threads or pl.thread_pool_size(),
+            memory_budget_mb=self._memory_budget_mb,
+            seconds=time.perf_counter() - self._start_time,
+            max_rss_mb=max(rss_values, default=None),
+            process_peak_rss_mb=get_peak_rss_mb(),
+            nr_chunked_operators=len(
+                [usage for usage in self._operator_usage if usage.get("chunk_rows")]
+            ),
+            operators=list(self._operator_usage),
+        )
+
+
+_governor = ResourceGovernor()
+
+
+def get_governor() -> ResourceGovernor:
+    """Returns the governor of the process"""
+    return _governor
+
+
+def set_governor(governor: ResourceGovernor) -> None:
+    global _governor
+    _governor = governor
+
+
+def initiate_worker(
+    nr_threads: int | None = None, memory_budget_mb: float | None = None
+) -> ResourceGovernor:
+    """Sets thread pool sizes and the memory budget of the process. The thread pool
+    sizes only apply to pools not yet started (see worker_thread_environment)"""
+    if nr_threads:
+        os.environ.update(get_thread_environment(nr_threads))
+    governor = ResourceGovernor(memory_budget_mb=memory_budget_mb, nr_threads=nr_threads)
+    set_governor(governor)
+    return governor
@@ -0,0 +1,601 @@
+"""Long running SHARKadm service.
+
+The service keeps a pool of worker processes where config, all operator modules
+(listed in the operator manifest) and the taxonomy tables (see taxonomy_store) are
+loaded once, when the worker starts. Config objects whose files have been edited
+are parsed again when the next job starts. Workflow jobs (data path and workflow name or
+workflow file) are sent to the workers. Each worker runs one job at a time since
+the log (adm_logger) is global in the process. If a worker dies the pool is
+replaced and jobs submitted meanwhile are answered with 503.
+
+Finished jobs are kept for finished_job_ttl seconds, and at most
+max_finished_jobs of them are kept.
+
+The service is reached over HTTP on localhost:
+
+    GET  /health                Service status
+    GET  /jobs                  All jobs
+    POST /jobs                  New job. Body: {"data_path": ..., "workflow": ...}
+    GET  /jobs/<id>             Job status and result
+    GET  /jobs/<id>/log?start=0 Log entries as json lines. Streamed until the job
+                                is finished. The last line holds the job
+    POST /shutdown              Stops the service
+
+POST requests must give the shared token of the service in the header
+X-SHARKadm-Token. The token is taken from the environment variable
+SHARKADM_SERVICE_TOKEN or, if not set, from a token file in the SHARKadm root
+directory (created by the service). The client reads the token the same way.
+
+Start the service and submit jobs with the cli:
+
+    sharkadm-cli service start
+    sharkadm-cli service submit <data_path> <workflow>
+"""
+
+import functools
+import hmac
+import json
+import multiprocessing
+import os
+import pathlib
+import queue
+import secrets
+import threading
+import time
+import urllib.parse
+import urllib.request
+import uuid
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from sharkadm import event, operator_manifest, resource_governor, taxonomy_store
+from sharkadm.sharkadm_logger import adm_logger
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+DEFAULT_MAX_FINISHED_JOBS = 1000
+DEFAULT_FINISHED_JOB_TTL = 24 * 3600
+
+TOKEN_HEADER = "X-SHARKadm-Token"
+TOKEN_ENVIRONMENT_VARIABLE = "SHARKADM_SERVICE_TOKEN"
+
+QUEUED = "queued"
+RUNNING = "running"
+FINISHED = "finished"
+FAILED = "failed"
+
+_LOG_EVENTS = ("log_workflow", "log_transformation", "log_validation", "log_export")
+
+# Set in each worker process by _initiate_worker
+_worker_queue: "queue.Queue | None" = None
+
+
+def _to_json_value(value: Any) -> Any:
+    if isinstance(value, (str, int, float, bool, type(None))):
+        return value
+    if isinstance(value, dict):
+        return {str(key): _to_json_value(val) for key, val in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_json_value(item) for item in value]
+    return str(value)
+
+
+def get_token_path() -> pathlib.Path:
+    from sharkadm import utils
+
+    return utils.get_root_directory("service") / "token"
+
+
+def get_token(token: str | None = None, create: bool = False) -> str | None:
+    """Returns the shared token of the service: the given token, the token in
+    environment variable SHARKADM_SERVICE_TOKEN or the token in the token file.
+    If create is True and no token is found a new token is written to the token
+    file (readable by the user only)"""
+    token = token or os.environ.get(TOKEN_ENVIRONMENT_VARIABLE)
+    if token:
+        return token
+    path = get_token_path()
+    if path.exists():
+        return path.read_text(encoding="utf-8").strip()
+    if not create:
+        return None
+    token = secrets.token_urlsafe(32)
+    path.touch(mode=0o600)
+    path.write_text(token, encoding="utf-8")
+    return token
+
+
+def _initiate_worker(
+    message_queue: queue.Queue,
+    snapshot_path: str | None,
+    nr_threads: int,
+    memory_budget_mb: float | None,
+) -> None:
+    """Sets thread pools and memory budget, loads config, imports all operator
+    modules and loads the taxonomy tables once per worker process. The taxonomy
+    tables compiled by the service are memory mapped and shared between the
+    workers"""
+    global _worker_queue
+    _worker_queue = message_queue
+    resource_governor.initiate_worker(
+        nr_threads=nr_threads, memory_budget_mb=memory_budget_mb
+    )
+
+    from sharkadm import config
+
+    if config.sharkadm_config:
+        config.warm_start(snapshot_path)
+    operator_manifest.import_operator_modules()
+    taxonomy_store.get_store().preload()
+
+
+def _get_workflow(workflow: str):
+    from sharkadm import workflow as sharkadm_workflow
+
+    path = pathlib.Path(workflow)
+    if path.suffix in (".yaml", ".yml"):
+        if not path.exists():
+            raise FileNotFoundError(path)
+        return sharkadm_workflow.SHARKadmWorkflow.from_yaml_config(path)
+    return sharkadm_workflow.get_workflow(workflow)
+
+
+def _run_job(job_id: str, data_path: str, workflow: str) -> dict:
+    """Runs a workflow job in a worker process. Log entries are put on the
+    message queue while the job runs"""
+
+    from sharkadm import config
+
+    def send_log(data: dict) -> None:
+        _worker_queue.put((job_id, "log", _to_json_value(data)))
+
+    _worker_queue.put((job_id, "status", RUNNING))
+    adm_logger.reset_log()
+    governor = resource_governor.get_governor()
+    governor.reset()
+    for ev in _LOG_EVENTS:
+        adm_logger.subscribe(ev, send_log)
+    try:
+        # Config files edited since the worker started are parsed again
+        config.config_registry.invalidate()
+        wflow = _get_workflow(workflow)
+        wflow.set_data_sources(data_path)
+        info = wflow.start_workflow()
+        return dict(
+            terminated=bool(info),
+            msg=info.msg if info else "",
+            export_paths=_to_json_value(wflow.export_paths),
+            nr_log_entries={
+                level: len([data for data in adm_logger.data if data["level"] == level])
+                for level in adm_logger.levels
+            },
+            resources=_to_json_value(governor.get_report()),
+        )
+    finally:
+        for ev in _LOG_EVENTS:
+            event.unsubscribe(ev, send_log)
+        # Tells the service that all log entries of the job are sent
+        _worker_queue.put((job_id, "end", None))
+
+
+class Job:
+    """A workflow job and the log entries received from the worker"""
+
+    def __init__(self, data_path: str, workflow: str):
+        self.id = uuid.uuid4().hex[:12]
+        self.data_path = data_path
+        self.workflow = workflow
+        self.status = QUEUED
+        self.created = time.time()
+        self.finished: float | None = None
+        self.result: dict | None = None
+        self.error = ""
+        self.log: list[dict] = []
+        self._condition = threading.Condition()
+        self._future: Future | None = None
+        self._end_received = False
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.id}, {self.status})"
+
+    @property
+    def is_done(self) -> bool:
+        return self.status in (FINISHED, FAILED)
+
+    def to_dict(self) -> dict:
+        return dict(
+            id=self.id,
+            data_path=self.data_path,
+            workflow=self.workflow,
+            status=self.status,
+            created=self.created,
+            finished=self.finished,
+            result=self.result,
+            error=self.error,
+            nr_log_entries=len(self.log),
+        )
+
+    def add_log(self, data: dict) -> None:
+        with self._condition:
+            self.log.append(data)
+            self._condition.notify_all()
+
+    def set_status(self, status: str) -> None:
+        with self._condition:
+            self.status = status
+            self._condition.notify_all()
+
+    def set_future_done(self, future: Future) -> None:
+        """Called when the worker has returned. The job is done when all log
+        entries are received as well, unless the worker never started the job"""
+        with self._condition:
+            self._future = future
+            no_end_message = future.cancelled() or isinstance(
+                future.exception(), BrokenProcessPool
+            )
+            if self._end_received or no_end_message:
+                self._set_done()
+
+    def set_end_received(self) -> None:
+        with self._condition:
+            self._end_received = True
+            if self._future:
+                self._set_done()
+
+    def _set_done(self) -> None:
+        if self._future.cancelled():
+            self.error = "Job cancelled"
+            self.status = FAILED
+        elif self._future.exception():
+            e = self._future.exception()
+            self.error = f"{e.__class__.__name__}: {e}"
+            self.status = FAILED
+        else:
+            self.result = self._future.result()
+            self.status = FINISHED
+        self.finished = time.time()
+        self._condition.notify_all()
+
+    def iter_log(self, start: int = 0, timeout: float = 1.0) -> Iterator[dict]:
+        """Yields log entries from index start until the job is done"""
+        index = start
+        while True:
+            with self._condition:
+                if index >= len(self.log) and not self.is_done:
+                    self._condition.wait(timeout)
+                entries = self.log[index:]
+                done = self.is_done
+            index += len(entries)
+            yield from entries
+            if done and index >= len(self.log):
+                return
+
+
+class SHARKadmService:
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        nr_workers: int = 2,
+        snapshot_path: str | pathlib.Path | None = None,
+        memory_budget_mb: float | None = None,
+        token: str | None = None,
+        max_finished_jobs: int = DEFAULT_MAX_FINISHED_JOBS,
+        finished_job_ttl: float = DEFAULT_FINISHED_JOB_TTL,
+    ):
+        """The cores are shared between the nr_workers worker processes.
+        memory_budget_mb is the (soft) memory budget of each worker. See get_token
+        for how the token is found if not given"""
+        self._host = host
+        self._port = port
+        self._nr_workers = nr_workers
+        self._snapshot_path = str(snapshot_path) if snapshot_path else None
+        self._memory_budget_mb = memory_budget_mb
+        self._token = get_token(token, create=True)
+        self._max_finished_jobs = max_finished_jobs
+        self._finished_job_ttl = finished_job_ttl
+
+        self._jobs: dict[str, Job] = {}
+        self._jobs_lock = threading.Lock()
+        self._manager = None
+        self._message_queue = None
+        self._executor: ProcessPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        self._closing = False
+        self._collector: threading.Thread | None = None
+        self._server: ThreadingHTTPServer | None = None
+        self._server_thread: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}: {self.url}"
+
+    @property
+    def url(self) -> str:
+        if self._server:
+            host, port = self._server.server_address[:2]
+            return f"http://{host}:{port}"
+        return f"http://{self._host}:{self._port}"
+
+    @property
+    def jobs(self) -> list[Job]:
+        self._evict_finished_jobs()
+        with self._jobs_lock:
+            return list(self._jobs.values())
+
+    def get_job(self, job_id: str) -> Job | None:
+        with self._jobs_lock:
+            return self._jobs.get(job_id)
+
+    def is_valid_token(self, token: str | None) -> bool:
+        if not token:
+            return False
+        return hmac.compare_digest(token.encode("utf-8"), self._token.encode("utf-8"))
+
+    def _evict_finished_jobs(self) -> None:
+        """Removes finished jobs older than finished_job_ttl and the oldest finished
+        jobs above max_finished_jobs"""
+        min_finished = time.time() - self._finished_job_ttl
+        with self._jobs_lock:
+            finished = sorted(
+                (job for job in self._jobs.values() if job.is_done),
+                key=lambda job: job.finished,
+            )
+            nr_too_many = len(finished) - self._max_finished_jobs
+            for nr, job in enumerate(finished):
+                if nr < nr_too_many or job.finished < min_finished:
+                    self._jobs.pop(job.id)
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        nr_threads = resource_governor.get_threads_per_worker(self._nr_workers)
+        with resource_governor.worker_thread_environment(nr_threads):
+            executor = ProcessPoolExecutor(
+                max_workers=self._nr_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_initiate_worker,
+                initargs=(
+                    self._message_queue,
+                    self._snapshot_path,
+                    nr_threads,
+                    self._memory_budget_mb,
+                ),
+            )
+            resource_governor.start_workers(executor, self._nr_workers)
+        return executor
+
+    def _replace_broken_executor(self, executor: ProcessPoolExecutor) -> None:
+        """Replaces executor with a new worker pool if it is still in use"""
+        with self._executor_lock:
+            if self._closing or executor is not self._executor:
+                return
+            adm_logger.log_workflow(
+                "Worker pool is broken. Starting new workers", level=adm_logger.WARNING
+            )
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = self._create_executor()
+
+    def _check_executor(self, executor: ProcessPoolExecutor, future: Future) -> None:
+        if not future.cancelled() and isinstance(future.exception(), BrokenProcessPool):
+            self._replace_broken_executor(executor)
+
+    def start(self, block: bool = True) -> None:
+        """Starts the worker pool and the http server. If block is False the
+        server runs in a background thread"""
+        # Taxonomy tables are compiled once here and then shared by the workers
+        taxonomy_store.get_store().preload()
+        self._manager = multiprocessing.get_context("spawn").Manager()
+        self._message_queue = self._manager.Queue()
+        self._executor = self._create_executor()
+        self._collector = threading.Thread(target=self._collect_messages, daemon=True)
+        self._collector.start()
+        self._server = ThreadingHTTPServer((self._host, self._port), _RequestHandler)
+        self._server.daemon_threads = True
+        self._server.service = self
+        adm_logger.log_workflow(f"SHARKadm service started at {self.url}")
+        if block:
+            self._serve()
+            return
+        self._server_thread = threading.Thread(target=self._serve, daemon=True)
+        self._server_thread.start()
+
+    def stop(self) -> None:
+        """Stops the service. Queued jobs are cancelled"""
+        if not self._server:
+            return
+        self._server.shutdown()
+        if self._server_thread:
+            self._server_thread.join()
+
+    def _serve(self) -> None:
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            with self._executor_lock:
+                self._closing = True
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._stopped.set()
+            self._collector.join()
+            self._manager.shutdown()
+
+    def submit(self, data_path: str | pathlib.Path, workflow: str) -> Job:
+        """Submits a job. Raises BrokenProcessPool if the worker pool is broken. The
+        pool is then replaced and the job can be submitted again"""
+        self._evict_finished_jobs()
+        job = Job(str(data_path), str(workflow))
+        # The job is added first since messages from the worker can arrive before
+        # submit returns
+        with self._jobs_lock:
+            self._jobs[job.id] = job
+        executor = self._executor
+        try:
+            future = executor.submit(_run_job, job.id, job.data_path, job.workflow)
+        except BrokenProcessPool:
+            with self._jobs_lock:
+                self._jobs.pop(job.id)
+            self._replace_broken_executor(executor)
+            raise
+        future.add_done_callback(job.set_future_done)
+        future.add_done_callback(functools.partial(self._check_executor, executor))
+        return job
+
+    def _collect_messages(self) -> None:
+        """Moves messages from the workers to the jobs"""
+        while not self._stopped.is_set():
+            try:
+                job_id, kind, data = self._message_queue.get(timeout=0.2)
+            except queue.Empty:
+                continue
+            except (EOFError, OSError):
+                return
+            job = self.get_job(job_id)
+            if not job:
+                continue
+            if kind == "log":
+                job.add_log(data)
+            elif kind == "status" and not job.is_done:
+                job.set_status(data)
+            elif kind == "end":
+                job.set_end_received()
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    server: ThreadingHTTPServer
+
+    @property
+    def service(self) -> SHARKadmService:
+        return self.server.service
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002
+        pass
+
+    def _send_json(self, data: Any, status: int = 200) -> None:
+        content = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _get_job_or_404(self, job_id: str) -> Job | None:
+        job = self.service.get_job(job_id)
+        if not job:
+            self._send_json(dict(error=f"No job with id {job_id}"), status=404)
+        return job
+
+    def do_GET(self) -> None:
+        url = urllib.parse.urlparse(self.path)
+        parts = [part for part in url.path.split("/") if part]
+        if parts == ["health"]:
+            self._send_json(dict(status="ok", nr_jobs=len(self.service.jobs)))
+        elif parts == ["jobs"]:
+            self._send_json([job.to_dict() for job in self.service.jobs])
+        elif len(parts) == 2 and parts[0] == "jobs":
+            job = self._get_job_or_404(parts[1])
+            if job:
+                self._send_json(job.to_dict())
+        elif len(parts) == 3 and parts[0] == "jobs" and parts[2] == "log":
+            job = self._get_job_or_404(parts[1])
+            if job:
+                query = urllib.parse.parse_qs(url.query)
+                self._stream_log(job, int(query.get("start", ["0"])[0]))
+        else:
+            self._send_json(dict(error=f"Invalid path: {url.path}"), status=404)
+
+    def do_POST(self) -> None:
+        url = urllib.parse.urlparse(self.path)
+        length = int(self.headers.get("Content-Length", 0))
+        content = self.rfile.read(length)
+        if not self.service.is_valid_token(self.headers.get(TOKEN_HEADER)):
+            self._send_json(dict(error="Missing or invalid token"), status=401)
+            return
+        if url.path == "/jobs":
+            try:
+                body = json.loads(content or b"{}")
+                job = self.service.submit(body["data_path"], body["workflow"])
+            except (KeyError, json.JSONDecodeError) as e:
+                self._send_json(dict(error=f"Invalid job: {e}"), status=400)
+                return
+            except BrokenProcessPool:
+                self._send_json(
+                    dict(error="Worker pool was broken and is restarted. Try again"),
+                    status=503,
+                )
+                return
+            self._send_json(job.to_dict(), status=201)
+        elif url.path == "/shutdown":
+            self._send_json(dict(status="stopping"))
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+        else:
+            self._send_json(dict(error=f"Invalid path: {url.path}"), status=404)
+
+    def _stream_log(self, job: Job, start: int) -> None:
+        # No content length. The response ends when the connection is closed
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.end_headers()
+        for data in job.iter_log(start=start):
+            self.wfile.write(json.dumps(dict(log=data)).encode("utf-8") + b"\n")
+            self.wfile.flush()
+        self.wfile.write(json.dumps(dict(job=job.to_dict())).encode("utf-8") + b"\n")
+        self.close_connection = True
+
+
+class SHARKadmServiceClient:
+    """Client for a running SHARKadm service"""
+
+    def __init__(
+        self, url: str = f"http://{DEFAULT_HOST}:{DEFAULT_PORT}", token: str | None = None
+    ):
+        """See get_token for how the token is found if not given"""
+        self._url = url.rstrip("/")
+        self._token = get_token(token)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}: {self._url}"
+
+    def _request(self, path: str, data: dict | None = None, method: str = "GET"):
+        content = None
+        if data is not None:
+            content = json.dumps(data).encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+        if self._token:
+            headers[TOKEN_HEADER] = self._token
+        request = urllib.request.Request(
+            f"{self._url}{path}", data=content, method=method, headers=headers
+        )
+        return urllib.request.urlopen(request)
+
+    def _get_json(self, path: str, data: dict | None = None, method: str = "GET"):
+        with self._request(path, data=data, method=method) as response:
+            return json.loads(response.read())
+
+    def health(self) -> dict:
+        return self._get_json("/health")
+
+    def submit(self, data_path: str | pathlib.Path, workflow: str) -> dict:
+        data_path = str(pathlib.Path(data_path).absolute())
+        return self._get_json(
+            "/jobs", data=dict(data_path=data_path, workflow=workflow), method="POST"
+        )
+
+    def get_job(self, job_id: str) -> dict:
+        return self._get_json(f"/jobs/{job_id}")
+
+    def get_jobs(self) -> list[dict]:
+        return self._get_json("/jobs")
+
+    def iter_log(self, job_id: str, start: int = 0) -> Iterator[dict]:
+        """Yields log entries while the job runs. The last item is the finished
+        job (dict with key 'job')"""
+        with self._request(f"/jobs/{job_id}/log?start={start}") as response:
+            for line in response:
+                if line.strip():
+                    yield json.loads(line)
+
+    def shutdown(self) -> dict:
+        return self._get_json("/shutdown", data={}, method="POST")
@@ -3,9 +3,8 @@ import pathlib
 import rich
 import typer
 
-from sharkadm import transformers, utils, validators
+from sharkadm import config, transformers, utils, validators
 from sharkadm.utils.operations_description import write_operations_description_to_file
-from sharkadm.workflow import SHARKadmWorkflow
 
 app = typer.Typer()
 
@@ -26,8 +25,7 @@ def list_validators(filter_string: str | None = None):
         info_lines.append(f'VALIDATORS filtered on "{filter_string}":')
     else:
         info_lines.append("VALIDATORS (all)")
-    for name, obj in validators.get_validators().items():
-        desc = obj.get_validator_description()
+    for name, desc in validators.get_validators_description().items():
         if filter_string:
             in_name = filter_string.lower() in name.lower()
             in_desc = filter_string.lower() in desc.lower()
@@ -45,8 +43,7 @@ def list_transformers(filter_string: str | None = None):
         info_lines.append(f'TRANSFORMERS filtered on "{filter_string}":')
     else:
         info_lines.append("TRANSFORMERS (all)")
-    for name, obj in transformers.get_transformers().items():
-        desc = obj.get_transformer_description()
+    for name, desc in transformers.get_transformers_description().items():
         if filter_string:
             in_name = filter_string.lower() in name.lower()
             in_desc = filter_string.lower() in desc.lower()
@@ -69,10 +66,28 @@ def operations(
 
 
 @app.command()
-def workflow(config_path: str, source: str):
+def config_snapshot(path: str | None = None):
+    """Parses all config files and saves them as a snapshot for warm starts"""
+    config.preload_config()
+    snapshot_path = config.config_registry.save_snapshot(path)
+    rich.print(f"Config snapshot saved to: {snapshot_path}")
+
+
+@app.command()
+def workflow(
+    config_path: str,
+    source: str,
+    warm_start: bool = typer.Option(False, "--warm-start"),
+):
+    """Runs the workflow in config_path. With --warm-start the parsed config is
+    loaded from (and saved to) the config snapshot in the cache directory"""
+    from sharkadm.workflow import SHARKadmWorkflow
+
     config_file = pathlib.Path(config_path)
     if not config_file.exists():
         raise FileNotFoundError(config_file)
+    if warm_start:
+        config.warm_start()
     wf = SHARKadmWorkflow.from_yaml_config(config_file)
     if source:
         wf.set_data_sources(source)
@@ -80,6 +95,103 @@ def workflow(config_path: str, source: str):
     rich.print("Workflow DONE!")
 
 
+service_app = typer.Typer(help="Long running service with warm caches")
+app.add_typer(service_app, name="service")
+
+
+@service_app.command("start")
+def service_start(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    workers: int = 2,
+    snapshot_path: str | None = None,
+    memory_budget_mb: float | None = None,
+    token: str | None = None,
+):
+    from sharkadm.service import SHARKadmService
+
+    service = SHARKadmService(
+        host=host,
+        port=port,
+        nr_workers=workers,
+        snapshot_path=snapshot_path,
+        memory_budget_mb=memory_budget_mb,
+        token=token,
+    )
+    rich.print(f"Starting SHARKadm service at {service.url}")
+    service.start()
+
+
+@service_app.command("submit")
+def service_submit(
+    data_path: str,
+    workflow: str,
+    url: str = "http://127.0.0.1:8765",
+    follow: bool = True,
+    token: str | None = None,
+):
+    from sharkadm.service import SHARKadmServiceClient
+
+    client = SHARKadmServiceClient(url, token=token)
+    job = client.submit(data_path, workflow)
+    rich.print(f"Job {job['id']} submitted")
+    if not follow:
+        return
+    for item in client.iter_log(job["id"]):
+        if "log" in item:
+            log = item["log"]
+            rich.print(f"{log.get('level', '')}: {log.get('msg', '')}")
+        else:
+            job = item["job"]
+    rich.print(f"Job {job['id']} {job['status']} {job['error']}")
+    if job["status"] != "finished":
+        raise typer.Exit(code=1)
+
+
+@service_app.command("status")
+def service_status(job_id: str | None = None, url: str = "http://127.0.0.1:8765"):
+    from sharkadm.service import SHARKadmServiceClient
+
+    client = SHARKadmServiceClient(url)
+    if job_id:
+        rich.print(client.get_job(job_id))
+        return
+    for job in client.get_jobs():
+        rich.print(f"{job['id']}  {job['status'].ljust(10)}{job['data_path']}")
+
+
+@service_app.command("stop")
+def service_stop(url: str = "http://127.0.0.1:8765", token: str | None = None):
+    from sharkadm.service import SHARKadmServiceClient
+
+    rich.print(SHARKadmServiceClient(url, token=token).shutdown())
+
+
+@app.command()
+def watch(
+    inbox: list[str],
+    db_path: str = "sharkadm_jobs.db",
+    workers: int = 2,
+    interval: float = 10.0,
+    max_attempts: int = 3,
+    memory_budget_mb: float | None = None,
+):
+    """Watches inbox directories and runs the DV workflow for new deliveries"""
+    from sharkadm.watch_folder import InboxWatcher, JobProcessor, JobQueue
+
+    job_queue = JobQueue(db_path, max_attempts=max_attempts)
+    watcher = InboxWatcher(job_queue, inbox)
+    processor = JobProcessor(
+        job_queue,
+        watcher=watcher,
+        nr_workers=workers,
+        poll_interval=interval,
+        memory_budget_mb=memory_budget_mb,
+    )
+    rich.print(f"Watching: {', '.join(inbox)}")
+    processor.run_forever()
+
+
 def main():
     app()
 
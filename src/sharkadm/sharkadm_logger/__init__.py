@@ -1,5 +1,7 @@
 from .feedback import FeedbackTxtExporter
+from .parquet import IpcExporter, ParquetExporter
 from .print_on_screen import PrintWarnings
+from .row_numbers import RowNumbers
 from .sharkadm_logger import SHARKadmLogger
 from .txt import TxtExporter, TxtExporterChangeLog
 from .xlsx import XlsxExporter
@@ -7,6 +9,8 @@ from .xlsx import XlsxExporter
 exporter_mapping = {
     "xlsx": XlsxExporter,
     "txt": TxtExporter,
+    "parquet": ParquetExporter,
+    "ipc": IpcExporter,
     "changelog": TxtExporterChangeLog,
     "feedback": FeedbackTxtExporter,
     "print_warnings": PrintWarnings,
@@ -1,7 +1,8 @@
 import logging
 import pathlib
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any
 
 from sharkadm import utils
 
@@ -12,6 +13,12 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _to_string(value: Any) -> str:
+    if value is None:
+        return ""
+    return str(value)
+
+
 class SharkadmLoggerExporter(ABC):
     def __init__(self, **kwargs):
         self.adm_logger: "SHARKadmLogger" | None = None
@@ -30,6 +37,48 @@ class SharkadmLoggerExporter(ABC):
     @abstractmethod
     def _get_default_file_name(self): ...
 
+    @staticmethod
+    def _compress_item(item: str) -> str:
+        return item.lower().replace(" ", "")
+
+    def _compress_list_items(self, lst: list[str] | str) -> list[str]:
+        if isinstance(lst, str):
+            lst = [lst]
+        return [self._compress_item(item) for item in lst]
+
+    def _get_export_columns(self) -> list[str]:
+        """Returns the columns to export given the kwargs columns, include_columns
+        and exclude_columns"""
+        header = self.adm_logger.keys
+        if self.kwargs.get("columns"):
+            header = [col for col in self.kwargs.get("columns") if col in header]
+        if self.kwargs.get("include_columns"):
+            include = self._compress_list_items(self.kwargs.get("include_columns"))
+            header = [col for col in header if self._compress_item(col) in include]
+        if self.kwargs.get("exclude_columns"):
+            exclude = self._compress_list_items(self.kwargs.get("exclude_columns"))
+            header = [col for col in header if self._compress_item(col) not in exclude]
+        return header
+
+    def _iter_entries(self) -> Iterator[dict]:
+        """Yields the log entries sorted on the kwarg sort_by (if given). Only the
+        sort keys are held in memory"""
+        data = self.adm_logger.data
+        sort_by = self.kwargs.get("sort_by")
+        if not sort_by:
+            yield from data
+            return
+        sort_by = self._compress_list_items(sort_by)
+        sort_columns = [
+            col for col in self.adm_logger.keys if self._compress_item(col) in sort_by
+        ]
+
+        def sort_key(index: int) -> tuple[str, ...]:
+            return tuple(_to_string(data[index].get(col)) for col in sort_columns)
+
+        for index in sorted(range(len(data)), key=sort_key):
+            yield data[index]
+
     def _set_save_path(self, suffix):
         file_path = self.kwargs.get("export_file_path") or self.kwargs.get("file_path")
         file_name = (
@@ -1,8 +1,10 @@
 import datetime
+from collections.abc import Iterable, Iterator
 from types import MappingProxyType
 from typing import Protocol
 
 from sharkadm.sharkadm_logger.base import SharkadmLoggerExporter
+from sharkadm.sharkadm_logger.row_numbers import RowNumbers
 from sharkadm.utils.paths import get_next_incremented_file_path
 
 
@@ -21,12 +23,12 @@ class Feedback:
         return f"Ogiltigt datum eller datumformat i Analysinfo: {dtime}"
 
     @staticmethod
-    def missing_position(rows: list):
-        if len(rows) >= 20:
+    def missing_position(rows: RowNumbers | list):
+        rows = RowNumbers(rows)
+        if rows.nr_ranges >= 20:
             return "Position saknas på fler än 20 rader"
         else:
-            row_str = ", ".join(sorted(rows, key=int))
-            return f"Position saknas på följande rader: {row_str}"
+            return f"Position saknas på följande rader: {rows.to_range_string()}"
 
 
 class FeedbackTxtExporter(SharkadmLoggerExporter):
@@ -41,27 +43,26 @@ class FeedbackTxtExporter(SharkadmLoggerExporter):
 
     def _export(self) -> None:
         self._set_save_path(suffix=".txt")
-        lines = self._extract_info(self.adm_logger.data)
         try:
-            self._save_txt(lines)
+            self._save_txt(self._extract_info(self.adm_logger.data))
         except PermissionError:
             self.file_path = get_next_incremented_file_path(self.file_path)
-            self._save_txt(lines)
+            self._save_txt(self._extract_info(self.adm_logger.data))
 
-    def _extract_info(self, data: dict) -> list[str]:
-        lines = []
-        for level, level_data in data.items():
-            for purpose, purpose_data in level_data.items():
-                if purpose != "feedback":
-                    continue
-                for log_type, log_type_data in purpose_data.items():
-                    for msg, msg_data in log_type_data.items():
-                        action = self.level_mapper.get(level)
-                        if action:
-                            msg = msg + f" ({action})"
-                        lines.append(msg)
-        return lines
+    def _extract_info(self, data: list[dict]) -> Iterator[str]:
+        for entry in data:
+            if entry.get("purpose") != "feedback":
+                continue
+            msg = entry.get("msg", "")
+            action = self.level_mapper.get(entry.get("level"))
+            if action:
+                msg = msg + f" ({action})"
+            yield msg
 
-    def _save_txt(self, lines: list[str]) -> None:
+    def _save_txt(self, lines: Iterable[str]) -> None:
+        """Lines are written one at a time"""
         with open(self.file_path, "w") as fid:
-            fid.write("\n".join(lines))
+            for i, line in enumerate(lines):
+                if i:
+                    fid.write("\n")
+                fid.write(line)
@@ -0,0 +1,58 @@
+import datetime
+
+import polars as pl
+
+from sharkadm.utils.paths import get_next_incremented_file_path
+
+from .base import SharkadmLoggerExporter, _to_string
+
+# Columns exported as integers. All other columns are exported as strings
+INTEGER_COLUMNS = ("count", "log_nr")
+
+
+class ParquetExporter(SharkadmLoggerExporter):
+    """Exports the log as a table for machine consumption. Filtering (on the
+    logger), sorting (kwarg sort_by) and column selection (kwargs columns,
+    include_columns and exclude_columns) are done before the table is built"""
+
+    suffix = ".parquet"
+
+    def _get_default_file_name(self):
+        date_str = datetime.datetime.now().strftime("%Y%m%d")
+        data_string = "-".join(self.adm_logger.filtered_on_levels)
+        file_name = f"sharkadm_log_{self.adm_logger.name}_{date_str}_{data_string}"
+        return file_name
+
+    def _export(self) -> None:
+        self._set_save_path(suffix=self.suffix)
+        df = self.get_data_frame()
+        try:
+            self._save(df)
+        except PermissionError:
+            self.file_path = get_next_incremented_file_path(self.file_path)
+            self._save(df)
+
+    def get_data_frame(self) -> pl.DataFrame:
+        columns = self._get_export_columns()
+        values = {col: [] for col in columns}
+        for data in self._iter_entries():
+            for col in columns:
+                values[col].append(_to_string(data.get(col)))
+        df = pl.DataFrame(values, schema={col: pl.String for col in columns})
+        return df.with_columns(
+            pl.col(col).replace("", None).cast(pl.Int64, strict=False)
+            for col in INTEGER_COLUMNS
+            if col in columns
+        )
+
+    def _save(self, df: pl.DataFrame) -> None:
+        df.write_parquet(self.file_path)
+
+
+class IpcExporter(ParquetExporter):
+    """Exports the log as an Arrow IPC (feather) file"""
+
+    suffix = ".arrow"
+
+    def _save(self, df: pl.DataFrame) -> None:
+        df.write_ipc(self.file_path)
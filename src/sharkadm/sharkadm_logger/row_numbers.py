@@ -0,0 +1,138 @@
+import bisect
+from collections.abc import Iterable, Iterator
+
+import polars as pl
+
+# Above this number of values the ranges are computed with polars. Below it a
+# loop in Python is faster (most log entries have one or a few row numbers)
+POLARS_THRESHOLD = 1000
+
+
+class RowNumbers:
+    """Set of row numbers stored as sorted, non-overlapping integer ranges"""
+
+    def __init__(self, values: Iterable[int | str] | pl.Series | None = None):
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+        if values is None:
+            return
+        if isinstance(values, RowNumbers):
+            self._starts = list(values._starts)
+            self._ends = list(values._ends)
+            return
+        self._set_ranges(values)
+
+    @classmethod
+    def from_ranges(cls, ranges: Iterable[tuple[int, int]]) -> "RowNumbers":
+        """Creates the set from (first, last) ranges. Ranges may overlap"""
+        row_numbers = cls()
+        for start, end in sorted(ranges):
+            if row_numbers._ends and start <= row_numbers._ends[-1] + 1:
+                row_numbers._ends[-1] = max(row_numbers._ends[-1], end)
+                continue
+            row_numbers._starts.append(start)
+            row_numbers._ends.append(end)
+        return row_numbers
+
+    def _set_ranges(self, values: Iterable[int | str] | pl.Series) -> None:
+        if not isinstance(values, pl.Series):
+            values = list(values)
+        if len(values) > POLARS_THRESHOLD:
+            self._set_ranges_polars(values)
+            return
+        if isinstance(values, pl.Series):
+            values = values.to_list()
+        numbers = sorted(
+            {int(str(value).strip()) for value in values if value is not None}
+        )
+        for nr in numbers:
+            if self._ends and nr == self._ends[-1] + 1:
+                self._ends[-1] = nr
+                continue
+            self._starts.append(nr)
+            self._ends.append(nr)
+
+    def _set_ranges_polars(self, values: list[int | str] | pl.Series) -> None:
+        if not isinstance(values, pl.Series):
+            values = pl.Series(values, dtype=pl.String, strict=False)
+        series = values.cast(pl.String).str.strip_chars().cast(pl.Int64)
+        series = series.drop_nulls().unique().sort()
+        if series.is_empty():
+            return
+        # A new range starts where the step to the previous number is not one
+        new_range = series.diff().fill_null(2) != 1
+        ranges = pl.DataFrame({"row": series, "group": new_range.cum_sum()})
+        ranges = ranges.group_by("group", maintain_order=True).agg(
+            pl.col("row").first().alias("start"), pl.col("row").last().alias("end")
+        )
+        self._starts = ranges["start"].to_list()
+        self._ends = ranges["end"].to_list()
+
+    @property
+    def ranges(self) -> list[tuple[int, int]]:
+        return list(zip(self._starts, self._ends))
+
+    @property
+    def nr_ranges(self) -> int:
+        return len(self._starts)
+
+    def __len__(self) -> int:
+        return sum(end - start + 1 for start, end in self.ranges)
+
+    def __bool__(self) -> bool:
+        return bool(self._starts)
+
+    def __iter__(self) -> Iterator[int]:
+        for start, end in self.ranges:
+            yield from range(start, end + 1)
+
+    def __contains__(self, item: int | str) -> bool:
+        try:
+            nr = int(item)
+        except (TypeError, ValueError):
+            return False
+        index = bisect.bisect_right(self._starts, nr) - 1
+        return index >= 0 and nr <= self._ends[index]
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, RowNumbers):
+            try:
+                other = RowNumbers(other)
+            except (TypeError, ValueError, pl.exceptions.PolarsError):
+                return NotImplemented
+        return self.ranges == other.ranges
+
+    def __or__(self, other: "RowNumbers | Iterable[int | str]") -> "RowNumbers":
+        return self.union(other)
+
+    def union(self, other: "RowNumbers | Iterable[int | str]") -> "RowNumbers":
+        if not isinstance(other, RowNumbers):
+            other = RowNumbers(other)
+        return RowNumbers.from_ranges(self.ranges + other.ranges)
+
+    def to_range_string(self, separator: str = ", ") -> str:
+        """Returns the row numbers as text. Example: '12-480, 1002'"""
+        return separator.join(
+            str(start) if start == end else f"{start}-{end}" for start, end in self.ranges
+        )
+
+    def __str__(self) -> str:
+        return self.to_range_string()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.to_range_string()!r})"
+
+
+def get_row_numbers(
+    values: RowNumbers | Iterable[int | str] | pl.Series | None,
+) -> RowNumbers | list | None:
+    """Returns values as RowNumbers. Values that are not integers are returned
+    as a list"""
+    if values is None or isinstance(values, RowNumbers):
+        return values
+    if not isinstance(values, pl.Series):
+        values = list(values)
+    try:
+        return RowNumbers(values)
+    except (TypeError, ValueError, pl.exceptions.PolarsError):
+        return list(values)
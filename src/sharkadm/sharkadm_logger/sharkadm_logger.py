@@ -1,17 +1,42 @@
+import collections
+import contextlib
 import inspect
 import logging
+import re
 import time
+from collections.abc import Iterable, Iterator
 from functools import wraps
+from typing import Callable
 
 from sharkadm import event
 from sharkadm.sharkadm_logger.base import SharkadmLoggerExporter
 from sharkadm.sharkadm_logger.feedback import Feedback
+from sharkadm.sharkadm_logger.row_numbers import RowNumbers, get_row_numbers
 
 logger = logging.getLogger(__name__)
 
 
 DATA_DTYPE = list[dict[str, str]]
 
+# Counts in messages that are summed when entries from chunks are merged
+CHUNK_COUNT_PATTERN = re.compile(r"\b\d+(\.\d+)?(?= (places|rows|seconds)\b)")
+
+
+def _sum_chunk_counts(msg: str, other_msg: str) -> str:
+    """Sums the counts in two messages that only differ in their counts"""
+    other_counts = iter(
+        match.group() for match in CHUNK_COUNT_PATTERN.finditer(other_msg)
+    )
+
+    def _sum(match: re.Match) -> str:
+        other_count = next(other_counts)
+        if match.group(1):
+            nr_decimals = len(match.group(1)) - 1
+            return f"{float(match.group()) + float(other_count):.{nr_decimals}f}"
+        return str(int(match.group()) + int(other_count))
+
+    return CHUNK_COUNT_PATTERN.sub(_sum, msg)
+
 
 class SHARKadmLogger:
     """Class to log events etc. in the SHARKadm data model"""
@@ -51,6 +76,13 @@ class SHARKadmLogger:
         self._nr_log_entries: int = 0
         self._dataset_name: str = ""
 
+        # Minimum level that is captured by log type. Log types not given are
+        # captured on all levels
+        self._capture_levels: dict[str, str] = dict()
+        self._aggregate: bool = False
+        self._aggregated: dict[tuple, dict] = dict()
+        self._held_entries: DATA_DTYPE | None = None
+
         self._reset_filter()
 
     def _reset_log(self) -> None:
@@ -58,6 +90,7 @@ class SHARKadmLogger:
         self.name: str = ""
         self._nr_log_entries: int = 0
         self._dataset_name: str = ""
+        self._aggregated = dict()
         self._reset_filter()
 
     def _reset_filter(self) -> None:
@@ -74,6 +107,41 @@ class SHARKadmLogger:
             raise KeyError(msg)
         return level
 
+    def set_capture_level(self, level: str, *log_types: str) -> "SHARKadmLogger":
+        """Entries below level are not captured for the given log types (all log
+        types if not given). The check is made before the message is created"""
+        level = self._check_level(level)
+        for log_type in log_types or self._log_types:
+            self._capture_levels[log_type.lower()] = level
+        return self
+
+    def reset_capture_levels(self) -> "SHARKadmLogger":
+        self._capture_levels = dict()
+        return self
+
+    def is_captured(self, log_type: str, level: str) -> bool:
+        min_level = self._capture_levels.get(log_type)
+        if not min_level:
+            return True
+        level = level.lower()
+        if level not in self._levels:
+            # Invalid levels are reported by _check_level
+            return True
+        return self._levels.index(level) >= self._levels.index(min_level)
+
+    def set_aggregation(self, aggregate: bool = True) -> "SHARKadmLogger":
+        """In aggregation mode, entries with the same log type, class, level,
+        purpose and message template are merged into the first entry. The number
+        of merged entries is given in "count" and the row numbers are combined.
+        The template defaults to the message itself."""
+        self._aggregate = aggregate
+        self._aggregated = dict()
+        return self
+
+    @property
+    def aggregate(self) -> bool:
+        return self._aggregate
+
     @property
     def data(self) -> DATA_DTYPE:
         if self._filtered_data is not None:
@@ -124,18 +192,22 @@ class SHARKadmLogger:
 
     def log_workflow(
         self,
-        msg: str,
+        msg: str | Callable[[], str],
         level: str = "info",
         purpose: str = "",
         item: str | None = None,
         cls: str | None = None,
+        template: str | None = None,
     ) -> None:
+        if not self.is_captured(self.WORKFLOW, level):
+            return
         if not cls:
             cls = ""
             stack = inspect.stack()
             if stack[1][0].f_locals.get("self"):
                 cls = stack[1][0].f_locals["self"].__class__.__name__
         data = dict(
+            template=template,
             log_type=self.WORKFLOW,
             msg=msg,
             level=level,
@@ -147,18 +219,21 @@ class SHARKadmLogger:
 
     def log_transformation(
         self,
-        msg: str,
+        msg: str | Callable[[], str],
         level: str = "info",
         purpose: str = "",
         row_number: int | None = None,
-        row_numbers: list[int] | None = None,
+        row_numbers: Iterable[int | str] | None = None,
         item: str | None = None,
         cls: str | None = None,
+        template: str | None = None,
     ) -> None:
-        if row_number is not None:
-            row_numbers = [row_number] + (row_numbers or [])
+        if not self.is_captured(self.TRANSFORMATION, level):
+            return
+        row_numbers = self._get_row_numbers(row_number, row_numbers)
 
         data = dict(
+            template=template,
             log_type=self.TRANSFORMATION,
             msg=msg,
             level=level,
@@ -171,7 +246,7 @@ class SHARKadmLogger:
 
     def log_validation(
         self,
-        msg: str,
+        msg: str | Callable[[], str],
         level: str = "debug",
         item: str | None = None,
         purpose: str = "",
@@ -180,19 +255,19 @@ class SHARKadmLogger:
         columns: list[str] | None = None,
         validation_success: bool | None = None,
         row_number: int | None = None,
-        row_numbers: list[int] | None = None,
+        row_numbers: Iterable[int | str] | None = None,
         cls: str | None = None,
+        template: str | None = None,
     ) -> None:
+        if not self.is_captured(self.VALIDATION, level):
+            return
         if not cls:
             cls = ""
             stack = inspect.stack()
             if stack[1][0].f_locals.get("self"):
                 cls = stack[1][0].f_locals["self"].__class__.__name__
 
-        if row_number is not None:
-            row_numbers = [row_number] + (row_numbers or [])
-        if row_numbers is not None:
-            row_numbers = list(set(row_numbers))
+        row_numbers = self._get_row_numbers(row_number, row_numbers)
 
         if column is not None:
             columns = [column] + (columns or [])
@@ -200,6 +275,7 @@ class SHARKadmLogger:
             columns = list(set(columns))
 
         data = dict(
+            template=template,
             log_type=self.VALIDATION,
             msg=msg,
             level=level,
@@ -216,26 +292,29 @@ class SHARKadmLogger:
 
     def log_validation_failed(
         self,
-        msg: str,
+        msg: str | Callable[[], str],
         level: str = "warning",
         item: str | None = None,
         purpose: str = "",
         validator: str | None = None,
         column: str | None = None,
         row_number: int | None = None,
-        row_numbers: list[int] | None = None,
+        row_numbers: Iterable[int | str] | None = None,
         cls: str | None = None,
+        template: str | None = None,
     ) -> None:
+        if not self.is_captured(self.VALIDATION, level):
+            return
         if not cls:
             cls = ""
             stack = inspect.stack()
             if stack[1][0].f_locals.get("self"):
                 cls = stack[1][0].f_locals["self"].__class__.__name__
 
-        if row_number is not None:
-            row_numbers = [row_number] + (row_numbers or [])
+        row_numbers = self._get_row_numbers(row_number, row_numbers)
 
         data = dict(
+            template=template,
             log_type=self.VALIDATION,
             msg=msg,
             level=level,
@@ -251,26 +330,29 @@ class SHARKadmLogger:
 
     def log_validation_succeeded(
         self,
-        msg: str,
+        msg: str | Callable[[], str],
         level: str = "info",
         item: str | None = None,
         purpose: str = "",
         validator: str | None = None,
         column: str | None = None,
         row_number: int | None = None,
-        row_numbers: list[int] | None = None,
+        row_numbers: Iterable[int | str] | None = None,
         cls: str | None = None,
+        template: str | None = None,
     ) -> None:
+        if not self.is_captured(self.VALIDATION, level):
+            return
         if not cls:
             cls = ""
             stack = inspect.stack()
             if stack[1][0].f_locals.get("self"):
                 cls = stack[1][0].f_locals["self"].__class__.__name__
 
-        if row_number is not None:
-            row_numbers = [row_number] + (row_numbers or [])
+        row_numbers = self._get_row_numbers(row_number, row_numbers)
 
         data = dict(
+            template=template,
             log_type=self.VALIDATION,
             msg=msg,
             level=level,
@@ -286,13 +368,17 @@ class SHARKadmLogger:
 
     def log_export(
         self,
-        msg: str,
+        msg: str | Callable[[], str],
         level: str = "info",
         purpose: str = "",
         item: str | None = None,
         cls: str | None = None,
+        template: str | None = None,
     ) -> None:
+        if not self.is_captured(self.EXPORT, level):
+            return
         data = dict(
+            template=template,
             log_type=self.EXPORT,
             msg=msg,
             level=level,
@@ -317,11 +403,31 @@ class SHARKadmLogger:
 
         return timeit_wrapper
 
+    @staticmethod
+    def _get_row_numbers(
+        row_number: int | str | None, row_numbers: Iterable[int | str] | None
+    ) -> RowNumbers | list | None:
+        """Row numbers are stored as compact ranges (see RowNumbers)"""
+        if row_number is not None:
+            row_numbers = [row_number, *(row_numbers or [])]
+        return get_row_numbers(row_numbers)
+
     def _log(self, **data) -> None:
         data["level"] = self._check_level(data.get("level", self.INFO))
         data["log_type"] = data.get("log_type", self.WORKFLOW)
         data["purpose"] = data.get("purpose", self.GENERAL)
         data["cls"] = data.get("cls", self.name)
+        if callable(data.get("msg")):
+            data["msg"] = data["msg"]()
+        if data.get("template") is None:
+            data.pop("template", None)
+
+        if self._held_entries is not None:
+            self._held_entries.append(data)
+            return
+
+        if self._aggregate and self._add_to_aggregated(data):
+            return
 
         self._nr_log_entries += 1
         data["log_nr"] = self._nr_log_entries
@@ -331,6 +437,91 @@ class SHARKadmLogger:
 
         event.post_event(f"log_{data['log_type'].lower()}", data)
 
+    def _add_to_aggregated(self, data: dict) -> bool:
+        """Merges data into an earlier entry with the same key. Returns True if
+        merged"""
+        key = (
+            data["log_type"],
+            data["cls"],
+            data["level"],
+            data["purpose"],
+            data.get("validation_success"),
+            data.get("template", data.get("msg")),
+        )
+        entry = self._aggregated.get(key)
+        if entry is None:
+            data["count"] = 1
+            self._aggregated[key] = data
+            return False
+        entry["count"] += 1
+        self._merge_row_numbers(entry, data)
+        return True
+
+    @staticmethod
+    def _merge_row_numbers(entry: dict, data: dict) -> None:
+        row_numbers = data.get("row_numbers")
+        previous = entry.get("row_numbers")
+        if row_numbers is None:
+            pass
+        elif previous is None:
+            entry["row_numbers"] = row_numbers
+        elif isinstance(previous, RowNumbers) and isinstance(row_numbers, RowNumbers):
+            entry["row_numbers"] = previous | row_numbers
+        else:
+            entry["row_numbers"] = [*previous, *row_numbers]
+
+    @contextlib.contextmanager
+    def held_entries(self) -> Iterator[DATA_DTYPE]:
+        """Entries logged within the context are not added to the log but to the
+        yielded list. They can be added later with log_chunk_entries"""
+        previous = self._held_entries
+        self._held_entries = []
+        try:
+            yield self._held_entries
+        finally:
+            self._held_entries = previous
+
+    def log_entries(self, entries: Iterable[dict]) -> None:
+        """Logs entries held with held_entries"""
+        for data in entries:
+            self._log(**data)
+
+    def log_chunk_entries(self, chunk_entries: Iterable[DATA_DTYPE]) -> None:
+        """Logs entries held while an operator was run on chunks of the data (one
+        list per chunk) as if the operator was run on all data. See
+        merge_chunk_entries"""
+        self.log_entries(self.merge_chunk_entries(chunk_entries))
+
+    @classmethod
+    def merge_chunk_entries(cls, chunk_entries: Iterable[DATA_DTYPE]) -> DATA_DTYPE:
+        """Merges entries from chunks of the data (one list per chunk). The n:th
+        entry with a given message in a chunk is merged with the n:th entry with
+        the same message in the other chunks. Counts in the messages, as in
+        "(4 places)", are summed and the row numbers are combined."""
+        merged: dict[tuple, dict] = dict()
+        for entries in chunk_entries:
+            occurrences = collections.Counter()
+            for data in entries:
+                key = (
+                    data["log_type"],
+                    data["cls"],
+                    data["level"],
+                    data["purpose"],
+                    data.get("validation_success"),
+                    data.get("template"),
+                    str(data.get("item")),
+                    CHUNK_COUNT_PATTERN.sub("#", str(data["msg"])),
+                )
+                occurrences[key] += 1
+                key = (*key, occurrences[key])
+                entry = merged.get(key)
+                if entry is None:
+                    merged[key] = dict(data)
+                    continue
+                entry["msg"] = _sum_chunk_counts(entry["msg"], data["msg"])
+                cls._merge_row_numbers(entry, data)
+        return list(merged.values())
+
     def reset_log(self) -> "SHARKadmLogger":
         """Resets all entries to the log"""
         logger.info(f"Resetting {self.__class__.__name__}")
@@ -446,8 +637,8 @@ class SHARKadmLogger:
             self._filtered_data.append(data)
 
     @staticmethod
-    def subscribe(ev: str, func, prio: int = 50) -> None:
-        event.subscribe(ev, func, prio)
+    def subscribe(ev: str, func, prio: int = 50, batched: bool = False) -> None:
+        event.subscribe(ev, func, prio, batched=batched)
 
     def print_on_screen(self, *args, **kwargs):
         def _print(data: dict):
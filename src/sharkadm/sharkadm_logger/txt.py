@@ -1,5 +1,6 @@
 import datetime
 import pathlib
+from collections.abc import Iterable, Iterator
 
 from sharkadm.utils.paths import get_next_incremented_file_path
 
@@ -19,41 +20,38 @@ class TxtExporter(SharkadmLoggerExporter):
 
     def _get_default_file_name(self):
         date_str = datetime.datetime.now().strftime("%Y%m%d")
-        data_string = "-".join(list(self.adm_logger.data))
+        data_string = "-".join(self.adm_logger.filtered_on_levels)
         file_name = f"sharkadm_log_{self.adm_logger.name}_{date_str}_{data_string}"
         return file_name
 
     def _export(self) -> None:
         self._set_save_path(suffix=".txt")
-        info = self._extract_info()
         try:
-            self._save_as_txt(info, self.path)
+            self._save_as_txt(self._extract_info(), self.path)
         except PermissionError:
             path = get_next_incremented_file_path(self.path)
-            self._save_as_txt(info, path)
+            self._save_as_txt(self._extract_info(), path)
 
-    def _extract_info(self) -> list[str]:
-        info = []
+    def _extract_info(self) -> Iterator[str]:
         for data in self.adm_logger.data:
             line_list = [
                 data.get("msg", ""),
                 data.get("level", ""),
+                str(data.get("row_numbers") or ""),
             ]
-            info.append("\t".join(line_list))
-        return info
+            yield "\t".join(line_list)
 
     @staticmethod
-    def _save_as_txt(info: list, path: pathlib.Path):
+    def _save_as_txt(info: Iterable[str], path: pathlib.Path):
+        """Lines are written one at a time"""
         with open(path, "a") as fid:
-            fid.write("\n".join(info))
+            for i, line in enumerate(info):
+                if i:
+                    fid.write("\n")
+                fid.write(line)
 
 
 class TxtExporterChangeLog(TxtExporter):
     def _extract_info(self) -> list[str]:
-        info = []
-        for data in self.adm_logger.data:
-            line_list = [
-                data.get("msg", ""),
-            ]
-            info.append("\t".join(line_list))
-        return sorted(info)
+        # Sorted lines. Needs all messages in memory
+        return sorted(data.get("msg", "") for data in self.adm_logger.data)
@@ -1,10 +1,10 @@
 import datetime
 
-import pandas as pd
+import xlsxwriter
 
 from sharkadm.utils.paths import get_next_incremented_file_path
 
-from .base import SharkadmLoggerExporter
+from .base import SharkadmLoggerExporter, _to_string
 
 COLUMN_WIDTH = dict(
     cls=33,
@@ -36,108 +36,48 @@ class XlsxExporter(SharkadmLoggerExporter):
 
     def _export(self) -> None:
         self._set_save_path(suffix=".xlsx")
-        df = self._extract_info()
         try:
-            self._save(df)
+            self._save()
         except PermissionError:
             self.file_path = get_next_incremented_file_path(self.file_path)
-            self._save(df)
-
-    def _save(self, df: pd.DataFrame) -> None:
-        if self.kwargs.get("as_table"):
-            self._save_as_xlsx_with_table(df)
-        elif self.kwargs.get("with_filter"):
-            self._save_as_xlsx_with_filter(df)
-        else:
-            self._save_as_xlsx(df)
-
-    def _extract_info(self) -> pd.DataFrame:
-        header = self.adm_logger.keys
-        df = pd.DataFrame(data=self.adm_logger.data, columns=header, dtype=str)
-        df.fillna("", inplace=True)
-        if self.kwargs.get("columns"):
-            columns = [col for col in self.kwargs.get("columns") if col in df.columns]
-            df = df[columns]
-        if self.kwargs.get("sort_by"):
-            sort_by_columns = [
-                col
-                for col in df.columns
-                if self._compress_item(col)
-                in self._compress_list_items(self.kwargs.get("sort_by"))
-            ]
-            df.sort_values(sort_by_columns, inplace=True)
-        include_columns = header
-        if self.kwargs.get("include_columns"):
-            include_columns = [
-                col
-                for col in header
-                if self._compress_item(col)
-                in self._compress_list_items(self.kwargs.get("include_columns"))
-            ]
-        if self.kwargs.get("exclude_columns"):
-            include_columns = [
-                col
-                for col in include_columns
-                if self._compress_item(col)
-                not in self._compress_list_items(self.kwargs.get("exclude_columns"))
-            ]
-        df = df[include_columns]
-        return df
-
-    def _compress_item(self, item: str) -> str:
-        return item.lower().replace(" ", "")
-
-    def _compress_list_items(self, lst: list[str] | str) -> list[str]:
-        if isinstance(lst, str):
-            lst = [lst]
-        return [self._compress_item(item) for item in lst]
-
-    @property
-    def writer(self) -> pd.ExcelWriter:
-        return pd.ExcelWriter(str(self.file_path), engine="xlsxwriter")
+            self._save()
 
     @property
     def sheet_name(self) -> str:
         return self.file_path.stem.split("SHARK_")[-1][:30]
 
-    @staticmethod
-    def _set_column_width(df: pd.DataFrame, worksheet):
-        for c, col in enumerate(df.columns):
-            width = get_column_width(col)
-            worksheet.set_column(c, c, width)
-
-    def _save_as_xlsx(self, df: pd.DataFrame):
-        with self.writer as writer:
-            df.to_excel(
-                writer, sheet_name=self.sheet_name, startrow=0, header=True, index=False
-            )
-            worksheet = writer.sheets[self.sheet_name]
-            self._set_column_width(df, worksheet)
-
-    def _save_as_xlsx_with_filter(self, df: pd.DataFrame):
-        with self.writer as writer:
-            df.to_excel(
-                writer, sheet_name=self.sheet_name, startrow=0, header=True, index=False
-            )
-            worksheet = writer.sheets[self.sheet_name]
-
-            (max_row, max_col) = df.shape
-            worksheet.autofilter(0, 0, max_row, max_col - 1)
-            self._set_column_width(df, worksheet)
-
-    def _save_as_xlsx_with_table(self, df: pd.DataFrame):
-        """
-        https://stackoverflow.com/questions/58326392/how-to-create-excel-table-with-pandas-to-excel
-        """
-        with self.writer as writer:
-            df.to_excel(
-                writer, sheet_name=self.sheet_name, startrow=1, header=False, index=False
-            )
-
-            worksheet = writer.sheets[self.sheet_name]
-            (max_row, max_col) = df.shape
-            column_settings = []
-            for header in df.columns:
-                column_settings.append({"header": header})
-            worksheet.add_table(0, 0, max_row, max_col - 1, {"columns": column_settings})
-            self._set_column_width(df, worksheet)
+    def _save(self) -> None:
+        """Rows are written one at a time in constant memory mode. Only the
+        current row is held in memory by xlsxwriter. Tables are not supported in
+        constant memory mode, so all rows are held in memory when as_table is
+        given"""
+        columns = self._get_export_columns()
+        as_table = self.kwargs.get("as_table")
+        workbook = xlsxwriter.Workbook(
+            str(self.file_path), {"constant_memory": not as_table}
+        )
+        try:
+            worksheet = workbook.add_worksheet(self.sheet_name)
+            for c, col in enumerate(columns):
+                worksheet.set_column(c, c, get_column_width(col))
+            worksheet.write_row(0, 0, columns)
+            nr_rows = 0
+            for nr_rows, data in enumerate(self._iter_entries(), start=1):
+                worksheet.write_row(
+                    nr_rows, 0, [_to_string(data.get(col)) for col in columns]
+                )
+            if not columns:
+                return
+            if as_table:
+                # https://xlsxwriter.readthedocs.io/working_with_tables.html
+                worksheet.add_table(
+                    0,
+                    0,
+                    max(nr_rows, 1),
+                    len(columns) - 1,
+                    {"columns": [{"header": col} for col in columns]},
+                )
+            elif self.kwargs.get("with_filter"):
+                worksheet.autofilter(0, 0, nr_rows, len(columns) - 1)
+        finally:
+            workbook.close()
@@ -25,6 +25,14 @@ class Operator:
 
     operation_type: str = OperatorType.OPERATOR
 
+    # Set to True if the operator handles pl.Categorical columns. Otherwise
+    # categorical columns are cast to pl.String before the operator is run.
+    supports_categorical: bool = False
+
+    # Set to True if the result for a row only depends on values in the same row.
+    # Row local operators can be run on a subset of rows (see incremental).
+    row_local: bool = False
+
     @property
     def name(self) -> str:
         return self.__class__.__name__
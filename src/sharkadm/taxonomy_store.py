@@ -0,0 +1,512 @@
+"""Preloaded and indexed taxonomy reference data.
+
+Lookups in dyntaxa, WoRMS, bvol, the red list and the SMHI trophic types are
+compiled into tables with the columns key and value (strings). Transformers join
+the unique values of a column against a table in one step instead of querying the
+nodc_* objects one name at a time. Keys are names, ids or name and size class
+joined with NAME_AND_SIZE_SEPARATOR.
+
+Tables are saved as uncompressed Arrow IPC files in the cache directory and read
+memory mapped. Worker processes on the same machine then share one read only copy
+through the page cache instead of loading the reference lists in every process.
+A table is rebuilt when the version of its source changes. The version is the hash
+of the source file or the package version together with the name, size and
+modification time of the reference list files of the package (so that lists
+updated without a new release of the package are noticed).
+
+Sources that expose the whole reference list as a mapper are compiled in full on
+first use and saved. Sources that can only be queried one key at a time (dyntaxa
+and WoRMS translations, dyntaxa ids, the red list) are compiled for the keys asked
+for and kept in the memory of the process only. Keys that are found are looked up
+once per process. Keys that are not found are not stored and looked up again on
+next use.
+"""
+
+import dataclasses
+import functools
+import hashlib
+import importlib
+import importlib.metadata
+import importlib.util
+import json
+import os
+import pathlib
+import threading
+from collections.abc import Callable, Iterable
+from typing import Any
+
+import polars as pl
+
+from sharkadm.sharkadm_logger import adm_logger
+
+KEY_COLUMN = "key"
+VALUE_COLUMN = "value"
+NAME_AND_SIZE_SEPARATOR = ":"
+
+STORE_VERSION = 1
+
+_SCHEMA = {KEY_COLUMN: pl.String, VALUE_COLUMN: pl.String}
+
+
+@dataclasses.dataclass(frozen=True)
+class TaxonomySource:
+    """A reference list in the taxonomy store. get_version returns None if the
+    source is not available. Give get_mapper if the whole list can be fetched as a
+    mapping key -> value, otherwise get_value that returns the value for one key
+    (None if not found). get_source returns a description used in log messages."""
+
+    name: str
+    get_version: Callable[[], str | None]
+    get_mapper: Callable[[], dict] | None = None
+    get_value: Callable[[str], Any] | None = None
+    get_source: Callable[[], str] | None = None
+
+    @property
+    def is_complete(self) -> bool:
+        return self.get_mapper is not None
+
+
+def get_package_version(package: str) -> str | None:
+    if importlib.util.find_spec(package) is None:
+        return None
+    try:
+        return importlib.metadata.version(package)
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def get_file_version(path: str | pathlib.Path | None) -> str | None:
+    from sharkadm.config.registry import get_file_hash
+
+    if not path or not pathlib.Path(path).is_file():
+        return None
+    return get_file_hash(path)
+
+
+# Parts of the file names of the reference lists read by the nodc_* packages
+LIST_FILE_NAME_PARTS = dict(nodc_bvol=("bvol",), nodc_dyntaxa=("dyntaxa", "taxon"))
+
+_NOT_LIST_FILE_SUFFIXES = (".py", ".pyc", ".pyi")
+
+
+def _get_list_directories(package: str) -> list[pathlib.Path]:
+    """Returns the directories where the reference lists of package may be: the
+    config directories and the directory of the package"""
+    from sharkadm import config
+
+    directories = [config.CONFIG_DIRECTORY]
+    if os.getenv(config.CONFIG_ENV):
+        directories.append(pathlib.Path(os.getenv(config.CONFIG_ENV)))
+    spec = importlib.util.find_spec(package)
+    if spec and spec.submodule_search_locations:
+        directories.extend(pathlib.Path(loc) for loc in spec.submodule_search_locations)
+    unique = []
+    for directory in directories:
+        if directory and directory.is_dir() and directory.resolve() not in unique:
+            unique.append(directory.resolve())
+    return unique
+
+
+def get_list_files(package: str) -> list[pathlib.Path]:
+    """Returns the reference list files of package found in _get_list_directories"""
+    name_parts = LIST_FILE_NAME_PARTS.get(package, (package.removeprefix("nodc_"),))
+    files = set()
+    for directory in _get_list_directories(package):
+        for path in directory.rglob("*"):
+            if path.suffix in _NOT_LIST_FILE_SUFFIXES or not path.is_file():
+                continue
+            if any(part in path.name.lower() for part in name_parts):
+                files.add(path)
+    return sorted(files)
+
+
+def get_package_list_version(package: str) -> str | None:
+    """Returns the package version combined with the path, size and modification
+    time of the reference list files of the package"""
+    version = get_package_version(package)
+    if version is None:
+        return None
+    digest = hashlib.sha256()
+    for path in get_list_files(package):
+        stat = path.stat()
+        digest.update(f"{path}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+    return f"{version}:{digest.hexdigest()[:16]}"
+
+
+@functools.cache
+def get_nodc_object(package: str, getter: str) -> Any:
+    """Returns the object from package.getter(). Created once per process and only
+    when a table needs to be compiled"""
+    return getattr(importlib.import_module(package), getter)()
+
+
+def _get_trophic_type_path() -> pathlib.Path | None:
+    from sharkadm.config import sharkadm_config
+
+    if not sharkadm_config:
+        return None
+    return sharkadm_config.get_path("trophictype_smhi")
+
+
+def _get_red_listed(name: str) -> str | None:
+    if get_nodc_object("nodc_dyntaxa", "get_red_list_object").get_info(name):
+        return "Y"
+    return None
+
+
+def _get_nodc_source(
+    name: str,
+    package: str,
+    getter: str,
+    mapper_method: str = "",
+    value_method: str = "",
+    has_source: bool = False,
+) -> TaxonomySource:
+    get_mapper = None
+    get_value = None
+    get_source = None
+    get_version = functools.partial(get_package_version, package)
+    if mapper_method:
+        # Complete tables are saved, so edits of the lists must change the version
+        get_version = functools.partial(get_package_list_version, package)
+
+        def get_mapper() -> dict:
+            return getattr(get_nodc_object(package, getter), mapper_method)()
+
+    if value_method:
+
+        def get_value(key: str) -> Any:
+            return getattr(get_nodc_object(package, getter), value_method)(key)
+
+    if has_source:
+
+        def get_source() -> str:
+            return str(get_nodc_object(package, getter).source)
+
+    return TaxonomySource(
+        name=name,
+        get_version=get_version,
+        get_mapper=get_mapper,
+        get_value=get_value,
+        get_source=get_source,
+    )
+
+
+def get_default_sources() -> list[TaxonomySource]:
+    def get_trophic_type_mapper() -> dict:
+        from sharkadm.config import get_trophic_type_smhi_object
+
+        return get_trophic_type_smhi_object(_get_trophic_type_path()).get_mapper()
+
+    return [
+        _get_nodc_source(
+            "dyntaxa_translate",
+            "nodc_dyntaxa",
+            "get_translate_dyntaxa_object",
+            value_method="get",
+            has_source=True,
+        ),
+        _get_nodc_source(
+            "dyntaxa_translated_id",
+            "nodc_dyntaxa",
+            "get_translate_dyntaxa_object",
+            value_method="get_dyntaxa_id",
+        ),
+        _get_nodc_source(
+            "dyntaxa_id", "nodc_dyntaxa", "get_dyntaxa_taxon_object", value_method="get"
+        ),
+        TaxonomySource(
+            name="dyntaxa_names",
+            get_version=functools.partial(get_package_list_version, "nodc_dyntaxa"),
+            get_mapper=lambda: {
+                name: name
+                for name in get_nodc_object(
+                    "nodc_dyntaxa", "get_dyntaxa_taxon_object"
+                ).get_name_list()
+            },
+        ),
+        TaxonomySource(
+            name="red_list",
+            get_version=functools.partial(get_package_version, "nodc_dyntaxa"),
+            get_value=_get_red_listed,
+        ),
+        _get_nodc_source(
+            "worms_translate",
+            "nodc_worms",
+            "get_translate_worms_object",
+            value_method="get",
+            has_source=True,
+        ),
+        _get_nodc_source(
+            "worms_aphia_id",
+            "nodc_worms",
+            "get_taxa_worms_object",
+            value_method="get_aphia_id",
+        ),
+        _get_nodc_source(
+            "bvol_name",
+            "nodc_bvol",
+            "get_translate_bvol_name_object",
+            mapper_method="get_scientific_name_from_to_mapper",
+        ),
+        _get_nodc_source(
+            "bvol_name_and_size",
+            "nodc_bvol",
+            "get_translate_bvol_name_size_object",
+            mapper_method="get_scientific_name_from_to_mapper",
+        ),
+        _get_nodc_source(
+            "bvol_aphia_id",
+            "nodc_bvol",
+            "get_bvol_nomp_object",
+            mapper_method="get_species_to_aphia_id_mapper",
+        ),
+        _get_nodc_source(
+            "bvol_ref_list",
+            "nodc_bvol",
+            "get_bvol_nomp_object",
+            mapper_method="get_species_and_size_class_to_ref_list_mapper",
+        ),
+        _get_nodc_source(
+            "bvol_name_and_size_aphia_id",
+            "nodc_bvol",
+            "get_bvol_nomp_object",
+            mapper_method="get_species_and_size_class_to_aphia_id_mapper",
+        ),
+        TaxonomySource(
+            name="trophic_type",
+            get_version=lambda: get_file_version(_get_trophic_type_path()),
+            get_mapper=get_trophic_type_mapper,
+        ),
+    ]
+
+
+def _get_table(mapper: dict) -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            KEY_COLUMN: [str(key) for key in mapper],
+            VALUE_COLUMN: [
+                None if value is None else str(value) for value in mapper.values()
+            ],
+        },
+        schema=_SCHEMA,
+    )
+
+
+class TaxonomyStore:
+    """Compiled taxonomy reference tables. Use get_store to get the store of the
+    process."""
+
+    def __init__(
+        self,
+        directory: str | pathlib.Path | None = None,
+        sources: Iterable[TaxonomySource] | None = None,
+    ):
+        self._directory = pathlib.Path(directory) if directory else None
+        self._sources = {
+            source.name: source for source in (sources or get_default_sources())
+        }
+        self._tables: dict[str, pl.DataFrame] = {}
+        self._meta: dict[str, dict] = {}
+        self._indexes: dict[str, dict[str, str | None]] = {}
+        self._lock = threading.RLock()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__} with {len(self._tables)} loaded tables"
+
+    @property
+    def directory(self) -> pathlib.Path:
+        if not self._directory:
+            from sharkadm import utils
+
+            self._directory = utils.get_root_directory("cache", "taxonomy")
+        self._directory.mkdir(parents=True, exist_ok=True)
+        return self._directory
+
+    @property
+    def source_names(self) -> list[str]:
+        return list(self._sources)
+
+    def _get_source(self, name: str) -> TaxonomySource:
+        if name not in self._sources:
+            raise KeyError(f"No taxonomy source named {name}")
+        return self._sources[name]
+
+    def is_available(self, name: str) -> bool:
+        return self._get_source(name).get_version() is not None
+
+    def get_table(self, name: str) -> pl.DataFrame:
+        """Returns the compiled table (columns key and value) of source name"""
+        with self._lock:
+            if name not in self._tables:
+                self._tables[name] = self._load_table(name)
+            return self._tables[name]
+
+    def _get_paths(self, name: str) -> tuple[pathlib.Path, pathlib.Path]:
+        return self.directory / f"{name}.arrow", self.directory / f"{name}.json"
+
+    def _load_table(self, name: str) -> pl.DataFrame:
+        source = self._get_source(name)
+        version = source.get_version()
+        if version is None:
+            self._meta[name] = dict()
+            return pl.DataFrame(schema=_SCHEMA)
+        if not source.is_complete:
+            self._meta[name] = dict(version=version, source="")
+            return pl.DataFrame(schema=_SCHEMA)
+        path, meta_path = self._get_paths(name)
+        meta = dict()
+        if meta_path.exists():
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        if (
+            path.exists()
+            and meta.get("store_version") == STORE_VERSION
+            and meta.get("version") == version
+        ):
+            self._meta[name] = meta
+            return pl.read_ipc(path, memory_map=True)
+        self._meta[name] = dict(store_version=STORE_VERSION, version=version, source="")
+        adm_logger.log_workflow(
+            f"Compiling taxonomy table {name}", level=adm_logger.DEBUG
+        )
+        return self._save(name, _get_table(source.get_mapper()))
+
+    def _save(self, name: str, table: pl.DataFrame) -> pl.DataFrame:
+        """Saves table and returns it memory mapped from the saved file. The table
+        is only kept in memory if it can not be saved"""
+        path, meta_path = self._get_paths(name)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            table.write_ipc(tmp_path, compression="uncompressed")
+            tmp_path.replace(path)
+            meta_path.write_text(json.dumps(self._meta[name]), encoding="utf-8")
+        except OSError as e:
+            # The file can not be replaced while mapped by another process on Windows
+            adm_logger.log_workflow(
+                f"Could not save taxonomy table {name}: {e}", level=adm_logger.DEBUG
+            )
+            return table
+        return pl.read_ipc(path, memory_map=True)
+
+    def _add_keys(self, name: str, keys: list[str]) -> pl.DataFrame:
+        """Looks up keys in the source and adds the keys found to the table in
+        memory. The table is not saved"""
+        source = self._get_source(name)
+        values = dict()
+        for key in keys:
+            try:
+                value = source.get_value(key)
+            except Exception as e:
+                adm_logger.log_workflow(
+                    f"Could not look up {key} in {name}: {e}", level=adm_logger.WARNING
+                )
+                continue
+            if value is not None:
+                values[key] = value
+        if not self._meta[name].get("source") and source.get_source:
+            self._meta[name]["source"] = source.get_source()
+        if values:
+            self._tables[name] = pl.concat([self._tables[name], _get_table(values)])
+            self._indexes.pop(name, None)
+        return self._tables[name]
+
+    def lookup(self, name: str, keys: Iterable) -> pl.DataFrame:
+        """Returns a table with the unique keys and their values (null if not
+        found). Keys not in a table compiled per key are looked up in the source
+        first."""
+        keys_df = (
+            pl.Series(KEY_COLUMN, [str(key) for key in keys if key is not None])
+            .cast(pl.String)
+            .unique()
+            .to_frame()
+        )
+        with self._lock:
+            table = self.get_table(name)
+            source = self._get_source(name)
+            if not source.is_complete and self._meta[name]:
+                missing = keys_df.join(table, on=KEY_COLUMN, how="anti")[KEY_COLUMN]
+                if len(missing):
+                    table = self._add_keys(name, missing.to_list())
+        return keys_df.join(table, on=KEY_COLUMN, how="left")
+
+    def get_mapping(self, name: str, keys: Iterable) -> dict[str, str]:
+        """Returns a mapping key -> value for the keys found in source name"""
+        df = self.lookup(name, keys).drop_nulls(VALUE_COLUMN)
+        return dict(zip(df[KEY_COLUMN], df[VALUE_COLUMN]))
+
+    def get_mapper(self, name: str) -> dict[str, str]:
+        """Returns the whole table as a mapping key -> value"""
+        df = self.get_table(name).drop_nulls(VALUE_COLUMN)
+        return dict(zip(df[KEY_COLUMN], df[VALUE_COLUMN]))
+
+    def replace(self, expr: pl.Expr, name: str, default: Any = None) -> pl.Expr:
+        """Returns expr with its values replaced by the values in table name (a hash
+        join on the table). Values not in the table are set to default. For tables
+        compiled per key only keys already looked up are used (see lookup)."""
+        table = self.get_table(name)
+        return expr.cast(pl.String).replace_strict(
+            table[KEY_COLUMN],
+            table[VALUE_COLUMN],
+            default=default,
+            return_dtype=pl.String,
+        )
+
+    def get(self, name: str, key: Any) -> str | None:
+        """Returns the value for one key. Uses a hash index on the table"""
+        key = str(key)
+        with self._lock:
+            if key not in self._get_index(name):
+                self.lookup(name, [key])
+            return self._get_index(name).get(key)
+
+    def _get_index(self, name: str) -> dict[str, str | None]:
+        if name not in self._indexes:
+            table = self.get_table(name)
+            self._indexes[name] = dict(zip(table[KEY_COLUMN], table[VALUE_COLUMN]))
+        return self._indexes[name]
+
+    def get_source_name(self, name: str) -> str:
+        """Returns the description of the source used in log messages"""
+        with self._lock:
+            self.get_table(name)
+            source = self._get_source(name)
+            if not self._meta[name].get("source") and source.get_source:
+                self._meta[name]["source"] = source.get_source()
+            return self._meta[name].get("source") or name
+
+    def preload(self, names: Iterable[str] | None = None) -> list[str]:
+        """Loads (and compiles if needed) the tables of the available sources.
+        Returns the names of the loaded tables"""
+        loaded = []
+        for name in names or self.source_names:
+            if not self.is_available(name):
+                continue
+            self.get_table(name)
+            loaded.append(name)
+        return loaded
+
+    def clear(self) -> None:
+        """Removes all tables. They are compiled again on next use"""
+        with self._lock:
+            for name in self.source_names:
+                for path in self._get_paths(name):
+                    path.unlink(missing_ok=True)
+            self._tables = {}
+            self._meta = {}
+            self._indexes = {}
+
+
+_store: TaxonomyStore | None = None
+
+
+def get_store() -> TaxonomyStore:
+    """Returns the taxonomy store of the process"""
+    global _store
+    if _store is None:
+        _store = TaxonomyStore()
+    return _store
+
+
+def set_store(store: TaxonomyStore | None) -> None:
+    global _store
+    _store = store
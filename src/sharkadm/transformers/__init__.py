@@ -1,252 +1,212 @@
-# ruff: noqa: I001
-import functools
 import pathlib
 from typing import Type
 
-from sharkadm import utils
-from sharkadm.transformers.add_ctd_kust import AddCtdKust
-from sharkadm.transformers.add_gsw_parameters import (
-    PolarsAddPressure,
-    PolarsAddDensityWide,
-    PolarsAddDensity,
-    PolarsAddOxygenSaturationWide,
-    PolarsAddOxygenSaturation,
-)
-from sharkadm.transformers.add_lmqnt import PolarsAddLmqnt
-from sharkadm.transformers.add_uncertainty import (
-    PolarsAddUncertainty,
-    PolarsAddStandardUncertainty,
-)
-from sharkadm.transformers.analyse_info import (
-    PolarsAddAnalyseInfo,
-)
-from sharkadm.transformers.aphia_id import (
-    PolarsSetReportedAphiaIdFromAphiaId,
-    PolarsSetAphiaIdFromReportedAphiaId,
-    PolarsSetAphiaIdFromWormsAphiaId,
-    PolarsSetAphiaIdFromBvolAphiaId,
-)
-from sharkadm.transformers.arithmetic import (
-    PolarsMultiply,
-    PolarsDivide,
-)
-from sharkadm.transformers.bacteria import SetBacteriaAsReportedScientificName
+from sharkadm.operator_catalogue import operator_catalogue
 from sharkadm.transformers.base import PolarsTransformer
-from sharkadm.transformers.boolean import (
-    PolarsFixYesNo,
-    PolarsFixTrueAndFalse,
-    PolarsAddDataFilterBooleanColumn,
-)
-from sharkadm.transformers.bvol import (
-    PolarsAddBvolAphiaId,
-    PolarsAddBvolRefList,
-    PolarsAddBvolScientificNameAndSizeClass,
-    PolarsAddBvolScientificNameOriginal,
-    PolarsAddBvolCellVolume,
-    PolarsAddBvolCarbonVolume,
-)
-from sharkadm.transformers.calculate import (
-    PolarsCalculateAbundance,
-    PolarsCalculateBiovolume,
-    PolarsCalculateCarbon,
-    PolarsFixCalcByDc,
-    PolarsOnlyKeepReportedIfCalcByDc,
-)
-from sharkadm.transformers.columns import (
-    PolarsAddColumnViewsColumns,
-    PolarsOnlyKeepColumnViewsColumns,
-    PolarsRemoveColumns,
-    PolarsClearColumns,
-    PolarsSortColumns,
-    AddColumnsWithPrefix,
-    PolarsAddDEPHqcColumn,
-    PolarsAddFloatColumns,
-    PolarsAddColumnDiff,
-    PolarsAddBooleanLargerThan,
-    PolarsAddIntColumns,
-    PolarsFixDuplicateColumns,
-)
-from sharkadm.transformers.coordinates import PolarsSetBoundingBox
-from sharkadm.transformers.cruise import PolarsAddCruiseId
-from sharkadm.transformers.custom_id import (
-    PolarsAddCustomId,
-    PolarsAddSharkSampleMd5,
-)
-from sharkadm.transformers.data_holder import AddDataHolderName
-from sharkadm.transformers.dataset_name import (
-    PolarsAddDatasetFileName,
-    PolarsAddDatasetName,
-)
-from sharkadm.transformers.datatype import (
-    PolarsAddDatatype,
-    PolarsAddDatatypePlanktonBarcoding,
-)
-from sharkadm.transformers.date_and_time import (
-    PolarsAddDatetime,
-    PolarsAddMonth,
-    PolarsAddReportedTimes,
-    PolarsAddReportedDates,
-    PolarsAddSampleDate,
-    PolarsAddSampleTime,
-    PolarsAddVisitDateFromObservationDate,
-    PolarsCreateFakeFullDates,
-    PolarsFixDateFormat,
-    PolarsFixTimeFormat,
-)
-from sharkadm.transformers.delivery_note_info import (
-    PolarsAddDeliveryNoteInfo,
-)
-from sharkadm.transformers.depth import (
-    AddSampleMinAndMaxDepth,
-    ReorderSampleMinAndMaxDepth,
-)
-from sharkadm.transformers.dyntaxa import (
-    PolarsAddDyntaxaId,
-    PolarsAddDyntaxaScientificName,
-    PolarsAddDyntaxaTranslatedScientificNameDyntaxaId,
-    PolarsAddReportedDyntaxaId,
-    PolarsAddReportedScientificNameDyntaxaId,
-    PolarsAddTaxonRanks,
-)
-from sharkadm.transformers.fake import FakeAddCTDtagToColumns, FakeAddPressureFromDepth
-from sharkadm.transformers.flags import PolarsConvertFlagsToSDN
-from sharkadm.transformers.laboratory import (
-    PolarsAddEnglishSamplingLaboratory,
-    PolarsAddSwedishSamplingLaboratory,
-    PolarsAddEnglishAnalyticalLaboratory,
-    PolarsAddSwedishAnalyticalLaboratory,
-)
-from sharkadm.transformers.lims import (
-    PolarsMoveLessThanFlagRowFormat,
-    PolarsMoveLargerThanFlagRowFormat,
-    PolarsRemoveNonDataLines,
-    PolarsKeepOnlyJellyfishLines,
-)
-from sharkadm.transformers.location import (
-    PolarsAddLocationHelcomOsparArea,
-    PolarsAddLocationMunicipality,
-    PolarsAddLocationNation,
-    PolarsAddLocationSeaBasin,
-    PolarsAddLocationTypeArea,
-    PolarsAddLocationSeaAreaCode,
-    PolarsAddLocationSeaAreaName,
-    PolarsAddLocationTYPNFS06,
-    PolarsAddLocationWaterCategory,
-    PolarsAddLocationWaterDistrict,
-    PolarsAddLocationWB,
-    PolarsAddLocationCounty,
-    PolarsAddLocationOnLand,
-    PolarsAddLocations,
-)
-from sharkadm.transformers.long_to_wide import LongToWide, PolarsLongToWide
-from sharkadm.transformers.manual import (
-    PolarsManualEpibenthos,
-    PolarsManualHarbourPorpoise,
-    PolarsManualSealPathology,
-)
-from sharkadm.transformers.map_header import ArchiveMapper, ExternalMapper
-from sharkadm.transformers.map_parameter_column import (
-    PolarsMapperParameterColumn,
-)
-from sharkadm.transformers.metadata import PolarsAddFromMetadata
-from sharkadm.transformers.occurrence_id import AddOccurrenceId
-from sharkadm.transformers.orderer import (
-    PolarsAddEnglishSampleOrderer,
-    PolarsAddSwedishSampleOrderer,
-)
-from sharkadm.transformers.parameter_column import PolarsAddParameterShortColumn
-from sharkadm.transformers.parameter_unit_value import RemoveRowsWithNoParameterValue
-from sharkadm.transformers.position import (
-    PolarsAddReportedPosition,
-    PolarsAddSamplePositionDD,
-    PolarsAddSamplePositionDDAsFloat,
-    PolarsAddSamplePositionDM,
-    PolarsAddSamplePositionSweref99tm,
-    PolarsSetPositionDDNumberOfDecimal,
-    PolarsAddReportedPositionString,
-)
-from sharkadm.transformers.profile import (
-    PolarsAddMetadataToProfileData,
-    PolarsLoadSensorInfoToProfileData,
-    AddMetadataToStandardFormat,
-)
-from sharkadm.transformers.project_code import (
-    PolarsAddEnglishProjectName,
-    PolarsAddSwedishProjectName,
-)
-from sharkadm.transformers.red_list import AddRedList
-from sharkadm.transformers.remove import (
-    PolarsRemoveMask,
-    PolarsRemoveValueInColumns,
-    PolarsKeepMask,
-    PolarsRemoveProfiles,
-    PolarsRemoveBottomDepthInfoProfiles,
-    PolarsRemoveValueInRowsForParameters,
-    PolarsReplaceColumnWithMask,
-)
-from sharkadm.transformers.replace import PolarsReplaceNanWithNone
-from sharkadm.transformers.replace_comma_with_dot import PolarsReplaceCommaWithDot
-from sharkadm.transformers.reporting_institute import (
-    PolarsAddEnglishReportingInstitute,
-    PolarsAddSwedishReportingInstitute,
-)
-from sharkadm.transformers.row import PolarsAddRowNumber
-from sharkadm.transformers.sampler_area import AddCalculatedSamplerArea
-from sharkadm.transformers.sampling_info import PolarsAddSamplingInfo
-from sharkadm.transformers.scientific_name import (
-    PolarsSetScientificNameFromDyntaxaScientificName,
-    PolarsSetScientificNameFromReportedScientificName,
-)
-from sharkadm.transformers.serial_number import FormatSerialNumber
-from sharkadm.transformers.shark_id import PolarsAddSharkId
-from sharkadm.transformers.sort_data import (
-    PolarsSortData,
-    SortDataPlanktonImaging,
-)
-from sharkadm.transformers.static_data_holding_center import (
-    PolarsAddStaticDataHoldingCenterEnglish,
-    PolarsAddStaticDataHoldingCenterSwedish,
-)
-from sharkadm.transformers.static_internet_access import (
-    PolarsAddStaticInternetAccessInfo,
-)
-from sharkadm.transformers.station import (
-    PolarsAddStationInfo,
-    PolarsCopyReportedStationNameToStationName,
-    PolarsSetStationNameFromReportedStationNameIfMissing,
-)
-from sharkadm.transformers.status import SetStatusDataHost, SetStatusDeliverer
-from sharkadm.transformers.string import PolarsCodesToUppercase
-from sharkadm.transformers.strip import PolarsStripAllValues
-from sharkadm.transformers.trophic_type import PolarsSetTrophicTypeSMHI
-from sharkadm.transformers.visit import (
-    PolarsAddPhysicalChemicalKey,
-    PolarsAddVisitKey,
-    AddVisitKeyProfile,
-)
-from sharkadm.transformers.wide_to_long import PolarsWideToLong
-from sharkadm.transformers.worms import (
-    PolarsAddWormsAphiaId,
-    PolarsAddWormsScientificName,
+from sharkadm.utils.lazy_import import get_lazy_attribute, import_modules
+
+# Transformer classes are imported from their modules on first access
+_LAZY_NAMES = {
+    "AddCalculatedSamplerArea": "sampler_area",
+    "AddColumnsWithPrefix": "columns",
+    "AddCtdKust": "add_ctd_kust",
+    "AddDataHolderName": "data_holder",
+    "AddMetadataToStandardFormat": "profile",
+    "AddOccurrenceId": "occurrence_id",
+    "AddRedList": "red_list",
+    "AddSampleMinAndMaxDepth": "depth",
+    "AddVisitKeyProfile": "visit",
+    "ArchiveMapper": "map_header",
+    "ExternalMapper": "map_header",
+    "FakeAddCTDtagToColumns": "fake",
+    "FakeAddPressureFromDepth": "fake",
+    "FormatSerialNumber": "serial_number",
+    "LongToWide": "long_to_wide",
+    "PolarsAddAnalyseInfo": "analyse_info",
+    "PolarsAddBooleanLargerThan": "columns",
+    "PolarsAddBvolAphiaId": "bvol",
+    "PolarsAddBvolCarbonVolume": "bvol",
+    "PolarsAddBvolCellVolume": "bvol",
+    "PolarsAddBvolRefList": "bvol",
+    "PolarsAddBvolScientificNameAndSizeClass": "bvol",
+    "PolarsAddBvolScientificNameOriginal": "bvol",
+    "PolarsAddColumnDiff": "columns",
+    "PolarsAddColumnViewsColumns": "columns",
+    "PolarsAddCruiseId": "cruise",
+    "PolarsAddCustomId": "custom_id",
+    "PolarsAddDEPHqcColumn": "columns",
+    "PolarsAddDataFilterBooleanColumn": "boolean",
+    "PolarsAddDatasetFileName": "dataset_name",
+    "PolarsAddDatasetName": "dataset_name",
+    "PolarsAddDatatype": "datatype",
+    "PolarsAddDatatypePlanktonBarcoding": "datatype",
+    "PolarsAddDatetime": "date_and_time",
+    "PolarsAddDeliveryNoteInfo": "delivery_note_info",
+    "PolarsAddDensity": "add_gsw_parameters",
+    "PolarsAddDensityWide": "add_gsw_parameters",
+    "PolarsAddDyntaxaId": "dyntaxa",
+    "PolarsAddDyntaxaScientificName": "dyntaxa",
+    "PolarsAddDyntaxaTranslatedScientificNameDyntaxaId": "dyntaxa",
+    "PolarsAddEnglishAnalyticalLaboratory": "laboratory",
+    "PolarsAddEnglishProjectName": "project_code",
+    "PolarsAddEnglishReportingInstitute": "reporting_institute",
+    "PolarsAddEnglishSampleOrderer": "orderer",
+    "PolarsAddEnglishSamplingLaboratory": "laboratory",
+    "PolarsAddFloatColumns": "columns",
+    "PolarsAddFromMetadata": "metadata",
+    "PolarsAddIntColumns": "columns",
+    "PolarsAddLmqnt": "add_lmqnt",
+    "PolarsAddLocationCounty": "location",
+    "PolarsAddLocationHelcomOsparArea": "location",
+    "PolarsAddLocationMunicipality": "location",
+    "PolarsAddLocationNation": "location",
+    "PolarsAddLocationOnLand": "location",
+    "PolarsAddLocationSeaAreaCode": "location",
+    "PolarsAddLocationSeaAreaName": "location",
+    "PolarsAddLocationSeaBasin": "location",
+    "PolarsAddLocationTYPNFS06": "location",
+    "PolarsAddLocationTypeArea": "location",
+    "PolarsAddLocationWB": "location",
+    "PolarsAddLocationWaterCategory": "location",
+    "PolarsAddLocationWaterDistrict": "location",
+    "PolarsAddLocations": "location",
+    "PolarsAddMetadataToProfileData": "profile",
+    "PolarsAddMonth": "date_and_time",
+    "PolarsAddOxygenSaturation": "add_gsw_parameters",
+    "PolarsAddOxygenSaturationWide": "add_gsw_parameters",
+    "PolarsAddParameterShortColumn": "parameter_column",
+    "PolarsAddPhysicalChemicalKey": "visit",
+    "PolarsAddPressure": "add_gsw_parameters",
+    "PolarsAddReportedDates": "date_and_time",
+    "PolarsAddReportedDyntaxaId": "dyntaxa",
+    "PolarsAddReportedPosition": "position",
+    "PolarsAddReportedPositionString": "position",
+    "PolarsAddReportedScientificNameDyntaxaId": "dyntaxa",
+    "PolarsAddReportedTimes": "date_and_time",
+    "PolarsAddRowNumber": "row",
+    "PolarsAddSampleDate": "date_and_time",
+    "PolarsAddSamplePositionDD": "position",
+    "PolarsAddSamplePositionDDAsFloat": "position",
+    "PolarsAddSamplePositionDM": "position",
+    "PolarsAddSamplePositionSweref99tm": "position",
+    "PolarsAddSampleTime": "date_and_time",
+    "PolarsAddSamplingInfo": "sampling_info",
+    "PolarsAddSharkId": "shark_id",
+    "PolarsAddSharkSampleMd5": "custom_id",
+    "PolarsAddStandardUncertainty": "add_uncertainty",
+    "PolarsAddStaticDataHoldingCenterEnglish": "static_data_holding_center",
+    "PolarsAddStaticDataHoldingCenterSwedish": "static_data_holding_center",
+    "PolarsAddStaticInternetAccessInfo": "static_internet_access",
+    "PolarsAddStationInfo": "station",
+    "PolarsAddSwedishAnalyticalLaboratory": "laboratory",
+    "PolarsAddSwedishProjectName": "project_code",
+    "PolarsAddSwedishReportingInstitute": "reporting_institute",
+    "PolarsAddSwedishSampleOrderer": "orderer",
+    "PolarsAddSwedishSamplingLaboratory": "laboratory",
+    "PolarsAddTaxonRanks": "dyntaxa",
+    "PolarsAddUncertainty": "add_uncertainty",
+    "PolarsAddVisitDateFromObservationDate": "date_and_time",
+    "PolarsAddVisitKey": "visit",
+    "PolarsAddWormsAphiaId": "worms",
+    "PolarsAddWormsScientificName": "worms",
+    "PolarsCalculateAbundance": "calculate",
+    "PolarsCalculateBiovolume": "calculate",
+    "PolarsCalculateCarbon": "calculate",
+    "PolarsClearColumns": "columns",
+    "PolarsCodesToUppercase": "string",
+    "PolarsConvertFlagsToSDN": "flags",
+    "PolarsCopyReportedStationNameToStationName": "station",
+    "PolarsCreateFakeFullDates": "date_and_time",
+    "PolarsDivide": "arithmetic",
+    "PolarsFixCalcByDc": "calculate",
+    "PolarsFixDateFormat": "date_and_time",
+    "PolarsFixDuplicateColumns": "columns",
+    "PolarsFixTimeFormat": "date_and_time",
+    "PolarsFixTrueAndFalse": "boolean",
+    "PolarsFixYesNo": "boolean",
+    "PolarsKeepMask": "remove",
+    "PolarsKeepOnlyJellyfishLines": "lims",
+    "PolarsLoadSensorInfoToProfileData": "profile",
+    "PolarsLongToWide": "long_to_wide",
+    "PolarsManualEpibenthos": "manual",
+    "PolarsManualHarbourPorpoise": "manual",
+    "PolarsManualSealPathology": "manual",
+    "PolarsMapperParameterColumn": "map_parameter_column",
+    "PolarsMoveLargerThanFlagRowFormat": "lims",
+    "PolarsMoveLessThanFlagRowFormat": "lims",
+    "PolarsMultiply": "arithmetic",
+    "PolarsOnlyKeepColumnViewsColumns": "columns",
+    "PolarsOnlyKeepReportedIfCalcByDc": "calculate",
+    "PolarsRemoveBottomDepthInfoProfiles": "remove",
+    "PolarsRemoveColumns": "columns",
+    "PolarsRemoveMask": "remove",
+    "PolarsRemoveNonDataLines": "lims",
+    "PolarsRemoveProfiles": "remove",
+    "PolarsRemoveValueInColumns": "remove",
+    "PolarsRemoveValueInRowsForParameters": "remove",
+    "PolarsReplaceColumnWithMask": "remove",
+    "PolarsReplaceCommaWithDot": "replace_comma_with_dot",
+    "PolarsReplaceNanWithNone": "replace",
+    "PolarsSetAphiaIdFromBvolAphiaId": "aphia_id",
+    "PolarsSetAphiaIdFromReportedAphiaId": "aphia_id",
+    "PolarsSetAphiaIdFromWormsAphiaId": "aphia_id",
+    "PolarsSetBoundingBox": "coordinates",
+    "PolarsSetPositionDDNumberOfDecimal": "position",
+    "PolarsSetReportedAphiaIdFromAphiaId": "aphia_id",
+    "PolarsSetScientificNameFromDyntaxaScientificName": "scientific_name",
+    "PolarsSetScientificNameFromReportedScientificName": "scientific_name",
+    "PolarsSetStationNameFromReportedStationNameIfMissing": "station",
+    "PolarsSetTrophicTypeSMHI": "trophic_type",
+    "PolarsSortColumns": "columns",
+    "PolarsSortData": "sort_data",
+    "PolarsStripAllValues": "strip",
+    "PolarsWideToLong": "wide_to_long",
+    "RemoveRowsWithNoParameterValue": "parameter_unit_value",
+    "ReorderSampleMinAndMaxDepth": "depth",
+    "SetBacteriaAsReportedScientificName": "bacteria",
+    "SetStatusDataHost": "status",
+    "SetStatusDeliverer": "status",
+    "SortDataPlanktonImaging": "sort_data",
+}
+
+
+def __getattr__(name: str):
+    return get_lazy_attribute(__name__, _LAZY_NAMES, name)
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + list(_LAZY_NAMES))
+
+
+def import_all_transformers() -> None:
+    """Imports all transformer modules"""
+    import_modules(__name__, _LAZY_NAMES.values())
+
+
+operator_catalogue.register_group(
+    "transformers", PolarsTransformer, import_all_transformers
 )
-from sharkadm.utils.inspect_kwargs import get_kwargs_for_class
 
 
-@functools.cache
 def get_transformer_list() -> list[str]:
     """Returns a sorted list of name of all available transformers"""
-    return sorted(utils.get_all_class_children_names(PolarsTransformer))
+    return sorted(get_transformers_info())
 
 
 def get_transformers() -> dict[str, Type[PolarsTransformer]]:
-    """Returns a dictionary with transformers"""
-    return utils.get_all_class_children(PolarsTransformer)
+    """Returns a dictionary with transformers. Imports all transformer modules"""
+    return operator_catalogue.get_classes("transformers")
+
+
+def get_transformer_class(name: str) -> Type[PolarsTransformer] | None:
+    """Returns the transformer class with the given name. Only the module of the
+    transformer is imported"""
+    return operator_catalogue.get_class("transformers", name)
 
 
 def get_transformer_object(name: str, **kwargs) -> PolarsTransformer | None:
     """Returns PolarsTransformer object that matches the given transformer names"""
-    all_trans = get_transformers()
-    tran = all_trans.get(name)
+    tran = get_transformer_class(name)
     if not tran:
         return
     args = kwargs.pop("args", [])
@@ -256,21 +216,15 @@ def get_transformer_object(name: str, **kwargs) -> PolarsTransformer | None:
 def get_transformers_description() -> dict[str, str]:
     """Returns a dictionary with transformer name as key and the description as value"""
     result = dict()
-    for name, tran in get_transformers().items():
+    for name, info in get_transformers_info().items():
         if name.startswith("_"):
             continue
-        result[name] = tran.get_transformer_description()
+        result[name] = info["description"]
     return result
 
 
 def get_transformers_info() -> dict:
-    result = dict()
-    for name, tran in get_transformers().items():
-        result[name] = dict()
-        result[name]["name"] = name
-        result[name]["description"] = tran.get_transformer_description()
-        result[name]["kwargs"] = get_kwargs_for_class(tran)
-    return result
+    return operator_catalogue.get_info("transformers")
 
 
 def get_transformers_description_text() -> str:
@@ -298,6 +252,11 @@ def write_transformers_description_to_file(path: str | pathlib.Path) -> None:
 
 
 def get_physical_chemical_transformer_objects() -> list[PolarsTransformer]:
+    from sharkadm.transformers.columns import PolarsAddDEPHqcColumn
+    from sharkadm.transformers.cruise import PolarsAddCruiseId
+    from sharkadm.transformers.visit import PolarsAddVisitKey
+    from sharkadm.transformers.wide_to_long import PolarsWideToLong
+
     return [
         PolarsAddDEPHqcColumn(),
         PolarsAddCruiseId(),
@@ -82,16 +82,13 @@ class PolarsAddPressure(PolarsTransformer):
             )
             return
 
-        valid_rows = data_holder.data[self.latitude_col].cast(
-            pl.Float64, strict=False
-        ).is_not_null() & data_holder.data[self.depth_col].cast(
-            pl.Float64, strict=False
-        ).is_between(0, 10000)
+        valid_rows = data_holder.float_col(
+            self.latitude_col
+        ).is_not_null() & data_holder.float_col(self.depth_col).is_between(0, 10000)
 
         if valid_rows.any():
-            valid_data = data_holder.data.filter(valid_rows)
-            depth = valid_data[self.depth_col].cast(pl.Float64, strict=False).to_numpy()
-            lat = valid_data[self.latitude_col].cast(pl.Float64, strict=False).to_numpy()
+            depth = data_holder.float_col(self.depth_col).filter(valid_rows).to_numpy()
+            lat = data_holder.float_col(self.latitude_col).filter(valid_rows).to_numpy()
 
             pres = np.full(len(data_holder.data), np.nan)
             pres[valid_rows.to_numpy()] = pressure(depth, lat)
@@ -162,34 +159,23 @@ class PolarsAddDensityWide(PolarsTransformer):
             return
 
         valid_rows = (
-            data_holder.data[self.longitude_col]
-            .cast(pl.Float64, strict=False)
-            .is_not_null()
-            & data_holder.data[self.latitude_col]
-            .cast(pl.Float64, strict=False)
-            .is_not_null()
-            & data_holder.data[self.depth_col]
-            .cast(pl.Float64, strict=False)
-            .is_between(0, 10000)
-            & data_holder.data[self.practical_salinity]
-            .cast(pl.Float64, strict=False)
-            .is_between(0, 50)
-            & data_holder.data[self.temperature]
-            .cast(pl.Float64, strict=False)
-            .is_not_null()
+            data_holder.float_col(self.longitude_col).is_not_null()
+            & data_holder.float_col(self.latitude_col).is_not_null()
+            & data_holder.float_col(self.depth_col).is_between(0, 10000)
+            & data_holder.float_col(self.practical_salinity).is_between(0, 50)
+            & data_holder.float_col(self.temperature).is_not_null()
         )
 
         if valid_rows.any():
-            valid_data = data_holder.data.filter(valid_rows)
             psal = (
-                valid_data[self.practical_salinity]
-                .cast(pl.Float64, strict=False)
+                data_holder.float_col(self.practical_salinity)
+                .filter(valid_rows)
                 .to_numpy()
             )
-            temp = valid_data[self.temperature].cast(pl.Float64, strict=False).to_numpy()
-            depth = valid_data[self.depth_col].cast(pl.Float64, strict=False).to_numpy()
-            lon = valid_data[self.longitude_col].cast(pl.Float64, strict=False).to_numpy()
-            lat = valid_data[self.latitude_col].cast(pl.Float64, strict=False).to_numpy()
+            temp = data_holder.float_col(self.temperature).filter(valid_rows).to_numpy()
+            depth = data_holder.float_col(self.depth_col).filter(valid_rows).to_numpy()
+            lon = data_holder.float_col(self.longitude_col).filter(valid_rows).to_numpy()
+            lat = data_holder.float_col(self.latitude_col).filter(valid_rows).to_numpy()
 
             dens = np.full(len(data_holder.data), np.nan)
             dens[valid_rows.to_numpy()] = in_situ_density(
@@ -418,47 +404,34 @@ class PolarsAddOxygenSaturationWide(PolarsTransformer):
             )
             return
         valid_rows = (
-            data_holder.data[self.longitude_col]
-            .cast(pl.Float64, strict=False)
-            .is_not_null()
-            & data_holder.data[self.latitude_col]
-            .cast(pl.Float64, strict=False)
-            .is_not_null()
-            & data_holder.data[self.depth_col]
-            .cast(pl.Float64, strict=False)
-            .is_between(0, 10000)
-            & data_holder.data[self.practical_salinity]
-            .cast(pl.Float64, strict=False)
-            .is_between(0, 50)
-            & data_holder.data[self.temperature]
-            .cast(pl.Float64, strict=False)
-            .is_not_null()
-            & data_holder.data[self.oxygen].cast(pl.Float64, strict=False).is_not_null()
-            & data_holder.data[self.density_col]
-            .cast(pl.Float64, strict=False)
-            .is_not_null()
+            data_holder.float_col(self.longitude_col).is_not_null()
+            & data_holder.float_col(self.latitude_col).is_not_null()
+            & data_holder.float_col(self.depth_col).is_between(0, 10000)
+            & data_holder.float_col(self.practical_salinity).is_between(0, 50)
+            & data_holder.float_col(self.temperature).is_not_null()
+            & data_holder.float_col(self.oxygen).is_not_null()
+            & data_holder.float_col(self.density_col).is_not_null()
         )
 
         if valid_rows.any():
-            valid_data = data_holder.data.filter(valid_rows)
             practical_salinity = (
-                valid_data[self.practical_salinity]
-                .cast(pl.Float64, strict=False)
+                data_holder.float_col(self.practical_salinity)
+                .filter(valid_rows)
                 .to_numpy()
             )
             temperature = (
-                valid_data[self.temperature].cast(pl.Float64, strict=False).to_numpy()
+                data_holder.float_col(self.temperature).filter(valid_rows).to_numpy()
             )
-            oxygen = valid_data[self.oxygen].cast(pl.Float64, strict=False).to_numpy()
+            oxygen = data_holder.float_col(self.oxygen).filter(valid_rows).to_numpy()
             density = (
-                valid_data[self.density_col].cast(pl.Float64, strict=False).to_numpy()
+                data_holder.float_col(self.density_col).filter(valid_rows).to_numpy()
             )
-            depth = valid_data[self.depth_col].cast(pl.Float64, strict=False).to_numpy()
+            depth = data_holder.float_col(self.depth_col).filter(valid_rows).to_numpy()
             longitude = (
-                valid_data[self.longitude_col].cast(pl.Float64, strict=False).to_numpy()
+                data_holder.float_col(self.longitude_col).filter(valid_rows).to_numpy()
             )
             latitude = (
-                valid_data[self.latitude_col].cast(pl.Float64, strict=False).to_numpy()
+                data_holder.float_col(self.latitude_col).filter(valid_rows).to_numpy()
             )
 
             oxygen_values = np.full(len(data_holder.data), np.nan)
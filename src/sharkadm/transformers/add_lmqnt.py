@@ -10,6 +10,7 @@ from .base import PolarsTransformer
 
 class PolarsAddLmqnt(PolarsTransformer):
     valid_data_types = ("physicalchemical",)
+    row_local = True
 
     @staticmethod
     def get_transformer_description() -> str:
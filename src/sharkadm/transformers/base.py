@@ -1,6 +1,6 @@
 import time
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, Callable, Protocol
 
 import polars as pl
 
@@ -151,11 +151,23 @@ class PolarsTransformer(ABC, Operator):
             .alias(self.col_to_set)
         )
 
+    def _add_mapping_to_col_to_set(
+        self, data_holder: "PolarsDataHolder", mapping: dict[str, str]
+    ) -> None:
+        """Sets col_to_set from source_col for all names in mapping in one step.
+        Other rows keep their value in col_to_set"""
+        data_holder.data = data_holder.data.with_columns(
+            pl.col(self.source_col)
+            .cast(pl.String)
+            .replace_strict(mapping, default=pl.col(self.col_to_set))
+            .alias(self.col_to_set)
+        )
+
     def _remove_columns(self, data_holder: "PolarsDataHolder", *cols) -> None:
         cols = [col for col in cols if col in data_holder.data.columns]
         data_holder.data = data_holder.data.drop(cols)
 
-    def _log(self, msg: str, **kwargs):
+    def _log(self, msg: str | Callable[[], str], **kwargs):
         adm_logger.log_transformation(msg, cls=self.__class__.__name__, **kwargs)
 
     def _log_workflow(self, msg: str, **kwargs):
@@ -10,6 +10,7 @@ from sharkadm.utils import matching_strings
 
 
 class PolarsFixYesNo(PolarsTransformer):
+    row_local = True
     apply_on_columns = (".*accreditated",)
     _mapping = MappingProxyType({"y": "Y", "yes": "Y", "n": "N", "no": "N"})
 
@@ -36,6 +37,7 @@ class PolarsFixYesNo(PolarsTransformer):
 
 
 class PolarsFixTrueAndFalse(PolarsTransformer):
+    row_local = True
     apply_on_column = "value"
 
     def __init__(self, apply_on_column: str | None = None, **kwargs):
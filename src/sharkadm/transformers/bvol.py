@@ -1,5 +1,6 @@
 import polars as pl
 
+from .. import taxonomy_store
 from ..data import PolarsDataHolder
 from ..sharkadm_logger import adm_logger
 from .base import PolarsTransformer
@@ -43,12 +44,11 @@ class PolarsAddBvolScientificNameOriginal(PolarsTransformer):
         # self._log_result(data_holder)
 
     def _add_column(self, data_holder: PolarsDataHolder):
-        translate_bvol_name = nodc_bvol.get_translate_bvol_name_object()
-        _mapper = translate_bvol_name.get_scientific_name_from_to_mapper()
-
         data_holder.data = data_holder.data.with_columns(
-            pl.col(self.source_col)
-            .replace_strict(_mapper, default=pl.col(self.source_col))
+            taxonomy_store.get_store()
+            .replace(
+                pl.col(self.source_col), "bvol_name", default=pl.col(self.source_col)
+            )
             .alias(self.col_to_set)
         )
 
@@ -58,6 +58,7 @@ class PolarsAddBvolScientificNameOriginal(PolarsTransformer):
             self._log(
                 f"Translating {from_name} -> {to_name} ({len(df)} places)",
                 level=adm_logger.INFO,
+                template="Translating",
             )
             # TODO: Log level here?
             #  Maybe just log reported_scientific_name -> final scientific_name
@@ -70,6 +71,7 @@ class PolarsAddBvolScientificNameOriginal(PolarsTransformer):
                 f"Translating to Bvol scientific name: "
                 f"{from_name} -> {to_name} ({len(df)} places)",
                 level=adm_logger.INFO,
+                template="Translating to Bvol scientific name",
             )
 
 
@@ -106,9 +108,6 @@ class PolarsAddBvolScientificNameAndSizeClass(PolarsTransformer):
 
         self._remove_columns(data_holder, self.col_to_set_name, self.col_to_set_size)
 
-        translate_bvol_name_and_size = nodc_bvol.get_translate_bvol_name_size_object()
-        _mapper = translate_bvol_name_and_size.get_scientific_name_from_to_mapper()
-
         data_holder.data = data_holder.data.with_columns(
             pl.concat_str(
                 [pl.col(self.source_name_col), pl.col(self.source_size_class_col)],
@@ -117,8 +116,12 @@ class PolarsAddBvolScientificNameAndSizeClass(PolarsTransformer):
         )
 
         data_holder.data = data_holder.data.with_columns(
-            pl.col("bvol_combined_from")
-            .replace_strict(_mapper, default=pl.col("bvol_combined_from"))
+            taxonomy_store.get_store()
+            .replace(
+                pl.col("bvol_combined_from"),
+                "bvol_name_and_size",
+                default=pl.col("bvol_combined_from"),
+            )
             .alias("bvol_combined_to")
         )
 
@@ -137,6 +140,7 @@ class PolarsAddBvolScientificNameAndSizeClass(PolarsTransformer):
                 f"Translating Bvol name and size_class "
                 f"{from_name} -> {to_name} ({len(df)} places)",
                 level=adm_logger.INFO,
+                template="Translating Bvol name and size_class",
             )
             # TODO: Log level here?
             #  Maybe just log reported_scientific_name -> final scientific_name
@@ -192,8 +196,6 @@ class PolarsAddBvolAphiaId(PolarsTransformer):
     #     )
 
     def _add_column(self, data_holder: PolarsDataHolder):
-        bvol_nomp = nodc_bvol.get_bvol_nomp_object()
-        _mapper = bvol_nomp.get_species_to_aphia_id_mapper()
         # One species might map to multiple aphia_ids. Check this! Should not happen
         # Diplopsalis och Diplopsalis CPX
         # Species = 1138
@@ -201,8 +203,8 @@ class PolarsAddBvolAphiaId(PolarsTransformer):
         # Kombination = 1136
 
         data_holder.data = data_holder.data.with_columns(
-            pl.col(self.scientific_name_col)
-            .replace_strict(_mapper, default="")
+            taxonomy_store.get_store()
+            .replace(pl.col(self.scientific_name_col), "bvol_aphia_id", default="")
             .alias(self.col_to_set)
         )
 
@@ -276,16 +278,14 @@ class PolarsAddBvolRefList(PolarsTransformer):
         )
 
     def _add_column(self, data_holder: PolarsDataHolder):
-        bvol_nomp = nodc_bvol.get_bvol_nomp_object()
-        _mapper = bvol_nomp.get_species_and_size_class_to_ref_list_mapper()
         # TODO: One species might map to multiple aphia_ids. Check this! Might be fixed...
         # Species = 1138
         # AphiaID = 1133
         # Kombination = 1136
 
         data_holder.data = data_holder.data.with_columns(
-            pl.col(self.joined_col)
-            .replace_strict(_mapper, default="")
+            taxonomy_store.get_store()
+            .replace(pl.col(self.joined_col), "bvol_ref_list", default="")
             .alias(self.col_to_set)
         )
 
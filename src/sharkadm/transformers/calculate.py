@@ -59,30 +59,30 @@ PAR_COUNTED = "# counted"
 def add_calculate_columns(data_holder: PolarsDataHolder) -> PolarsDataHolder:
     if FLOAT_COL_VALUE in data_holder.data.columns:
         return data_holder
-    data_holder.data = add_column.add_float_column(
-        data_holder.data, COL_VALUE, column_name=FLOAT_COL_VALUE
+    data_holder.data = add_column.add_cached_float_column(
+        data_holder, COL_VALUE, column_name=FLOAT_COL_VALUE
     )
-    data_holder.data = add_column.add_float_column(
-        data_holder.data, GIVEN_COL_COUNTED, column_name=FLOAT_COL_COUNTED
+    data_holder.data = add_column.add_cached_float_column(
+        data_holder, GIVEN_COL_COUNTED, column_name=FLOAT_COL_COUNTED
     )
-    data_holder.data = add_column.add_float_column(
-        data_holder.data, GIVEN_COL_COEFFICIENT, column_name=FLOAT_COL_COEFFICIENT
+    data_holder.data = add_column.add_cached_float_column(
+        data_holder, GIVEN_COL_COEFFICIENT, column_name=FLOAT_COL_COEFFICIENT
     )
-    data_holder.data = add_column.add_float_column(
-        data_holder.data,
+    data_holder.data = add_column.add_cached_float_column(
+        data_holder,
         COL_CELL_VOLUME_REPORTED,
         column_name=FLOAT_COL_CELL_VOLUME_REPORTED,
     )
     print("+++")
     print([col for col in data_holder.data.columns if "reported" in col])
-    data_holder.data = add_column.add_float_column(
-        data_holder.data, GIVEN_COL_ABUNDANCE, column_name=FLOAT_COL_ABUNDANCE_REPORTED
+    data_holder.data = add_column.add_cached_float_column(
+        data_holder, GIVEN_COL_ABUNDANCE, column_name=FLOAT_COL_ABUNDANCE_REPORTED
     )
-    data_holder.data = add_column.add_float_column(
-        data_holder.data, GIVEN_COL_BIOVOLUME, column_name=FLOAT_COL_BIOVOLUME_REPORTED
+    data_holder.data = add_column.add_cached_float_column(
+        data_holder, GIVEN_COL_BIOVOLUME, column_name=FLOAT_COL_BIOVOLUME_REPORTED
     )
-    data_holder.data = add_column.add_float_column(
-        data_holder.data, GIVEN_COL_CARBON, column_name=FLOAT_COL_CARBON_REPORTED
+    data_holder.data = add_column.add_cached_float_column(
+        data_holder, GIVEN_COL_CARBON, column_name=FLOAT_COL_CARBON_REPORTED
     )
 
     data_holder.data = data_holder.data.with_columns(
@@ -150,11 +150,13 @@ class PolarsAddFloatColumns(PolarsTransformer):
         for col, name in zip(self._columns, self._column_names):
             if col in data_holder.data.columns:
                 if name:
-                    data_holder.data = add_column.add_float_column(
-                        data_holder.data, col, name
+                    data_holder.data = add_column.add_cached_float_column(
+                        data_holder, col, name
                     )
                 else:
-                    data_holder.data = add_column.add_float_column(data_holder.data, col)
+                    data_holder.data = add_column.add_cached_float_column(
+                        data_holder, col
+                    )
 
 
 class PolarsAddIntColumns(PolarsTransformer):
@@ -11,6 +11,8 @@ from .base import PolarsTransformer
 
 
 class PolarsAddCustomId(PolarsTransformer):
+    row_local = True
+
     def __init__(self, add_md5: bool = False):
         super().__init__()
         self._id_handler = config.get_custom_id_handler()
@@ -66,6 +68,7 @@ class PolarsAddCustomId(PolarsTransformer):
 
 
 class PolarsAddSharkSampleMd5(PolarsTransformer):
+    row_local = True
     col_to_set = "shark_sample_md5"
 
     def __init__(self):
@@ -11,6 +11,7 @@ DATETIME_FORMATS = ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d")
 
 
 class PolarsAddSampleTime(PolarsTransformer):
+    row_local = True
     invalid_data_types = ("harbourseal",)
     source_col = "visit_time"
     col_to_set = "sample_time"
@@ -43,6 +44,7 @@ class PolarsAddSampleTime(PolarsTransformer):
 
 
 class PolarsAddSampleDate(PolarsTransformer):
+    row_local = True
     source_col = "visit_date"
     col_to_set = "sample_date"
 
@@ -1,15 +1,15 @@
 import polars as pl
 
+from .. import taxonomy_store
 from ..data import PolarsDataHolder
 from ..sharkadm_logger import adm_logger
 from .base import PolarsTransformer
 
+# Reference data is read through the taxonomy store and only loaded from
+# nodc_dyntaxa when a table has to be compiled
 nodc_dyntaxa = None
 try:
     import nodc_dyntaxa
-
-    translate_dyntaxa = nodc_dyntaxa.get_translate_dyntaxa_object()
-    dyntaxa_taxon = nodc_dyntaxa.get_dyntaxa_taxon_object()
 except ModuleNotFoundError as e:
     module_name = str(e).split("'")[-2]
     adm_logger.log_workflow(
@@ -106,58 +106,70 @@ class PolarsAddDyntaxaScientificName(PolarsTransformer):
             )
             return
         self._add_empty_col_to_set(data_holder)
-        for (name,), df in data_holder.data.group_by(self.source_col):
+        store = taxonomy_store.get_store()
+        counts = data_holder.data.group_by(self.source_col).len()
+        names = [str(name) for name in counts[self.source_col]]
+        translated = store.get_mapping("dyntaxa_translate", names)
+        # Dyntaxa ids are translated to a name that is translated again
+        translated_twice = store.get_mapping(
+            "dyntaxa_translate",
+            [
+                translated[name]
+                for name in names
+                if name.isdigit() and translated.get(name)
+            ],
+        )
+        source = store.get_source_name("dyntaxa_translate")
+        new_names = dict()
+        for name, nr_rows in counts.iter_rows():
             name = str(name)
-            new_name = translate_dyntaxa.get(name)
+            new_name = translated.get(name)
             if new_name:
                 if name.isdigit():
-                    new_name_2 = translate_dyntaxa.get(new_name)
+                    new_name_2 = translated_twice.get(new_name)
                     if new_name_2:
                         self._log(
-                            f"Translated using {translate_dyntaxa.source}. "
+                            f"Translated using {source}. "
                             f"Reported name: {name} > "
-                            f"Translated to: {new_name_2} ({len(df)} rows)",
-                            # f"Translated from dyntaxa: {name} -> {new_name} -> "
-                            # f"{new_name_2} ({len(df)} places)",
+                            f"Translated to: {new_name_2} ({nr_rows} rows)",
                             level=adm_logger.INFO,
+                            template="Translated using dyntaxa",
                         )
                         new_name = new_name_2
                     else:
                         self._log(
-                            f"No second translation for: {new_name} ({len(df)} places)",
+                            lambda: (
+                                f"No second translation for: {new_name} "
+                                f"({nr_rows} places)"
+                            ),
                             level=adm_logger.DEBUG,
+                            template="No second translation",
                         )
                 else:
                     self._log(
-                        f"Translated using {translate_dyntaxa.source}. "
+                        f"Translated using {source}. "
                         f"Reported name: {name} > "
-                        f"Translated to: {new_name} ({len(df)} rows)",
-                        # f"Translated from dyntaxa: {name} -> {new_name} "
-                        # f"({len(df)} places)",
+                        f"Translated to: {new_name} ({nr_rows} rows)",
                         level=adm_logger.INFO,
+                        template="Translated using dyntaxa",
                     )
             else:
                 if name.isdigit():
                     self._log(
                         f"{self.source_col} {name} seems to be a dyntaxa_id "
-                        f"and could not be translated ({len(df)} rows)",
+                        f"and could not be translated ({nr_rows} rows)",
                         level=adm_logger.WARNING,
+                        template="Seems to be a dyntaxa_id and could not be translated",
                     )
                 else:
                     self._log(
-                        f"No translation ({translate_dyntaxa.source}) for: "
-                        f"{name} ({len(df)} rows)",
+                        lambda: f"No translation ({source}) for: {name} ({nr_rows} rows)",
                         level=adm_logger.DEBUG,
+                        template="No translation",
                     )
                 new_name = name
-
-            self._add_to_col_to_set(data_holder, name, new_name)
-            # data_holder.data = data_holder.data.with_columns(
-            #     pl.when(pl.col(self.source_col) == name)
-            #     .then(pl.lit(new_name))
-            #     .otherwise(pl.col(self.col_to_set))
-            #     .alias(self.col_to_set)
-            # )
+            new_names[name] = new_name
+        self._add_mapping_to_col_to_set(data_holder, new_names)
 
 
 class PolarsAddDyntaxaTranslatedScientificNameDyntaxaId(PolarsTransformer):
@@ -189,22 +201,19 @@ class PolarsAddDyntaxaTranslatedScientificNameDyntaxaId(PolarsTransformer):
             )
             return
         self._add_empty_col_to_set(data_holder)
-        for (name,), df in data_holder.data.group_by(self.source_col):
-            name = str(name)
-            _id = translate_dyntaxa.get_dyntaxa_id(name)
+        counts = data_holder.data.group_by(self.source_col).len()
+        ids = taxonomy_store.get_store().get_mapping(
+            "dyntaxa_translated_id", counts[self.source_col]
+        )
+        for name, nr_rows in counts.iter_rows():
+            _id = ids.get(str(name))
             if not _id:
                 continue
             self._log(
-                f"Adding {_id} to {self.col_to_set} ({len(df)} places)",
+                f"Adding {_id} to {self.col_to_set} ({nr_rows} places)",
                 level=adm_logger.INFO,
             )
-            self._add_to_col_to_set(data_holder, name, _id)
-            # data_holder.data = data_holder.data.with_columns(
-            #     pl.when(pl.col(self.source_col) == name)
-            #     .then(pl.lit(_id))
-            #     .otherwise(pl.col(self.col_to_set))
-            #     .alias(self.col_to_set)
-            # )
+        self._add_mapping_to_col_to_set(data_holder, ids)
 
 
 class PolarsAddTaxonRanks(PolarsTransformer):
@@ -243,6 +252,9 @@ class PolarsAddTaxonRanks(PolarsTransformer):
             )
             return
         self._add_columns(data_holder=data_holder)
+        dyntaxa_taxon = taxonomy_store.get_nodc_object(
+            "nodc_dyntaxa", "get_dyntaxa_taxon_object"
+        )
         for (name,), df in data_holder.data.group_by(self.source_col):
             info = dyntaxa_taxon.get_info(scientificName=name, taxonomicStatus="accepted")
             if not info:
@@ -312,24 +324,30 @@ class PolarsAddDyntaxaId(PolarsTransformer):
             self._log(f"Adding empty column {self.col_to_set}", level=adm_logger.DEBUG)
             self._add_empty_col_to_set(data_holder)
 
-        for (name,), df in data_holder.data.group_by(self.source_col):
+        counts = data_holder.data.group_by(self.source_col).len()
+        names = [name for name in counts[self.source_col] if str(name).strip()]
+        dyntaxa_ids = taxonomy_store.get_store().get_mapping("dyntaxa_id", names)
+        for name, nr_rows in counts.iter_rows():
             if not str(name).strip():
                 self._log(
                     f"Missing {self.source_col} when trying to add dyntaxa_id, "
-                    f"{len(df)} rows.",
+                    f"{nr_rows} rows.",
                     level=adm_logger.WARNING,
                 )
                 continue
-            dyntaxa_id = dyntaxa_taxon.get(str(name))
+            dyntaxa_id = dyntaxa_ids.get(str(name))
             if not dyntaxa_id:
                 self._log(
-                    f"No {self.col_to_set} found for {name}, {len(df)} rows.",
+                    f"No {self.col_to_set} found for {name}, {nr_rows} rows.",
                     level=adm_logger.WARNING,
                 )
                 continue
             self._log(
                 f"Adding {self.col_to_set} {dyntaxa_id} translated from {name} "
-                f"({len(df)} places)",
+                f"({nr_rows} places)",
                 level=adm_logger.INFO,
             )
-            self._add_to_col_to_set(data_holder, name, dyntaxa_id)
+        self._add_mapping_to_col_to_set(
+            data_holder,
+            {name: dyntaxa_id for name, dyntaxa_id in dyntaxa_ids.items() if dyntaxa_id},
+        )
@@ -8,6 +8,7 @@ from .base import PolarsTransformer
 
 class PolarsConvertFlagsToSDN(PolarsTransformer):
     valid_data_types = ("physicalchemical",)
+    row_local = True
     flag_col = "quality_flag"
     mapping = MappingProxyType(
         {
@@ -1,10 +1,12 @@
 import polars as pl
 
+from sharkadm import taxonomy_store
 from sharkadm.sharkadm_logger import adm_logger
 
 from ..data import PolarsDataHolder
 from .base import PolarsTransformer
 
+nodc_dyntaxa = None
 try:
     import nodc_dyntaxa
 except ModuleNotFoundError as e:
@@ -25,25 +27,34 @@ class AddRedList(PolarsTransformer):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.mapped = {}
-        self.red_list_obj = nodc_dyntaxa.get_red_list_object()
 
     @staticmethod
     def get_transformer_description() -> str:
         return "Adds info if red listed. Red listed species are marked with Y"
 
     def _transform(self, data_holder: PolarsDataHolder) -> None:
+        if not nodc_dyntaxa:
+            self._log(
+                "Could not add red list info. Package nodc-dyntaxa not found/installed!",
+                level=adm_logger.ERROR,
+            )
+            return
         self._add_empty_col_to_set(data_holder)
+        store = taxonomy_store.get_store()
         for col in self.source_cols:
-            for (name,), df in data_holder.data.group_by(col):
-                if not self.red_list_obj.get_info(name):
+            counts = data_holder.data.group_by(col).len()
+            red_listed = store.get_mapping("red_list", counts[col])
+            if not red_listed:
+                continue
+            for name, nr_rows in counts.iter_rows():
+                if not red_listed.get(str(name)):
                     continue
-                boolean = pl.col(col) == name
-                data_holder.data = data_holder.data.with_columns(
-                    pl.when(boolean)
-                    .then(pl.lit("Y"))
-                    .otherwise(pl.col(self.col_to_set))
-                    .alias(self.col_to_set)
-                )
                 self._log(
-                    f"{name} in column {col} is set as red listed ({len(df)} places)"
+                    f"{name} in column {col} is set as red listed ({nr_rows} places)"
                 )
+            data_holder.data = data_holder.data.with_columns(
+                pl.when(pl.col(col).cast(pl.String).is_in(list(red_listed)))
+                .then(pl.lit("Y"))
+                .otherwise(pl.col(self.col_to_set))
+                .alias(self.col_to_set)
+            )
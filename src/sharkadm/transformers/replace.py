@@ -5,6 +5,8 @@ from .base import PolarsTransformer
 
 
 class PolarsReplaceNanWithNone(PolarsTransformer):
+    row_local = True
+
     @staticmethod
     def get_transformer_description() -> str:
         return "Replaces all nan values in data with None"
@@ -6,6 +6,7 @@ from sharkadm.utils import matching_strings
 
 
 class PolarsReplaceCommaWithDot(PolarsTransformer):
+    row_local = True
     apply_on_columns: tuple[str, ...] = (
         "latitude",
         "longitude",
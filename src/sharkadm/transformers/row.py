@@ -6,6 +6,7 @@ from .base import PolarsTransformer
 
 class PolarsAddRowNumber(PolarsTransformer):
     col_to_set = "row_number"
+    supports_categorical = True
 
     @staticmethod
     def get_transformer_description() -> str:
@@ -19,6 +20,6 @@ class PolarsAddRowNumber(PolarsTransformer):
         if self.col_to_set in data_holder.data:
             self._log(f"Column {self.col_to_set} already present. Will not overwrite")
             return
-        data_holder.data = data_holder.data.with_row_index(self.col_to_set, 1).cast(
-            pl.String
-        )
+        data_holder.data = data_holder.data.with_row_index(
+            self.col_to_set, 1
+        ).with_columns(pl.exclude(pl.Categorical).cast(pl.String))
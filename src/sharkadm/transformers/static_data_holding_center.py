@@ -5,6 +5,7 @@ from .base import PolarsTransformer
 
 
 class PolarsAddStaticDataHoldingCenterEnglish(PolarsTransformer):
+    row_local = True
     col_to_set = "data_holding_centre"
     text_to_set = "Swedish Meteorological and Hydrological Institute (SMHI)"
 
@@ -22,6 +23,7 @@ class PolarsAddStaticDataHoldingCenterEnglish(PolarsTransformer):
 
 
 class PolarsAddStaticDataHoldingCenterSwedish(PolarsTransformer):
+    row_local = True
     col_to_set = "data_holding_centre"
     text_to_set = "Sveriges Meteorologiska och Hydrologiska Institut (SMHI)"
 
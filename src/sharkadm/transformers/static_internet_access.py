@@ -5,6 +5,7 @@ from .base import PolarsTransformer
 
 
 class PolarsAddStaticInternetAccessInfo(PolarsTransformer):
+    row_local = True
     col_to_set = "internet_access"
     text_to_set = "https://shark.smhi.se"
 
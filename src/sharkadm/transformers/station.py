@@ -95,17 +95,14 @@ class PolarsAddStationInfo(PolarsTransformer):
             [self.source_lat_column, self.source_lon_column, self.reported_station_col]
         ):
             if not (lat_str and lon_str):
-                rows = list(df["row_number"])
                 self._log(
-                    adm_logger.feedback.missing_position(
-                        rows=sorted(set(df["row_number"]))
-                    ),
+                    adm_logger.feedback.missing_position(rows=df["row_number"]),
                     level=adm_logger.ERROR,
                     purpose=adm_logger.FEEDBACK,
                 )  # Ska kanske vara i validator istället
                 self._log(
                     f"Missing {self.source_lat_column} and/or {self.source_lon_column}",
-                    row_numbers=rows,
+                    row_numbers=df["row_number"],
                     level=adm_logger.ERROR,
                 )
                 continue
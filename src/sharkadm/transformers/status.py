@@ -14,6 +14,8 @@ if sharkadm_config:
 
 
 class SetStatusDataHost(PolarsTransformer):
+    row_local = True
+
     @staticmethod
     def get_transformer_description() -> str:
         return "Sets status columns as checked by data host"
@@ -26,6 +28,8 @@ class SetStatusDataHost(PolarsTransformer):
 
 
 class SetStatusDeliverer(PolarsTransformer):
+    row_local = True
+
     @staticmethod
     def get_transformer_description() -> str:
         return "Sets status columns as checked by deliverer"
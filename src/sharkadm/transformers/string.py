@@ -7,6 +7,7 @@ from .base import PolarsTransformer
 
 
 class _PolarsToUppercase(PolarsTransformer):
+    row_local = True
     apply_on_columns: tuple = ()
 
     def __init__(self, apply_on_columns: tuple[str] | None = None) -> None:
@@ -5,6 +5,8 @@ from .base import PolarsTransformer
 
 
 class PolarsStripAllValues(PolarsTransformer):
+    row_local = True
+
     @staticmethod
     def get_transformer_description() -> str:
         return "Strips all values in data"
@@ -1,6 +1,7 @@
 import polars as pl
 
-from sharkadm.config import get_trophic_type_smhi_object, trophic_type_smhi
+from sharkadm import taxonomy_store
+from sharkadm.config import trophic_type_smhi
 from sharkadm.data import PolarsDataHolder
 from sharkadm.sharkadm_logger import adm_logger
 from sharkadm.transformers.base import PolarsTransformer
@@ -20,31 +21,53 @@ class PolarsSetTrophicTypeSMHI(PolarsTransformer):
         )
 
     def _transform(self, data_holder: PolarsDataHolder) -> None:
-        tt_object = get_trophic_type_smhi_object()
-        mapper = tt_object.get_mapper()
         if self.col_to_set not in data_holder.data.columns:
             self._add_empty_col_to_set(data_holder)
-        for (name, size, value), df in data_holder.data.group_by(
-            [self.source_col_name, self.source_col_size_class, self.col_to_set]
-        ):
-            key = trophic_type_smhi.NAME_AND_SIZE_SEPARATOR.join([name, size])
-            new_value = mapper.get(key)
-            if new_value == value:
-                continue
-            if new_value:
-                data_holder.data = data_holder.data.with_columns(
-                    pl.when(
-                        (pl.col(self.source_col_name) == name)
-                        & (pl.col(self.source_col_size_class) == size)
-                    )
-                    .then(pl.lit(new_value))
-                    .otherwise(pl.col(self.col_to_set))
-                    .alias(self.col_to_set)
-                )
-                self._log(
-                    f"Reported trophic type replaced. "
-                    f"Scientific name/size: {name}/{size} "
-                    f"Old: {value} "
-                    f"New {new_value} ({len(df)} places)",
-                    level=adm_logger.INFO,
-                )
+        new_value = (
+            taxonomy_store.get_store()
+            .replace(
+                pl.concat_str(
+                    [pl.col(self.source_col_name), pl.col(self.source_col_size_class)],
+                    separator=trophic_type_smhi.NAME_AND_SIZE_SEPARATOR,
+                ),
+                "trophic_type",
+            )
+            .alias("_new_trophic_type")
+        )
+        is_replaced = (pl.col("_new_trophic_type") != "") & (
+            pl.col("_new_trophic_type") != pl.col(self.col_to_set)
+        )
+        replaced = (
+            data_holder.data.select(
+                self.source_col_name,
+                self.source_col_size_class,
+                self.col_to_set,
+                new_value,
+            )
+            .filter(is_replaced)
+            .group_by(
+                self.source_col_name,
+                self.source_col_size_class,
+                self.col_to_set,
+                "_new_trophic_type",
+            )
+            .len()
+        )
+        for name, size, value, new_value_str, nr_rows in replaced.iter_rows():
+            self._log(
+                f"Reported trophic type replaced. "
+                f"Scientific name/size: {name}/{size} "
+                f"Old: {value} "
+                f"New {new_value_str} ({nr_rows} places)",
+                level=adm_logger.INFO,
+            )
+        data_holder.data = (
+            data_holder.data.with_columns(new_value)
+            .with_columns(
+                pl.when(is_replaced)
+                .then(pl.col("_new_trophic_type"))
+                .otherwise(pl.col(self.col_to_set))
+                .alias(self.col_to_set)
+            )
+            .drop("_new_trophic_type")
+        )
@@ -1,14 +1,14 @@
+from sharkadm import taxonomy_store
 from sharkadm.sharkadm_logger import adm_logger
 
 from ..data import PolarsDataHolder
 from .base import PolarsTransformer
 
+# Reference data is read through the taxonomy store and only loaded from
+# nodc_worms when a table has to be compiled
 nodc_worms = None
 try:
     import nodc_worms
-
-    taxa_worms = nodc_worms.get_taxa_worms_object()
-    translate_worms = nodc_worms.get_translate_worms_object()
 except ModuleNotFoundError as e:
     module_name = str(e).split("'")[-2]
     adm_logger.log_workflow(
@@ -42,24 +42,23 @@ class PolarsAddWormsScientificName(PolarsTransformer):
             )
             return
         self._add_empty_col_to_set(data_holder)
-        for (name,), df in data_holder.data.group_by(self.source_col):
-            try:
-                new_name = translate_worms.get(str(name))
-            except Exception as e:
-                self._log(
-                    f"Could not translate worms name {name}: {e}", level=adm_logger.ERROR
-                )
-                continue
+        store = taxonomy_store.get_store()
+        counts = data_holder.data.group_by(self.source_col).len()
+        translated = store.get_mapping("worms_translate", counts[self.source_col])
+        source = store.get_source_name("worms_translate")
+        new_names = dict()
+        for name, nr_rows in counts.iter_rows():
+            new_name = translated.get(str(name))
             if new_name:
                 self._log(
-                    f"Translated using {translate_worms.source}. "
+                    f"Translated using {source}. "
                     f"Reported name via dyntaxa: {name} "
-                    f"Translated to: {new_name} ({len(df)} rows)"
+                    f"Translated to: {new_name} ({nr_rows} rows)"
                 )
-                # self._log(f"Translate worms: {name} -> {new_name} ({len(df)} places)")
             else:
                 new_name = name
-            self._add_to_col_to_set(data_holder, name, new_name)
+            new_names[str(name)] = new_name
+        self._add_mapping_to_col_to_set(data_holder, new_names)
 
 
 class PolarsAddWormsAphiaId(PolarsTransformer):
@@ -89,21 +88,16 @@ class PolarsAddWormsAphiaId(PolarsTransformer):
             self._log(f"Adding column {self.col_to_set}", level=adm_logger.DEBUG)
             self._add_empty_col_to_set(data_holder)
 
-        for (source_name,), df in data_holder.data.group_by(self.source_col):
-            try:
-                aphia_id = taxa_worms.get_aphia_id(str(source_name))
-            except Exception as e:
-                self._log(
-                    f"Could not find aphia_id for species {source_name}: {e}",
-                    item=source_name,
-                    level=adm_logger.WARNING,
-                )
-                continue
-            if not aphia_id:
+        source_names = data_holder.data[self.source_col].unique()
+        aphia_ids = taxonomy_store.get_store().get_mapping("worms_aphia_id", source_names)
+        for source_name in source_names:
+            if not aphia_ids.get(str(source_name)):
                 self._log(
                     f"No aphia_id found for species {source_name}",
                     item=source_name,
                     level=adm_logger.WARNING,
                 )
-                continue
-            self._add_to_col_to_set(data_holder, source_name, aphia_id)
+        self._add_mapping_to_col_to_set(
+            data_holder,
+            {name: aphia_id for name, aphia_id in aphia_ids.items() if aphia_id},
+        )
@@ -19,6 +19,24 @@ def add_float_column(
     )
 
 
+def add_cached_float_column(
+    data_holder, column: str, column_name: str = "", suffix: str = "float"
+) -> pl.DataFrame:
+    """Like add_float_column but uses the float column cache in data_holder (see
+    PolarsDataHolder.float_col). Comma is accepted as decimal separator."""
+    new_column_name = column_name
+    if not new_column_name:
+        suffix = suffix.strip("_")
+        new_column_name = f"{column}_{suffix}"
+    if column not in data_holder.data.columns:
+        return data_holder.data.with_columns(
+            pl.lit(None).cast(float).alias(new_column_name)
+        )
+    return data_holder.data.with_columns(
+        data_holder.float_col(column, strict=True).alias(new_column_name)
+    )
+
+
 def add_int_column(
     data: pl.DataFrame, column: str, column_name: str = "", suffix: str = "int"
 ) -> pl.DataFrame:
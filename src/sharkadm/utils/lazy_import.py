@@ -0,0 +1,18 @@
+import importlib
+from typing import Any, Iterable
+
+
+def get_lazy_attribute(package: str, lazy_names: dict[str, str], name: str) -> Any:
+    """Imports and returns attribute name from the module given in lazy_names.
+    Module names are relative to package. Used in package level __getattr__."""
+    module_name = lazy_names.get(name)
+    if not module_name:
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+    module = importlib.import_module(f"{package}.{module_name}")
+    return getattr(module, name)
+
+
+def import_modules(package: str, module_names: Iterable[str]) -> None:
+    """Imports all given modules (relative to package)"""
+    for module_name in sorted(set(module_names)):
+        importlib.import_module(f"{package}.{module_name}")
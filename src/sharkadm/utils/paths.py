@@ -1,12 +1,17 @@
 import pathlib
 
 
-def get_next_incremented_file_path(path: pathlib.Path) -> pathlib.Path:
-    if not path.exists():
+def get_next_incremented_file_path(
+    path: pathlib.Path, reserved: set[pathlib.Path] | None = None
+) -> pathlib.Path:
+    """Returns path or, if taken, the first free incremented version of path.
+    Paths in reserved are treated as taken even if they are not yet written."""
+    reserved = reserved or set()
+    if not path.exists() and path not in reserved:
         return path
     i = 1
     new_path = _get_incremented_file_path(path, i)
-    while new_path.exists():
+    while new_path.exists() or new_path in reserved:
         i += 1
         new_path = _get_incremented_file_path(path, i)
     return new_path
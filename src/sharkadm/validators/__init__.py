@@ -1,114 +1,117 @@
-import functools
 import pathlib
 from typing import Type
 
-from sharkadm import utils
-from sharkadm.utils.inspect_kwargs import get_kwargs_for_class
-from sharkadm.validators.air_pressure import ValidateAirpres
-from sharkadm.validators.air_temperature import ValidateAirtemp
-from sharkadm.validators.aphia_id import (
-    ValidateAphiaIdVsBvolAphiaId,
-    ValidateReportedVsAphiaId,
-    ValidateReportedVsBvolAphiaId,
-)
+from sharkadm.operator_catalogue import operator_catalogue
+from sharkadm.utils.lazy_import import get_lazy_attribute, import_modules
 from sharkadm.validators.base import Validator
-from sharkadm.validators.bvol import ValidateBvolSizeClass
-from sharkadm.validators.calculate import (
-    ValidateCalculatedValueDiffersToMuchFromReportedValue,
-)
-from sharkadm.validators.cloud import ValidateCloud
-from sharkadm.validators.codes import (
-    ValidateLABOcodes,
-    ValidateProjectCodes,
-    ValidateSflag,
-)
-from sharkadm.validators.column_combination import (
-    AssertCombination,
-    AssertMinMaxDepthCombination,
-)
-from sharkadm.validators.columns import (
-    ValidateColumnViewColumnsNotInDataset,
-    ValidateUnmappedColumnsHasData,
-)
-from sharkadm.validators.common_values import ValidateCommonValuesByVisit
-from sharkadm.validators.date_and_time import MissingTime, ValidateDateAndTime
-from sharkadm.validators.depth import (
-    ValidateSampleDepth,
-    ValidateSecchiDepth,
-    ValidateWaterDepth,
-)
-from sharkadm.validators.duplicates import ValidateDuplicatedRows
-from sharkadm.validators.dyntaxa import ValidateScientificNameInDyntaxa
-from sharkadm.validators.ice import ValidateIceob
-from sharkadm.validators.mandatory import (
-    ValidateMandatoryColumns,
-    ValidateValuesInMandatoryNatColumns,
-    ValidateValuesInMandatoryRegColumns,
-)
-from sharkadm.validators.occurrence_id import ValidateOccurrenceId
-from sharkadm.validators.position import ValidateReportedPosition
-from sharkadm.validators.positive import ValidatePositiveValues
-from sharkadm.validators.scientific_name import (
-    ValidateAphiaIdDiffersFromBvolAphiaId,
-    ValidateScientificNameAndSizeClassDiffersFromBvol,
-    ValidateScientificNameIsPresent,
-    ValidateScientificNameIsTranslated,
-)
-from sharkadm.validators.serial_number import ValidateSerialNumber
-from sharkadm.validators.size_class import (
-    ValidateSizeClassIsPresent,
-    ValidateSizeClassRefListCode,
-)
-from sharkadm.validators.speed import ValidateSpeed
-from sharkadm.validators.station import (
-    ValidateCoordinatesDm,
-    ValidateNameInMaster,
-    ValidatePositionInOcean,
-    ValidatePositionWithinStationRadius,
-    ValidateStationIdentity,
-    ValidateSynonymsInMaster,
-)
-from sharkadm.validators.waves import ValidateWaves
-from sharkadm.validators.weather import ValidateWeath, ValidateWeatherConsistency
-from sharkadm.validators.wind import ValidateWindir, ValidateWinsp
-from sharkadm.validators.year import ValidateYearNrDigits
-
-
-@functools.cache
+
+# Validator classes are imported from their modules on first access
+_LAZY_NAMES = {
+    "AssertCombination": "column_combination",
+    "AssertMinMaxDepthCombination": "column_combination",
+    "MissingTime": "date_and_time",
+    "ValidateAirpres": "air_pressure",
+    "ValidateAirtemp": "air_temperature",
+    "ValidateAphiaIdDiffersFromBvolAphiaId": "scientific_name",
+    "ValidateAphiaIdVsBvolAphiaId": "aphia_id",
+    "ValidateBvolSizeClass": "bvol",
+    "ValidateCalculatedValueDiffersToMuchFromReportedValue": "calculate",
+    "ValidateCloud": "cloud",
+    "ValidateColumnViewColumnsNotInDataset": "columns",
+    "ValidateCommonValuesByVisit": "common_values",
+    "ValidateCoordinatesDm": "station.coordinates_dm",
+    "ValidateCoordinatesSweref99": "station.coordinates_sweref99",
+    "ValidateDateAndTime": "date_and_time",
+    "ValidateDuplicatedRows": "duplicates",
+    "ValidateIceob": "ice",
+    "ValidateLABOcodes": "codes",
+    "ValidateMandatoryColumns": "mandatory",
+    "ValidateNameInMaster": "station.name_in_master",
+    "ValidateOccurrenceId": "occurrence_id",
+    "ValidatePositionInOcean": "station.position_in_ocean",
+    "ValidatePositionWithinStationRadius": "station.position_within_station_radius",
+    "ValidatePositiveValues": "positive",
+    "ValidateProjectCodes": "codes",
+    "ValidateReportedPosition": "position",
+    "ValidateReportedVsAphiaId": "aphia_id",
+    "ValidateReportedVsBvolAphiaId": "aphia_id",
+    "ValidateSampleDepth": "depth",
+    "ValidateScientificNameAndSizeClassDiffersFromBvol": "scientific_name",
+    "ValidateScientificNameInDyntaxa": "dyntaxa",
+    "ValidateScientificNameIsPresent": "scientific_name",
+    "ValidateScientificNameIsTranslated": "scientific_name",
+    "ValidateSecchiDepth": "depth",
+    "ValidateSerialNumber": "serial_number",
+    "ValidateSflag": "codes",
+    "ValidateSizeClassIsPresent": "size_class",
+    "ValidateSizeClassRefListCode": "size_class",
+    "ValidateSpeed": "speed",
+    "ValidateStationIdentity": "station.station_identity",
+    "ValidateSynonymsInMaster": "station.synonym_in_master",
+    "ValidateUnmappedColumnsHasData": "columns",
+    "ValidateValuesInMandatoryNatColumns": "mandatory",
+    "ValidateValuesInMandatoryRegColumns": "mandatory",
+    "ValidateWaterDepth": "depth",
+    "ValidateWaves": "waves",
+    "ValidateWeath": "weather",
+    "ValidateWeatherConsistency": "weather",
+    "ValidateWindir": "wind",
+    "ValidateWinsp": "wind",
+    "ValidateYearNrDigits": "year",
+}
+
+
+def __getattr__(name: str):
+    return get_lazy_attribute(__name__, _LAZY_NAMES, name)
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + list(_LAZY_NAMES))
+
+
+def import_all_validators() -> None:
+    """Imports all validator modules"""
+    import_modules(__name__, _LAZY_NAMES.values())
+
+
+operator_catalogue.register_group("validators", Validator, import_all_validators)
+
+
 def get_validator_list() -> list[Type[Validator]]:
-    return sorted(utils.get_all_class_children_names(Validator))
+    return sorted(get_validators_info())
 
 
 def get_validators() -> dict[str, Type[Validator]]:
-    """Returns a dictionary with validators"""
-    return utils.get_all_class_children(Validator)
+    """Returns a dictionary with validators. Imports all validator modules"""
+    return operator_catalogue.get_classes("validators")
+
+
+def get_validator_class(name: str) -> Type[Validator] | None:
+    """Returns the validator class with the given name. Only the module of the
+    validator is imported"""
+    return operator_catalogue.get_class("validators", name)
 
 
 def get_validator_object(name: str, **kwargs) -> Validator:
     """Returns Validator object that matches the given validator name"""
-    all_validators = get_validators()
-    val = all_validators[name]
+    val = get_validator_class(name)
+    if not val:
+        raise KeyError(name)
     return val(**kwargs)
 
 
 def get_validators_description() -> dict[str, str]:
     """Returns a dictionary with validator name as key and the description as value"""
     result = dict()
-    for name, val in get_validators().items():
+    for name, info in get_validators_info().items():
         if name.startswith("_"):
             continue
-        result[name] = val.get_validator_description()
+        result[name] = info["description"]
     return result
 
 
 def get_validators_info() -> dict:
-    result = dict()
-    for name, val in get_validators().items():
-        result[name] = dict()
-        result[name]["name"] = name
-        result[name]["description"] = val.get_validator_description()
-        result[name]["kwargs"] = get_kwargs_for_class(val)
-    return result
+    return operator_catalogue.get_info("validators")
 
 
 def get_validators_description_text() -> str:
@@ -34,7 +34,7 @@ class ValidateAirpres(Validator):
             return
 
         unique_rows = (
-            data_holder.data.select(
+            data_holder.get_data(
                 ["visit_date", "reported_station_name", "air_pressure_hpa", "row_number"]
             )
             .group_by(["visit_date", "reported_station_name", "air_pressure_hpa"])
@@ -34,7 +34,7 @@ class ValidateAirtemp(Validator):
             return
 
         unique_rows = (
-            data_holder.data.select(
+            data_holder.get_data(
                 [
                     "visit_date",
                     "reported_station_name",
@@ -26,6 +26,12 @@ class DataHolderProtocol(Protocol):
     @abstractmethod
     def data_type(self) -> str: ...
 
+    @abstractmethod
+    def float_col(self, col: str, strict: bool = False) -> pl.Series: ...
+
+    @abstractmethod
+    def get_data(self, columns: list[str] | None = None) -> pl.DataFrame: ...
+
 
 class Validator(ABC, Operator):
     """Abstract base class used as a blueprint to validate/tidy/check data
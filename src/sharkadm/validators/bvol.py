@@ -1,5 +1,6 @@
 import polars as pl
 
+from sharkadm import taxonomy_store
 from sharkadm.sharkadm_logger import adm_logger
 
 from ..data import PolarsDataHolder
@@ -57,15 +58,15 @@ class ValidateBvolSizeClass(Validator):
         )
 
     def _map_and_validate(self, data_holder: PolarsDataHolder):
-        bvol_nomp = nodc_bvol.get_bvol_nomp_object()
-        _mapper = bvol_nomp.get_species_and_size_class_to_aphia_id_mapper()
         # TODO: One species might map to multiple aphia_ids. Check this!
         # Species = 1138
         # AphiaID = 1133
         # Kombination = 1136
         temp_col = "_temp"
         df = data_holder.data.with_columns(
-            pl.col(self.joined_col).replace_strict(_mapper, default="").alias(temp_col)
+            taxonomy_store.get_store()
+            .replace(pl.col(self.joined_col), "bvol_name_and_size_aphia_id", default="")
+            .alias(temp_col)
         ).filter(pl.col(temp_col) == "")
         for (name, size_class), dd in df.group_by(
             self.scientific_name_col, self.size_class_col
@@ -11,6 +11,8 @@ logger = logging.getLogger(__name__)
 
 
 class ValidateColumnViewColumnsNotInDataset(Validator):
+    supports_categorical = True
+
     def __init__(self):
         super().__init__()
         self._column_views = config.get_column_views_config()
@@ -30,6 +32,8 @@ class ValidateColumnViewColumnsNotInDataset(Validator):
 
 
 class ValidateUnmappedColumnsHasData(Validator):
+    supports_categorical = True
+
     @staticmethod
     def get_validator_description() -> str:
         return (
@@ -30,16 +30,17 @@ class ValidateWaterDepth(Validator):
             return
 
         unique_rows = (
-            data_holder.data.select(
+            data_holder.get_data(
                 ["visit_date", "reported_station_name", "water_depth_m", "row_number"]
             )
+            .with_columns(
+                data_holder.float_col("water_depth_m").alias("water_depth_float")
+            )
             .group_by(["visit_date", "reported_station_name", "water_depth_m"])
-            .agg(pl.col("row_number").alias("row_numbers"))
-        )
-        unique_rows = unique_rows.with_columns(
-            pl.col("water_depth_m")
-            .cast(pl.Float64, strict=False)
-            .alias("water_depth_float")
+            .agg(
+                pl.col("row_number").alias("row_numbers"),
+                pl.first("water_depth_float"),
+            )
         )
         unique_rows = unique_rows.with_columns(
             [
@@ -112,7 +113,7 @@ class ValidateSampleDepth(Validator):
             self._log_fail("Missing visit date or reported station name columns.")
             return
 
-        unique_rows = data_holder.data.select(
+        unique_rows = data_holder.get_data(
             [
                 "visit_date",
                 "reported_station_name",
@@ -1,8 +1,13 @@
+import polars as pl
+
 from ..data import PolarsDataHolder
+from ..dataset_diff import get_row_hashes
 from .base import Validator
 
 
 class ValidateDuplicatedRows(Validator):
+    supports_categorical = True
+
     log_columns = (
         "visit_date",
         "sample_time",
@@ -11,6 +16,7 @@ class ValidateDuplicatedRows(Validator):
         "parameter",
         "value",
     )
+    _row_hash_column = "_duplicates_row_hash"
 
     def __init__(
         self,
@@ -37,13 +43,35 @@ class ValidateDuplicatedRows(Validator):
             columns = [
                 col for col in data_holder.data.columns if col not in self.exclude_columns
             ]
+        log_cols = [col for col in data_holder.data.columns if col in self.log_columns]
+
+        data = data_holder.data
+        # Rows can only be duplicates if their hashes collide. Only colliding rows
+        # are compared on the actual values
+        candidates = (
+            data.with_columns(get_row_hashes(data, columns).alias(self._row_hash_column))
+            .filter(pl.col(self._row_hash_column).is_duplicated())
+            .select(
+                self._row_hash_column,
+                "row_number",
+                *[col for col in data.columns if col in columns or col in log_cols],
+            )
+        )
+        if candidates.is_empty():
+            return
 
-        data = data_holder.data.filter(data_holder.data[columns].is_duplicated())
-        log_cols = [col for col in self.log_columns if col in data.columns]
-        for vals, df in data.group_by(columns):
-            rows = df["row_number"].to_list()
-            rows_str = ", ".join(rows)
-            d = df.to_dicts()[0]
-            info = "; ".join([val for key, val in d.items() if key in log_cols])
+        group_columns = [self._row_hash_column, *columns]
+        duplicates = (
+            candidates.group_by(group_columns, maintain_order=True)
+            .agg(
+                pl.col("row_number"),
+                *[pl.col(col).first() for col in log_cols if col not in group_columns],
+            )
+            .filter(pl.col("row_number").list.len() > 1)
+        )
+        for row in duplicates.iter_rows(named=True):
+            rows = row["row_number"]
+            rows_str = ", ".join(str(nr) for nr in rows)
+            info = "; ".join(str(row[col]) for col in log_cols)
             msg = f"Duplicates in rows [{rows_str}]: {info}"
             self._log_fail(msg, row_numbers=rows)
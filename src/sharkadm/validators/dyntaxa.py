@@ -1,5 +1,6 @@
 import polars as pl
 
+from .. import taxonomy_store
 from ..data import PolarsDataHolder
 from ..sharkadm_logger import adm_logger
 from .base import Validator
@@ -45,11 +46,10 @@ class ValidateScientificNameInDyntaxa(Validator):
                 level=adm_logger.ERROR,
             )
             return
-        dyntaxa_taxon = nodc_dyntaxa.get_dyntaxa_taxon_object()
-        mapper = dict((name, name) for name in dyntaxa_taxon.get_name_list())
-
         df = data_holder.data.with_columns(
-            pl.col(self.col_to_check).replace_strict(mapper, default="").alias("mapped")
+            taxonomy_store.get_store()
+            .replace(pl.col(self.col_to_check), "dyntaxa_names", default="")
+            .alias("mapped")
         ).filter(pl.col("mapped") == "")
         for (name,), d in df.group_by(self.col_to_check):
             if not name:
@@ -31,7 +31,7 @@ class ValidateIceob(Validator):
             str(i) for i in range(10) if i not in (2, 3)
         ]  # 2, 3 refers to icebergs
         unique_rows = (
-            data_holder.data.select(
+            data_holder.get_data(
                 [
                     "visit_date",
                     "reported_station_name",
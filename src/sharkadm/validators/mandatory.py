@@ -25,6 +25,8 @@ class DataHolderProtocol(Protocol):
 
 
 class ValidateMandatoryColumns(Validator):
+    supports_categorical = True
+
     @staticmethod
     def get_validator_description() -> str:
         return "Checks if mandatory columns listed in sharkadm config have values."
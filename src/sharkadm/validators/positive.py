@@ -3,7 +3,9 @@ from sharkadm.validators.base import DataHolderProtocol, Validator
 
 
 class ValidatePositiveValues(Validator):
+    row_local = True
     _display_name = "Positive values"
+    supports_categorical = True
 
     def __init__(self, columns_to_validate: tuple[str] | None = None) -> None:
         super().__init__()
@@ -1,9 +1,17 @@
-from sharkadm.validators.station.coordinates_dm import ValidateCoordinatesDm
-from sharkadm.validators.station.coordinates_sweref99 import ValidateCoordinatesSweref99
-from sharkadm.validators.station.name_in_master import ValidateNameInMaster
-from sharkadm.validators.station.position_in_ocean import ValidatePositionInOcean
-from sharkadm.validators.station.position_within_station_radius import (
-    ValidatePositionWithinStationRadius,
-)
-from sharkadm.validators.station.station_identity import ValidateStationIdentity
-from sharkadm.validators.station.synonym_in_master import ValidateSynonymsInMaster
+from sharkadm.utils.lazy_import import get_lazy_attribute
+
+# Station validators depend on geopandas and nodc_station. They are imported from
+# their modules on first access.
+_LAZY_NAMES = {
+    "ValidateCoordinatesDm": "coordinates_dm",
+    "ValidateCoordinatesSweref99": "coordinates_sweref99",
+    "ValidateNameInMaster": "name_in_master",
+    "ValidatePositionInOcean": "position_in_ocean",
+    "ValidatePositionWithinStationRadius": "position_within_station_radius",
+    "ValidateStationIdentity": "station_identity",
+    "ValidateSynonymsInMaster": "synonym_in_master",
+}
+
+
+def __getattr__(name: str):
+    return get_lazy_attribute(__name__, _LAZY_NAMES, name)
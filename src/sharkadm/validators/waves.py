@@ -29,7 +29,7 @@ class ValidateWaves(Validator):
 
         valid_values = [str(i) for i in range(0, 10)]
         unique_rows = (
-            data_holder.data.select(
+            data_holder.get_data(
                 [
                     "visit_date",
                     "reported_station_name",
@@ -30,7 +30,7 @@ class ValidateWeath(Validator):
         valid_values = [str(i) for i in range(0, 10)]
 
         unique_rows = (
-            data_holder.data.select(
+            data_holder.get_data(
                 [
                     "visit_date",
                     "reported_station_name",
@@ -110,7 +110,7 @@ class ValidateWeatherConsistency(Validator):
             return
 
         unique_rows = (
-            data_holder.data.select(
+            data_holder.get_data(
                 [
                     "visit_date",
                     "reported_station_name",
@@ -35,7 +35,7 @@ class ValidateWindir(Validator):
             + ["99"]
         )
         unique_rows = (
-            data_holder.data.select(
+            data_holder.get_data(
                 [
                     "visit_date",
                     "reported_station_name",
@@ -112,7 +112,7 @@ class ValidateWinsp(Validator):
             return
 
         unique_rows = (
-            data_holder.data.select(
+            data_holder.get_data(
                 [
                     "visit_date",
                     "reported_station_name",
@@ -4,6 +4,7 @@ from .base import DataHolderProtocol, Validator
 
 
 class ValidateYearNrDigits(Validator):
+    row_local = True
     _display_name = "Formatting of years"
 
     @staticmethod
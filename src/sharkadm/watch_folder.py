@@ -0,0 +1,495 @@
+"""Watch folder ingestion.
+
+InboxWatcher looks for deliveries (archive directories, SHARK zip packages, LIMS
+exports and DV templates) in inbox directories. A delivery is added to the
+JobQueue when it has been unchanged (size and modification time) between two
+scans, so files that are still being copied are not picked up. Deliveries are
+identified by a hash of their content. A delivery with the same content as an
+existing job (that has not failed) is not added again.
+
+The JobQueue is stored in sqlite and survives restarts. Jobs have a state
+(pending, running, done or failed), a priority and a number of attempts. A failed
+job is retried after a delay until max_attempts is reached.
+
+JobProcessor takes jobs from the queue and runs the DV workflow for the data
+type of the delivery (see workflow.get_dv_workflow_for_data_type) in a pool of
+worker processes. New jobs are only taken from the queue when a worker is free
+(back-pressure). Jobs left as running by a stopped processor are set to pending
+when a new processor starts. If a worker process dies, the jobs that were running
+are failed (and retried while attempts are left) and the worker pool is replaced.
+"""
+
+import contextlib
+import hashlib
+import multiprocessing
+import pathlib
+import sqlite3
+import tempfile
+import time
+import zipfile
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from sharkadm import resource_governor, taxonomy_store
+from sharkadm.data.archive import directory_is_archive
+from sharkadm.data.lims import is_lims_directory
+from sharkadm.data.zip_archive import path_is_zip_archive
+from sharkadm.sharkadm_logger import adm_logger
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+LIMS_DATA_TYPE = "PhysicalChemical"
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def get_delivery_path(path: str | pathlib.Path) -> pathlib.Path | None:
+    """Returns the path to process if path is a delivery. Else returns None"""
+    path = pathlib.Path(path)
+    if path.name.startswith(("~", ".")):
+        return None
+    if path.is_file():
+        if path.suffix == ".xlsx":
+            return path
+        if path_is_zip_archive(path):
+            return path
+        return None
+    if lims_directory := is_lims_directory(path):
+        return lims_directory
+    if archive_directory := directory_is_archive(path):
+        return archive_directory
+    return None
+
+
+def _iter_files(path: pathlib.Path) -> Iterator[pathlib.Path]:
+    if path.is_file():
+        yield path
+        return
+    yield from sorted(p for p in path.rglob("*") if p.is_file())
+
+
+def get_signature(path: str | pathlib.Path) -> tuple[int, float]:
+    """Returns total size and latest modification time of the files in path"""
+    size = 0
+    mtime = 0.0
+    for file_path in _iter_files(pathlib.Path(path)):
+        stat = file_path.stat()
+        size += stat.st_size
+        mtime = max(mtime, stat.st_mtime)
+    return size, mtime
+
+
+def get_content_hash(path: str | pathlib.Path) -> str:
+    """Returns a sha256 hash of the content (and relative file names) in path"""
+    path = pathlib.Path(path)
+    sha = hashlib.sha256()
+    for file_path in _iter_files(path):
+        if path.is_dir():
+            sha.update(file_path.relative_to(path).as_posix().encode("utf-8"))
+        with open(file_path, "rb") as fid:
+            while chunk := fid.read(_HASH_CHUNK_SIZE):
+                sha.update(chunk)
+    return sha.hexdigest()
+
+
+def get_data_type(path: str | pathlib.Path) -> str:
+    """Returns the data type given in the delivery note of the delivery"""
+    from sharkadm.data.archive.delivery_note import DeliveryNote
+
+    path = pathlib.Path(path)
+    if path.suffix == ".xlsx":
+        return DeliveryNote.from_dv_template(path).data_type
+    if is_lims_directory(path):
+        return LIMS_DATA_TYPE
+    if path.suffix == ".zip":
+        with zipfile.ZipFile(path) as zf:
+            name = next(
+                (n for n in zf.namelist() if n.endswith("delivery_note.txt")), None
+            )
+            if not name:
+                raise FileNotFoundError(f"No delivery_note.txt in {path}")
+            with tempfile.TemporaryDirectory() as directory:
+                note_path = pathlib.Path(zf.extract(name, directory))
+                return DeliveryNote.from_txt_file(note_path).data_type
+    for note_path in path.rglob("delivery_note.txt"):
+        return DeliveryNote.from_txt_file(note_path).data_type
+    raise FileNotFoundError(f"No delivery_note.txt in {path}")
+
+
+class JobQueue:
+    """Persistent job queue stored in a sqlite database"""
+
+    def __init__(
+        self,
+        db_path: str | pathlib.Path,
+        max_attempts: int = 3,
+        retry_delay: float = 60.0,
+    ):
+        self._db_path = pathlib.Path(db_path)
+        self._max_attempts = max_attempts
+        self._retry_delay = retry_delay
+        self._create_database()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}: {self._db_path}"
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        connection = sqlite3.connect(self._db_path, timeout=30)
+        connection.row_factory = sqlite3.Row
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def _create_database(self) -> None:
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    path TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    workflow TEXT,
+                    state TEXT NOT NULL,
+                    priority INTEGER NOT NULL DEFAULT 0,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    error TEXT NOT NULL DEFAULT '',
+                    created REAL NOT NULL,
+                    updated REAL NOT NULL,
+                    next_attempt REAL NOT NULL
+                );
+                """
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS jobs_content_hash ON jobs (content_hash);"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS jobs_state ON jobs (state, priority);"
+            )
+
+    def add(
+        self,
+        path: str | pathlib.Path,
+        priority: int = 0,
+        workflow: str | None = None,
+        content_hash: str | None = None,
+    ) -> int | None:
+        """Adds a job for path. Returns the job id. Returns None if a job with the
+        same content already exists and has not failed"""
+        content_hash = content_hash or get_content_hash(path)
+        now = time.time()
+        with self._connect() as connection:
+            existing = connection.execute(
+                "SELECT id FROM jobs WHERE content_hash = ? AND state != ?;",
+                (content_hash, FAILED),
+            ).fetchone()
+            if existing:
+                return None
+            cursor = connection.execute(
+                """
+                INSERT INTO jobs (path, content_hash, workflow, state, priority,
+                                  created, updated, next_attempt)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?);
+                """,
+                (str(path), content_hash, workflow, PENDING, priority, now, now, now),
+            )
+            return cursor.lastrowid
+
+    def claim_next(self) -> dict | None:
+        """Sets the pending job with the highest priority (oldest first) that is due
+        to running and returns it. Returns None if no job is due"""
+        now = time.time()
+        with self._connect() as connection:
+            # Write lock so that two processors can not claim the same job
+            connection.execute("BEGIN IMMEDIATE;")
+            row = connection.execute(
+                """
+                SELECT * FROM jobs WHERE state = ? AND next_attempt <= ?
+                ORDER BY priority DESC, created, id LIMIT 1;
+                """,
+                (PENDING, now),
+            ).fetchone()
+            if not row:
+                return None
+            connection.execute(
+                "UPDATE jobs SET state = ?, attempts = attempts + 1, updated = ? "
+                "WHERE id = ?;",
+                (RUNNING, now, row["id"]),
+            )
+        return self.get_job(row["id"])
+
+    def set_done(self, job_id: int) -> None:
+        self._update(job_id, state=DONE, error="")
+
+    def set_failed(self, job_id: int, error: str) -> str:
+        """Sets the job to pending (for a retry after a delay) if attempts are left.
+        Else the job is set to failed. Returns the new state"""
+        job = self.get_job(job_id)
+        if job["attempts"] >= self._max_attempts:
+            self._update(job_id, state=FAILED, error=error)
+            return FAILED
+        delay = self._retry_delay * 2 ** (job["attempts"] - 1)
+        self._update(job_id, state=PENDING, error=error, next_attempt=time.time() + delay)
+        return PENDING
+
+    def release(self, job_id: int) -> None:
+        """Sets a claimed job that was never started back to pending"""
+        with self._connect() as connection:
+            connection.execute(
+                "UPDATE jobs SET state = ?, attempts = attempts - 1, updated = ? "
+                "WHERE id = ?;",
+                (PENDING, time.time(), job_id),
+            )
+
+    def reset_running(self) -> int:
+        """Sets running jobs to pending. Returns the number of jobs that were reset"""
+        with self._connect() as connection:
+            cursor = connection.execute(
+                "UPDATE jobs SET state = ?, updated = ? WHERE state = ?;",
+                (PENDING, time.time(), RUNNING),
+            )
+            return cursor.rowcount
+
+    def _update(self, job_id: int, **kwargs) -> None:
+        kwargs["updated"] = time.time()
+        columns = ", ".join(f"{key} = ?" for key in kwargs)
+        with self._connect() as connection:
+            connection.execute(
+                f"UPDATE jobs SET {columns} WHERE id = ?;", (*kwargs.values(), job_id)
+            )
+
+    def get_job(self, job_id: int) -> dict | None:
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT * FROM jobs WHERE id = ?;", (job_id,)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def get_jobs(self, state: str | None = None) -> list[dict]:
+        query = "SELECT * FROM jobs"
+        args = ()
+        if state:
+            query += " WHERE state = ?"
+            args = (state,)
+        with self._connect() as connection:
+            rows = connection.execute(f"{query} ORDER BY id;", args).fetchall()
+        return [dict(row) for row in rows]
+
+    def get_nr_jobs(self, state: str) -> int:
+        with self._connect() as connection:
+            return connection.execute(
+                "SELECT COUNT(*) FROM jobs WHERE state = ?;", (state,)
+            ).fetchone()[0]
+
+
+class InboxWatcher:
+    """Polls inbox directories and adds deliveries to a job queue"""
+
+    def __init__(
+        self,
+        job_queue: JobQueue,
+        inboxes: dict[str | pathlib.Path, int] | list[str | pathlib.Path],
+    ):
+        """inboxes is a list of directories or a dict with directories and the
+        priority of the jobs from each directory"""
+        if not isinstance(inboxes, dict):
+            inboxes = {inbox: 0 for inbox in inboxes}
+        self._job_queue = job_queue
+        self._inboxes = {pathlib.Path(path): prio for path, prio in inboxes.items()}
+        # Signature of each delivery at the previous scan
+        self._signatures: dict[pathlib.Path, tuple[int, float]] = {}
+        # Signature of each delivery when it was last added to the queue
+        self._submitted: dict[pathlib.Path, tuple[int, float]] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}: {', '.join(map(str, self._inboxes))}"
+
+    def iter_deliveries(self) -> Iterator[tuple[pathlib.Path, int]]:
+        for inbox, priority in self._inboxes.items():
+            if not inbox.is_dir():
+                adm_logger.log_workflow(
+                    f"Inbox directory does not exist: {inbox}", level=adm_logger.WARNING
+                )
+                continue
+            for path in sorted(inbox.iterdir()):
+                delivery_path = get_delivery_path(path)
+                if delivery_path:
+                    yield delivery_path, priority
+
+    def scan(self) -> list[int]:
+        """Adds new or changed deliveries that are stable since the last scan.
+        Returns the ids of the added jobs"""
+        job_ids = []
+        signatures = {}
+        for path, priority in self.iter_deliveries():
+            signature = get_signature(path)
+            signatures[path] = signature
+            if self._signatures.get(path) != signature:
+                # New or still being written. Checked again next scan
+                continue
+            if self._submitted.get(path) == signature:
+                continue
+            self._submitted[path] = signature
+            job_id = self._job_queue.add(path, priority=priority)
+            if job_id is None:
+                adm_logger.log_workflow(
+                    f"Delivery already in queue (same content): {path}",
+                    level=adm_logger.DEBUG,
+                )
+                continue
+            adm_logger.log_workflow(f"Delivery added to queue: {path}")
+            job_ids.append(job_id)
+        self._signatures = signatures
+        return job_ids
+
+
+def run_job(path: str, workflow: str | None = None) -> dict:
+    """Runs the workflow for the delivery in path. If no workflow (name or yaml
+    file) is given the DV workflow for the data type of the delivery is used"""
+    from sharkadm import workflow as sharkadm_workflow
+
+    adm_logger.reset_log()
+    governor = resource_governor.get_governor()
+    governor.reset()
+    if workflow and pathlib.Path(workflow).suffix in (".yaml", ".yml"):
+        wflow = sharkadm_workflow.SHARKadmWorkflow.from_yaml_config(workflow)
+    elif workflow:
+        wflow = sharkadm_workflow.get_workflow(workflow)
+    else:
+        wflow = sharkadm_workflow.get_dv_workflow_for_data_type(get_data_type(path))
+    wflow.set_data_sources(path)
+    info = wflow.start_workflow()
+    if info:
+        raise RuntimeError(f"Workflow terminated: {info.msg}")
+    return dict(export_paths=wflow.export_paths, resources=governor.get_report())
+
+
+class JobProcessor:
+    """Runs jobs from a job queue in worker processes"""
+
+    def __init__(
+        self,
+        job_queue: JobQueue,
+        watcher: InboxWatcher | None = None,
+        nr_workers: int = 2,
+        poll_interval: float = 10.0,
+        memory_budget_mb: float | None = None,
+    ):
+        """The cores are shared between the nr_workers worker processes.
+        memory_budget_mb is the (soft) memory budget of each worker"""
+        self._job_queue = job_queue
+        self._watcher = watcher
+        self._nr_workers = nr_workers
+        self._poll_interval = poll_interval
+        self._memory_budget_mb = memory_budget_mb
+        self._running: dict[Future, int] = {}
+        self._executor: ProcessPoolExecutor | None = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}: {self._job_queue}"
+
+    @property
+    def nr_running(self) -> int:
+        return len(self._running)
+
+    def start(self) -> None:
+        nr_reset = self._job_queue.reset_running()
+        if nr_reset:
+            adm_logger.log_workflow(f"{nr_reset} interrupted jobs set to pending")
+        # Taxonomy tables are compiled once here and then shared by the workers
+        taxonomy_store.get_store().preload()
+        self._executor = self._create_executor()
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        # Spawned workers so that thread pools are sized in each worker
+        nr_threads = resource_governor.get_threads_per_worker(self._nr_workers)
+        with resource_governor.worker_thread_environment(nr_threads):
+            executor = ProcessPoolExecutor(
+                max_workers=self._nr_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=resource_governor.initiate_worker,
+                initargs=(nr_threads, self._memory_budget_mb),
+            )
+            resource_governor.start_workers(executor, self._nr_workers)
+        return executor
+
+    def _replace_broken_executor(self) -> None:
+        adm_logger.log_workflow(
+            "Worker pool is broken. Starting new workers", level=adm_logger.WARNING
+        )
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = self._create_executor()
+
+    def stop(self, wait: bool = True) -> None:
+        if not self._executor:
+            return
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+        self._collect_finished(wait=wait)
+        self._executor = None
+
+    def run_once(self) -> None:
+        """Scans the inboxes, collects finished jobs and starts new jobs while
+        there are free workers"""
+        if self._watcher:
+            self._watcher.scan()
+        if self._collect_finished():
+            self._replace_broken_executor()
+        while self.nr_running < self._nr_workers:
+            job = self._job_queue.claim_next()
+            if not job:
+                break
+            adm_logger.log_workflow(f"Starting job {job['id']}: {job['path']}")
+            try:
+                future = self._executor.submit(run_job, job["path"], job["workflow"])
+            except BrokenProcessPool:
+                # Never started. Running jobs are failed on next collect
+                self._job_queue.release(job["id"])
+                self._collect_finished(wait=True)
+                self._replace_broken_executor()
+                continue
+            self._running[future] = job["id"]
+
+    def run_forever(self) -> None:
+        self.start()
+        try:
+            while True:
+                self.run_once()
+                time.sleep(self._poll_interval)
+        finally:
+            self.stop()
+
+    def _collect_finished(self, wait: bool = False) -> bool:
+        """Sets the state of finished jobs. Returns True if a job failed because the
+        worker pool is broken"""
+        broken = False
+        for future in list(self._running):
+            if not (wait or future.done()):
+                continue
+            job_id = self._running.pop(future)
+            if future.cancelled():
+                # Not started. Taken again by the next processor
+                self._job_queue.release(job_id)
+                continue
+            try:
+                future.result()
+            except Exception as e:
+                broken = broken or isinstance(e, BrokenProcessPool)
+                state = self._job_queue.set_failed(job_id, f"{e.__class__.__name__}: {e}")
+                adm_logger.log_workflow(
+                    f"Job {job_id} failed ({state}): {e}", level=adm_logger.WARNING
+                )
+                continue
+            self._job_queue.set_done(job_id)
+            resources = future.result()["resources"]
+            adm_logger.log_workflow(
+                f"Job {job_id} done in {resources['seconds']:.1f} s. "
+                f"Max memory: {resources['max_rss_mb'] or 0:.0f} MB"
+            )
+        return broken
@@ -1,3 +1,4 @@
+import functools
 import pathlib
 from typing import Any
 
@@ -7,6 +8,7 @@ from sharkadm import (
     data_filter,
     exporters,
     multi_transformers,
+    resource_governor,
     sharkadm_exceptions,
     transformers,
     utils,
@@ -15,19 +17,36 @@ from sharkadm import (
 from sharkadm.config import sharkadm_config
 from sharkadm.config.data_type import DataType, data_type_handler
 from sharkadm.controller import SHARKadmPolarsController, get_polars_controller_with_data
+from sharkadm.data.data_source.streaming import get_streaming_kwargs
 from sharkadm.exporters import PolarsExporter
 from sharkadm.exporters.base import PolarsFileExporter
+from sharkadm.incremental import IncrementalSnapshot
 from sharkadm.sharkadm_logger import adm_logger, get_exporter
 from sharkadm.sharkadm_operator import Operator, OperatorInfo
 from sharkadm.transformers import PolarsTransformer
 from sharkadm.validators import Validator
 
-# VALIDATOR_DESCRIPTIONS = validators.get_validators_description()
-# TRANSFORMER_DESCRIPTIONS = transformers.get_transformers_description()
-OPERATOR_DESCRIPTIONS = validators.get_validators_description()
-OPERATOR_DESCRIPTIONS.update(transformers.get_transformers_description())
-# OPERATOR_DESCRIPTIONS.update(exporters.get_exporters_description())
-EXPORTER_DESCRIPTIONS = exporters.get_exporters_description()
+
+@functools.cache
+def get_operator_descriptions() -> dict[str, str]:
+    descriptions = validators.get_validators_description()
+    descriptions.update(transformers.get_transformers_description())
+    # descriptions.update(exporters.get_exporters_description())
+    return descriptions
+
+
+@functools.cache
+def get_exporter_descriptions() -> dict[str, str]:
+    return exporters.get_exporters_description()
+
+
+def __getattr__(name: str):
+    # OPERATOR_DESCRIPTIONS and EXPORTER_DESCRIPTIONS are created on first access
+    if name == "OPERATOR_DESCRIPTIONS":
+        return get_operator_descriptions()
+    if name == "EXPORTER_DESCRIPTIONS":
+        return get_exporter_descriptions()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class _Operators(list):
@@ -114,6 +133,10 @@ class SHARKadmWorkflow:
     def initiate_workflow(self) -> None:
         if self._adm_logger_config.get("reset_before_workflow"):
             adm_logger.reset_log()
+        for log_type, level in self._adm_logger_config.get("capture_levels", {}).items():
+            adm_logger.set_capture_level(level, log_type)
+        if "aggregate" in self._adm_logger_config:
+            adm_logger.set_aggregation(self._adm_logger_config["aggregate"])
         adm_logger.log_workflow("Initiating workflow")
 
         self._all_validator_objects: list[Validator] = _Operators()
@@ -216,11 +239,40 @@ class SHARKadmWorkflow:
 
     def start_workflow(self) -> OperatorInfo | None:
         """Sets upp the workflow in the controller and starts it"""
+        load_kwargs = dict()
+        if self._workflow_config.get("data_filter"):
+            # Data filter and columns are pushed down to the loaders when possible
+            load_kwargs["data_filter"] = self._get_data_filter(
+                dict(self._workflow_config["data_filter"])
+            )
+        if self._workflow_config.get("columns"):
+            load_kwargs["columns"] = self._workflow_config["columns"]
+        # Memory bounded reading of large files
+        load_kwargs.update(get_streaming_kwargs(self._workflow_config))
         for data_source in self._data_sources:
             if self._adm_logger_config.get("reset_between_data_sources"):
                 adm_logger.reset_log()
-            self._controller = get_polars_controller_with_data(data_source)
-            info = self._controller.run_operators(*self._operator_objects)
+            # Streaming settings in the workflow config have precedence
+            source_load_kwargs = {
+                **resource_governor.get_governor().get_load_kwargs(data_source),
+                **load_kwargs,
+            }
+            self._controller = get_polars_controller_with_data(
+                data_source,
+                categorical_storage=self._workflow_config.get(
+                    "categorical_storage", False
+                ),
+                categorical_columns=self._workflow_config.get("categorical_columns"),
+                # Row local transformers are run in chunks if chunk_rows is given
+                chunk_rows=self._workflow_config.get("chunk_rows"),
+                spill_to_disk=self._workflow_config.get("spill_to_disk", False),
+                **source_load_kwargs,
+            )
+            snapshot = self._get_incremental_snapshot()
+            if snapshot:
+                info = snapshot.run_operators(self._controller, *self._operator_objects)
+            else:
+                info = self._controller.run_operators(*self._operator_objects)
             print(f"{info=}")
             if info.terminated:
                 return info[-1]
@@ -229,6 +281,14 @@ class SHARKadmWorkflow:
             self._do_adm_logger_stuff()
         self.save_config()
 
+    def _get_incremental_snapshot(self) -> IncrementalSnapshot | None:
+        """Returns snapshot for the current dataset if incremental_directory is
+        given in the workflow config"""
+        directory = self._workflow_config.get("incremental_directory")
+        if not directory:
+            return None
+        return IncrementalSnapshot(directory, self._controller.data_holder.dataset_name)
+
     def _do_adm_logger_stuff(self) -> None:
         # Other options for log here later?
         for adm_logger_config in self._adm_logger_config.get("exporters", []):
@@ -296,13 +356,13 @@ class SHARKadmWorkflow:
 
     def get_operator_descriptions(self) -> dict[str, str]:
         return {
-            oper["name"]: OPERATOR_DESCRIPTIONS[oper["name"]]
+            oper["name"]: get_operator_descriptions()[oper["name"]]
             for oper in self._operators_info
         }
 
     def get_exporter_descriptions(self) -> dict[str, str]:
         return {
-            exp["name"]: EXPORTER_DESCRIPTIONS[exp["name"]]
+            exp["name"]: get_exporter_descriptions()[exp["name"]]
             for exp in self._exporters_info
         }
 
@@ -0,0 +1,85 @@
+from sharkadm.config.column_views import ColumnViews
+from sharkadm.config.registry import ConfigRegistry
+
+
+def _write_column_views(path, columns: str = "visit_year\tstation_name"):
+    path.write_text(f"sharkweb_all\tsharkdata_other\n{columns}\n")
+    return path
+
+
+def test_registry_parses_each_config_once(tmp_path):
+    # Given a registry and a config file
+    given_path = _write_column_views(tmp_path / "column_views.txt")
+    registry = ConfigRegistry()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return ColumnViews(given_path)
+
+    # When getting the same object twice
+    first = registry.get(("column_views", str(given_path)), loader, given_path)
+    second = registry.get(("column_views", str(given_path)), loader, given_path)
+
+    # Then the file is only parsed once
+    assert first is second
+    assert len(calls) == 1
+
+
+def test_snapshot_is_loaded_in_new_registry(tmp_path):
+    # Given a saved snapshot
+    given_path = _write_column_views(tmp_path / "column_views.txt")
+    key = ("column_views", str(given_path))
+    registry = ConfigRegistry()
+    registry.get(key, lambda: ColumnViews(given_path), given_path)
+    snapshot_path = registry.save_snapshot(tmp_path / "snapshot.pickle")
+
+    # When loading the snapshot in a new registry
+    new_registry = ConfigRegistry()
+    all_valid = new_registry.load_snapshot(snapshot_path)
+
+    # Then the object is available without calling the loader
+    assert all_valid
+    obj = new_registry.get(key, lambda: None, given_path)
+    assert obj.get_columns_for_view("all") == ["visit_year"]
+
+
+def test_snapshot_entries_with_changed_source_files_are_ignored(tmp_path):
+    # Given a saved snapshot
+    given_path = _write_column_views(tmp_path / "column_views.txt")
+    key = ("column_views", str(given_path))
+    registry = ConfigRegistry()
+    registry.get(key, lambda: ColumnViews(given_path), given_path)
+    snapshot_path = registry.save_snapshot(tmp_path / "snapshot.pickle")
+
+    # When the source file is changed after the snapshot was saved
+    _write_column_views(given_path, columns="sample_date\tstation_name")
+    new_registry = ConfigRegistry()
+    all_valid = new_registry.load_snapshot(snapshot_path)
+
+    # Then the stale entry is not used
+    assert not all_valid
+    assert key not in new_registry
+    obj = new_registry.get(key, lambda: ColumnViews(given_path), given_path)
+    assert obj.get_columns_for_view("all") == ["sample_date"]
+
+
+def test_invalidate_clears_objects_with_changed_source_files(tmp_path):
+    # Given a registry with objects parsed from two config files
+    registry = ConfigRegistry()
+    paths = {name: _write_column_views(tmp_path / f"{name}.txt") for name in ("a", "b")}
+    for name, path in paths.items():
+        registry.get((name,), lambda path=path: ColumnViews(path), path)
+
+    # When one of the files is edited and the registry is invalidated
+    _write_column_views(paths["a"], columns="sample_date\tstation_name")
+    registry.invalidate()
+
+    # Then only the object from the edited file is parsed again on next use
+    assert registry.keys == [("b",)]
+    obj = registry.get(("a",), lambda: ColumnViews(paths["a"]), paths["a"])
+    assert obj.get_columns_for_view("all") == ["sample_date"]
+
+    # And a single object can be cleared
+    registry.invalidate(("b",))
+    assert registry.keys == [("a",)]
@@ -1,7 +1,14 @@
+import gc
+import shutil
+from unittest import mock
+
 import polars as pl
 import pytest
 
+from sharkadm.config.data_type import DataType
+from sharkadm.data.data_source import streaming
 from sharkadm.data.data_source.txt_file import CsvRowFormatPolarsDataFile
+from sharkadm.data_filter import PolarsDataFilterParameter, PolarsDataFilterYears
 from tests.data.data_source.conftest import csv_file_from_dict
 
 
@@ -142,3 +149,172 @@ def test_original_column_names_are_stored(tmp_path, given_columns):
 
     # But the original columns can still be retrieved
     assert set(data_file._original_header) == expected_columns
+
+
+def test_data_filter_and_columns_are_applied_when_reading(tmp_path):
+    # Given a csv file with several years
+    given_csv_data = [
+        {"visit_year": "2020", "parameter": "TEMP", "value": 1.23},
+        {"visit_year": "2021", "parameter": "TEMP", "value": 2.48},
+        {"visit_year": "2021", "parameter": "SALT", "value": 3.14},
+    ]
+    given_data_path = tmp_path / "data.txt"
+    csv_file_from_dict(given_csv_data, given_data_path)
+
+    # When loading the file with a data filter and columns
+    data_file = CsvRowFormatPolarsDataFile(
+        given_data_path,
+        data_filter=PolarsDataFilterYears(2021) & PolarsDataFilterParameter("TEMP"),
+        columns=["value"],
+    )
+
+    # Then only matching rows and the given columns are read
+    data = data_file.get_data()
+    assert data_file.data_filter_applied
+    assert set(data.columns) == {"value", "source"}
+    assert data["value"].to_list() == ["2.48"]
+
+
+def test_data_filter_with_internal_names_is_applied_after_mapping(tmp_path):
+    # Given a csv file with external column names
+    given_csv_data = [
+        {"YEAR": "2020", "value": 1.23},
+        {"YEAR": "2021", "value": 2.48},
+    ]
+    given_data_path = tmp_path / "data.txt"
+    csv_file_from_dict(given_csv_data, given_data_path)
+    mapper = mock.Mock()
+    mapper.get_internal_name.side_effect = lambda name: {"YEAR": "visit_year"}.get(
+        name, name
+    )
+
+    # When loading the file with a data filter using internal names and the mapper
+    data_file = CsvRowFormatPolarsDataFile(
+        given_data_path, data_filter=PolarsDataFilterYears(2021), header_mapper=mapper
+    )
+
+    # Then the filter is pushed down to the scan
+    assert data_file.data_filter_applied
+    assert data_file.get_data()["YEAR"].to_list() == ["2021"]
+
+    # When loading the file without the mapper
+    data_file = CsvRowFormatPolarsDataFile(
+        given_data_path, data_filter=PolarsDataFilterYears(2021)
+    )
+
+    # Then the filter is applied when the header is mapped
+    assert not data_file.data_filter_applied
+    data_file.map_header(mapper)
+    assert data_file.data_filter_applied
+    assert data_file.get_data()["visit_year"].to_list() == ["2021"]
+
+
+@pytest.mark.parametrize("given_encoding", ("cp1252", "utf-8"))
+def test_streaming_gives_same_data_as_reading_all_at_once(tmp_path, given_encoding):
+    # Given a csv file with non ascii characters
+    given_data_path = tmp_path / "data.txt"
+    lines = ["id\tstation\tvalue"] + [f"{i}\tÅsköar\t{i / 10}" for i in range(5000)]
+    given_data_path.write_text("\n".join(lines) + "\n", encoding=given_encoding)
+
+    # When loading the file with and without streaming
+    data_file = CsvRowFormatPolarsDataFile(given_data_path, encoding=given_encoding)
+    streamed_data_file = CsvRowFormatPolarsDataFile(
+        given_data_path,
+        encoding=given_encoding,
+        streaming=True,
+        memory_budget_mb=0.1,
+        temp_directory=tmp_path,
+    )
+
+    # Then the data is the same
+    assert streamed_data_file.get_data().equals(data_file.get_data())
+
+    # And only the file backing the streamed data is kept while the data file exists
+    assert len(list(tmp_path.rglob("*.arrow"))) == 1
+    del streamed_data_file
+    gc.collect()
+    assert list(tmp_path.iterdir()) == [given_data_path]
+
+
+def _write_large_file(path) -> None:
+    lines = ["id\tvalue"] + [f"{i}\t{i / 10}" for i in range(5000)]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def test_spilled_data_is_kept_as_long_as_the_data_holder(
+    tmp_path, polars_data_frame_holder_class
+):
+    # Given a streamed data file set as data source of a data holder
+    given_data_path = tmp_path / "data.txt"
+    _write_large_file(given_data_path)
+    spill_root = tmp_path / "spill"
+    spill_root.mkdir()
+    data_file = CsvRowFormatPolarsDataFile(
+        given_data_path,
+        encoding="utf-8",
+        streaming=True,
+        memory_budget_mb=0.1,
+        temp_directory=spill_root,
+    )
+    data_file.data_type_obj = DataType("phytoplankton")
+    data_holder = polars_data_frame_holder_class(pl.DataFrame())
+    data_holder._set_data_source(data_file)
+
+    # When only the data holder is kept
+    del data_file
+    gc.collect()
+
+    # Then the spilled file is kept
+    assert len(list(spill_root.rglob("*.arrow"))) == 1
+    assert len(data_holder.data) == 5000
+
+    # And removed with the data holder
+    del data_holder
+    gc.collect()
+    assert not list(spill_root.iterdir())
+
+
+def test_spill_directory_that_can_not_be_removed_is_removed_later(tmp_path, monkeypatch):
+    # Given a spill directory that can not be removed (as a mapped file on Windows)
+    rmtree = shutil.rmtree
+
+    def fail_to_remove(path, *args, **kwargs):
+        raise PermissionError(f"File in use: {path}")
+
+    monkeypatch.setattr(streaming.shutil, "rmtree", fail_to_remove)
+    spill_directory = streaming.SpillDirectory(tmp_path)
+    (spill_directory.path / "data.arrow").write_bytes(b"data")
+    spill_directory.cleanup()
+    assert spill_directory.path.exists()
+
+    # When the directory can be removed and a new spill directory is created
+    monkeypatch.setattr(streaming.shutil, "rmtree", rmtree)
+    new_spill_directory = streaming.SpillDirectory(tmp_path)
+
+    # Then the old directory is removed
+    assert not spill_directory.path.exists()
+    assert list(tmp_path.iterdir()) == [new_spill_directory.path]
+    new_spill_directory.cleanup()
+    assert not list(tmp_path.iterdir())
+
+
+def test_data_filter_is_applied_when_reading_non_utf8_file(tmp_path):
+    # Given a cp1252 encoded csv file with non ascii characters
+    given_data_path = tmp_path / "data.txt"
+    lines = ["visit_year\tstation\tvalue", "2020\tÅsköar\t1.23", "2021\tÅsköar\t2.48"]
+    given_data_path.write_text("\n".join(lines) + "\n", encoding="cp1252")
+
+    # When loading the file with a data filter
+    data_file = CsvRowFormatPolarsDataFile(
+        given_data_path,
+        encoding="cp1252",
+        data_filter=PolarsDataFilterYears(2021),
+        temp_directory=tmp_path,
+    )
+
+    # Then the filter is pushed down and the characters are decoded
+    assert data_file.data_filter_applied
+    assert data_file.get_data()["station"].to_list() == ["Åsköar"]
+
+    # And the transcoded file is removed
+    assert list(tmp_path.iterdir()) == [given_data_path]
@@ -0,0 +1,49 @@
+import datetime
+
+import openpyxl
+
+from sharkadm.data.archive.analyse_info import AnalyseInfo
+from sharkadm.data.data_source.dv_template_workbook import DvTemplateWorkbook
+
+
+def _create_template(path):
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Analysinfo"
+    ws.append(["Analysinformation"])
+    ws.append(["Tabellhuvud:", "PARAM", "VALIDFR", "VALIDTO", "UNCERT"])
+    ws.append(["", "TEMP", datetime.datetime(2020, 1, 1), None, 0.05])
+    ws["E3"].number_format = "0.0%"
+    ws.append([])
+    ws.append(["", "SALT", datetime.datetime(2021, 5, 1), None, "0.01"])
+    wb.save(path)
+
+
+def test_table_is_read_from_tagged_header_row(tmp_path):
+    # Given a template with a tagged header row and an empty row
+    path = tmp_path / "template.xlsx"
+    _create_template(path)
+
+    # When reading the sheet as a table
+    workbook = DvTemplateWorkbook(path)
+    table = workbook.get_table("Analysinfo")
+
+    # Then the header is found and empty rows are removed
+    assert workbook.get_header_row("Analysinfo") == 1
+    assert table.columns == ["Tabellhuvud:", "PARAM", "VALIDFR", "VALIDTO", "UNCERT"]
+    assert table["PARAM"].to_list() == ["TEMP", "SALT"]
+
+
+def test_analyse_info_from_workbook_converts_percent_formatted_uncert(tmp_path):
+    # Given a template with uncertainty formatted as percent
+    path = tmp_path / "template.xlsx"
+    _create_template(path)
+
+    # When loading analyse info from the workbook
+    info = AnalyseInfo.from_dv_template(DvTemplateWorkbook(path))
+
+    # Then dates are parsed and percent formatted values are converted
+    temp = info.data["TEMP"][0]
+    assert temp["VALIDFR"] == datetime.date(2020, 1, 1)
+    assert temp["UNCERT"] == "5.0%"
+    assert info.data["SALT"][0]["UNCERT"] == "0.01"
@@ -0,0 +1,126 @@
+from unittest import mock
+
+import polars as pl
+import pytest
+
+from sharkadm.config.data_type import DataType, data_type_handler
+from sharkadm.data.data_source.profile.standard_format_file import (
+    StandardFormatPolarsDataFile,
+    get_sensor_columns,
+)
+from sharkadm.data.profile.standard_format_data_holder import (
+    PolarsProfileStandardFormatDataHolder,
+)
+
+HEADER_LINES = [
+    "//FORMAT=PROFILE",
+    "//METADATA;SHIP;77SE",
+    "//METADATA;SERNO;{serno}",
+    "//METADATA;COMNT_VISIT;",
+    "//SENSORINFO;PRES_CTD;DBAR",
+    "//METADATA;AFTER_SENSORINFO;ignored",
+]
+
+DATA_LINES = [
+    "YEAR\tMONTH\tDAY\tHOUR\tMINUTE\tPRES_CTD [dbar]\tQV:SMHI:PRES_CTD [dbar]",
+    "2025\t9\t24\t11\t23\t1.5\t",
+    "2025\t9\t24\t11\t23\t2.5\t",
+]
+
+
+def _write_profile(path, serno: str = "0775", data_lines: list[str] = DATA_LINES):
+    lines = [line.format(serno=serno) for line in HEADER_LINES] + data_lines
+    path.write_text("\n".join(lines) + "\n", encoding="cp1252")
+    return path
+
+
+def test_metadata_is_read_together_with_data(tmp_path):
+    # Given a standard format file
+    given_path = _write_profile(tmp_path / "ctd_profile_20250924_77SE_0775.txt")
+
+    # When loading the file
+    data_file = StandardFormatPolarsDataFile(given_path)
+
+    # Then metadata lines before sensor info are available
+    assert data_file.metadata == {"SHIP": "77SE", "SERNO": "0775", "COMNT_VISIT": ""}
+
+    # And the data is parsed as strings by default
+    assert len(data_file.data) == 2
+    assert data_file.data["PRES_CTD [dbar]"].dtype == pl.String
+    assert data_file.data["SDATE"].to_list() == ["2025-09-24", "2025-09-24"]
+
+
+def test_sensor_columns_can_be_parsed_as_floats(tmp_path):
+    # Given a standard format file
+    given_path = _write_profile(tmp_path / "ctd_profile_20250924_77SE_0775.txt")
+
+    # When loading the file with typed sensor columns
+    data_file = StandardFormatPolarsDataFile(given_path, typed_sensor_columns=True)
+
+    # Then sensor columns are floats and flag columns are strings
+    assert data_file.data["PRES_CTD [dbar]"].to_list() == [1.5, 2.5]
+    assert data_file.data["QV:SMHI:PRES_CTD [dbar]"].dtype == pl.String
+
+
+@pytest.mark.parametrize(
+    "given_header, expected_columns",
+    (
+        (["YEAR", "TEMP_CTD [deg C]"], ["TEMP_CTD [deg C]"]),
+        (["QV:SMHI:TEMP_CTD [deg C]", "Q0_TEMP_CTD [deg C]"], []),
+    ),
+)
+def test_get_sensor_columns(given_header, expected_columns):
+    assert get_sensor_columns(given_header) == expected_columns
+
+
+@pytest.mark.parametrize("given_max_workers", (None, 1, 4))
+def test_data_holder_combines_all_files_in_order(tmp_path, given_max_workers):
+    # Given a directory with profiles where one lacks a column
+    _write_profile(tmp_path / "ctd_profile_20250924_77SE_0775.txt", serno="0775")
+    for serno in ("0776", "0777", "0778"):
+        _write_profile(
+            tmp_path / f"ctd_profile_20250925_77SE_{serno}.txt",
+            serno=serno,
+            data_lines=[
+                "YEAR\tMONTH\tDAY\tHOUR\tMINUTE\tPRES_CTD [dbar]",
+                f"2025\t9\t25\t08\t00\t{serno}.1",
+                f"2025\t9\t25\t08\t00\t{serno}.2",
+            ],
+        )
+
+    # When loading the directory
+    with mock.patch.object(
+        data_type_handler, "get_data_type_obj", return_value=DataType("profile")
+    ):
+        data_holder = PolarsProfileStandardFormatDataHolder(
+            tmp_path, max_workers=given_max_workers
+        )
+
+    # Then the rows of each file follow each other in the order the files are listed
+    expected_pressures = []
+    for path in tmp_path.iterdir():
+        serno = path.stem[-4:]
+        if serno == "0775":
+            expected_pressures.extend(["1.5", "2.5"])
+        else:
+            expected_pressures.extend([f"{serno}.1", f"{serno}.2"])
+    assert data_holder.data["PRES_CTD [dbar]"].to_list() == expected_pressures
+
+    # And missing values are empty strings
+    assert data_holder.data["QV:SMHI:PRES_CTD [dbar]"].null_count() == 0
+    assert len(data_holder.data_sources) == 4
+
+
+def test_columns_are_pushed_down_but_date_and_time_columns_are_kept(tmp_path):
+    # Given a standard format file
+    given_path = _write_profile(tmp_path / "ctd_profile_20250924_77SE_0775.txt")
+
+    # When loading the file with a given column
+    data_file = StandardFormatPolarsDataFile(given_path, columns=["PRES_CTD [dbar]"])
+
+    # Then the quality flag column is not read
+    assert "QV:SMHI:PRES_CTD [dbar]" not in data_file.data.columns
+    assert data_file.data["PRES_CTD [dbar]"].to_list() == ["1.5", "2.5"]
+
+    # And date and time can still be added
+    assert data_file.data["SDATE"].to_list() == ["2025-09-24", "2025-09-24"]
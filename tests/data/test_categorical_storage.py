@@ -0,0 +1,94 @@
+import polars as pl
+
+from sharkadm.controller import SHARKadmPolarsController
+from sharkadm.transformers.base import PolarsTransformer
+from sharkadm.validators import ValidatePositiveValues
+
+
+def _get_data(nr_rows: int = 100) -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "parameter": ["Temperature", "Salinity"] * (nr_rows // 2),
+            "value": [str(i) for i in range(nr_rows)],
+        }
+    )
+
+
+class _UppercaseParameter(PolarsTransformer):
+    @staticmethod
+    def get_transformer_description() -> str:
+        return "Test transformer using string functions"
+
+    def _transform(self, data_holder) -> None:
+        assert data_holder.data["parameter"].dtype == pl.String
+        data_holder.data = data_holder.data.with_columns(
+            pl.col("parameter").str.to_uppercase()
+        )
+
+
+def test_low_cardinality_columns_are_stored_as_categorical(
+    polars_data_frame_holder_class,
+):
+    # Given a data holder with categorical storage
+    data_holder = polars_data_frame_holder_class(_get_data())
+    data_holder.use_categorical_storage()
+
+    # When encoding the data
+    data_holder.encode_categorical()
+
+    # Then only the low cardinality column is categorical and memory is saved
+    assert data_holder.data["parameter"].dtype == pl.Categorical
+    assert data_holder.data["value"].dtype == pl.String
+    info = data_holder.categorical_storage_info
+    assert info["categorical_size"] < info["string_size"]
+
+
+def test_string_transformer_gets_strings_in_categorical_storage(
+    polars_data_frame_holder_class,
+):
+    # Given a controller with a data holder using categorical storage
+    class DataHolder(polars_data_frame_holder_class):
+        data_type_internal = "unknown"
+
+    data_holder = DataHolder(_get_data())
+    data_holder.use_categorical_storage()
+    controller = SHARKadmPolarsController()
+    controller.set_data_holder(data_holder)
+    assert data_holder.data["parameter"].dtype == pl.Categorical
+
+    # When running a transformer that does not support categorical columns
+    controller.transform(_UppercaseParameter())
+
+    # Then the transformer gets strings and the column is categorical afterward
+    assert data_holder.data["parameter"].dtype == pl.Categorical
+    assert data_holder.data["parameter"].cast(pl.String).to_list()[:2] == [
+        "TEMPERATURE",
+        "SALINITY",
+    ]
+    assert data_holder.data["row_number"].dtype == pl.String
+
+
+def test_categorical_safe_operators_do_not_decode_columns(
+    polars_data_frame_holder_class,
+):
+    # Given a controller with a data holder using categorical storage
+    class DataHolder(polars_data_frame_holder_class):
+        data_type_internal = "unknown"
+
+    data = _get_data().with_columns(
+        pl.Series("depth", ["-1", "2"] * 50),
+    )
+    data_holder = DataHolder(data)
+    data_holder.use_categorical_storage()
+    controller = SHARKadmPolarsController()
+    controller.set_data_holder(data_holder)
+    decoded = []
+    data_holder.decode_categorical = lambda: decoded.append(True)
+
+    # When running a validator that supports categorical columns
+    info = controller.validate(ValidatePositiveValues(columns_to_validate=("depth",)))
+
+    # Then the columns are not decoded and the validator works on categoricals
+    assert info.all_succeeded
+    assert not decoded
+    assert data_holder.data["depth"].dtype == pl.Categorical
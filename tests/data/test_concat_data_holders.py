@@ -0,0 +1,50 @@
+import polars as pl
+import pytest
+
+from sharkadm.data import PolarsConcatDataHolder, concat_data_holders
+from tests.conftest import PolarsDataFrameHolder
+
+
+class NamedDataFrameHolder(PolarsDataFrameHolder):
+    def __init__(self, data: pl.DataFrame, dataset_name: str):
+        super().__init__(data)
+        self._dataset_name = dataset_name
+
+    @property
+    def dataset_name(self) -> str:
+        return self._dataset_name
+
+
+def test_data_holders_with_different_columns_are_concatenated_and_tagged():
+    # Given data holders with partly different columns
+    holders = [
+        NamedDataFrameHolder(pl.DataFrame({"a": ["1"], "b": ["x"]}), "first"),
+        NamedDataFrameHolder(pl.DataFrame({"a": ["2"], "c": ["y"]}), "second"),
+        NamedDataFrameHolder(pl.DataFrame({"a": ["3"]}), "third"),
+    ]
+
+    # When concatenating all holders
+    cdh = concat_data_holders(holders)
+
+    # Then all rows are kept, columns are aligned and rows are tagged with origin
+    assert isinstance(cdh, PolarsConcatDataHolder)
+    assert cdh.data["a"].to_list() == ["1", "2", "3"]
+    assert cdh.data["c"].to_list() == [None, "y", None]
+    assert cdh.data["dataset_name"].to_list() == ["first", "second", "third"]
+    assert cdh.dataset_name == "first # second # third"
+
+
+def test_adding_data_holders_uses_concat_and_checks_dataset_names():
+    # Given two data holders
+    first = NamedDataFrameHolder(pl.DataFrame({"a": ["1"]}), "first")
+    second = NamedDataFrameHolder(pl.DataFrame({"b": ["2"]}), "second")
+
+    # When adding the holders
+    cdh = sum([first, second])
+
+    # Then the data is concatenated
+    assert cdh.data.height == 2
+
+    # And the same dataset can not be added again
+    with pytest.raises(TypeError):
+        cdh + first
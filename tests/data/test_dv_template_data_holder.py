@@ -0,0 +1,58 @@
+from types import SimpleNamespace
+
+import openpyxl
+
+from sharkadm.data.data_source.dv_template_workbook import DvTemplateWorkbook
+from sharkadm.data.dv_template import dv_template_data_holder
+from sharkadm.data.dv_template.dv_template_data_holder import (
+    MANDATORY_COLUMNS_SHEET_NAME,
+    PolarsDvTemplateDataHolder,
+)
+
+
+def _get_data_holder(path, mandatory_keys: list[str]) -> PolarsDvTemplateDataHolder:
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = MANDATORY_COLUMNS_SHEET_NAME
+    ws.append(["Obligatorisk", "Beskrivning", "Enhet", "Kolumn"])
+    for nr, key in enumerate(mandatory_keys):
+        ws.append(["*" if nr % 2 else "(*)", "", "", key])
+    ws.append(["*", "", "", "not a key"])
+    wb.save(path)
+
+    # Only the attributes used when loading mandatory columns are set
+    data_holder = PolarsDvTemplateDataHolder.__new__(PolarsDvTemplateDataHolder)
+    data_holder._workbook = DvTemplateWorkbook(path)
+    data_holder._delivery_note = SimpleNamespace(
+        data_type="Phytoplankton", import_matrix_key="SYNTHETIC"
+    )
+    data_holder._import_matrix_mapper = None
+    return data_holder
+
+
+def test_mandatory_columns_cache_is_bounded(tmp_path, monkeypatch):
+    # Given a cache with room for two template versions
+    monkeypatch.setattr(dv_template_data_holder, "MANDATORY_COLUMNS_CACHE_SIZE", 2)
+    monkeypatch.setattr(dv_template_data_holder, "_mandatory_columns_cache", {})
+    cache = dv_template_data_holder._mandatory_columns_cache
+
+    # When loading mandatory columns from three template versions
+    data_holders = [
+        _get_data_holder(tmp_path / f"template_{nr}.xlsx", ["SDATE", "STATN", key])
+        for nr, key in enumerate(["LATIT", "LONGI", "DEPH"])
+    ]
+    for data_holder in data_holders:
+        data_holder._load_mandatory_columns()
+
+    # Then the mandatory columns are read from the sheet
+    assert data_holders[0].mandatory_reg_columns == ["STATN"]
+    assert data_holders[0].mandatory_nat_columns == ["SDATE", "STATN", "LATIT"]
+
+    # And only the two most recently used versions are kept
+    assert len(cache) == 2
+    assert {key[-1][-1][-1] for key in cache} == {"LONGI", "DEPH"}
+
+    # And a version used again is kept when a new version is loaded
+    data_holders[1]._load_mandatory_columns()
+    _get_data_holder(tmp_path / "template_3.xlsx", ["WADEP"])._load_mandatory_columns()
+    assert {key[-1][-1][-1] for key in cache} == {"LONGI", "WADEP"}
@@ -0,0 +1,93 @@
+import polars as pl
+import pytest
+
+from sharkadm.data_filter import (
+    PolarsDataFilter,
+    PolarsDataFilterMatchInColumn,
+    PolarsDataFilterParameter,
+    PolarsDataFilterQflag,
+    PolarsDataFilterYears,
+)
+
+
+def _get_data() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "visit_year": ["2020", "2021", "2021", "2022"],
+            "parameter": ["TEMP", "TEMP", "SALT", "TEMP"],
+            "quality_flag": ["", "B", "", ""],
+            "value": ["1", "2", "3", "4"],
+        }
+    )
+
+
+def test_filter_stores_rows_and_gathers_requested_columns(
+    polars_data_frame_holder_class,
+):
+    # Given a data holder
+    data_holder = polars_data_frame_holder_class(_get_data())
+
+    # When filtering on year
+    data_holder.filter(PolarsDataFilterYears(2021, 2022))
+
+    # Then only the row indexes are stored and requested columns can be gathered
+    assert data_holder.is_filtered
+    assert data_holder.filter_rows.to_list() == [1, 2, 3]
+    assert data_holder.get_data(["value"]).columns == ["value"]
+    assert data_holder.get_data(["value"])["value"].to_list() == ["2", "3", "4"]
+    assert data_holder.data["parameter"].to_list() == ["TEMP", "SALT", "TEMP"]
+
+
+def test_chained_and_combined_filters_give_same_rows(polars_data_frame_holder_class):
+    # Given two data holders with the same data
+    chained = polars_data_frame_holder_class(_get_data())
+    combined = polars_data_frame_holder_class(_get_data())
+
+    # When filtering one in steps and the other with a combined filter
+    chained.filter(PolarsDataFilterYears(2021, 2022))
+    chained.filter(PolarsDataFilterParameter("TEMP"))
+    chained.filter(PolarsDataFilterQflag(""))
+    combined_filter = (
+        PolarsDataFilterYears(2021, 2022)
+        & PolarsDataFilterParameter("TEMP")
+        & PolarsDataFilterQflag("")
+    )
+    combined.filter(combined_filter)
+
+    # Then the combined filter is a single expression and the rows are the same
+    assert combined_filter.get_filter_expression() is not None
+    assert chained.filter_rows.to_list() == [3]
+    assert combined.filter_rows.to_list() == [3]
+
+
+def test_filter_without_expression_and_reset(polars_data_frame_holder_class):
+    # Given a filtered data holder
+    data_holder = polars_data_frame_holder_class(_get_data())
+    data_holder.filter(PolarsDataFilterParameter("TEMP"))
+
+    # When filtering with a filter that has no expression
+    data_filter = PolarsDataFilterMatchInColumn("visit_year", "2022")
+    data_holder.filter(data_filter)
+
+    # Then the mask is applied to the filtered data
+    assert data_filter.get_filter_expression() is None
+    assert data_holder.data["visit_year"].to_list() == ["2022"]
+
+    # When resetting the filter
+    data_holder.reset_filter()
+
+    # Then all data is returned
+    assert not data_holder.is_filtered
+    assert len(data_holder.data) == 4
+
+
+def test_filter_must_implement_mask():
+    # Given a filter with an expression but without _get_filter_mask
+    class ExpressionOnly(PolarsDataFilter):
+        def _get_filter_expression(self) -> pl.Expr:
+            return pl.col("visit_year") == "2021"
+
+    # When creating the filter
+    # Then it is refused
+    with pytest.raises(TypeError):
+        ExpressionOnly()
@@ -0,0 +1,48 @@
+import polars as pl
+import pytest
+
+
+def test_float_col_parses_comma_and_empty_values(polars_data_frame_holder_class):
+    # Given a data holder with a string column
+    data_holder = polars_data_frame_holder_class(
+        pl.DataFrame({"sample_depth_m": ["1.5", "2,5", "", "x"]})
+    )
+
+    # When getting the float column
+    float_col = data_holder.float_col("sample_depth_m")
+
+    # Then comma is a decimal separator and empty or invalid values are null
+    assert float_col.dtype == pl.Float64
+    assert float_col.to_list() == [1.5, 2.5, None, None]
+
+
+def test_float_col_is_cached_until_column_changes(polars_data_frame_holder_class):
+    # Given a data holder where the float column has been parsed
+    data_holder = polars_data_frame_holder_class(
+        pl.DataFrame({"sample_depth_m": ["1", "2"], "other": ["a", "b"]})
+    )
+    first = data_holder.float_col("sample_depth_m")
+
+    # When another column changes
+    data_holder.data = data_holder.data.with_columns(pl.col("other").str.to_uppercase())
+
+    # Then the cached float column is used
+    assert data_holder.float_col("sample_depth_m") is first
+
+    # When the source column changes
+    data_holder.data = data_holder.data.with_columns(pl.lit("3").alias("sample_depth_m"))
+
+    # Then the column is parsed again
+    assert data_holder.float_col("sample_depth_m").to_list() == [3.0, 3.0]
+
+
+def test_strict_float_col_raises_for_invalid_values(polars_data_frame_holder_class):
+    # Given a data holder with an invalid value
+    data_holder = polars_data_frame_holder_class(
+        pl.DataFrame({"sample_depth_m": ["1", "", "x"]})
+    )
+
+    # When getting the float column in strict mode
+    # Then an error is raised
+    with pytest.raises(pl.exceptions.InvalidOperationError):
+        data_holder.float_col("sample_depth_m", strict=True)
@@ -0,0 +1,87 @@
+import threading
+
+import polars as pl
+import pytest
+
+from sharkadm.exporters import profile
+from sharkadm.exporters.profile import write_profile_file, write_profile_files
+
+
+def _get_jobs(directory, nr_files: int) -> list:
+    return [
+        (
+            directory / f"profile_{nr}.txt",
+            ["//FORMAT=PROFILE", f"//METADATA;STATION;Å{nr}"],
+            pl.DataFrame({"PRES_CTD": [str(nr), "2.5"], "TEMP_CTD [°C]": ["8.1", "7.9"]}),
+        )
+        for nr in range(nr_files)
+    ]
+
+
+def test_header_lines_and_data_are_written_with_encoding(tmp_path):
+    # Given header lines and data with non ascii characters
+    path = tmp_path / "profile.txt"
+    data = pl.DataFrame({"STATION": ["Å17", "Å17"], "TEMP_CTD [°C]": ["8.1", "7.9"]})
+
+    # When writing the file in cp1252
+    write_profile_file(path, ["//METADATA;COMNT;Ö"], data, encoding="cp1252")
+
+    # Then the header lines are followed by tab separated data
+    assert path.read_bytes().decode("cp1252").splitlines() == [
+        "//METADATA;COMNT;Ö",
+        "STATION\tTEMP_CTD [°C]",
+        "Å17\t8.1",
+        "Å17\t7.9",
+    ]
+    assert b"\xc5" in path.read_bytes()
+
+
+@pytest.mark.parametrize("given_max_workers", (None, 1, 4))
+def test_all_profile_files_are_written(tmp_path, given_max_workers):
+    # Given jobs for several profiles
+    jobs = _get_jobs(tmp_path, 10)
+
+    # When writing the files
+    write_profile_files(jobs, max_workers=given_max_workers, encoding="cp1252")
+
+    # Then each file holds its own header lines and data
+    for path, header_lines, data in jobs:
+        lines = path.read_text(encoding="cp1252").splitlines()
+        assert lines[: len(header_lines)] == header_lines
+        assert lines[len(header_lines)] == "\t".join(data.columns)
+        assert lines[len(header_lines) + 1 :] == [
+            "\t".join(row) for row in data.iter_rows()
+        ]
+
+
+def test_profile_files_are_written_on_several_threads(tmp_path, monkeypatch):
+    # Given a writer that waits for another writer and records its thread
+    thread_ids = set()
+    barrier = threading.Barrier(2, timeout=5)
+    write = profile.write_profile_file
+
+    def wait_and_write(*args, **kwargs):
+        thread_ids.add(threading.get_ident())
+        barrier.wait()
+        write(*args, **kwargs)
+
+    monkeypatch.setattr(profile, "write_profile_file", wait_and_write)
+    jobs = _get_jobs(tmp_path, 2)
+
+    # When writing two files with two workers
+    write_profile_files(jobs, max_workers=2)
+
+    # Then the files are written concurrently
+    assert len(thread_ids) == 2
+    assert all(path.exists() for path, _, _ in jobs)
+
+
+def test_errors_in_writer_threads_are_raised(tmp_path):
+    # Given a job with a path in a directory that does not exist
+    jobs = _get_jobs(tmp_path, 2)
+    jobs.append((tmp_path / "missing" / "profile.txt", [], jobs[0][2]))
+
+    # When writing the files
+    # Then the error is raised
+    with pytest.raises(FileNotFoundError):
+        write_profile_files(jobs, max_workers=2)
@@ -0,0 +1,101 @@
+import pathlib
+
+import polars as pl
+
+from sharkadm.exporters.standard_format import PolarsStandardFormat
+from sharkadm.utils.paths import get_next_incremented_file_path
+
+
+class _ProfileDataHolder:
+    def __init__(self, data: pl.DataFrame, metadata: dict[str, dict[str, str]]):
+        self.data = data
+        self.metadata_original_columns = metadata
+
+
+def _get_data_holder() -> _ProfileDataHolder:
+    # Two casts in the same source file give two files with the same stem
+    data = pl.DataFrame(
+        {
+            "visit_date": ["2024-05-01", "2024-05-01", "2024-05-02"],
+            "sample_time": ["10:11:12", "10:11:12", "08:00:00"],
+            "source": ["ctd_Å17.cnv"] * 3,
+            "reported_station_name": ["Å17"] * 3,
+            "visit_reported_latitude": ["57.1", "57.1", "57.2"],
+            "visit_reported_longitude": ["11.1", "11.1", "11.2"],
+            "PRES_CTD": ["1", "2", "1"],
+            "TEMP_CTD": ["8.1", "7.9", "6.5"],
+        }
+    )
+    metadata = {"ctd_Å17": {"COMNT_VISIT": "Sjögång", "TEMP_CTD": ""}}
+    return _ProfileDataHolder(data, metadata)
+
+
+def test_reserved_paths_are_taken():
+    # Given a path that is reserved but not written
+    # When getting the next free path
+    # Then the reserved paths are skipped
+    path = get_next_incremented_file_path(
+        pathlib.Path("missing_directory") / "ctd.txt",
+        reserved={
+            pathlib.Path("missing_directory") / name for name in ("ctd.txt", "ctd(1).txt")
+        },
+    )
+    assert path.name == "ctd(2).txt"
+
+
+def test_each_profile_gets_its_own_incremented_file(tmp_path):
+    # Given an export directory with a file from an earlier export
+    (tmp_path / "ctd_Å17.txt").write_text("earlier export")
+
+    # When exporting two profiles from the same source concurrently
+    PolarsStandardFormat(export_directory=tmp_path, max_workers=2)._export(
+        _get_data_holder()
+    )
+
+    # Then each profile is written to a new incremented file
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "ctd_Å17(1).txt",
+        "ctd_Å17(2).txt",
+        "ctd_Å17.txt",
+    ]
+    assert (tmp_path / "ctd_Å17.txt").read_text() == "earlier export"
+
+
+def test_profile_files_are_written_in_cp1252(tmp_path):
+    # Given profile data with non ascii characters
+    # When exporting
+    PolarsStandardFormat(export_directory=tmp_path, max_workers=2)._export(
+        _get_data_holder()
+    )
+
+    # Then the files are cp1252 with metadata rows followed by the data
+    contents = [
+        path.read_bytes().decode("cp1252").splitlines()
+        for path in sorted(tmp_path.iterdir())
+    ]
+    assert sorted(len(lines) for lines in contents) == [8, 9]
+    for lines in contents:
+        assert lines[:6] == [
+            r"// FORMAT=PROFILE",
+            r"// METADATA_DELIMITER=;",
+            r"// DATA_DELIMITER =\t",
+            r"// ENCODING=cp1252",
+            "//METADATA;COMNT_VISIT;Sjögång",
+            "//METADATA;TEMP_CTD;",
+        ]
+        header = lines[6].split("\t")
+        assert header[:2] == ["YEAR", "MONTH"]
+        rows = [dict(zip(header, line.split("\t"))) for line in lines[7:]]
+        assert {row["STATION"] for row in rows} == {"Å17"}
+
+        # And empty values are written as empty fields
+        assert {row["CRUISE"] for row in rows} == {""}
+        assert {row["QV:SMHI:TEMP_CTD"] for row in rows} == {""}
+
+    # And each profile holds its own data
+    temperatures = sorted(
+        line.split("\t")[lines[6].split("\t").index("TEMP_CTD")]
+        for lines in contents
+        for line in lines[7:]
+    )
+    assert temperatures == ["6.5", "7.9", "8.1"]
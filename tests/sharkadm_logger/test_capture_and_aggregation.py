@@ -0,0 +1,54 @@
+from sharkadm import adm_logger
+
+
+def test_entries_below_capture_level_are_not_created():
+    # Given a capture level of warning for transformations
+    adm_logger.reset_log()
+    adm_logger.set_capture_level(adm_logger.WARNING, adm_logger.TRANSFORMATION)
+    created_messages = []
+
+    def message() -> str:
+        created_messages.append(1)
+        return "Debug message"
+
+    try:
+        # When logging on different levels
+        adm_logger.log_transformation(message, level=adm_logger.DEBUG)
+        adm_logger.log_transformation("Warning message", level=adm_logger.WARNING)
+        adm_logger.log_workflow(message, level=adm_logger.DEBUG)
+    finally:
+        adm_logger.reset_capture_levels()
+
+    # Then only entries on captured levels are created
+    assert [data["msg"] for data in adm_logger.data] == [
+        "Warning message",
+        "Debug message",
+    ]
+    # And the lazy message is only created when captured
+    assert len(created_messages) == 1
+
+
+def test_aggregation_merges_entries_with_same_template():
+    # Given aggregation mode
+    adm_logger.reset_log()
+    adm_logger.set_aggregation()
+
+    try:
+        # When logging the same kind of message for different names and rows
+        for name, rows in [("a", [1, 2]), ("b", [3]), ("c", [10])]:
+            adm_logger.log_transformation(
+                f"No translation for {name}",
+                template="No translation",
+                row_numbers=rows,
+                cls="Translator",
+            )
+        adm_logger.log_transformation("Other message", cls="Translator")
+    finally:
+        adm_logger.set_aggregation(False)
+
+    # Then one entry is kept per template with a count and all row numbers
+    first, other = adm_logger.data
+    assert first["msg"] == "No translation for a"
+    assert first["count"] == 3
+    assert str(first["row_numbers"]) == "1-3, 10"
+    assert other["count"] == 1
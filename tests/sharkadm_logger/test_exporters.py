@@ -0,0 +1,84 @@
+import zipfile
+
+import fastexcel
+import polars as pl
+
+from sharkadm import adm_logger
+from sharkadm.sharkadm_logger import FeedbackTxtExporter, ParquetExporter, XlsxExporter
+
+
+def _log_entries() -> None:
+    adm_logger.reset_log()
+    adm_logger.log_transformation("Second message", level=adm_logger.WARNING)
+    adm_logger.log_transformation("First message", level=adm_logger.INFO)
+    adm_logger.log_workflow(
+        "Feedback message", level=adm_logger.WARNING, purpose="feedback"
+    )
+
+
+def test_xlsx_export_is_sorted_and_has_selected_columns(tmp_path):
+    # Given a log with entries
+    _log_entries()
+    path = tmp_path / "log.xlsx"
+
+    # When exporting sorted on message with selected columns
+    adm_logger.export(
+        XlsxExporter(file_path=path, sort_by="msg", columns=["msg", "level"])
+    )
+
+    # Then the file holds the selected columns in sorted order
+    df = fastexcel.read_excel(path).load_sheet(0).to_polars()
+    assert df.columns == ["msg", "level"]
+    assert df["msg"].to_list() == ["Feedback message", "First message", "Second message"]
+
+
+def test_parquet_export_has_typed_columns(tmp_path):
+    # Given a log with entries
+    _log_entries()
+    path = tmp_path / "log.parquet"
+
+    # When exporting excluding the message column
+    adm_logger.export(ParquetExporter(file_path=path, exclude_columns="msg"))
+
+    # Then the file holds all entries and integer log numbers
+    df = pl.read_parquet(path)
+    assert "msg" not in df.columns
+    assert df["log_nr"].dtype == pl.Int64
+    assert df["level"].to_list() == ["warning", "info", "warning"]
+
+
+def test_feedback_export_only_holds_feedback_entries(tmp_path):
+    # Given a log with one feedback entry
+    _log_entries()
+    path = tmp_path / "feedback.txt"
+
+    # When exporting feedback
+    adm_logger.export(FeedbackTxtExporter(file_path=path))
+
+    # Then only the feedback message is written
+    assert path.read_text().startswith("Feedback message")
+    assert "First message" not in path.read_text()
+
+
+def test_xlsx_export_as_table_and_with_filter(tmp_path):
+    # Given a log with entries
+    _log_entries()
+    table_path = tmp_path / "table.xlsx"
+    filter_path = tmp_path / "filter.xlsx"
+
+    # When exporting as table and with filter
+    adm_logger.export(XlsxExporter(file_path=table_path, columns=["msg"], as_table=True))
+    adm_logger.export(
+        XlsxExporter(file_path=filter_path, columns=["msg"], with_filter=True)
+    )
+
+    # Then the table holds all entries
+    reader = fastexcel.read_excel(table_path)
+    assert len(reader.table_names()) == 1
+    table = reader.load_table(reader.table_names()[0]).to_polars()
+    assert table["msg"].len() == 3
+
+    # And the filter covers the header and all entries
+    with zipfile.ZipFile(filter_path) as zip_file:
+        sheet = zip_file.read("xl/worksheets/sheet1.xml").decode()
+    assert '<autoFilter ref="A1:A4"/>' in sheet
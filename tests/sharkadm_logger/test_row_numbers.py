@@ -0,0 +1,54 @@
+import polars as pl
+
+from sharkadm import adm_logger
+from sharkadm.sharkadm_logger import RowNumbers
+from sharkadm.sharkadm_logger import row_numbers as row_numbers_module
+
+
+def test_row_numbers_are_stored_as_ranges():
+    # Given row numbers as strings with duplicates and gaps
+    given_rows = pl.Series([str(nr) for nr in [*range(480, 11, -1), 1002, 13, 1002]])
+
+    # When creating a row number set
+    row_numbers = RowNumbers(given_rows)
+
+    # Then the rows are stored as ranges and rendered as a range string
+    assert row_numbers.ranges == [(12, 480), (1002, 1002)]
+    assert str(row_numbers) == "12-480, 1002"
+    assert len(row_numbers) == 470
+    assert "100" in row_numbers
+    assert 1001 not in row_numbers
+
+    # And sets can be combined
+    assert (row_numbers | [481, 1000]).to_range_string() == "12-481, 1000, 1002"
+
+
+def test_logged_row_numbers_are_compact():
+    # When logging a validation with many row numbers
+    adm_logger.reset_log()
+    adm_logger.log_validation(
+        "Missing value", row_number=1, row_numbers=[str(nr) for nr in range(2, 100_001)]
+    )
+
+    # Then the row numbers are stored as one range
+    row_numbers = adm_logger.data[-1]["row_numbers"]
+    assert isinstance(row_numbers, RowNumbers)
+    assert row_numbers.ranges == [(1, 100_000)]
+
+
+def test_small_and_large_inputs_give_the_same_ranges(monkeypatch):
+    # Given row numbers with duplicates, gaps, padding and missing values
+    given_rows = [" 7", 3, "1", None, "2", 9, "8", "3", 20]
+
+    # When creating row number sets in Python and with polars
+    in_python = RowNumbers(given_rows)
+    monkeypatch.setattr(row_numbers_module, "POLARS_THRESHOLD", 0)
+    with_polars = RowNumbers(given_rows)
+
+    # Then the ranges are the same
+    assert in_python.ranges == with_polars.ranges == [(1, 3), (7, 9), (20, 20)]
+
+    # And values that are not integers are returned as a list in both cases
+    assert row_numbers_module.get_row_numbers(["1", "a"]) == ["1", "a"]
+    monkeypatch.setattr(row_numbers_module, "POLARS_THRESHOLD", 1000)
+    assert row_numbers_module.get_row_numbers(["1", "a"]) == ["1", "a"]
@@ -0,0 +1,75 @@
+import copy
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+from benchmarks import nodc_stubs, runner, synthetic
+from sharkadm.data.archive import directory_is_archive
+from sharkadm.data.lims import is_lims_directory
+from sharkadm.data.profile import path_has_or_is_cnv_profile_data
+from sharkadm.data.zip_archive import path_is_zip_archive
+
+
+def test_synthetic_data_is_deterministic_and_recognised(tmp_path):
+    # Given synthetic data generated twice with the same seed
+    df = synthetic.get_rows(500, nr_stations=5, nr_taxa=10, seed=3)
+
+    # Then the data is identical and has the requested variation
+    assert df.equals(synthetic.get_rows(500, nr_stations=5, nr_taxa=10, seed=3))
+    assert len(df) == 500
+    assert df["station_name"].n_unique() <= 5
+    assert df["scientific_name"].n_unique() <= 10
+
+    # And written inputs are recognised as their formats
+    assert directory_is_archive(synthetic.write_archive(tmp_path, df))
+    assert path_is_zip_archive(synthetic.write_zip_archive(tmp_path, df))
+    assert is_lims_directory(synthetic.write_lims(tmp_path, df))
+    assert path_has_or_is_cnv_profile_data(synthetic.write_cnv(tmp_path, 2, 50))
+    assert synthetic.write_dv_template(tmp_path, df).exists()
+
+
+@pytest.fixture(scope="module")
+def results(tmp_path_factory) -> dict:
+    # The benchmarks set up NODC_CONFIG and the nodc stubs before sharkadm is
+    # imported, so they are run in a new process
+    path = tmp_path_factory.mktemp("benchmarks") / "results.json"
+    subprocess.run(
+        [sys.executable, "-m", "benchmarks", "run", "--scale", "200", "--output", path],
+        cwd=pathlib.Path(__file__).parent.parent,
+        check=True,
+        capture_output=True,
+    )
+    return runner.load_results(path)
+
+
+def test_all_cases_run_with_nodc_stubs_and_generated_config(results):
+    # Then all cases are run without errors
+    errors = [res for res in results["results"] if res["status"] != "ok"]
+    assert not errors
+    assert len(results["results"]) == len(runner.get_cases())
+
+    # And the stubs are used for the packages that are not installed
+    meta = results["meta"]
+    assert meta["generated_nodc_config"]
+    for name in nodc_stubs.STUB_PACKAGES:
+        assert (name in meta["nodc_stubs"]) != meta["nodc_packages"][name]
+
+
+def test_benchmark_results_are_compared_between_runs(results):
+    # Given two runs of an operator case
+    old = copy.deepcopy(results)
+    new = copy.deepcopy(results)
+    case_name = "ValidateDuplicatedRows"
+    old["results"] = [res for res in old["results"] if res["case"] == case_name]
+    new["results"] = [res for res in new["results"] if res["case"] == case_name]
+
+    # When the new run is made slower
+    old["results"][0]["seconds"] = 1.0
+    new["results"][0]["seconds"] = 2.0
+
+    # Then the comparison reports a regression
+    lines, regressions = runner.compare_results(old, new, threshold=0.5)
+    assert [reg["case"] for reg in regressions] == [case_name]
+    assert case_name in lines[-1]
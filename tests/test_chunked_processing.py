@@ -0,0 +1,144 @@
+import polars as pl
+import pytest
+
+from sharkadm import adm_logger
+from sharkadm.controller import SHARKadmPolarsController, get_row_local_segments
+from sharkadm.sharkadm_operator import OperatorsInfo
+from sharkadm.transformers import PolarsReplaceCommaWithDot, PolarsStripAllValues
+from sharkadm.transformers.base import PolarsTransformer
+from sharkadm.transformers.boolean import PolarsFixTrueAndFalse
+from tests.conftest import PolarsDataFrameHolder
+
+_processed_rows: list[int] = []
+
+
+class _DataHolder(PolarsDataFrameHolder):
+    data_type_internal = "unknown"
+
+
+class _AddValueTimesTwo(PolarsTransformer):
+    row_local = True
+
+    @staticmethod
+    def get_transformer_description() -> str:
+        return "Test transformer adding value times two"
+
+    def _transform(self, data_holder) -> None:
+        _processed_rows.append(len(data_holder.data))
+        data_holder.data = data_holder.data.with_columns(
+            (pl.col("value").cast(float) * 2).cast(str).alias("value_x2")
+        )
+
+
+class _AddMeanValue(PolarsTransformer):
+    @staticmethod
+    def get_transformer_description() -> str:
+        return "Test transformer adding the mean of all values"
+
+    def _transform(self, data_holder) -> None:
+        _processed_rows.append(len(data_holder.data))
+        data_holder.data = data_holder.data.with_columns(
+            pl.col("value_x2").cast(float).mean().alias("mean_value_x2")
+        )
+
+
+def _get_data() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "station": [f" station {i} " for i in range(10)],
+            "value": [f"{i},5" for i in range(10)],
+        }
+    )
+
+
+def _run(chunk_rows: int | None, spill_to_disk: bool = False) -> pl.DataFrame:
+    controller = SHARKadmPolarsController()
+    controller.set_data_holder(_DataHolder(_get_data()))
+    controller.set_chunked_processing(chunk_rows, spill_to_disk=spill_to_disk)
+    _processed_rows.clear()
+    info = controller.run_operators(
+        PolarsStripAllValues(),
+        PolarsReplaceCommaWithDot(apply_on_columns=("value",)),
+        _AddValueTimesTwo(),
+        _AddMeanValue(),
+    )
+    assert info.all_succeeded
+    return controller.data_holder.data
+
+
+@pytest.mark.parametrize("spill_to_disk", [False, True])
+def test_chunked_processing_gives_same_result(spill_to_disk):
+    # Given the result of processing all rows at once
+    expected = _run(chunk_rows=None)
+    assert _processed_rows == [10, 10]
+
+    # When processing the row local transformers in chunks of four rows
+    result = _run(chunk_rows=4, spill_to_disk=spill_to_disk)
+
+    # Then the row local transformers are run per chunk and the dataset level
+    # transformer on all rows
+    assert _processed_rows == [4, 4, 2, 10]
+
+    # And the result is the same
+    assert result.equals(expected)
+    assert result["mean_value_x2"][0] == 10.0
+
+
+def test_operators_are_grouped_in_row_local_segments():
+    # Given row local transformers separated by a dataset level transformer
+    operators = (
+        PolarsStripAllValues(),
+        _AddValueTimesTwo(),
+        _AddMeanValue(),
+        PolarsStripAllValues(),
+    )
+
+    # When grouping the operators
+    segments = get_row_local_segments(operators)
+
+    # Then the dataset level transformer is a boundary
+    assert [len(segment) for segment in segments] == [2, 1, 1]
+
+
+def _run_and_get_log(chunk_rows: int | None) -> tuple[list, list, OperatorsInfo]:
+    adm_logger.reset_log()
+    controller = SHARKadmPolarsController()
+    controller.set_data_holder(
+        _DataHolder(
+            pl.DataFrame({"value": ["yes"] * 5 + ["no", "yes", "yes", "no", "no"]})
+        )
+    )
+    controller.set_chunked_processing(chunk_rows)
+    info = controller.run_operators(PolarsFixTrueAndFalse(), PolarsStripAllValues())
+    assert info.all_succeeded
+    transformations = [
+        (data["msg"], data["level"], data["cls"])
+        for data in adm_logger.data
+        if data["log_type"] == adm_logger.TRANSFORMATION
+    ]
+    workflow = [
+        data["msg"].split(" executed in ")[0]
+        for data in adm_logger.data
+        if data["log_type"] == adm_logger.WORKFLOW and "in chunks of" not in data["msg"]
+    ]
+    return transformations, workflow, info
+
+
+def test_log_is_the_same_with_and_without_chunks():
+    # Given the log from processing all rows at once
+    expected_transformations, expected_workflow, expected_info = _run_and_get_log(None)
+    assert [msg for msg, _, _ in expected_transformations] == [
+        "Translated yes -> TRUE (7 places)",
+        "Translated no -> FALSE (3 places)",
+    ]
+
+    # When processing in chunks of four rows
+    transformations, workflow, info = _run_and_get_log(chunk_rows=4)
+
+    # Then the counts from the chunks are merged to the same log entries
+    assert transformations == expected_transformations
+    assert workflow == expected_workflow
+
+    # And the operators info covers all chunks
+    assert len(expected_info.operators_info) == 2
+    assert len(info.operators_info) == 6
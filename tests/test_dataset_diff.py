@@ -0,0 +1,96 @@
+import zipfile
+
+import polars as pl
+
+from sharkadm.data.change_log import ChangeLog
+from sharkadm.dataset_diff import diff_data, diff_data_holders, diff_zip_packages
+from tests.conftest import PolarsDataFrameHolder
+
+
+def _get_old_data() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "station": ["A", "B", "C"],
+            "depth": ["1", "5", "10"],
+            "value": ["1.0", "2.0", "3.0"],
+            "quality_flag": ["", "", ""],
+            "row_number": ["1", "2", "3"],
+        }
+    )
+
+
+def _get_new_data() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "station": ["A", "B", "D"],
+            "depth": ["1", "5", "20"],
+            "value": ["1.0", "2.5", "4.0"],
+            "quality_flag": ["", "B", ""],
+            "row_number": ["7", "8", "9"],
+        }
+    )
+
+
+def test_diff_with_key_columns_gives_added_removed_and_changed_rows():
+    # Given an old and a new version of a dataset in data holders
+    old = PolarsDataFrameHolder(_get_old_data())
+    new = PolarsDataFrameHolder(
+        _get_new_data().with_columns(pl.col("station").cast(pl.Categorical))
+    )
+
+    # When comparing them on station and depth
+    diff = diff_data_holders(old, new, key_columns=["station", "depth"])
+
+    # Then rows are added, removed and changed and changes are counted per column
+    assert diff.added["station"].to_list() == ["D"]
+    assert diff.removed["station"].to_list() == ["C"]
+    assert diff.changed["station"].to_list() == ["B"]
+    assert diff.changed["value_old"].to_list() == ["2.0"]
+    assert diff.changed["value_new"].to_list() == ["2.5"]
+    assert diff.column_change_counts == {"value": 1, "quality_flag": 1}
+    assert "row_number" not in diff.value_columns
+
+
+def test_diff_without_key_columns_and_change_log(tmp_path):
+    # Given an old and a new version of a dataset
+    old = _get_old_data()
+    new = _get_new_data()
+
+    # When comparing whole rows
+    diff = diff_data(old, new)
+
+    # Then changed rows are both removed and added
+    assert not diff.changed.height
+    assert diff.added["station"].to_list() == ["B", "D"]
+    assert diff.removed["station"].to_list() == ["B", "C"]
+    assert diff_data(old, old).is_identical
+
+    # When adding the diff to a change log and writing the report
+    change_log = ChangeLog(tmp_path / "change_log.txt")
+    diff.add_to_change_log(change_log)
+    diff.write_report(tmp_path / "report.txt")
+
+    # Then the summary is added to the log and the report is written
+    assert "Rows added: 2" in change_log.get_log_lines()[0]
+    assert "Rows removed: 2" in (tmp_path / "report.txt").read_text(encoding="utf8")
+
+
+def test_diff_zip_packages(tmp_path):
+    # Given two zip packages with the data file in different encodings
+    paths = []
+    for name, data, encoding in [
+        ("old", _get_old_data(), "cp1252"),
+        ("new", _get_new_data().with_columns(station=pl.lit("Ö")), "utf8"),
+    ]:
+        path = tmp_path / f"{name}.zip"
+        with zipfile.ZipFile(path, "w") as zf:
+            content = data.write_csv(separator="\t").encode(encoding)
+            zf.writestr("shark_data.txt", content)
+        paths.append(path)
+
+    # When comparing the packages
+    diff = diff_zip_packages(*paths, key_columns=["depth"])
+
+    # Then the data files are compared
+    assert diff.column_change_counts["station"] == 2
+    assert diff.changed["station_new"].to_list() == ["Ö", "Ö"]
@@ -0,0 +1,70 @@
+import threading
+import time
+
+from sharkadm import event
+
+
+def test_events_are_delivered_in_order_of_priority_and_reposted_as_log():
+    # Given subscribers with different priorities
+    received = []
+
+    def late(data):
+        received.append("late")
+
+    def early(data):
+        received.append("early")
+
+    def log(data_list):
+        received.append(len(data_list))
+
+    event.subscribe(event.Events.LOG_EXPORT, late, 90)
+    event.subscribe(event.Events.LOG_EXPORT, early, 10)
+    event.subscribe(event.Events.LOG, log, batched=True)
+
+    # When posting an event synchronously
+    event.post_event(event.Events.LOG_EXPORT, "exported")
+    event.unsubscribe(event.Events.LOG_EXPORT, late)
+    event.unsubscribe(event.Events.LOG_EXPORT, early)
+    event.unsubscribe(event.Events.LOG, log)
+
+    # Then subscribers are called in order and the event is posted as log
+    assert received == ["early", "late", 1]
+
+
+def test_queued_dispatch_does_not_block_and_coalesces_progress():
+    # Given a slow batched subscriber and a progress subscriber
+    batches = []
+    progress = []
+    release = threading.Event()
+
+    def slow_subscriber(data_list):
+        release.wait(2)
+        batches.append([data["msg"] for data in data_list])
+
+    event.subscribe(event.Events.LOG_TRANSFORMATION, slow_subscriber, batched=True)
+    event.subscribe(event.Events.LOG_PROGRESS, progress.append)
+
+    # When posting many events in queued mode
+    event.start_queued_dispatch(progress_interval=60)
+    try:
+        start = time.monotonic()
+        for i in range(100):
+            event.post_event(event.Events.LOG_TRANSFORMATION, f"msg {i}")
+            event.post_event(
+                event.Events.LOG_PROGRESS, dict(total=100, current=i, title="Test")
+            )
+        # Then posting does not wait for the subscriber
+        assert time.monotonic() - start < 1
+    finally:
+        release.set()
+        event.stop_queued_dispatch()
+        event.unsubscribe(event.Events.LOG_TRANSFORMATION, slow_subscriber)
+        event.unsubscribe(event.Events.LOG_PROGRESS, progress.append)
+
+    # And all events are delivered in batches
+    assert [msg for batch in batches for msg in batch] == [f"msg {i}" for i in range(100)]
+    assert len(batches) < 100
+
+    # And progress is coalesced per title
+    assert [data["current"] for data in progress] in ([0, 99], [99])
+    assert not event.is_queued_dispatch()
@@ -0,0 +1,160 @@
+import polars as pl
+
+from sharkadm import adm_logger
+from sharkadm.controller import SHARKadmPolarsController
+from sharkadm.incremental import IncrementalSnapshot
+from sharkadm.transformers import PolarsReplaceCommaWithDot, PolarsStripAllValues
+from sharkadm.transformers.base import PolarsTransformer
+from sharkadm.validators import ValidatePositiveValues
+from tests.conftest import PolarsDataFrameHolder
+
+_processed_rows: list[int] = []
+
+
+class _DataHolder(PolarsDataFrameHolder):
+    data_type_internal = "unknown"
+
+
+class _AddValueTimesTwo(PolarsTransformer):
+    row_local = True
+
+    @staticmethod
+    def get_transformer_description() -> str:
+        return "Test transformer adding value times two"
+
+    def _transform(self, data_holder) -> None:
+        _processed_rows.append(len(data_holder.data))
+        data_holder.data = data_holder.data.with_columns(
+            (pl.col("value").cast(int) * 2).cast(str).alias("value_x2")
+        )
+
+
+def _run(snapshot: IncrementalSnapshot, data: pl.DataFrame) -> pl.DataFrame:
+    controller = SHARKadmPolarsController()
+    controller.set_data_holder(_DataHolder(data))
+    snapshot.run_operators(controller, _AddValueTimesTwo())
+    return controller.data_holder.data
+
+
+def test_only_changed_rows_are_processed_and_merged(tmp_path):
+    # Given a processed dataset
+    snapshot = IncrementalSnapshot(tmp_path, "dataset")
+    _processed_rows.clear()
+    _run(snapshot, pl.DataFrame({"station": ["A", "B", "C"], "value": ["1", "2", "3"]}))
+
+    # When the dataset is resubmitted with one changed, one removed and one new row
+    result = _run(
+        snapshot, pl.DataFrame({"station": ["A", "B", "D"], "value": ["1", "5", "4"]})
+    )
+
+    # Then only the changed and the new row are processed
+    assert _processed_rows == [3, 2]
+
+    # And the result is the same as for a full run
+    assert result["station"].to_list() == ["A", "B", "D"]
+    assert result["value_x2"].to_list() == ["2", "10", "8"]
+    assert result["row_number"].to_list() == ["1", "2", "3"]
+    assert not any(col.startswith("_incremental") for col in result.columns)
+
+
+def test_changed_row_local_operators_require_full_rerun(tmp_path):
+    # Given a processed dataset
+    snapshot = IncrementalSnapshot(tmp_path, "dataset")
+    data = pl.DataFrame({"station": ["A", "B"], "value": ["1", "2"]})
+    _run(snapshot, data)
+
+    # Then a full rerun is required if the row local operators change
+    reason = snapshot.get_reason_for_full_rerun(
+        [_AddValueTimesTwo(), ValidatePositiveValues()], ["station", "value"]
+    )
+    assert reason == "Operators have changed"
+
+    # And not if operators are added after the first operator that is not row local
+    assert not snapshot.get_reason_for_full_rerun(
+        [_AddValueTimesTwo(), _AddMeanValue(), ValidatePositiveValues()],
+        ["station", "value"],
+    )
+
+
+class _AddMeanValue(PolarsTransformer):
+    @staticmethod
+    def get_transformer_description() -> str:
+        return "Test transformer adding the mean of all values"
+
+    def _transform(self, data_holder) -> None:
+        _processed_rows.append(len(data_holder.data))
+        data_holder.data = data_holder.data.with_columns(
+            pl.col("value").cast(float).mean().alias("mean_value")
+        )
+
+
+class _AddValueTimesTwoFloat(_AddValueTimesTwo):
+    def _transform(self, data_holder) -> None:
+        _processed_rows.append(len(data_holder.data))
+        data_holder.data = data_holder.data.with_columns(
+            (pl.col("value").cast(float) * 2).cast(str).alias("value_x2")
+        )
+
+
+def _run_workflow(
+    snapshot: IncrementalSnapshot, values: dict[str, str]
+) -> tuple[pl.DataFrame, list]:
+    adm_logger.reset_log()
+    controller = SHARKadmPolarsController()
+    controller.set_data_holder(
+        _DataHolder(
+            pl.DataFrame({"station": list(values), "value": list(values.values())})
+        )
+    )
+    info = snapshot.run_operators(
+        controller,
+        PolarsStripAllValues(),
+        PolarsReplaceCommaWithDot(apply_on_columns=("value",)),
+        _AddValueTimesTwoFloat(),
+        ValidatePositiveValues(columns_to_validate=("value",)),
+        _AddMeanValue(),
+    )
+    assert info.all_succeeded
+    validation = sorted(
+        (data["msg"], data["validation_success"], str(data.get("row_numbers")))
+        for data in adm_logger.data
+        if data["log_type"] == adm_logger.VALIDATION
+    )
+    return controller.data_holder.data, validation
+
+
+def test_workflow_with_validators_processes_changed_rows_only(tmp_path):
+    # Given a dataset processed with transformers, a validator and a transformer
+    # that needs all rows
+    snapshot = IncrementalSnapshot(tmp_path / "incremental", "dataset")
+    _processed_rows.clear()
+    _run_workflow(
+        snapshot,
+        {"A": " 1,5", "B": "-2,0", "C": "3,0", "D": "-2,0 ", "E": "4,0"},
+    )
+    assert _processed_rows == [5, 5]
+
+    for given_values, nr_changed in (
+        # One changed, one removed and one new row
+        ({"A": " 1,5", "B": "5,0", "C": "3,0", "D": "-2,0 ", "F": "-1,0"}, 2),
+        # The last negative values removed or changed
+        ({"A": " 1,5", "B": "5,0", "C": "3,0", "F": "1,0"}, 1),
+        # A negative value in a new row only
+        ({"A": " 1,5", "B": "5,0", "C": "3,0", "F": "1,0", "G": "-7"}, 1),
+    ):
+        # When the dataset is resubmitted
+        _processed_rows.clear()
+        result, validation = _run_workflow(snapshot, given_values)
+
+        # Then only the changed rows are run through the row local operators and
+        # all rows through the transformer that needs all rows
+        assert _processed_rows == [nr_changed, len(given_values)]
+
+        # And the result and the validation log are the same as for a full run
+        full_result, full_validation = _run_workflow(
+            IncrementalSnapshot(tmp_path / "full", str(len(given_values))),
+            given_values,
+        )
+        assert result.equals(full_result)
+        assert validation == full_validation
+        assert not any(col.startswith("_incremental") for col in result.columns)
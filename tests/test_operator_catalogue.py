@@ -0,0 +1,66 @@
+from sharkadm.operator_catalogue import OperatorCatalogue
+from sharkadm.transformers import PolarsTransformer
+
+
+class _CatalogueBase:
+    @staticmethod
+    def get_transformer_description() -> str:
+        return "Test operator"
+
+
+class _FirstOperator(_CatalogueBase):
+    def __init__(self, value: int = 1, **kwargs):
+        self.value = value
+
+
+def test_classes_are_cached_until_invalidated():
+    # Given a catalogue with classes looked up once
+    catalogue = OperatorCatalogue()
+    catalogue.register_group("test_operators", _CatalogueBase)
+    first = catalogue.get_classes("test_operators")
+
+    # When a new class is defined
+    class _SecondOperator(_CatalogueBase):
+        pass
+
+    # Then it is only found after the catalogue is invalidated
+    assert catalogue.get_classes("test_operators") == first
+    assert "_SecondOperator" not in first
+    catalogue.invalidate("test_operators")
+    assert "_SecondOperator" in catalogue.get_classes("test_operators")
+
+
+def test_get_class_and_info_for_class_not_in_manifest():
+    # Given a catalogue with a group not in the operator manifest
+    catalogue = OperatorCatalogue()
+    catalogue.register_group("transformers", _CatalogueBase)
+
+    # When getting class and info
+    cls = catalogue.get_class("transformers", "_FirstOperator")
+    info = catalogue.get_info("transformers")
+
+    # Then the class and its kwargs are found
+    assert cls is _FirstOperator
+    assert info["_FirstOperator"]["kwargs"] == {"value": 1}
+    assert info["_FirstOperator"]["description"] == "Test operator"
+
+    # And changes to the returned info do not change the catalogue
+    info["_FirstOperator"]["kwargs"]["value"] = 2
+    info["_FirstOperator"]["description"] = "Changed"
+    info.pop("_FirstOperator")
+    assert catalogue.get_info("transformers")["_FirstOperator"] == dict(
+        name="_FirstOperator", description="Test operator", kwargs={"value": 1}
+    )
+
+
+def test_get_class_from_manifest():
+    # Given a catalogue with transformers
+    catalogue = OperatorCatalogue()
+    catalogue.register_group("transformers", PolarsTransformer)
+
+    # When getting a transformer class by name
+    cls = catalogue.get_class("transformers", "PolarsAddRowNumber")
+
+    # Then the class is returned
+    assert issubclass(cls, PolarsTransformer)
+    assert cls.__name__ == "PolarsAddRowNumber"
@@ -0,0 +1,48 @@
+import json
+import subprocess
+import sys
+
+from sharkadm import operator_manifest, transformers, validators
+
+
+def test_operator_manifest_is_up_to_date(tmp_path):
+    # Given the manifest shipped with the package
+    given_manifest = operator_manifest.get_operator_manifest()
+
+    # When creating the manifest in a new process (classes imported by other tests
+    # should not be included)
+    path = tmp_path / "operator_manifest.json"
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from sharkadm import operator_manifest;"
+            f"operator_manifest.write_operator_manifest({str(path)!r})",
+        ],
+        check=True,
+    )
+    manifest = json.loads(path.read_text(encoding="utf-8"))
+
+    # Then they are equal. If not, run: python -m sharkadm.operator_manifest
+    assert given_manifest == manifest
+
+
+def test_lazy_names_are_importable():
+    # Given the lazy transformer and validator names
+    given_packages = [transformers, validators]
+
+    for package in given_packages:
+        for name in package._LAZY_NAMES:
+            # When getting the class from the package
+            cls = getattr(package, name)
+
+            # Then the class with the given name is returned
+            assert cls.__name__ == name
+
+
+def test_get_transformer_object_from_manifest():
+    # When getting a transformer object by name
+    obj = transformers.get_transformer_object("PolarsAddRowNumber")
+
+    # Then an object of the right class is returned
+    assert obj.__class__.__name__ == "PolarsAddRowNumber"
@@ -0,0 +1,125 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import polars as pl
+import pytest
+
+from sharkadm import resource_governor
+from sharkadm.controller import SHARKadmPolarsController
+from sharkadm.resource_governor import ResourceGovernor
+from sharkadm.transformers.base import PolarsTransformer
+from tests.conftest import PolarsDataFrameHolder
+
+_processed_rows: list[int] = []
+
+
+def _get_thread_environment(*args) -> dict[str, str | None]:
+    return {
+        name: os.environ.get(name)
+        for name in resource_governor.THREAD_ENVIRONMENT_VARIABLES
+    }
+
+
+class _DataHolder(PolarsDataFrameHolder):
+    data_type_internal = "unknown"
+
+
+class _AddValueTimesTwo(PolarsTransformer):
+    row_local = True
+
+    @staticmethod
+    def get_transformer_description() -> str:
+        return "Test transformer adding value times two"
+
+    def _transform(self, data_holder) -> None:
+        _processed_rows.append(len(data_holder.data))
+        data_holder.data = data_holder.data.with_columns(
+            (pl.col("value").cast(int) * 2).cast(str).alias("value_x2")
+        )
+
+
+@pytest.fixture
+def governor():
+    old_governor = resource_governor.get_governor()
+    yield
+    resource_governor.set_governor(old_governor)
+
+
+def test_row_local_transformer_is_chunked_within_memory_budget(governor, monkeypatch):
+    # Given a memory budget below what is already in use and small chunks
+    monkeypatch.setattr(resource_governor, "MIN_CHUNK_ROWS", 10)
+    monkeypatch.setattr(resource_governor, "CHUNK_PART_OF_BUDGET", 1e-6)
+    resource_governor.set_governor(ResourceGovernor(memory_budget_mb=1))
+    data = pl.DataFrame({"value": [str(i) for i in range(100)]})
+    controller = SHARKadmPolarsController()
+    controller.set_data_holder(_DataHolder(data))
+    _processed_rows.clear()
+
+    # When running a row local transformer
+    controller.run_operators(_AddValueTimesTwo())
+
+    # Then the rows are processed in chunks and the result is complete
+    assert len(_processed_rows) > 1
+    assert sum(_processed_rows) == 100
+    result = controller.data_holder.data
+    assert result["value_x2"].to_list() == [str(i * 2) for i in range(100)]
+
+    # And the chunking is part of the report
+    report = resource_governor.get_governor().get_report()
+    assert report["nr_chunked_operators"] == 1
+    assert report["operators"][0]["nr_rows"] == 100
+
+
+def test_no_chunks_without_memory_budget(governor):
+    # Given no memory budget
+    resource_governor.set_governor(ResourceGovernor())
+    controller = SHARKadmPolarsController()
+    controller.set_data_holder(_DataHolder(pl.DataFrame({"value": ["1", "2"]})))
+    _processed_rows.clear()
+
+    # When running a row local transformer
+    controller.run_operators(_AddValueTimesTwo())
+
+    # Then all rows are processed at once
+    assert _processed_rows == [2]
+    assert resource_governor.get_governor().get_report()["nr_chunked_operators"] == 0
+
+
+def test_threads_are_shared_between_workers():
+    # Given eight cores
+    # When sharing them between workers
+    # Then each worker gets at least one thread
+    assert resource_governor.get_threads_per_worker(3, nr_cpus=8) == 2
+    assert resource_governor.get_threads_per_worker(16, nr_cpus=8) == 1
+    env = resource_governor.get_thread_environment(2)
+    assert env["POLARS_MAX_THREADS"] == "2"
+    assert env["OMP_NUM_THREADS"] == "2"
+
+
+def test_spawned_workers_start_with_thread_environment(monkeypatch):
+    # Given one thread setting in the environment of this process
+    for name in resource_governor.THREAD_ENVIRONMENT_VARIABLES:
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("OMP_NUM_THREADS", "7")
+    pool_size = pl.thread_pool_size()
+
+    # When starting workers within the thread environment
+    with resource_governor.worker_thread_environment(2):
+        executor = ProcessPoolExecutor(
+            max_workers=2, mp_context=multiprocessing.get_context("spawn")
+        )
+        resource_governor.start_workers(executor, 2)
+
+    # Then all workers have the settings from start (without an initializer)
+    with executor:
+        assert len(executor._processes) == 2
+        environments = list(executor.map(_get_thread_environment, range(4)))
+    assert all(env == resource_governor.get_thread_environment(2) for env in environments)
+
+    # And the environment and thread pool of this process are unchanged
+    assert _get_thread_environment() == {
+        name: "7" if name == "OMP_NUM_THREADS" else None
+        for name in resource_governor.THREAD_ENVIRONMENT_VARIABLES
+    }
+    assert pl.thread_pool_size() == pool_size
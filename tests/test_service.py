@@ -0,0 +1,130 @@
+import os
+import signal
+import time
+import urllib.error
+
+import pytest
+
+from sharkadm.service import (
+    FAILED,
+    FINISHED,
+    Job,
+    SHARKadmService,
+    SHARKadmServiceClient,
+)
+
+_TOKEN = "test-token"
+
+
+def _write_workflow(tmp_path):
+    workflow_path = tmp_path / "workflow.yaml"
+    workflow_path.write_text(
+        f"workflow_config:\n  export_directory: {tmp_path}\n"
+        "adm_logger_config: {}\noperators: []\nexporters: []\n"
+    )
+    return workflow_path
+
+
+def _run_job(client, tmp_path) -> dict:
+    job = client.submit(tmp_path / "data.txt", str(_write_workflow(tmp_path)))
+    return list(client.iter_log(job["id"]))[-1]["job"]
+
+
+@pytest.fixture(scope="module")
+def client():
+    service = SHARKadmService(port=0, nr_workers=1, token=_TOKEN)
+    service.start(block=False)
+    yield SHARKadmServiceClient(service.url, token=_TOKEN)
+    service.stop()
+
+
+def test_log_is_streamed_until_job_is_done(client, tmp_path):
+    # Given a workflow file
+    workflow_path = _write_workflow(tmp_path)
+
+    # When submitting a job and following the log
+    job = client.submit(tmp_path / "data.txt", str(workflow_path))
+    items = list(client.iter_log(job["id"]))
+
+    # Then log entries from the worker are streamed and the last item is the job
+    assert items[0]["log"]["msg"] == "Initiating workflow"
+    assert items[-1]["job"]["id"] == job["id"]
+    assert items[-1]["job"]["nr_log_entries"] == len(items) - 1
+    assert client.get_job(job["id"])["status"] == items[-1]["job"]["status"]
+
+
+def test_failing_job_reports_error(client, tmp_path):
+    # When submitting a job with a missing workflow file
+    job = client.submit(tmp_path / "data.txt", str(tmp_path / "missing.yaml"))
+    finished = list(client.iter_log(job["id"]))[-1]["job"]
+
+    # Then the job has failed with the error
+    assert finished["status"] == FAILED
+    assert "FileNotFoundError" in finished["error"]
+    assert job["id"] in [item["id"] for item in client.get_jobs()]
+
+
+def test_post_requires_token(client, tmp_path):
+    # Given a client without the token of the service
+    other_client = SHARKadmServiceClient(client._url, token="wrong-token")
+
+    # When submitting a job
+    with pytest.raises(urllib.error.HTTPError) as e:
+        other_client.submit(tmp_path / "data.txt", "workflow")
+
+    # Then the request is refused
+    assert e.value.code == 401
+
+
+def test_old_finished_jobs_are_evicted():
+    # Given a service keeping two finished jobs for one hour
+    service = SHARKadmService(
+        port=0, token=_TOKEN, max_finished_jobs=2, finished_job_ttl=3600
+    )
+    now = time.time()
+    for finished in [now - 7200, now - 3, now - 2, now - 1, None]:
+        job = Job("data.txt", "workflow")
+        if finished:
+            job.status = FINISHED
+            job.finished = finished
+        service._jobs[job.id] = job
+
+    # When listing the jobs
+    jobs = service.jobs
+
+    # Then the two latest finished jobs and the running job are kept
+    assert [job.finished for job in jobs] == [now - 2, now - 1, None]
+
+
+def test_worker_pool_is_replaced_when_a_worker_dies(tmp_path):
+    # Given a service with a started worker
+    service = SHARKadmService(port=0, nr_workers=1, token=_TOKEN)
+    service.start(block=False)
+    client = SHARKadmServiceClient(service.url, token=_TOKEN)
+    try:
+        assert _run_job(client, tmp_path)["status"] in (FINISHED, FAILED)
+        broken_executor = service._executor
+
+        # When the worker process is killed
+        for pid in list(broken_executor._processes):
+            os.kill(pid, signal.SIGKILL)
+
+        # Then jobs submitted meanwhile are refused (503) or failed and the pool is
+        # replaced so that later jobs are run
+        errors = []
+        deadline = time.time() + 60
+        while time.time() < deadline:
+            try:
+                job = _run_job(client, tmp_path)
+            except urllib.error.HTTPError as e:
+                assert e.code == 503
+                errors.append(e.code)
+                continue
+            if "BrokenProcessPool" not in job["error"]:
+                break
+            errors.append(job["error"])
+        assert errors
+        assert "BrokenProcessPool" not in job["error"]
+        assert service._executor is not broken_executor
+    finally:
+        service.stop()
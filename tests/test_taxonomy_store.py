@@ -0,0 +1,135 @@
+import polars as pl
+import pytest
+
+from sharkadm import config, taxonomy_store
+from sharkadm.controller import SHARKadmPolarsController
+from sharkadm.taxonomy_store import TaxonomySource, TaxonomyStore
+from sharkadm.transformers import PolarsSetTrophicTypeSMHI
+from tests.conftest import PolarsDataFrameHolder
+
+_looked_up: list[str] = []
+
+_NAMES = {"Abra alba": "Abra alba", "Abra albus": "Abra alba"}
+
+
+class _DataHolder(PolarsDataFrameHolder):
+    data_type_internal = "unknown"
+
+
+def _get_name(name: str) -> str | None:
+    _looked_up.append(name)
+    return _NAMES.get(name)
+
+
+def _get_sources(version: str = "1") -> list[TaxonomySource]:
+    return [
+        TaxonomySource(
+            name="translate", get_version=lambda: version, get_value=_get_name
+        ),
+        TaxonomySource(
+            name="trophic_type",
+            get_version=lambda: version,
+            get_mapper=lambda: {"Dinophysis:1": "MX", "Dinophysis:2": "HT"},
+        ),
+    ]
+
+
+@pytest.fixture
+def store(tmp_path):
+    old_store = taxonomy_store.get_store()
+    store = TaxonomyStore(tmp_path, sources=_get_sources())
+    taxonomy_store.set_store(store)
+    _looked_up.clear()
+    yield store
+    taxonomy_store.set_store(old_store)
+
+
+def test_keys_found_are_looked_up_once_per_process(store, tmp_path):
+    # Given a store compiled per key
+    # When looking up names
+    mapping = store.get_mapping("translate", ["Abra albus", "Unknown", "Abra albus"])
+
+    # Then every name is looked up in the source once
+    assert mapping == {"Abra albus": "Abra alba"}
+    assert sorted(_looked_up) == ["Abra albus", "Unknown"]
+
+    # And names not found are looked up again on next use
+    assert store.get("translate", "Abra albus") == "Abra alba"
+    assert store.get("translate", "Unknown") is None
+    assert sorted(_looked_up) == ["Abra albus", "Unknown", "Unknown"]
+
+    # And tables compiled per key are not saved
+    assert not list(tmp_path.glob("translate.*"))
+    other_store = TaxonomyStore(tmp_path, sources=_get_sources())
+    assert other_store.get("translate", "Abra albus") == "Abra alba"
+    assert _looked_up.count("Abra albus") == 2
+
+
+def test_complete_tables_are_saved_and_compiled_again_on_new_version(tmp_path):
+    # Given a complete table compiled by one store
+    compiled = []
+
+    def get_sources(version: str) -> list[TaxonomySource]:
+        return [
+            TaxonomySource(
+                name="trophic_type",
+                get_version=lambda: version,
+                get_mapper=lambda: compiled.append(version) or {"Dinophysis:1": "MX"},
+            )
+        ]
+
+    TaxonomyStore(tmp_path, sources=get_sources("1")).get_table("trophic_type")
+
+    # When another store with the same version uses the table
+    store = TaxonomyStore(tmp_path, sources=get_sources("1"))
+
+    # Then the table is read from file
+    assert store.get("trophic_type", "Dinophysis:1") == "MX"
+    assert compiled == ["1"]
+
+    # And the table is compiled again when the source version changes
+    new_store = TaxonomyStore(tmp_path, sources=get_sources("2"))
+    assert new_store.get("trophic_type", "Dinophysis:1") == "MX"
+    assert compiled == ["1", "2"]
+
+
+def test_trophic_type_is_set_with_one_join(store):
+    # Given data with scientific name and size class
+    data = pl.DataFrame(
+        {
+            "bvol_scientific_name": ["Dinophysis", "Dinophysis", "Dinophysis"],
+            "bvol_size_class": ["1", "2", "3"],
+            "trophic_type_code": ["AU", "HT", "AU"],
+        }
+    )
+    controller = SHARKadmPolarsController()
+    controller.set_data_holder(_DataHolder(data))
+
+    # When setting trophic type
+    controller.transform(PolarsSetTrophicTypeSMHI())
+
+    # Then only values found in the reference list are replaced
+    assert controller.data["trophic_type_code"].to_list() == ["MX", "HT", "AU"]
+    assert "_new_trophic_type" not in controller.data.columns
+
+
+def test_list_version_changes_when_list_file_is_updated(tmp_path, monkeypatch):
+    # Given an installed package reading a list in the config directory
+    monkeypatch.setattr(taxonomy_store, "get_package_version", lambda package: "1.0")
+    monkeypatch.setattr(config, "CONFIG_DIRECTORY", tmp_path)
+    monkeypatch.delenv(config.CONFIG_ENV, raising=False)
+    list_path = tmp_path / "bvol_nomp_version_2024.txt"
+    list_path.write_text("Dinophysis\t1")
+    (tmp_path / "translate_codes_NEW.txt").write_text("not a bvol list")
+    version = taxonomy_store.get_package_list_version("nodc_bvol")
+
+    # When the list is updated without a new package version
+    list_path.write_text("Dinophysis\t1\nDinophysis\t2")
+
+    # Then the version of the list changes
+    assert taxonomy_store.get_list_files("nodc_bvol") == [list_path.resolve()]
+    assert version.startswith("1.0:")
+    assert taxonomy_store.get_package_list_version("nodc_bvol") != version
+
+    # And the version of other packages is not changed by the list
+    assert taxonomy_store.get_list_files("nodc_dyntaxa") == []
@@ -0,0 +1,128 @@
+import os
+import signal
+import time
+import zipfile
+
+from sharkadm.watch_folder import (
+    DONE,
+    FAILED,
+    PENDING,
+    RUNNING,
+    InboxWatcher,
+    JobProcessor,
+    JobQueue,
+)
+
+
+def _write_zip(path, content: str) -> None:
+    # Fixed time stamp so that zip files with the same content are identical
+    info = zipfile.ZipInfo("shark_data.txt", date_time=(2020, 1, 1, 0, 0, 0))
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr(info, content)
+
+
+def test_jobs_are_claimed_by_priority_and_retried(tmp_path):
+    # Given a queue with jobs of different priority
+    queue = JobQueue(tmp_path / "jobs.db", max_attempts=2, retry_delay=0)
+    low = queue.add("low", priority=0, content_hash="a")
+    high = queue.add("high", priority=5, content_hash="b")
+
+    # Then the same content is only added once
+    assert queue.add("low_again", content_hash="a") is None
+
+    # When claiming jobs
+    first = queue.claim_next()
+    second = queue.claim_next()
+
+    # Then the job with highest priority is claimed first
+    assert [first["id"], second["id"]] == [high, low]
+    assert queue.claim_next() is None
+    assert queue.get_nr_jobs(RUNNING) == 2
+
+    # And a failed job is retried until max attempts is reached
+    assert queue.set_failed(low, "error") == PENDING
+    assert queue.claim_next()["id"] == low
+    assert queue.set_failed(low, "error") == FAILED
+    queue.set_done(high)
+    assert queue.get_job(high)["state"] == DONE
+    assert queue.get_job(low)["attempts"] == 2
+
+
+def test_watcher_adds_stable_deliveries_once(tmp_path):
+    # Given an inbox with a zip package
+    inbox = tmp_path / "inbox"
+    inbox.mkdir()
+    _write_zip(inbox / "SHARK_Test.zip", "a\tb\n1\t2\n")
+    (inbox / "notes.txt").write_text("Not a delivery")
+    queue = JobQueue(tmp_path / "jobs.db")
+    watcher = InboxWatcher(queue, {inbox: 3})
+
+    # When scanning
+    first_scan = watcher.scan()
+    second_scan = watcher.scan()
+    third_scan = watcher.scan()
+
+    # Then the delivery is added when unchanged between two scans
+    assert first_scan == []
+    assert len(second_scan) == 1
+    assert third_scan == []
+    job = queue.get_job(second_scan[0])
+    assert job["priority"] == 3
+    assert job["path"].endswith("SHARK_Test.zip")
+
+    # And a copy with the same content is not added
+    _write_zip(inbox / "SHARK_Copy.zip", "a\tb\n1\t2\n")
+    watcher.scan()
+    assert watcher.scan() == []
+
+
+def test_processor_sets_state_of_finished_jobs(tmp_path):
+    # Given a job with an invalid delivery
+    queue = JobQueue(tmp_path / "jobs.db", max_attempts=1)
+    job_id = queue.add(tmp_path / "missing.zip", content_hash="a")
+    processor = JobProcessor(queue, nr_workers=1)
+
+    # When processing the queue
+    processor.start()
+    try:
+        processor.run_once()
+        for _ in range(200):
+            if not processor.nr_running:
+                break
+            time.sleep(0.05)
+            processor.run_once()
+    finally:
+        processor.stop()
+
+    # Then the job is failed with the error
+    job = queue.get_job(job_id)
+    assert job["state"] == FAILED
+    assert "missing.zip" in job["error"]
+
+
+def test_processor_replaces_worker_pool_when_a_worker_dies(tmp_path):
+    # Given a processor with a started worker
+    queue = JobQueue(tmp_path / "jobs.db", max_attempts=2, retry_delay=0)
+    processor = JobProcessor(queue, nr_workers=1)
+    processor.start()
+    try:
+        broken_executor = processor._executor
+        pid = broken_executor.submit(os.getpid).result()
+
+        # When the worker process is killed and a job is added
+        os.kill(pid, signal.SIGKILL)
+        job_id = queue.add(tmp_path / "missing.zip", content_hash="a")
+        for _ in range(400):
+            processor.run_once()
+            if queue.get_job(job_id)["state"] == FAILED:
+                break
+            time.sleep(0.05)
+        executor = processor._executor
+    finally:
+        processor.stop()
+
+    # Then the pool is replaced and the job is run by a new worker
+    assert executor is not broken_executor
+    job = queue.get_job(job_id)
+    assert job["state"] == FAILED
+    assert "missing.zip" in job["error"]
@@ -0,0 +1,40 @@
+import polars as pl
+
+from sharkadm import adm_logger
+from sharkadm.validators.duplicates import ValidateDuplicatedRows
+from tests.conftest import PolarsDataFrameHolder
+
+
+class _DataHolder(PolarsDataFrameHolder):
+    data_type_internal = "unknown"
+
+
+def test_duplicated_rows_are_logged_once_per_group():
+    # Given data with two groups of duplicated rows
+    given_data = pl.DataFrame(
+        {
+            "reported_station_name": ["A", "B", "A", "C", "B", "A"],
+            "parameter": ["TEMP", "SALT", "TEMP", "TEMP", "SALT", "TEMP"],
+            "value": ["1", "2", "1", "1", "2", "1"],
+            "comment": ["", "", "", "", "", "x"],
+            "row_number": ["1", "2", "3", "4", "5", "6"],
+        }
+    ).with_columns(pl.col("parameter").cast(pl.Categorical))
+
+    # When validating duplicates without the comment column
+    adm_logger.reset_log()
+    ValidateDuplicatedRows(exclude_columns=["comment"]).validate(_DataHolder(given_data))
+
+    # Then each group of duplicates is logged once with all its row numbers
+    failed_logs = [
+        log
+        for log in adm_logger.data
+        if log["log_type"] == adm_logger.VALIDATION
+        and log["cls"] == "ValidateDuplicatedRows"
+        and not log["validation_success"]
+    ]
+    assert sorted(str(log["row_numbers"]) for log in failed_logs) == [
+        "1, 3, 6",
+        "2, 5",
+    ]
+    assert "A; TEMP; 1" in failed_logs[0]["msg"]